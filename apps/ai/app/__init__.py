@@ -12,8 +12,22 @@ Public API:
     - generate_cv_from_data(): Generate CV from structured data (default: FR + EN, optional: selective)
     - generate_cv_phase1_from_pdf(): PHASE 1 - FR only (fast, ~1-2 min)
     - generate_cv_phase2_from_pdf(): PHASE 2 - EN only (deferred, background)
+    - agenerate_cv_from_pdf() / agenerate_cv_from_data(): async counterparts (AsyncOpenAI)
+    - regenerate_cv_from_data(): incremental regeneration after a form edit (diff vs last generation)
+    - generate_cv_batch(): N CVs (data or PDFs) on a shared pool + LLM budget, streamed
     - CVContent: Data model for structured input
-    - CVGenerationResult: Generation output with PDF/DOCX bytes
+    - CVGenerationResult: Generation output with PDF/DOCX bytes (DOCX may be deferred)
+    - GenerationSession: Phase 1 checkpoint (extracted text, analysis, base content)
+    - DocxWriter: Native DOCX from content (mirrors the grid template)
+    - generate_docx_from_pdf(): PDF → DOCX conversion fallback
+    - add_sink() / TraceSink: receive the per-stage span tree of each generation
+    - use_cassette() / Cassette: record / replay OpenAI calls (offline, deterministic runs)
+    - use_deadline() / Deadline: time budget of a generation (see result.degradations)
+    - extract_text_layer() / TextLayer: local PDF text extraction with a confidence score
+    - UploadManager: reuse of live OpenAI uploads + background deletion
+    - get_client() / close_clients(): shared pooled OpenAI client (timeouts, backoff)
+    - LLMUsage / usage_from_trace(): tokens, retries and cost of a generation (result.usage)
+    - ModelProfile / get_profile(): provider, model and parameters per LLM call type
 
 PFR Logic (Performance Optimized - Single Pass):
     - < 70%: BLOCK generation
@@ -31,8 +45,10 @@ Two-Phase Generation Example (SaaS optimization):
     >>> phase1 = generate_cv_phase1_from_pdf(pdf_bytes, domain="finance")
     >>> pdf_fr = phase1["fr"].pdf_bytes
     >>>
-    >>> # PHASE 2: EN + DOCX (background, trigger asynchronously)
-    >>> phase2 = generate_cv_phase2_from_pdf(pdf_bytes, domain="finance")
+    >>> # PHASE 2: EN + DOCX (background), reusing Phase 1 extraction + analysis
+    >>> phase2 = generate_cv_phase2_from_pdf(
+    ...     pdf_bytes, domain="finance", session=phase1["fr"].session
+    ... )
     >>> pdf_en = phase2["en"].pdf_bytes
 
 Standard Example (both languages at once):
@@ -46,12 +62,37 @@ Standard Example (both languages at once):
 from .generator import (
     generate_cv_from_pdf,
     generate_cv_from_data,
+    agenerate_cv_from_pdf,
+    agenerate_cv_from_data,
     generate_cv_phase1_from_pdf,
     generate_cv_phase2_from_pdf,
+    generate_docx_from_pdf,
+    regenerate_cv_from_data,
     CVGenerator,
 )
-from .models import CVContent, CVGenerationResult, PageFillMetrics
+from .batch import generate_cv_batch
+from .models import (
+    BatchItem,
+    BatchItemResult,
+    CVContent,
+    CVGenerationResult,
+    GenerationSession,
+    LLMUsage,
+    PageFillMetrics,
+)
 from .density import DensityCalculator
+from .cache import ExtractionCache, LLMResponseCache, RenderCache
+from .page_estimator import PageFillEstimator
+from .trim_planner import TrimPlanner
+from .docx_writer import DocxWriter
+from .tracing import Span, TraceSink, PrintSink, MemorySink, add_sink, remove_sink
+from .cassette import Cassette, CassetteMiss, use_cassette
+from .deadline import Deadline, use_deadline
+from .pdf_text import TextLayer, extract_text_layer
+from .uploads import UploadManager
+from .openai_client import close_clients, get_client
+from .usage import usage_from_trace
+from .model_registry import ModelProfile, get_profile
 
 __version__ = "2.3.0"
 __author__ = "Postulae"
@@ -61,16 +102,70 @@ __all__ = [
     "generate_cv_from_pdf",
     "generate_cv_from_data",
 
+    # Async counterparts (do not block the event loop)
+    "agenerate_cv_from_pdf",
+    "agenerate_cv_from_data",
+
+    # Incremental regeneration (form edits)
+    "regenerate_cv_from_data",
+
+    # Batch generation (cohorts, results streamed as they finish)
+    "generate_cv_batch",
+
     # Phase 1 & 2 functions (SaaS optimization)
     "generate_cv_phase1_from_pdf",  # FR only (fast)
     "generate_cv_phase2_from_pdf",  # EN only (deferred)
+    "generate_docx_from_pdf",       # Deferred DOCX artifact (on demand)
 
     # Classes
     "CVGenerator",
     "DensityCalculator",
+    "RenderCache",
+    "LLMResponseCache",
+    "ExtractionCache",
+    "PageFillEstimator",
+    "TrimPlanner",
+    "DocxWriter",
+
+    # Tracing (per-stage span tree, see CVGenerationResult.trace)
+    "Span",
+    "TraceSink",
+    "PrintSink",
+    "MemorySink",
+    "add_sink",
+    "remove_sink",
+
+    # Record / replay of OpenAI calls
+    "Cassette",
+    "CassetteMiss",
+    "use_cassette",
+
+    # Generation deadline (degraded modes)
+    "Deadline",
+    "use_deadline",
+
+    # Local PDF text extraction (GPT-4o vision only for scans / low confidence)
+    "extract_text_layer",
+    "TextLayer",
+
+    # OpenAI uploads and shared client
+    "UploadManager",
+    "get_client",
+    "close_clients",
+
+    # LLM usage and cost (see CVGenerationResult.usage)
+    "usage_from_trace",
+
+    # Model per LLM call type (LLM_MODEL_PROFILES)
+    "ModelProfile",
+    "get_profile",
 
     # Models
     "CVContent",
     "CVGenerationResult",
+    "GenerationSession",
+    "LLMUsage",
     "PageFillMetrics",
+    "BatchItem",
+    "BatchItemResult",
 ]
@@ -0,0 +1,154 @@
+"""
+Batch CV generation for Postulae CV Generator (school cohorts).
+
+Runs N generations (structured data or PDFs) over one shared worker pool:
+- ONE CVGenerator for the whole batch (warm layout template, render cache,
+  estimator, planner) instead of one per CV
+- ONE LLM concurrency budget shared by every item and language
+  (llm_client.llm_budget), so the batch stays within the API quota
+- Results are yielded as items finish (completion order, not input order);
+  a failed item is reported and does not stop the batch
+
+Items run on threads, which overlap LLM round trips (they release the
+GIL). Renders and PDF measurement are pure Python and hold the GIL, so
+they run one at a time across the batch: more workers add LLM overlap,
+not CPU throughput. The estimate measure mode keeps renders to the final
+artifact (and estimates near the page break); in "render" mode every
+decision renders and the batch is CPU-bound on one core. Size max_workers
+by the LLM budget (BATCH_MAX_WORKERS defaults to BATCH_LLM_CONCURRENCY / 2),
+not by the core count.
+
+Usage:
+    for item in generate_cv_batch(items, max_workers=8, llm_concurrency=16):
+        print(item.item_id, item.status)
+"""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional
+
+from .generator import CVGenerator
+from .llm_client import llm_budget
+from .models import BatchItem, BatchItemResult, CVGenerationResult
+from .tracing import run_in_context
+
+
+def _validate_items(items: List[BatchItem]) -> None:
+    """
+    Raises:
+        ValueError: If an item has both or neither of cv_content / pdf_bytes
+    """
+    for index, item in enumerate(items):
+        if (item.cv_content is None) == (item.pdf_bytes is None):
+            raise ValueError(
+                f"Batch item {index} ({item.item_id}): provide exactly one of cv_content or pdf_bytes"
+            )
+
+
+def _run_item(
+    generator: CVGenerator,
+    llm_slots: threading.BoundedSemaphore,
+    index: int,
+    item: BatchItem,
+) -> BatchItemResult:
+    """Generate one item; errors are captured on the result, never raised."""
+    start = time.time()
+    try:
+        with llm_budget(llm_slots):
+            if item.pdf_bytes is not None:
+                results: Dict[str, CVGenerationResult] = generator.generate_from_pdf(
+                    item.pdf_bytes, item.domain, item.languages
+                )
+            else:
+                results = generator.generate_from_data(item.cv_content, item.languages)
+    except Exception as e:
+        print(f"[BATCH] Item {index} ({item.item_id}) failed: {str(e)}")
+        return BatchItemResult(
+            item_id=item.item_id,
+            index=index,
+            status="failed",
+            error=str(e),
+            duration_seconds=round(time.time() - start, 2),
+        )
+
+    return BatchItemResult(
+        item_id=item.item_id,
+        index=index,
+        status="done",
+        results=results,
+        duration_seconds=round(time.time() - start, 2),
+    )
+
+
+def generate_cv_batch(
+    items: List[BatchItem],
+    max_workers: Optional[int] = None,
+    llm_concurrency: Optional[int] = None,
+    generator: Optional[CVGenerator] = None,
+    docx_mode: Optional[str] = None,
+    second_language_mode: Optional[str] = None,
+) -> Iterator[BatchItemResult]:
+    """
+    Generate a batch of CVs, yielding each item as soon as it finishes.
+
+    Items run on a bounded thread pool (LLM round trips overlap, renders
+    share one core, see module docstring); languages of an item still run
+    concurrently inside it.
+    Closing the iterator early cancels the items not started yet.
+
+    Args:
+        items: CVs to generate (structured data or PDF each)
+        max_workers: Items processed concurrently (default: BATCH_MAX_WORKERS from config)
+        llm_concurrency: Chat completions in flight for the whole batch
+                         (default: BATCH_LLM_CONCURRENCY from config)
+        generator: Shared generator (default: a new CVGenerator for the batch)
+        docx_mode: "eager" or "deferred" when no generator is given
+        second_language_mode: "generate" or "translate" when no generator is given
+
+    Yields:
+        BatchItemResult per item, in completion order
+
+    Raises:
+        ValueError: If an item or a limit is invalid (checked before any generation starts)
+    """
+    _validate_items(items)
+    if not items:
+        return
+
+    if max_workers is None or llm_concurrency is None:
+        from apps.config import BATCH_LLM_CONCURRENCY, BATCH_MAX_WORKERS
+        max_workers = max_workers or BATCH_MAX_WORKERS
+        llm_concurrency = llm_concurrency or BATCH_LLM_CONCURRENCY
+    if max_workers < 1 or llm_concurrency < 1:
+        raise ValueError("Batch max_workers and llm_concurrency must be >= 1")
+    # One budget for every item and language of the batch
+    llm_slots = threading.BoundedSemaphore(llm_concurrency)
+    if generator is None:
+        generator = CVGenerator(docx_mode=docx_mode, second_language_mode=second_language_mode)
+
+    start = time.time()
+    done_count = 0
+    print(f"[BATCH] {len(items)} item(s), {max_workers} worker(s), LLM budget {llm_concurrency}")
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix="cvbatch",
+    )
+    try:
+        # run_in_context: items attach to the caller's trace, if any
+        pending = {
+            executor.submit(run_in_context(_run_item), generator, llm_slots, index, item)
+            for index, item in enumerate(items)
+        }
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done_count += 1
+                yield future.result()
+    finally:
+        # Early close (client gone): drop queued items, let running ones finish
+        executor.shutdown(wait=False, cancel_futures=True)
+        print(
+            f"[BATCH] {done_count}/{len(items)} item(s) finished "
+            f"in {time.time() - start:.1f}s"
+        )
@@ -0,0 +1,571 @@
+"""
+Caching primitives for Postulae CV Generator.
+
+- LRUCache: thread-safe in-process LRU bounded by entry count and bytes
+- RenderCache: memoizes render + PFR measurement by content hash
+- LLMResponseCache: memoizes generate_cv_content responses (model, prompt,
+  instructions, language, input)
+- ExtractionCache: memoizes PDF text extraction by PDF SHA-256 + prompt version
+
+Shared tier (optional): any object exposing the RedisSession interface
+(get(key) / set_with_expiry(key, value, expiry_seconds)) so several
+workers can share entries. Shared-tier failures never break generation.
+"""
+import base64
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .layout import LayoutEngine
+from .models import PageFillMetrics
+
+
+def stable_hash(value: Any) -> str:
+    """
+    SHA-256 of the canonical JSON form of a value.
+
+    Keys are sorted and non-JSON values stringified, so two equal
+    dictionaries always produce the same hash.
+    """
+    canonical = json.dumps(
+        value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache bounded by entry count and (optionally) total size.
+
+    Tracks hit/miss counters for observability.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum total size (requires sizeof), None = unbounded
+            sizeof: Function returning the size of a value in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda value: 0)
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return cached value (and mark it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Return cached value without touching LRU order or counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Insert or replace a value, evicting least recently used entries."""
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._total_bytes += size
+            self._evict()
+
+    def delete(self, key: str) -> bool:
+        """Drop one entry; True if it was cached."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._total_bytes -= entry[1]
+            return True
+
+    def _evict(self) -> None:
+        """Evict LRU entries until both bounds hold (lock must be held)."""
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None
+            and self._total_bytes > self.max_bytes
+            and len(self._entries) > 1
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RenderCache:
+    """
+    Memoizes LayoutEngine render + DensityCalculator PFR measurement.
+
+    Key: stable hash of the NORMALIZED template data (what the template
+    actually renders) + trim flag + template version. Repeated or reverted
+    content (e.g. "revert to trimmed version", CAS 4 re-render) is served
+    without paying for xhtml2pdf + pdfplumber again.
+    """
+
+    KEY_PREFIX = "postulae:render:"
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        shared_store: Optional[Any] = None,
+        shared_ttl_seconds: int = 3600,
+    ):
+        """
+        Args:
+            max_entries: In-process LRU entry bound
+            max_bytes: In-process LRU size bound (PDF bytes)
+            shared_store: Optional cross-worker store (RedisSession interface)
+            shared_ttl_seconds: Expiry of shared entries
+        """
+        self._local = LRUCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            sizeof=lambda entry: len(entry[0]),
+        )
+        self.shared_store = shared_store
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self._template_version = self._compute_template_version()
+        self._inflight: Dict[str, Tuple[threading.Lock, int]] = {}
+        self._inflight_lock = threading.Lock()
+
+    @staticmethod
+    def _compute_template_version() -> str:
+        """Hash of the template so layout changes invalidate shared entries."""
+        template_path = LayoutEngine.TEMPLATES_DIR / "grid_template.html"
+        try:
+            return hashlib.sha256(template_path.read_bytes()).hexdigest()[:12]
+        except OSError:
+            return "unknown"
+
+    def make_key(self, content: Dict, trim: bool) -> str:
+        """
+        Build the cache key for a render request.
+
+        normalize_cv_data never mutates content, so no copy is needed.
+        """
+        normalized = LayoutEngine.normalize_cv_data(content, trim=trim)
+        return stable_hash(
+            {"data": normalized, "trim": bool(trim), "template": self._template_version}
+        )
+
+    def get_or_render(
+        self,
+        content: Dict,
+        trim: bool,
+        render: Callable[[Dict, bool], Tuple[bytes, PageFillMetrics]],
+    ) -> Tuple[bytes, PageFillMetrics]:
+        """
+        Return (pdf_bytes, metrics) for content, rendering only on a miss.
+
+        Args:
+            content: CV content dictionary
+            trim: Trim flag passed to the layout engine
+            render: Function performing the real render + measurement
+
+        Returns:
+            Tuple (PDF bytes, PageFillMetrics copy)
+        """
+        key = self.make_key(content, trim)
+
+        entry = self._local.get(key)
+        if entry is None:
+            # Single-flight: concurrent identical renders wait for the first one
+            try:
+                with self._key_lock(key):
+                    entry = self._local.peek(key)
+                    if entry is None:
+                        entry = self._get_shared(key)
+                        if entry is not None:
+                            self._local.set(key, entry)
+                    if entry is None:
+                        entry = render(content, trim)
+                        self._local.set(key, entry)
+                        self._set_shared(key, entry)
+            finally:
+                self._release_key_lock(key)
+
+        pdf_bytes, metrics = entry
+        return pdf_bytes, metrics.model_copy()
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Return the in-flight lock for a key (reference counted)."""
+        with self._inflight_lock:
+            lock, refs = self._inflight.get(key, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            self._inflight[key] = (lock, refs + 1)
+            return lock
+
+    def _release_key_lock(self, key: str) -> None:
+        """Drop one reference to a key's in-flight lock."""
+        with self._inflight_lock:
+            lock, refs = self._inflight[key]
+            if refs <= 1:
+                del self._inflight[key]
+            else:
+                self._inflight[key] = (lock, refs - 1)
+
+    def _get_shared(self, key: str) -> Optional[Tuple[bytes, PageFillMetrics]]:
+        """Read an entry from the shared store (None on miss or error)."""
+        if self.shared_store is None:
+            return None
+        try:
+            raw = self.shared_store.get(self.KEY_PREFIX + key)
+            if not raw:
+                return None
+            payload = json.loads(raw)
+            return (
+                base64.b64decode(payload["pdf"]),
+                PageFillMetrics.model_validate(payload["metrics"]),
+            )
+        except Exception as e:
+            print(f"[RENDER CACHE] Shared store read failed: {e}")
+            return None
+
+    def _set_shared(self, key: str, entry: Tuple[bytes, PageFillMetrics]) -> None:
+        """Write an entry to the shared store (errors are logged, not raised)."""
+        if self.shared_store is None:
+            return
+        try:
+            pdf_bytes, metrics = entry
+            payload = json.dumps({
+                "pdf": base64.b64encode(pdf_bytes).decode("ascii"),
+                "metrics": metrics.model_dump(),
+            })
+            self.shared_store.set_with_expiry(
+                self.KEY_PREFIX + key, payload, self.shared_ttl_seconds
+            )
+        except Exception as e:
+            print(f"[RENDER CACHE] Shared store write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop in-process entries (shared entries expire on their own)."""
+        self._local.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return in-process hit/miss counters."""
+        return self._local.stats()
+
+
+_default_render_cache: Optional[RenderCache] = None
+_default_render_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderCache:
+    """
+    Return the process-wide render cache (created on first use).
+
+    Configured from apps.config (RENDER_CACHE_SIZE, RENDER_CACHE_SHARED,
+    RENDER_CACHE_TTL). When shared, entries go through the RedisSession pool.
+    """
+    global _default_render_cache
+    with _default_render_cache_lock:
+        if _default_render_cache is None:
+            from apps.config import RENDER_CACHE_SIZE, RENDER_CACHE_SHARED, RENDER_CACHE_TTL
+
+            shared_store = None
+            if RENDER_CACHE_SHARED:
+                try:
+                    from apps.database import get_redis
+                    shared_store = get_redis()
+                except Exception as e:
+                    print(f"[RENDER CACHE] Shared store unavailable, using local cache only: {e}")
+
+            _default_render_cache = RenderCache(
+                max_entries=RENDER_CACHE_SIZE,
+                shared_store=shared_store,
+                shared_ttl_seconds=RENDER_CACHE_TTL,
+            )
+        return _default_render_cache
+
+
+class LLMResponseCache:
+    """
+    Memoizes CV content returned by the LLM (generate_cv_content).
+
+    Key: model + sampling parameters + hash of the system prompt + hash of
+    the enrichment instructions + language + canonical hash of the input,
+    so any prompt file or instruction change invalidates entries. Retries,
+    resubmitted forms and test runs then skip the ~30 s GPT-4o call.
+
+    Entries are stored as JSON text: every hit returns a fresh dict that
+    callers own.
+    """
+
+    KEY_PREFIX = "postulae:llm:"
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        shared_store: Optional[Any] = None,
+        shared_ttl_seconds: int = 86400,
+    ):
+        """
+        Args:
+            max_entries: In-process LRU entry bound
+            shared_store: Optional cross-worker store (RedisSession interface)
+            shared_ttl_seconds: Expiry of shared entries
+        """
+        self._local = LRUCache(max_entries=max_entries, sizeof=len)
+        self.shared_store = shared_store
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self._shared_hits = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str,
+        enrichment_instructions: Optional[str],
+        language: str,
+        input_data: Dict,
+        **params: Any,
+    ) -> str:
+        """
+        Build the cache key of a content request.
+
+        Args:
+            model: LLM model name
+            system_prompt: Full system prompt sent (prompt file + instructions)
+            enrichment_instructions: Adaptive enrichment instructions (or None)
+            language: Output language
+            input_data: Raw text or structured input (hashed canonically)
+            **params: Other request parameters (temperature, response_format...)
+        """
+        return stable_hash({
+            "model": model,
+            "params": params,
+            "prompt": hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(),
+            "instructions": hashlib.sha256((enrichment_instructions or "").encode("utf-8")).hexdigest(),
+            "language": language,
+            "input": stable_hash(input_data),
+        })
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached content (local, then shared tier), or None."""
+        text = self._local.get(key)
+        if text is None:
+            text = self._get_shared(key)
+            if text is None:
+                return None
+            self._local.set(key, text)
+            with self._lock:
+                self._shared_hits += 1
+        return json.loads(text)
+
+    def set(self, key: str, content: Dict) -> None:
+        """Store content in both tiers."""
+        text = json.dumps(content, ensure_ascii=False)
+        self._local.set(key, text)
+        if self.shared_store is None:
+            return
+        try:
+            self.shared_store.set_with_expiry(self.KEY_PREFIX + key, text, self.shared_ttl_seconds)
+        except Exception as e:
+            print(f"[LLM CACHE] Shared store write failed: {e}")
+
+    def delete(self, key: str) -> None:
+        """Drop an entry from both tiers."""
+        self._local.delete(key)
+        if self.shared_store is None:
+            return
+        try:
+            self.shared_store.delete(self.KEY_PREFIX + key)
+        except Exception as e:
+            print(f"[LLM CACHE] Shared store delete failed: {e}")
+
+    def _get_shared(self, key: str) -> Optional[str]:
+        """Read an entry from the shared store (None on miss or error)."""
+        if self.shared_store is None:
+            return None
+        try:
+            return self.shared_store.get(self.KEY_PREFIX + key) or None
+        except Exception as e:
+            print(f"[LLM CACHE] Shared store read failed: {e}")
+            return None
+
+    def clear(self) -> None:
+        """Drop in-process entries (shared entries expire on their own)."""
+        self._local.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss counters.
+
+        hits counts every answered lookup (shared_hits of them came from
+        the shared tier); misses are lookups that reached the LLM.
+        """
+        local = self._local.stats()
+        with self._lock:
+            shared_hits = self._shared_hits
+        return {
+            "hits": local["hits"] + shared_hits,
+            "shared_hits": shared_hits,
+            "misses": local["misses"] - shared_hits,
+            "entries": local["entries"],
+            "bytes": local["bytes"],
+        }
+
+
+class ExtractionCache(LLMResponseCache):
+    """
+    Memoizes PDF text extraction (upload + GPT-4o vision call).
+
+    Key: prompt version (model, parameters, extraction prompt) + SHA-256
+    of the PDF bytes. The same PDF evaluated then generated, or uploaded
+    again, skips both the file upload and the vision call. Entries hold the
+    full CV text (personal data): the shared tier is opt-in with a short
+    TTL (EXTRACTION_CACHE_SHARED / EXTRACTION_CACHE_TTL), and deleting an
+    upload drops its entry (llm_client.forget_extraction()).
+    """
+
+    KEY_PREFIX = "postulae:extract:"
+
+    @staticmethod
+    def make_key(pdf_bytes: bytes, prompt_version: str) -> str:
+        """Cache key of a PDF for an extraction prompt version."""
+        return f"{prompt_version}:{hashlib.sha256(pdf_bytes).hexdigest()}"
+
+    def get_text(self, key: str) -> Optional[str]:
+        """Return the cached raw text, or None."""
+        entry = self.get(key)
+        return entry["raw_text"] if entry is not None else None
+
+    def set_text(self, key: str, raw_text: str) -> None:
+        """Store extracted raw text."""
+        self.set(key, {"raw_text": raw_text})
+
+
+_default_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_configured = False
+_default_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    Return the process-wide LLM response cache (None when disabled).
+
+    Configured from apps.config (LLM_CACHE_ENABLED, LLM_CACHE_SIZE,
+    LLM_CACHE_SHARED, LLM_CACHE_TTL). When shared, entries go through the
+    RedisSession pool.
+    """
+    global _default_llm_cache, _llm_cache_configured
+    with _default_llm_cache_lock:
+        if not _llm_cache_configured:
+            _llm_cache_configured = True
+            try:
+                from apps.config import LLM_CACHE_ENABLED, LLM_CACHE_SHARED, LLM_CACHE_SIZE, LLM_CACHE_TTL
+            except ImportError:
+                return None
+            if LLM_CACHE_ENABLED:
+                shared_store = None
+                if LLM_CACHE_SHARED:
+                    try:
+                        from apps.database import get_redis
+                        shared_store = get_redis()
+                    except Exception as e:
+                        print(f"[LLM CACHE] Shared store unavailable, using local cache only: {e}")
+                _default_llm_cache = LLMResponseCache(
+                    max_entries=LLM_CACHE_SIZE,
+                    shared_store=shared_store,
+                    shared_ttl_seconds=LLM_CACHE_TTL,
+                )
+        return _default_llm_cache
+
+
+def set_llm_cache(cache: Optional[LLMResponseCache]) -> None:
+    """Replace the process-wide LLM response cache (None disables it)."""
+    global _default_llm_cache, _llm_cache_configured
+    with _default_llm_cache_lock:
+        _default_llm_cache = cache
+        _llm_cache_configured = True
+
+
+_default_extraction_cache: Optional[ExtractionCache] = None
+_extraction_cache_configured = False
+_default_extraction_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """
+    Return the process-wide PDF extraction cache (None when disabled).
+
+    Configured from apps.config (EXTRACTION_CACHE_ENABLED,
+    EXTRACTION_CACHE_SIZE, EXTRACTION_CACHE_SHARED, EXTRACTION_CACHE_TTL).
+    The opt-in shared tier (RedisSession pool) keeps entries across
+    restarts and workers for EXTRACTION_CACHE_TTL; without it (default),
+    entries live in this process only.
+    """
+    global _default_extraction_cache, _extraction_cache_configured
+    with _default_extraction_cache_lock:
+        if not _extraction_cache_configured:
+            _extraction_cache_configured = True
+            try:
+                from apps.config import (
+                    EXTRACTION_CACHE_ENABLED,
+                    EXTRACTION_CACHE_SHARED,
+                    EXTRACTION_CACHE_SIZE,
+                    EXTRACTION_CACHE_TTL,
+                )
+            except ImportError:
+                return None
+            if EXTRACTION_CACHE_ENABLED:
+                shared_store = None
+                if EXTRACTION_CACHE_SHARED:
+                    try:
+                        from apps.database import get_redis
+                        shared_store = get_redis()
+                    except Exception as e:
+                        print(f"[EXTRACTION CACHE] Shared store unavailable, using local cache only: {e}")
+                _default_extraction_cache = ExtractionCache(
+                    max_entries=EXTRACTION_CACHE_SIZE,
+                    shared_store=shared_store,
+                    shared_ttl_seconds=EXTRACTION_CACHE_TTL,
+                )
+        return _default_extraction_cache
+
+
+def set_extraction_cache(cache: Optional[ExtractionCache]) -> None:
+    """Replace the process-wide PDF extraction cache (None disables it)."""
+    global _default_extraction_cache, _extraction_cache_configured
+    with _default_extraction_cache_lock:
+        _default_extraction_cache = cache
+        _extraction_cache_configured = True
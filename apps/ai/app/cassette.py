@@ -0,0 +1,213 @@
+"""
+Record / replay cassettes for the OpenAI calls of Postulae CV Generator.
+
+Every OpenAI call goes through llm_client (chat completions, including the
+enrichment bullets, and PDF uploads). With a cassette active, each request
+is fingerprinted (canonical JSON of the request, file bytes by sha256) and:
+- "record": sent live, response + latency stored on disk
+- "replay": answered from disk (CassetteMiss if not recorded), no network
+- "auto": replayed when recorded, otherwise sent live and recorded
+
+Replays can re-inject the recorded latency (latency_scale=1.0) so full
+CVGenerator runs can be profiled offline, or skip it (0.0) for fast,
+deterministic regression tests.
+
+Usage:
+    with use_cassette("apps/ai/cassettes/hec_cohort", mode="auto"):
+        generate_cv_from_pdf(pdf_bytes)
+
+Or for a whole process: LLM_CASSETTE_MODE / LLM_CASSETTE_DIR /
+LLM_CASSETTE_LATENCY_SCALE in apps.config.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+
+from openai.types import FileObject
+from openai.types.chat import ChatCompletion
+
+from .tracing import current_span
+
+MODES = ("off", "record", "replay", "auto")
+
+# Call kind → OpenAI response type rebuilt on replay
+RESPONSE_TYPES = {
+    "chat": ChatCompletion,
+    "file": FileObject,
+}
+
+
+class CassetteMiss(LookupError):
+    """Replay mode and the request was never recorded."""
+
+
+def _encode(value: Any) -> Any:
+    """JSON fallback: bytes become their sha256 (file uploads)."""
+    if isinstance(value, (bytes, bytearray)):
+        return {"sha256": hashlib.sha256(value).hexdigest(), "size": len(value)}
+    raise TypeError(f"Cannot fingerprint {type(value).__name__}")
+
+
+class Cassette:
+    """Directory of recorded OpenAI responses, one JSON file per request."""
+
+    def __init__(self, directory: str, mode: str = "replay", latency_scale: float = 0.0):
+        """
+        Args:
+            directory: Cassette directory (created on first record)
+            mode: "record", "replay" or "auto"
+            latency_scale: Replay delay as a multiple of the recorded latency
+                           (0 = instant, 1 = as recorded)
+
+        Raises:
+            ValueError: If mode is unknown or latency_scale is negative
+        """
+        if mode not in MODES or mode == "off":
+            raise ValueError(f"Unknown cassette mode '{mode}'. Expected one of {MODES[1:]}")
+        if latency_scale < 0:
+            raise ValueError("Cassette latency_scale must be >= 0")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.stats = {"replayed": 0, "recorded": 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(kind: str, request: Dict) -> str:
+        """Stable hash of a request (key order and bytes identity independent)."""
+        canonical = json.dumps(
+            {"kind": kind, "request": request}, sort_keys=True, ensure_ascii=False, default=_encode
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, kind: str, fingerprint: str) -> Path:
+        return self.directory / f"{kind}-{fingerprint}.json"
+
+    def _load(self, kind: str, fingerprint: str) -> Optional[Dict]:
+        path = self._path(kind, fingerprint)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _save(self, kind: str, fingerprint: str, request: Dict, response: Any, latency: float) -> None:
+        entry = {
+            "kind": kind,
+            "fingerprint": fingerprint,
+            "latency_seconds": round(latency, 4),
+            "request": json.loads(json.dumps(request, ensure_ascii=False, default=_encode)),
+            "response": response.model_dump(mode="json"),
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename: concurrent recorders never leave a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.directory), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self._path(kind, fingerprint))
+        with self._lock:
+            self.stats["recorded"] += 1
+
+    def _lookup(self, kind: str, request: Dict):
+        """Return (fingerprint, entry or None); raise CassetteMiss in replay mode."""
+        fingerprint = self.fingerprint(kind, request)
+        entry = None if self.mode == "record" else self._load(kind, fingerprint)
+        if entry is None and self.mode == "replay":
+            raise CassetteMiss(
+                f"No recorded {kind} response for {request.get('model', kind)} "
+                f"(fingerprint {fingerprint[:12]}) in {self.directory}"
+            )
+        return fingerprint, entry
+
+    def _replayed(self, kind: str, entry: Dict) -> Any:
+        with self._lock:
+            self.stats["replayed"] += 1
+        span = current_span()
+        if span is not None:
+            span.set(cassette="replay")
+        return RESPONSE_TYPES[kind].model_validate(entry["response"])
+
+    def call(self, kind: str, request: Dict, send: Callable[[], Any]) -> Any:
+        """
+        Answer a blocking call from the cassette, or send and record it.
+
+        Args:
+            kind: "chat" or "file"
+            request: Request parameters (fingerprinted)
+            send: Performs the live call
+
+        Raises:
+            CassetteMiss: Replay mode and the request was never recorded
+        """
+        fingerprint, entry = self._lookup(kind, request)
+        if entry is not None:
+            delay = entry.get("latency_seconds", 0) * self.latency_scale
+            if delay:
+                time.sleep(delay)
+            return self._replayed(kind, entry)
+
+        start = time.time()
+        response = send()
+        self._save(kind, fingerprint, request, response, time.time() - start)
+        return response
+
+    async def acall(self, kind: str, request: Dict, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of call() (send returns an awaitable)."""
+        fingerprint, entry = self._lookup(kind, request)
+        if entry is not None:
+            delay = entry.get("latency_seconds", 0) * self.latency_scale
+            if delay:
+                await asyncio.sleep(delay)
+            return self._replayed(kind, entry)
+
+        start = time.time()
+        response = await send()
+        self._save(kind, fingerprint, request, response, time.time() - start)
+        return response
+
+
+_active: Optional[Cassette] = None
+
+
+def get_cassette() -> Optional[Cassette]:
+    """Cassette applied to every OpenAI call of the process (None = live)."""
+    return _active
+
+
+def set_cassette(cassette: Optional[Cassette]) -> None:
+    """Activate a cassette for the whole process (None to go live again)."""
+    global _active
+    _active = cassette
+
+
+@contextmanager
+def use_cassette(directory: str, mode: str = "replay", latency_scale: float = 0.0) -> Iterator[Cassette]:
+    """
+    Activate a cassette for the block (all threads: batch and language pools too).
+
+    Yields:
+        The active Cassette (see cassette.stats after the run)
+    """
+    previous = get_cassette()
+    cassette = Cassette(directory, mode=mode, latency_scale=latency_scale)
+    set_cassette(cassette)
+    try:
+        yield cassette
+    finally:
+        set_cassette(previous)
+
+
+def configure_from_settings() -> None:
+    """Activate the cassette configured in apps.config (LLM_CASSETTE_MODE != "off")."""
+    try:
+        from apps.config import LLM_CASSETTE_DIR, LLM_CASSETTE_LATENCY_SCALE, LLM_CASSETTE_MODE
+    except ImportError:
+        return
+    if LLM_CASSETTE_MODE != "off" and get_cassette() is None:
+        set_cassette(Cassette(LLM_CASSETTE_DIR, LLM_CASSETTE_MODE, LLM_CASSETTE_LATENCY_SCALE))
+        print(f"[CASSETTE] {LLM_CASSETTE_MODE} mode, {LLM_CASSETTE_DIR}")
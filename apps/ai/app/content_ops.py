@@ -0,0 +1,56 @@
+"""
+Copy-on-write updates of CV content for Postulae CV Generator.
+
+CV content stays plain JSON-like dicts and lists (LLM output, templates,
+DB column), but pipeline stages treat it as IMMUTABLE: a stage never
+mutates its input, it returns new content that shares every untouched
+section and entry with the input (structural sharing). A trim or an
+enrichment therefore only allocates the experiences it changes, and
+content can be kept (session, revert to base) without defensive copies.
+
+Rule for new code: build changed entries with these helpers (or
+{**entry, key: value}); never assign into a dict/list received as input.
+"""
+from typing import Any, Callable, Dict, Iterable, List
+
+
+def with_sections(content: Dict, **sections: Any) -> Dict:
+    """New content with top-level sections replaced (others shared)."""
+    updated = dict(content)
+    updated.update(sections)
+    return updated
+
+
+def without_sections(content: Dict, *keys: str) -> Dict:
+    """New content without the given top-level sections (others shared)."""
+    return {key: value for key, value in content.items() if key not in keys}
+
+
+def with_entry(content: Dict, section: str, index: int, **fields: Any) -> Dict:
+    """
+    New content where ONE entry of a list section has fields replaced.
+
+    Only the section list and that entry are copied.
+    """
+    entries = list(content[section])
+    entries[index] = {**entries[index], **fields}
+    return with_sections(content, **{section: entries})
+
+
+def map_entries(content: Dict, section: str, transform: Callable[[Dict], Dict]) -> Dict:
+    """
+    New content with transform applied to every entry of a list section.
+
+    transform returns a new entry, or the same entry object to keep it
+    shared. Missing sections are left as they are.
+    """
+    entries = content.get(section)
+    if not isinstance(entries, list):
+        return content
+    return with_sections(content, **{section: [transform(entry) for entry in entries]})
+
+
+def without_indices(items: List, indices: Iterable[int]) -> List:
+    """New list without the items at the given indices."""
+    dropped = set(indices)
+    return [item for index, item in enumerate(items) if index not in dropped]
@@ -0,0 +1,135 @@
+"""
+Per-generation deadline for Postulae CV Generator.
+
+A generation can get a time budget (GENERATION_DEADLINE_SECONDS, off by
+default). Before an optional or expensive stage, the pipeline asks the
+active deadline whether the stage still fits in the remaining time; when
+it does not, the stage takes its cheaper path and the degradation is recorded:
+- skip_fallback_extraction: no second GPT-4o call for empty work experience
+- skip_enrichment: no enrichment pass (content accepted below target PFR)
+- partial_enrichment: enrichment stops adding bullets when time runs out
+- estimate_measure: trim / enrichment decisions on the analytical PFR
+  estimate (TrimPlanner and step trims) instead of a real render each
+- defer_docx: DOCX built on download instead of during generation
+
+The deadline never fails a generation by itself: the one-page rule and
+the PFR thresholds still apply, only optional work is dropped.
+
+Usage:
+    with use_deadline(60) as deadline:
+        ...
+        if allows("enrichment"):
+            ...
+        else:
+            degrade("skip_enrichment", "12s left")
+    deadline.degradations  # ["skip_enrichment"]
+
+The deadline propagates through contextvars like the trace spans (see
+tracing.run_in_context for thread pools). Without an active deadline,
+allows() is always True.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from .tracing import current_span
+
+# Seconds a stage needs to be worth starting (typical duration, p90)
+STAGE_COSTS = {
+    "fallback_extraction": 15.0,   # GPT-4o JSON call on the full source text
+    "enrichment": 20.0,            # Whole enrichment pass + re-measure
+    "enrichment_bullet": 4.0,      # Individual retry of invalid batched bullets
+    "render_measure": 8.0,         # xhtml2pdf render + pdfplumber
+    "docx": 5.0,                   # Native DOCX build
+}
+
+
+class Deadline:
+    """Time budget of one generation and the degradations it caused."""
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            seconds: Time budget from now
+            clock: Monotonic clock (injectable for tests)
+
+        Raises:
+            ValueError: If seconds is not positive
+        """
+        if seconds <= 0:
+            raise ValueError("Deadline seconds must be > 0")
+        self.seconds = seconds
+        self._clock = clock
+        self._expires_at = clock() + seconds
+        self._degradations: List[str] = []
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Seconds left (negative once expired)."""
+        return self._expires_at - self._clock()
+
+    def allows(self, stage: str) -> bool:
+        """True if the stage's typical cost still fits in the remaining time."""
+        return self.remaining() >= STAGE_COSTS[stage]
+
+    def degrade(self, name: str, reason: str = "") -> None:
+        """Record a degradation (once per generation) on the deadline and the current span."""
+        with self._lock:
+            if name not in self._degradations:
+                self._degradations.append(name)
+        span = current_span()
+        if span is not None:
+            span.set(degraded=name)
+        print(f"[DEADLINE] {name} ({self.remaining():.1f}s left){': ' + reason if reason else ''}")
+
+    @property
+    def degradations(self) -> List[str]:
+        """Degradations applied so far, in the order they happened."""
+        with self._lock:
+            return list(self._degradations)
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "generation_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline active in the current context (None = unbounded)."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def use_deadline(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """
+    Give the block a time budget.
+
+    Nested generations (e.g. regeneration falling back to a full one) keep
+    the outer deadline. seconds None or <= 0 runs unbounded (yields None).
+    """
+    active = _current_deadline.get()
+    if active is not None or not seconds or seconds <= 0:
+        yield active
+        return
+
+    deadline = Deadline(seconds)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def allows(stage: str) -> bool:
+    """True if the stage fits in the active deadline (always True without one)."""
+    deadline = _current_deadline.get()
+    return deadline is None or deadline.allows(stage)
+
+
+def degrade(name: str, reason: str = "") -> None:
+    """Record a degradation on the active deadline (no-op without one)."""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.degrade(name, reason)
@@ -5,11 +5,12 @@ Measures content density to ensure CVs meet Postulae standards.
 Critical for Postulae's product constraint: exactly one page, optimal density.
 """
 import io
-from typing import Tuple
+from typing import Dict, Tuple
 
 import pdfplumber
 
 from .models import PageFillMetrics
+from .page_estimator import PageFillEstimator
 
 
 class DensityCalculator:
@@ -95,6 +96,24 @@ class DensityCalculator:
                 page_height=None,
             )
 
+    @staticmethod
+    def estimate_pfr(content: Dict, trim: bool = False) -> PageFillMetrics:
+        """
+        Predict Page Fill Rate from CV content WITHOUT rendering.
+
+        Simulates line wrapping of grid_template.html with reportlab font
+        metrics (~1 ms vs a full xhtml2pdf render + pdfplumber parse).
+        Typical error vs calculate_pfr() is below 1 point of PFR.
+
+        Args:
+            content: CV content dictionary (same input as LayoutEngine)
+            trim: Apply layout trimming if True (mirrors the render flag)
+
+        Returns:
+            Estimated PageFillMetrics (same semantics as calculate_pfr)
+        """
+        return PageFillEstimator.estimate_pfr(content, trim=trim)
+
     @classmethod
     def is_acceptable(cls, metrics: PageFillMetrics) -> bool:
         """
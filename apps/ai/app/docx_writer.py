@@ -0,0 +1,453 @@
+"""
+Native DOCX writer for Postulae CV Generator.
+
+Builds the OOXML package directly (zipfile + XML) from the SAME normalized
+data the PDF template renders (LayoutEngine.normalize_cv_data), mirroring
+grid_template.html: centered header, section titles with a rule, and a
+date | content | location grid (12% / 70% / 18%) per entry.
+
+Replaces the PDF → DOCX reconstruction (pdf2docx): no temp file, runs in
+milliseconds, and the document structure matches the PDF (real tables,
+real bullet lists, editable text).
+
+CRITICAL: typography mirrors grid_template.html. If the template changes,
+update the constants below.
+"""
+import io
+import re
+import zipfile
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from .layout import LayoutEngine
+
+
+# Units: twips (1/20 pt) for lengths, half-points for font sizes
+PAGE_WIDTH = 11906                  # A4
+PAGE_HEIGHT = 16838
+PAGE_MARGIN = 624                   # 11mm
+CONTENT_WIDTH = PAGE_WIDTH - 2 * PAGE_MARGIN
+MM = 56.7
+
+DATE_COL = int(CONTENT_WIDTH * 0.12)
+LOCATION_COL = int(CONTENT_WIDTH * 0.18)
+CONTENT_COL = CONTENT_WIDTH - DATE_COL - LOCATION_COL
+SKILLS_COL = CONTENT_WIDTH - DATE_COL
+CELL_PADDING = 45                   # padding: 0 3px
+
+FONT = "Times New Roman"
+SIZE_BODY = 19                      # 9.5pt
+SIZE_SMALL = 18                     # 9pt
+SIZE_ENTRY = 20                     # 10pt
+SIZE_TITLE = 22                     # 11pt
+SIZE_NAME = 32                      # 16pt
+LINK_COLOR = "0066CC"
+
+BULLET_INDENT = int(4 * MM) + 200   # ul margin 4mm + bullet glyph
+BULLET_HANGING = 200
+BULLET_NUM_ID = 1
+
+# Characters not allowed in XML 1.0
+_INVALID_XML = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Fixed timestamp: identical content → identical bytes (cacheable)
+_ZIP_DATE = (2024, 1, 1, 0, 0, 0)
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+HYPERLINK_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+
+
+def _text(value) -> str:
+    """XML-escaped text with invalid characters removed."""
+    return escape(_INVALID_XML.sub("", str(value)))
+
+
+def _attr(value) -> str:
+    """_text() for a double-quoted attribute value (quotes escaped too)."""
+    return escape(_INVALID_XML.sub("", str(value)), {'"': "&quot;"})
+
+
+def _run(
+    text: str,
+    size: int = SIZE_BODY,
+    bold: bool = False,
+    italic: bool = False,
+    caps: bool = False,
+    color: Optional[str] = None,
+) -> str:
+    """One text run."""
+    props = []
+    if bold:
+        props.append("<w:b/>")
+    if italic:
+        props.append("<w:i/>")
+    if caps:
+        props.append("<w:caps/>")
+    if color:
+        props.append(f'<w:color w:val="{color}"/>')
+    props.append(f'<w:sz w:val="{size}"/><w:szCs w:val="{size}"/>')
+    return (
+        f'<w:r><w:rPr>{"".join(props)}</w:rPr>'
+        f'<w:t xml:space="preserve">{_text(text)}</w:t></w:r>'
+    )
+
+
+def _paragraph(
+    runs: List[str],
+    align: Optional[str] = None,
+    before: int = 0,
+    after: int = 0,
+    line: int = 240,
+    numbered: bool = False,
+    border_bottom: bool = False,
+    keep_next: bool = False,
+) -> str:
+    """
+    One paragraph.
+
+    Args:
+        runs: Run XML fragments
+        align: left (default), center, right
+        before: Space before (twips)
+        after: Space after (twips)
+        line: Line spacing (240 = single, CSS line-height 1.2 → 288)
+        numbered: Bullet list item
+        border_bottom: Horizontal rule under the paragraph (section titles)
+        keep_next: Keep with next paragraph (titles)
+    """
+    props = []
+    if keep_next:
+        props.append("<w:keepNext/>")
+    if numbered:
+        props.append(f'<w:numPr><w:ilvl w:val="0"/><w:numId w:val="{BULLET_NUM_ID}"/></w:numPr>')
+    if border_bottom:
+        props.append('<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="000000"/></w:pBdr>')
+    props.append(f'<w:spacing w:before="{before}" w:after="{after}" w:line="{line}" w:lineRule="auto"/>')
+    if align:
+        props.append(f'<w:jc w:val="{align}"/>')
+    return f'<w:p><w:pPr>{"".join(props)}</w:pPr>{"".join(runs)}</w:p>'
+
+
+def _cell(width: int, paragraphs: List[str], padded: bool = False) -> str:
+    """One table cell (a cell must contain at least one paragraph)."""
+    margins = ""
+    if padded:
+        margins = (
+            f'<w:tcMar><w:left w:w="{CELL_PADDING}" w:type="dxa"/>'
+            f'<w:right w:w="{CELL_PADDING}" w:type="dxa"/></w:tcMar>'
+        )
+    body = "".join(paragraphs) or _paragraph([])
+    return f'<w:tc><w:tcPr><w:tcW w:w="{width}" w:type="dxa"/>{margins}</w:tcPr>{body}</w:tc>'
+
+
+def _table(widths: List[int], rows: List[List[str]]) -> str:
+    """Borderless fixed-layout table (one row per entry, rows never split)."""
+    grid = "".join(f'<w:gridCol w:w="{w}"/>' for w in widths)
+    borders = "".join(
+        f'<w:{side} w:val="nil"/>'
+        for side in ("top", "left", "bottom", "right", "insideH", "insideV")
+    )
+    body = "".join(
+        f'<w:tr><w:trPr><w:cantSplit/></w:trPr>{"".join(cells)}</w:tr>' for cells in rows
+    )
+    return (
+        f'<w:tbl><w:tblPr><w:tblW w:w="{sum(widths)}" w:type="dxa"/>'
+        f'<w:tblBorders>{borders}</w:tblBorders><w:tblLayout w:type="fixed"/>'
+        f'<w:tblCellMar><w:left w:w="0" w:type="dxa"/><w:right w:w="0" w:type="dxa"/></w:tblCellMar>'
+        f'</w:tblPr><w:tblGrid>{grid}</w:tblGrid>{body}</w:tbl>'
+    )
+
+
+class DocxWriter:
+    """Renders normalized CV data to a DOCX package mirroring the grid template."""
+
+    @staticmethod
+    def generate_docx_from_data(data: Dict, trim: bool = False) -> bytes:
+        """
+        Generate DOCX directly from CV data (same input as LayoutEngine).
+
+        Args:
+            data: CV content dictionary (not mutated)
+            trim: Apply layout trimming if True (same flag as the PDF render)
+
+        Returns:
+            DOCX bytes
+
+        Raises:
+            ValueError: If DOCX generation fails
+        """
+        try:
+            normalized = LayoutEngine.normalize_cv_data(data, trim=trim)
+            return DocxWriter.render_normalized(normalized)
+        except Exception as e:
+            raise ValueError(f"Failed to generate DOCX: {str(e)}")
+
+    @staticmethod
+    def render_normalized(data: Dict) -> bytes:
+        """
+        Render already-normalized template data to DOCX bytes.
+
+        Args:
+            data: Output of LayoutEngine.normalize_cv_data
+
+        Returns:
+            DOCX bytes
+        """
+        links: List[str] = []
+        body = "".join([
+            DocxWriter._header(data, links),
+            DocxWriter._education(data),
+            DocxWriter._experience(data),
+            DocxWriter._skills(data),
+            DocxWriter._interests(data),
+        ])
+        section = (
+            f'<w:sectPr><w:pgSz w:w="{PAGE_WIDTH}" w:h="{PAGE_HEIGHT}"/>'
+            f'<w:pgMar w:top="{PAGE_MARGIN}" w:right="{PAGE_MARGIN}" w:bottom="{PAGE_MARGIN}" '
+            f'w:left="{PAGE_MARGIN}" w:header="0" w:footer="0" w:gutter="0"/></w:sectPr>'
+        )
+        document = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}"><w:body>{body}{section}</w:body></w:document>'
+        )
+        return DocxWriter._package(document, links, str(data.get("name", "")))
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _header(data: Dict, links: List[str]) -> str:
+        """Centered name + contact line (address • phone • email link)."""
+        parts = [
+            _paragraph(
+                [_run(data.get("name", ""), size=SIZE_NAME, bold=True)],
+                align="center", after=40,
+            )
+        ]
+
+        runs: List[str] = []
+        for key in ("address", "phone"):
+            if data.get(key):
+                if runs:
+                    runs.append(_run(" • ", size=SIZE_SMALL))
+                runs.append(_run(data[key], size=SIZE_SMALL))
+        if data.get("email"):
+            if runs:
+                runs.append(_run(" • ", size=SIZE_SMALL))
+            links.append(f"mailto:{data['email']}")
+            runs.append(
+                f'<w:hyperlink r:id="rIdLink{len(links)}">'
+                f'{_run(data["email"], size=SIZE_SMALL, color=LINK_COLOR)}</w:hyperlink>'
+            )
+        parts.append(_paragraph(runs, align="center", after=int(5 * MM)))
+        return "".join(parts)
+
+    @staticmethod
+    def _section_title(title: str) -> str:
+        """Section title with the horizontal rule under it."""
+        return _paragraph(
+            [_run(title, size=SIZE_TITLE, bold=True, caps=True)],
+            after=int(1 * MM), border_bottom=True, keep_next=True,
+        )
+
+    @staticmethod
+    def _date_cell(entry: Dict) -> str:
+        """Start date (as in the template) + optional italic duration."""
+        date = str(entry.get("date", "")).replace("\n", " ").replace("\r", " ")
+        start = date.split("-")[0] if "-" in date else date
+        paragraphs = [_paragraph([_run(start.strip(), size=SIZE_SMALL)], line=264)]
+        if entry.get("duration"):
+            paragraphs.append(_paragraph([_run(entry["duration"], size=SIZE_SMALL, italic=True)], before=15))
+        return _cell(DATE_COL, paragraphs)
+
+    @staticmethod
+    def _location_cell(entry: Dict) -> str:
+        """Right-aligned location."""
+        location = str(entry.get("location", "")).replace("\n", " ").replace("\r", " ")
+        return _cell(LOCATION_COL, [_paragraph([_run(location, size=SIZE_SMALL)], align="right", line=264)])
+
+    @staticmethod
+    def _entry_rows(entries: List[Dict], content_cell) -> List[List[str]]:
+        """One grid row per entry; the gap between entries follows the template."""
+        rows = []
+        for idx, entry in enumerate(entries):
+            is_last = idx == len(entries) - 1
+            rows.append([
+                DocxWriter._date_cell(entry),
+                content_cell(entry, 0 if is_last else 240),
+                DocxWriter._location_cell(entry),
+            ])
+        return rows
+
+    @staticmethod
+    def _education(data: Dict) -> str:
+        """FORMATION section."""
+        def content_cell(edu: Dict, gap: int) -> str:
+            paragraphs = [
+                _paragraph([_run(edu.get("institution", ""), size=SIZE_ENTRY, bold=True, caps=True)])
+            ]
+            if edu.get("degree"):
+                paragraphs.append(_paragraph(
+                    [_run(edu["degree"], size=SIZE_ENTRY, bold=True, italic=True)], before=30,
+                ))
+            details = [str(edu[k]) for k in ("honors", "major") if edu.get(k)]
+            for i, text in enumerate(details):
+                paragraphs.append(_paragraph(
+                    [_run(text, size=SIZE_SMALL)], before=int(1.5 * MM) if i == 0 else 0, line=288,
+                ))
+            if edu.get("coursework"):
+                text = "Relevant coursework: " + ", ".join(str(c) for c in edu["coursework"])
+                paragraphs.append(_paragraph([_run(text, size=SIZE_SMALL)], before=int(1.5 * MM), line=288))
+            paragraphs[-1] = paragraphs[-1].replace('w:after="0"', f'w:after="{gap}"', 1)
+            return _cell(CONTENT_COL, paragraphs, padded=True)
+
+        education = data.get("education") or []
+        parts = [DocxWriter._section_title("FORMATION")]
+        if education:
+            parts.append(_table(
+                [DATE_COL, CONTENT_COL, LOCATION_COL],
+                DocxWriter._entry_rows(education, content_cell),
+            ))
+        return "".join(parts)
+
+    @staticmethod
+    def _experience(data: Dict) -> str:
+        """EXPÉRIENCES PROFESSIONNELLES section."""
+        def content_cell(exp: Dict, gap: int) -> str:
+            paragraphs = [
+                _paragraph([_run(exp.get("company", ""), size=SIZE_ENTRY, bold=True, caps=True)])
+            ]
+            if exp.get("position"):
+                paragraphs.append(_paragraph(
+                    [_run(exp["position"], size=SIZE_ENTRY, bold=True, italic=True)], before=30,
+                ))
+            for i, bullet in enumerate(exp.get("bullets") or []):
+                paragraphs.append(_paragraph(
+                    [_run(bullet)], before=int(3.5 * MM) if i == 0 else 0,
+                    after=int(1 * MM), line=288, numbered=True,
+                ))
+            if gap:
+                paragraphs[-1] = re.sub(r'w:after="\d+"', f'w:after="{gap}"', paragraphs[-1], count=1)
+            return _cell(CONTENT_COL, paragraphs, padded=True)
+
+        experiences = data.get("experience") or []
+        parts = [DocxWriter._section_title("EXPÉRIENCES PROFESSIONNELLES")]
+        if experiences:
+            parts.append(_table(
+                [DATE_COL, CONTENT_COL, LOCATION_COL],
+                DocxWriter._entry_rows(experiences, content_cell),
+            ))
+        return "".join(parts)
+
+    @staticmethod
+    def _list_section(title: str, items: List[Tuple[str, str]]) -> str:
+        """Spacer + bullet list section (skills / interests), items = (label, text)."""
+        paragraphs = []
+        for label, text in items:
+            runs = [_run(f"{label} ", bold=True)] if label else []
+            runs.append(_run(text))
+            paragraphs.append(_paragraph(runs, after=int(1 * MM), line=288, numbered=True))
+        return DocxWriter._section_title(title) + _table(
+            [DATE_COL, SKILLS_COL],
+            [[_cell(DATE_COL, []), _cell(SKILLS_COL, paragraphs, padded=True)]],
+        )
+
+    @staticmethod
+    def _skills(data: Dict) -> str:
+        """LANGUES & COMPÉTENCES section."""
+        items = []
+        for key, label in (("languages", "Language:"), ("it_skills", "IT:"), ("databases", "Financial Databases:")):
+            values = data.get(key) or []
+            if values:
+                items.append((label, ", ".join(str(v) for v in values)))
+        return DocxWriter._list_section("LANGUES & COMPÉTENCES", items)
+
+    @staticmethod
+    def _interests(data: Dict) -> str:
+        """ACTIVITÉS & CENTRES D'INTÉRÊT section (omitted when empty, as in the template)."""
+        interests = data.get("interests") or []
+        if not interests:
+            return ""
+        return DocxWriter._list_section(
+            "ACTIVITÉS & CENTRES D'INTÉRÊT", [("", str(i)) for i in interests]
+        )
+
+    # ------------------------------------------------------------------
+    # Package
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _package(document: str, links: List[str], title: str) -> bytes:
+        """Zip the OOXML parts (fixed timestamps: deterministic output)."""
+        link_rels = "".join(
+            f'<Relationship Id="rIdLink{i}" Type="{HYPERLINK_REL}" Target="{_attr(target)}" TargetMode="External"/>'
+            for i, target in enumerate(links, start=1)
+        )
+        parts = {
+            "[Content_Types].xml": (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+                '<Override PartName="/word/numbering.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+                '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+                '</Types>'
+            ),
+            "_rels/.rels": (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f'<Relationships xmlns="{REL_NS}">'
+                '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+                '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>'
+                '</Relationships>'
+            ),
+            "docProps/core.xml": (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+                'xmlns:dc="http://purl.org/dc/elements/1.1/">'
+                f'<dc:title>{_text(title)} — Resume</dc:title><dc:creator>Postulae</dc:creator>'
+                '</cp:coreProperties>'
+            ),
+            "word/_rels/document.xml.rels": (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f'<Relationships xmlns="{REL_NS}">'
+                '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+                '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering" Target="numbering.xml"/>'
+                f'{link_rels}</Relationships>'
+            ),
+            "word/styles.xml": (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f'<w:styles xmlns:w="{W_NS}"><w:docDefaults>'
+                f'<w:rPrDefault><w:rPr><w:rFonts w:ascii="{FONT}" w:hAnsi="{FONT}" w:eastAsia="{FONT}" w:cs="{FONT}"/>'
+                f'<w:color w:val="000000"/><w:sz w:val="{SIZE_BODY}"/><w:szCs w:val="{SIZE_BODY}"/><w:lang w:val="fr-FR"/></w:rPr></w:rPrDefault>'
+                '<w:pPrDefault><w:pPr><w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+                '</w:docDefaults>'
+                '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+                '</w:styles>'
+            ),
+            "word/numbering.xml": (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f'<w:numbering xmlns:w="{W_NS}">'
+                '<w:abstractNum w:abstractNumId="0"><w:multiLevelType w:val="singleLevel"/>'
+                '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/><w:lvlText w:val="•"/>'
+                f'<w:lvlJc w:val="left"/><w:pPr><w:ind w:left="{BULLET_INDENT}" w:hanging="{BULLET_HANGING}"/></w:pPr>'
+                f'<w:rPr><w:rFonts w:ascii="{FONT}" w:hAnsi="{FONT}"/></w:rPr></w:lvl></w:abstractNum>'
+                f'<w:num w:numId="{BULLET_NUM_ID}"><w:abstractNumId w:val="0"/></w:num>'
+                '</w:numbering>'
+            ),
+            "word/document.xml": document,
+        }
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as package:
+            for name, xml in parts.items():
+                package.writestr(
+                    zipfile.ZipInfo(name, date_time=_ZIP_DATE),
+                    xml.encode("utf-8"),
+                    compress_type=zipfile.ZIP_DEFLATED,
+                )
+        return buffer.getvalue()
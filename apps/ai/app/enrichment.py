@@ -14,7 +14,8 @@ PFR Gap Estimation:
 Incremental Process (SINGLE PASS):
 1. Calculate PFR gap
 2. Estimate bullets needed (max 10 per pass for safety)
-3. Add bullets to experiences with fewest bullets
+3. Add bullets to experiences with fewest bullets (ONE batched LLM call,
+   individual calls only for invalid items)
 4. Maximum: +1 bullet per experience (ceiling: 5 total per experience)
 5. NO new experiences created
 6. NO global rewriting
@@ -27,19 +28,15 @@ Hard Execution Limits:
 
 This ensures predictable, stable, and fast enrichment without unbounded loops.
 """
-from copy import deepcopy
-from typing import Dict, Optional, List
+import asyncio
+from typing import Dict, Optional, List, Tuple
 import json
-import os
-
-import openai
-from dotenv import load_dotenv
 
+from .content_ops import map_entries, with_entry, without_sections
+from .deadline import allows as deadline_allows, degrade
+from .model_registry import request_options
 from .models import PageFillMetrics
-
-# Load OpenAI API key
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
+from .llm_client import chat_completion, achat_completion
 
 
 class ContentEnricher:
@@ -64,6 +61,11 @@ class ContentEnricher:
     # but there is NO RETRY if the pass doesn't reach the target PFR
     MAX_BULLETS_TO_ADD_PER_PASS = 10  # Safety limit per enrichment pass
 
+    # Batched generation: one JSON call for all selected experiences; a bullet
+    # outside these bounds (or missing / duplicated) is regenerated individually
+    BATCH_BULLET_MIN_WORDS = 8
+    BATCH_BULLET_MAX_WORDS = 40
+
     @staticmethod
     def incremental_enrich_content(
         content: Dict,
@@ -71,6 +73,7 @@ class ContentEnricher:
         domain: str = "finance",
         language: str = "en",
         original_text: Optional[str] = None,
+        target_pfr: Optional[float] = None,
     ) -> Dict:
         """
         INCREMENTAL enrichment for low-density CVs (< 90% PFR).
@@ -79,7 +82,8 @@ class ContentEnricher:
         1. Calculate PFR gap: target (92%) - current PFR
         2. Estimate bullets needed: gap / 2.5% (rounded DOWN)
         3. Identify experiences with fewest bullets
-        4. Add calculated number of bullets (max 10 per pass) via LLM
+        4. Add calculated number of bullets (max 10 per pass) via ONE batched
+           LLM call; only invalid items are regenerated individually
         5. NO global rewriting, NO new experiences
 
         HARD EXECUTION LIMITS (NON-NEGOTIABLE):
@@ -100,28 +104,125 @@ class ContentEnricher:
             domain: Target domain
             language: Output language
             original_text: Original CV text for context (unused in incremental mode)
+            target_pfr: PFR to aim for (default: TARGET_PFR). Pass a lower value
+                        for conservative enrichment instead of mutating TARGET_PFR.
 
         Returns:
             Incrementally enriched content dictionary
         """
-        enriched = deepcopy(content)
+        # Copy-on-write: content is shared, each enriched experience is copied
+        enriched = content
+        selected = ContentEnricher._select_experiences_to_enrich(
+            enriched, current_metrics, target_pfr
+        )
+
+        # Step 5: Add bullets to selected experiences (SINGLE PASS, no retry)
+        if not selected:  # Nothing to add: no LLM call
+            return enriched
+
+        experiences = [exp for _, exp in selected]
+        if len(experiences) == 1:
+            new_bullets = [ContentEnricher._generate_single_bullet(experiences[0], domain, language)]
+        else:
+            new_bullets = ContentEnricher._generate_batch_bullets(experiences, domain, language)
+            for i in ContentEnricher._bullets_to_retry(new_bullets):
+                # Generation deadline: keep the bullets generated so far
+                if not deadline_allows("enrichment_bullet"):
+                    degrade("partial_enrichment", ContentEnricher._added_summary(new_bullets))
+                    break
+                new_bullets[i] = ContentEnricher._generate_single_bullet(experiences[i], domain, language)
+
+        for (exp_idx, _), new_bullet in zip(selected, new_bullets):
+            enriched = ContentEnricher._append_bullet(enriched, exp_idx, new_bullet)
+
+        # CRITICAL: Accept result even if bullets_added < bullets_needed
+        # NO RETRY - single pass only as per hard execution limits
+        return enriched
+
+    @staticmethod
+    async def aincremental_enrich_content(
+        content: Dict,
+        current_metrics: PageFillMetrics,
+        domain: str = "finance",
+        language: str = "en",
+        original_text: Optional[str] = None,
+        target_pfr: Optional[float] = None,
+    ) -> Dict:
+        """
+        Async counterpart of incremental_enrich_content().
+
+        Same selection rules and hard limits; invalid items of the batched
+        call are regenerated concurrently (still ONE pass, no retry).
+
+        Returns:
+            Incrementally enriched content dictionary
+        """
+        # Copy-on-write: content is shared, each enriched experience is copied
+        enriched = content
+        selected = ContentEnricher._select_experiences_to_enrich(
+            enriched, current_metrics, target_pfr
+        )
+
+        if not selected:  # Nothing to add: no LLM call
+            return enriched
+
+        experiences = [exp for _, exp in selected]
+        if len(experiences) == 1:
+            new_bullets = [await ContentEnricher._agenerate_single_bullet(experiences[0], domain, language)]
+        else:
+            new_bullets = await ContentEnricher._agenerate_batch_bullets(experiences, domain, language)
+            retry = ContentEnricher._bullets_to_retry(new_bullets)
+            if retry and not deadline_allows("enrichment_bullet"):
+                degrade("partial_enrichment", ContentEnricher._added_summary(new_bullets))
+                retry = []
+            retried = await asyncio.gather(*[
+                ContentEnricher._agenerate_single_bullet(experiences[i], domain, language)
+                for i in retry
+            ])
+            for i, new_bullet in zip(retry, retried):
+                new_bullets[i] = new_bullet
+
+        for (exp_idx, _), new_bullet in zip(selected, new_bullets):
+            enriched = ContentEnricher._append_bullet(enriched, exp_idx, new_bullet)
+
+        return enriched
+
+    @staticmethod
+    def _select_experiences_to_enrich(
+        enriched: Dict,
+        current_metrics: PageFillMetrics,
+        target_pfr: Optional[float] = None,
+    ) -> List[Tuple[int, Dict]]:
+        """
+        Steps 1-4: decide which experiences receive one new bullet.
+
+        Args:
+            enriched: Content being enriched
+            current_metrics: Current page fill metrics
+            target_pfr: PFR to aim for (default: TARGET_PFR)
+
+        Returns:
+            List of (experience index, experience) to enrich, fewest bullets first
+        """
         current_pfr = current_metrics.fill_percentage
+        if target_pfr is None:
+            target_pfr = ContentEnricher.TARGET_PFR
 
         # Step 1: Calculate PFR gap
-        pfr_gap = max(0, ContentEnricher.TARGET_PFR - current_pfr)
+        pfr_gap = max(0, target_pfr - current_pfr)
 
         # Step 2: Estimate bullets needed (rounded DOWN for safety)
         bullets_needed = int(pfr_gap / ContentEnricher.BULLET_PFR_IMPACT)
 
         if bullets_needed <= 0:
             # Already at target, no enrichment needed
-            return enriched
+            return []
 
         # Step 3: Identify experiences with fewest bullets (prioritize enrichment)
         experiences = enriched.get("experience", [])
         if not experiences:
             # No experiences to enrich, return as-is
-            return enriched
+            return []
 
         # Count bullets per experience and sort by count (ascending)
         exp_with_counts = []
@@ -138,44 +239,33 @@ class ContentEnricher:
             ContentEnricher.MAX_BULLETS_TO_ADD_PER_PASS
         )  # Max +1 per exp, with safety cap
 
-        # Select experiences to enrich (those with fewest bullets)
-        experiences_to_enrich = exp_with_counts[:bullets_to_add]
-
-        # Step 5: Add bullets to selected experiences (SINGLE PASS, no retry)
-        bullets_added = 0
-
-        for exp_idx, current_bullet_count, exp in experiences_to_enrich:
-            # Skip if experience already has max bullets
-            if current_bullet_count >= ContentEnricher.MAX_BULLETS_PER_EXPERIENCE:
-                continue
+        # Select experiences to enrich (those with fewest bullets),
+        # skipping experiences that already have max bullets
+        return [
+            (exp_idx, exp)
+            for exp_idx, current_bullet_count, exp in exp_with_counts[:bullets_to_add]
+            if current_bullet_count < ContentEnricher.MAX_BULLETS_PER_EXPERIENCE
+        ]
 
-            # Call LLM to generate 1 contextual bullet for this experience
-            new_bullet = ContentEnricher._generate_single_bullet(
-                experience=exp,
-                domain=domain,
-                language=language,
-            )
-
-            if new_bullet:
-                # Add the new bullet to the experience
-                if "bullets" not in enriched["experience"][exp_idx]:
-                    enriched["experience"][exp_idx]["bullets"] = []
-                enriched["experience"][exp_idx]["bullets"].append(new_bullet)
-                bullets_added += 1
+    @staticmethod
+    def _append_bullet(enriched: Dict, exp_idx: int, new_bullet: Optional[str]) -> Dict:
+        """
+        Append a generated bullet to an experience (no-op if generation failed).
 
-        # CRITICAL: Accept result even if bullets_added < bullets_needed
-        # NO RETRY - single pass only as per hard execution limits
-        return enriched
+        Returns:
+            New content sharing every other experience (enriched is not modified)
+        """
+        if not new_bullet:
+            return enriched
+        bullets = enriched["experience"][exp_idx].get("bullets", [])
+        return with_entry(enriched, "experience", exp_idx, bullets=[*bullets, new_bullet])
 
     @staticmethod
-    def _generate_single_bullet(
+    def _build_single_bullet_messages(
         experience: Dict, domain: str, language: str
-    ) -> Optional[str]:
+    ) -> List[Dict]:
         """
-        Generate a SINGLE contextual bullet for a given experience.
-
-        Uses LLM to expand based on existing context (role, company, existing bullets).
-        Does NOT invent facts.
+        Build LLM messages asking for ONE contextual bullet for an experience.
 
         Args:
             experience: Experience dictionary with title, company, bullets
@@ -183,7 +273,7 @@ class ContentEnricher:
             language: Output language (fr or en)
 
         Returns:
-            Single bullet point string, or None if generation fails
+            Chat messages
         """
         # Extract experience context
         title = experience.get("title", "")
@@ -227,38 +317,245 @@ Generate ONE additional bullet point that:
 
 Respond ONLY with the bullet point, no dash, no number."""
 
+        return [
+            {
+                "role": "system",
+                "content": "You are a professional CV writer. Generate contextual, factual bullet points.",
+            },
+            {"role": "user", "content": prompt},
+        ]
+
+    @staticmethod
+    def _clean_bullet(bullet: str) -> Optional[str]:
+        """Clean up an LLM bullet (remove dash/number if present)."""
+        bullet = bullet.strip()
+        if bullet.startswith("- "):
+            bullet = bullet[2:]
+        if bullet.startswith("• "):
+            bullet = bullet[2:]
+        if bullet and bullet[0].isdigit() and bullet[1:3] in [". ", ") "]:
+            bullet = bullet[3:]
+
+        return bullet if bullet else None
+
+    @staticmethod
+    def _generate_single_bullet(
+        experience: Dict, domain: str, language: str
+    ) -> Optional[str]:
+        """
+        Generate a SINGLE contextual bullet for a given experience.
+
+        Uses LLM to expand based on existing context (role, company, existing bullets).
+        Does NOT invent facts.
+
+        Args:
+            experience: Experience dictionary with title, company, bullets
+            domain: Target domain (finance, consulting, etc.)
+            language: Output language (fr or en)
+
+        Returns:
+            Single bullet point string, or None if generation fails
+        """
         try:
-            # Call LLM (OpenAI GPT-4)
-            response = openai.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional CV writer. Generate contextual, factual bullet points.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.7,
-                max_tokens=100,
+            # Call LLM (model of the "enrichment" profile)
+            response = chat_completion(
+                call_type="enrichment",
+                messages=ContentEnricher._build_single_bullet_messages(
+                    experience, domain, language
+                ),
+                **request_options("enrichment"),
             )
 
-            bullet = response.choices[0].message.content.strip()
+            return ContentEnricher._clean_bullet(response.choices[0].message.content)
+
+        except Exception as e:
+            # If LLM call fails, return None (no enrichment for this experience)
+            print(f"Warning: Failed to generate bullet: {e}")
+            return None
+
+    @staticmethod
+    async def _agenerate_single_bullet(
+        experience: Dict, domain: str, language: str
+    ) -> Optional[str]:
+        """
+        Async counterpart of _generate_single_bullet().
 
-            # Clean up (remove dash/number if present)
-            if bullet.startswith("- "):
-                bullet = bullet[2:]
-            if bullet.startswith("• "):
-                bullet = bullet[2:]
-            if bullet and bullet[0].isdigit() and bullet[1:3] in [". ", ") "]:
-                bullet = bullet[3:]
+        Returns:
+            Single bullet point string, or None if generation fails
+        """
+        try:
+            response = await achat_completion(
+                call_type="enrichment",
+                messages=ContentEnricher._build_single_bullet_messages(
+                    experience, domain, language
+                ),
+                **request_options("enrichment"),
+            )
 
-            return bullet if bullet else None
+            return ContentEnricher._clean_bullet(response.choices[0].message.content)
 
         except Exception as e:
-            # If LLM call fails, return None (no enrichment for this experience)
             print(f"Warning: Failed to generate bullet: {e}")
             return None
 
+    @staticmethod
+    def _batch_bullet_request(experiences: List[Dict], domain: str, language: str) -> Dict:
+        """
+        Build ONE chat request asking for one new bullet per experience (JSON).
+
+        Args:
+            experiences: Experiences to enrich (ids are their positions)
+            domain: Target domain (finance, consulting, etc.)
+            language: Output language (fr or en)
+
+        Returns:
+            chat_completion() keyword arguments
+        """
+        blocks = []
+        for idx, exp in enumerate(experiences):
+            bullets = chr(10).join(f'- {b}' for b in exp.get("bullets", []))
+            blocks.append(f'[id {idx}] {exp.get("title", "")} | {exp.get("company", "")}\n{bullets}')
+        experiences_text = "\n\n".join(blocks)
+
+        if language == "fr":
+            prompt = f"""Tu es un expert en rédaction de CV pour le secteur {domain}.
+
+Expériences (id, rôle | entreprise, bullets existants):
+{experiences_text}
+
+Pour CHAQUE expérience, génère UN SEUL bullet point supplémentaire qui:
+1. Est contextuel au rôle et aux bullets existants de CETTE expérience
+2. Ajoute une dimension manquante (scope, méthode, outils, impact, coordination)
+3. Est quantifié si possible (métriques, pourcentages, tailles)
+4. N'invente PAS de faits
+5. Fait 15-25 mots, sans tiret ni numéro
+6. Style: professionnel, finance/conseil
+
+Réponds UNIQUEMENT en JSON: {{"bullets": [{{"id": 0, "bullet": "..."}}, ...]}} avec exactement un élément par id."""
+
+        else:  # English
+            prompt = f"""You are a CV writing expert for {domain} sector.
+
+Experiences (id, role | company, existing bullets):
+{experiences_text}
+
+For EACH experience, generate ONE additional bullet point that:
+1. Is contextual to the role and existing bullets of THAT experience
+2. Adds a missing dimension (scope, method, tools, impact, coordination)
+3. Is quantified if possible (metrics, percentages, sizes)
+4. Does NOT invent facts
+5. Is 15-25 words, no dash, no number
+6. Style: professional, finance/consulting tone
+
+Respond ONLY in JSON: {{"bullets": [{{"id": 0, "bullet": "..."}}, ...]}} with exactly one item per id."""
+
+        return {
+            **request_options("enrichment"),
+            "call_type": "enrichment",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a professional CV writer. Generate contextual, factual bullet points.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": 80 * len(experiences),
+            "response_format": {"type": "json_object"},
+        }
+
+    @staticmethod
+    def _parse_batch_bullets(raw: str, experiences: List[Dict]) -> List[Optional[str]]:
+        """
+        Validate the batched answer item by item.
+
+        An item is kept if its id is known and not repeated, and its bullet is
+        a string of BATCH_BULLET_MIN_WORDS-BATCH_BULLET_MAX_WORDS words that
+        repeats neither an existing bullet nor another new one.
+
+        Returns:
+            One bullet per experience, None where the item is missing or invalid
+        """
+        bullets: List[Optional[str]] = [None] * len(experiences)
+        try:
+            items = json.loads(raw).get("bullets")
+        except (TypeError, ValueError, AttributeError):
+            return bullets
+        if not isinstance(items, list):
+            return bullets
+
+        seen = set()
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            idx, bullet = item.get("id"), item.get("bullet")
+            if type(idx) is not int or not 0 <= idx < len(experiences) or bullets[idx] is not None:
+                continue
+            if not isinstance(bullet, str) or not (bullet := ContentEnricher._clean_bullet(bullet)):
+                continue
+            words = len(bullet.split())
+            if not ContentEnricher.BATCH_BULLET_MIN_WORDS <= words <= ContentEnricher.BATCH_BULLET_MAX_WORDS:
+                continue
+            existing = {b.strip().lower() for b in experiences[idx].get("bullets", [])}
+            if bullet.lower() in existing or bullet.lower() in seen:
+                continue
+            seen.add(bullet.lower())
+            bullets[idx] = bullet
+        return bullets
+
+    @staticmethod
+    def _generate_batch_bullets(
+        experiences: List[Dict], domain: str, language: str
+    ) -> List[Optional[str]]:
+        """
+        Generate one bullet per experience in a single LLM call.
+
+        Returns:
+            One bullet per experience, None for items to regenerate individually
+        """
+        try:
+            response = chat_completion(
+                **ContentEnricher._batch_bullet_request(experiences, domain, language)
+            )
+            return ContentEnricher._parse_batch_bullets(response.choices[0].message.content, experiences)
+
+        except Exception as e:
+            print(f"Warning: Failed to generate bullets in batch: {e}")
+            return [None] * len(experiences)
+
+    @staticmethod
+    async def _agenerate_batch_bullets(
+        experiences: List[Dict], domain: str, language: str
+    ) -> List[Optional[str]]:
+        """
+        Async counterpart of _generate_batch_bullets().
+
+        Returns:
+            One bullet per experience, None for items to regenerate individually
+        """
+        try:
+            response = await achat_completion(
+                **ContentEnricher._batch_bullet_request(experiences, domain, language)
+            )
+            return ContentEnricher._parse_batch_bullets(response.choices[0].message.content, experiences)
+
+        except Exception as e:
+            print(f"Warning: Failed to generate bullets in batch: {e}")
+            return [None] * len(experiences)
+
+    @staticmethod
+    def _bullets_to_retry(bullets: List[Optional[str]]) -> List[int]:
+        """Positions of the batch items to regenerate with individual calls."""
+        retry = [i for i, bullet in enumerate(bullets) if bullet is None]
+        if retry:
+            print(f"[ENRICHMENT] Batch: {len(bullets) - len(retry)}/{len(bullets)} bullets valid, "
+                  f"{len(retry)} individual call(s)")
+        return retry
+
+    @staticmethod
+    def _added_summary(bullets: List[Optional[str]]) -> str:
+        """Degradation detail: bullets generated out of bullets selected."""
+        return f"{sum(bullet is not None for bullet in bullets)}/{len(bullets)} bullets added"
+
     @staticmethod
     def aggressive_enrich_content(
         content: Dict,
@@ -335,39 +632,23 @@ Respond ONLY with the bullet point, no dash, no number."""
         Returns:
             Trimmed content
         """
-        trimmed = deepcopy(content)
+        # Copy-on-write: only the sections and experiences trimmed are copied
+        trimmed = dict(content)
 
         if step == 1:
             # LIGHT TRIM: Shorten bullet length slightly, keep all experiences
-            for exp in trimmed.get("experience", []):
-                if "bullets" in exp:
-                    # Shorten bullets to 85% (remove filler words)
-                    shortened_bullets = []
-                    for bullet in exp["bullets"]:
-                        words = bullet.split()
-                        target_words = max(10, int(len(words) * 0.85))
-                        shortened = " ".join(words[:target_words])
-                        if not shortened.endswith("."):
-                            shortened += "..."
-                        shortened_bullets.append(shortened)
-                    exp["bullets"] = shortened_bullets
+            # (bullets to 85%, remove filler words)
+            trimmed = map_entries(
+                trimmed, "experience",
+                lambda exp: ContentEnricher._shorten_bullets(exp, ratio=0.85),
+            )
 
         elif step == 2:
             # MODERATE TRIM: Limit to 3 bullets per exp, shorten to 80%
-            for exp in trimmed.get("experience", []):
-                if "bullets" in exp:
-                    # Keep only 3 bullets
-                    exp["bullets"] = exp["bullets"][:3]
-                    # Shorten to 80%
-                    shortened_bullets = []
-                    for bullet in exp["bullets"]:
-                        words = bullet.split()
-                        target_words = max(10, int(len(words) * 0.80))
-                        shortened = " ".join(words[:target_words])
-                        if not shortened.endswith("."):
-                            shortened += "..."
-                        shortened_bullets.append(shortened)
-                    exp["bullets"] = shortened_bullets
+            trimmed = map_entries(
+                trimmed, "experience",
+                lambda exp: ContentEnricher._shorten_bullets(exp, ratio=0.80, keep=3),
+            )
 
             # Limit education to 2 entries
             if "education" in trimmed and len(trimmed["education"]) > 2:
@@ -376,10 +657,10 @@ Respond ONLY with the bullet point, no dash, no number."""
         elif step == 3:
             # AGGRESSIVE TRIM: Minimal content (last resort)
             if "experience" in trimmed:
-                trimmed["experience"] = trimmed["experience"][:2]
-                for exp in trimmed["experience"]:
-                    if "bullets" in exp:
-                        exp["bullets"] = exp["bullets"][:2]
+                trimmed["experience"] = [
+                    {**exp, "bullets": exp["bullets"][:2]} if "bullets" in exp else exp
+                    for exp in trimmed["experience"][:2]
+                ]
 
             if "education" in trimmed:
                 trimmed["education"] = trimmed["education"][:2]
@@ -392,7 +673,32 @@ Respond ONLY with the bullet point, no dash, no number."""
             )[:2]
 
             # Remove certifications
-            if "certifications" in trimmed:
-                del trimmed["certifications"]
+            trimmed = without_sections(trimmed, "certifications")
 
         return trimmed
+
+    @staticmethod
+    def _shorten_bullets(exp: Dict, ratio: float, keep: Optional[int] = None) -> Dict:
+        """
+        New experience with its bullets cut to `ratio` of their words.
+
+        Args:
+            exp: Experience dictionary (not modified)
+            ratio: Share of words kept per bullet (min 10 words)
+            keep: Keep only the first N bullets first (None = all)
+
+        Returns:
+            Shortened copy, or exp itself when it has no bullets
+        """
+        if "bullets" not in exp:
+            return exp
+        bullets = exp["bullets"] if keep is None else exp["bullets"][:keep]
+        shortened_bullets = []
+        for bullet in bullets:
+            words = bullet.split()
+            target_words = max(10, int(len(words) * ratio))
+            shortened = " ".join(words[:target_words])
+            if not shortened.endswith("."):
+                shortened += "..."
+            shortened_bullets.append(shortened)
+        return {**exp, "bullets": shortened_bullets}
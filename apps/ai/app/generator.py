@@ -16,27 +16,73 @@ HARD EXECUTION LIMITS (NON-NEGOTIABLE):
 - Accept results even if outside [90-95%] to avoid loops
 
 PERFORMANCE-OPTIMIZED FLOW (< 1 minute target):
-1. Generate base content for BOTH FR and EN
+1. Generate base content for BOTH FR and EN (concurrently)
 2. Measure PFR for both languages
 3. Identify the LOWER PFR language
 4. If PFR < 65%: STOP and return blocking payload
 5. If 65 ≤ PFR < 90%: Apply SINGLE enrichment pass per language (no retry loops)
-6. If PFR > 95%: Apply SINGLE trimming pass (no retry loops)
+6. If PFR > 95%: Apply SINGLE planned trimming pass (minimal cuts, no retry loops)
 7. Accept result even if outside [90-95%] to avoid regeneration
 
-Always generates BOTH FR and EN.
+Decisions (steps 2-6) use the analytical PFR estimate by default
+(measure_mode="estimate"): the real PDF is rendered only for the final
+artifact and for the rare estimates within ESTIMATE_CONFIRM_MARGIN of the
+page break. measure_mode="render" renders and measures at every step.
+
+Every public generate call records a span tree (see tracing.py), returned
+on CVGenerationResult.trace and emitted to the registered trace sinks. The
+LLM calls of the span tree (tokens, retries, latency, estimated cost) are
+summed per call type and model on CVGenerationResult.usage (see usage.py).
+
+With second_language_mode="translate", the second language is derived by
+translating the first language's final content (length-constrained)
+instead of being regenerated, enriched and trimmed again.
+
+regenerate_from_data() diffs a new form against the user's last generation:
+contact / skills edits only re-render, an edited experience has only its
+bullets rewritten; structural changes fall back to full generation.
+
+Each generate call runs under a deadline (deadline_seconds, see deadline.py):
+when the remaining budget is short, stages take a cheaper path (skip
+enrichment, trim decisions on the estimated PFR, deferred DOCX) and the
+result lists them in CVGenerationResult.degradations.
+
+Always generates BOTH FR and EN. When generation is split in two phases,
+Phase 2 reuses the GenerationSession of Phase 1 (extracted text, analysis)
+instead of uploading and extracting the same PDF again.
 """
+import asyncio
+import hashlib
 import tempfile
 import os
-from typing import Dict, List, Optional, Tuple
-from copy import deepcopy
-
-from .models import CVContent, CVGenerationResult, PageFillMetrics
-from .llm_client import extract_text_from_pdf_bytes, generate_cv_content
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .models import CVContent, CVGenerationResult, GenerationSession, PageFillMetrics
+from .llm_client import (
+    extract_text_from_pdf_bytes,
+    aextract_text_from_pdf_bytes,
+    generate_cv_content,
+    agenerate_cv_content,
+    translate_cv_content,
+    atranslate_cv_content,
+    rewrite_experience_bullets,
+)
 from .density import DensityCalculator
+from .page_estimator import ESTIMATE_ERROR_MARGIN, PageFillEstimator
 from .layout import LayoutEngine
+from .docx_writer import DocxWriter
 from .enrichment import ContentEnricher
 from .content_analyzer import ContentAnalyzer
+from .cache import RenderCache, get_render_cache
+from .content_ops import map_entries, with_sections
+from .deadline import Deadline, allows as deadline_allows, degrade, use_deadline
+from .trim_planner import TrimPlanner
+from .incremental import apply_experience_header, apply_render_fields, plan_regeneration
+from .tracing import Span, configure_from_settings, run_in_context, span, start_trace
+from .usage import usage_from_trace
+
+T = TypeVar("T")
 
 
 class CVGenerator:
@@ -47,11 +93,101 @@ class CVGenerator:
     Enforces Postulae PFR constraints.
     """
 
-    def __init__(self):
+    # Bounded pool for per-language work (FR + EN run concurrently)
+    MAX_LANGUAGE_WORKERS = 2
+
+    # PFR measurement used for pipeline decisions (block / enrich / trim):
+    # - "estimate": analytical estimate, real render only for the final artifact
+    # - "render": real render + pdfplumber measurement at every step
+    # - "cross_check": real render at every step, logs estimate vs real delta
+    MEASURE_MODES = ("estimate", "render", "cross_check")
+
+    # Estimate mode: estimates within this many PFR points of the page break
+    # (~92% PFR, either side) are confirmed with a real render before a
+    # decision uses them; sized by the measured estimator error
+    ESTIMATE_CONFIRM_MARGIN = ESTIMATE_ERROR_MARGIN
+
+    # DOCX artifact (pdf2docx is one of the slowest CPU stages):
+    # - "eager": DOCX built during generation
+    # - "deferred": result carries the PDF only, DOCX built on demand
+    DOCX_MODES = ("eager", "deferred")
+
+    # Second language (FR + EN requests, or Phase 2 with a session):
+    # - "generate": full content generation per language (base prompt + source)
+    # - "translate": compact translation of the first language's final content
+    SECOND_LANGUAGE_MODES = ("generate", "translate")
+
+    # For structured data, assume RICH content (no enrichment needed)
+    STRUCTURED_DATA_ANALYSIS = {
+        'richness': 'rich',
+        'strategy': 'minimal',
+        'target_pfr': '86-88%',
+        'target_chars': 2700,
+        'warning': 'green'
+    }
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        render_cache: Optional[RenderCache] = None,
+        measure_mode: Optional[str] = None,
+        docx_mode: Optional[str] = None,
+        second_language_mode: Optional[str] = None,
+        deadline_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            max_workers: Max languages processed concurrently
+                         (default: MAX_LANGUAGE_WORKERS, 1 = sequential)
+            render_cache: Render + PFR memoization cache
+                          (default: process-wide cache from get_render_cache())
+            measure_mode: One of MEASURE_MODES (default: PFR_MEASURE_MODE from config)
+            docx_mode: One of DOCX_MODES (default: DOCX_MODE from config)
+            second_language_mode: One of SECOND_LANGUAGE_MODES
+                                  (default: SECOND_LANGUAGE_MODE from config)
+            deadline_seconds: Time budget of each generate call, 0 = unbounded
+                              (default: GENERATION_DEADLINE_SECONDS from config)
+
+        Raises:
+            ValueError: If measure_mode, docx_mode or second_language_mode is unknown
+        """
+        if measure_mode is None:
+            from apps.config import PFR_MEASURE_MODE
+            measure_mode = PFR_MEASURE_MODE
+        if measure_mode not in self.MEASURE_MODES:
+            raise ValueError(
+                f"Unknown measure_mode '{measure_mode}'. Expected one of {self.MEASURE_MODES}"
+            )
+        if docx_mode is None:
+            from apps.config import DOCX_MODE
+            docx_mode = DOCX_MODE
+        if docx_mode not in self.DOCX_MODES:
+            raise ValueError(
+                f"Unknown docx_mode '{docx_mode}'. Expected one of {self.DOCX_MODES}"
+            )
+        if second_language_mode is None:
+            from apps.config import SECOND_LANGUAGE_MODE
+            second_language_mode = SECOND_LANGUAGE_MODE
+        if second_language_mode not in self.SECOND_LANGUAGE_MODES:
+            raise ValueError(
+                f"Unknown second_language_mode '{second_language_mode}'. "
+                f"Expected one of {self.SECOND_LANGUAGE_MODES}"
+            )
+        if deadline_seconds is None:
+            from apps.config import GENERATION_DEADLINE_SECONDS
+            deadline_seconds = GENERATION_DEADLINE_SECONDS
+        self.measure_mode = measure_mode
+        self.docx_mode = docx_mode
+        self.deadline_seconds = deadline_seconds
+        self.second_language_mode = second_language_mode
+        self.max_workers = max_workers or self.MAX_LANGUAGE_WORKERS
+        self.render_cache = render_cache if render_cache is not None else get_render_cache()
         self.density_calc = DensityCalculator()
         self.layout_engine = LayoutEngine()
         self.enricher = ContentEnricher()
+        self.trim_planner = TrimPlanner()
         self.analyzer = ContentAnalyzer()
+        configure_from_settings()
 
     def _count_chars(self, content: Dict) -> int:
         """
@@ -75,6 +211,30 @@ class CVGenerator:
             total += len(' '.join(activities))
         return total
 
+    @staticmethod
+    def _pad_bullet(bullet: str) -> str:
+        """Bullet étendu à 200 caractères minimum (cap à 250), inchangé s'il est assez long."""
+        # Target minimum 200 chars per bullet (was 220)
+        if len(bullet) >= 200:
+            return bullet
+
+        # Ajouter du contexte générique mais pertinent
+        additions = [
+            ", avec coordination d'équipes pluridisciplinaires et gestion de projets transverses",
+            ", incluant analyses de données quantitatives et qualitatives approfondies",
+            ", en collaboration étroite avec stakeholders internes et externes",
+            ", avec production de livrables détaillés et présentations exécutives régulières",
+            ", optimisation continue des processus et méthodologies de travail",
+            ", participation active aux réunions stratégiques et comités de pilotage",
+            ", suivi rigoureux des indicateurs de performance et reporting hebdomadaire"
+        ]
+
+        # Ajouter jusqu'à atteindre 200 chars
+        while len(bullet) < 200 and additions:
+            bullet += additions.pop(0)
+
+        return bullet[:250]  # Cap à 250 chars
+
     def _pad_content_if_needed(self, content: Dict, target_chars: int) -> Dict:
         """
         Si contenu trop court, expand bullets automatiquement.
@@ -94,44 +254,34 @@ class CVGenerator:
             print(f"[PADDING] Auto-padding: +{deficit} chars needed")
 
             # Expand chaque bullet proportionnellement
-            for exp in content.get('work_experience', []):
-                for i, bullet in enumerate(exp.get('bullets', [])):
-                    # Target minimum 200 chars per bullet (was 220)
-                    if len(bullet) < 200:
-                        # Ajouter du contexte générique mais pertinent
-                        additions = [
-                            ", avec coordination d'équipes pluridisciplinaires et gestion de projets transverses",
-                            ", incluant analyses de données quantitatives et qualitatives approfondies",
-                            ", en collaboration étroite avec stakeholders internes et externes",
-                            ", avec production de livrables détaillés et présentations exécutives régulières",
-                            ", optimisation continue des processus et méthodologies de travail",
-                            ", participation active aux réunions stratégiques et comités de pilotage",
-                            ", suivi rigoureux des indicateurs de performance et reporting hebdomadaire"
-                        ]
-
-                        # Ajouter jusqu'à atteindre 200 chars
-                        while len(bullet) < 200 and additions:
-                            bullet += additions.pop(0)
-
-                        exp['bullets'][i] = bullet[:250]  # Cap à 250 chars
+            # (copy-on-write: l'entrée n'est jamais modifiée, seules les entrées étendues sont copiées)
+            content = map_entries(
+                content, 'work_experience',
+                lambda exp: {**exp, 'bullets': [self._pad_bullet(b) for b in exp['bullets']]}
+                if 'bullets' in exp else exp,
+            )
 
             # Expand activities si encore insuffisant
             activities = content.get('activities_interests', {})
-            if isinstance(activities, dict) and self._count_chars(content) < target_chars:
-                items = activities.get('items', [])
-                for i, activity in enumerate(items):
-                    if len(activity) < 150:
-                        items[i] = activity + " avec organisation d'événements réguliers, gestion de la communication, coordination logistique et animation de communauté"
-                activities['items'] = items
+            if isinstance(activities, dict) and 'activities_interests' in content \
+                    and self._count_chars(content) < target_chars:
+                items = [
+                    activity + " avec organisation d'événements réguliers, gestion de la communication, coordination logistique et animation de communauté"
+                    if len(activity) < 150 else activity
+                    for activity in activities.get('items', [])
+                ]
+                content = with_sections(content, activities_interests={**activities, 'items': items})
 
             # Expand coursework si encore insuffisant
             if self._count_chars(content) < target_chars:
-                for edu in content.get('education', []):
-                    coursework = edu.get('coursework', [])
-                    for i, course in enumerate(coursework):
-                        if len(course) < 40:  # Coursework très courts
-                            coursework[i] = course + " (méthodes avancées, études de cas pratiques)"
-                    edu['coursework'] = coursework
+                content = map_entries(
+                    content, 'education',
+                    lambda edu: {**edu, 'coursework': [
+                        course + " (méthodes avancées, études de cas pratiques)"
+                        if len(course) < 40 else course  # Coursework très courts
+                        for course in edu.get('coursework', [])
+                    ]},
+                )
 
             new_chars = self._count_chars(content)
             print(f"[PADDING] After padding: {new_chars} chars (+{new_chars - current_chars})")
@@ -140,25 +290,142 @@ class CVGenerator:
 
     def generate_from_pdf(
         self,
-        pdf_bytes: bytes,
+        pdf_bytes: Optional[bytes],
         domain: str = "finance",
         languages: Optional[List[str]] = None,
+        session: Optional[GenerationSession] = None,
     ) -> Dict[str, CVGenerationResult]:
         """
         Generate CV from uploaded PDF file.
         By default generates BOTH FR and EN, but can generate selectively.
 
         Args:
-            pdf_bytes: PDF file as bytes
+            pdf_bytes: PDF file as bytes (optional when a session is given)
             domain: Target domain (finance, consulting, startup, government)
             languages: List of languages to generate (default: ["fr", "en"])
                       Use ["fr"] for Phase 1 (fast), ["en"] for Phase 2 (deferred)
+            session: GenerationSession of a previous phase (result.session):
+                     skips upload, extraction and analysis
 
         Returns:
             Dictionary with requested language keys → CVGenerationResult
+            (each result carries the session for a later phase)
+
+        Raises:
+            ValueError: If generation fails, PFR < 70% or the session belongs
+                        to a different PDF
+        """
+        if session is None:
+            self._validate_pdf_bytes(pdf_bytes)
+        else:
+            self._check_session(session, pdf_bytes)
+
+        if languages is None:
+            languages = ["fr", "en"]
+
+        with start_trace("cv_generation", source="pdf", domain=domain,
+                         languages=",".join(languages),
+                         session_reused=session is not None) as root, \
+                use_deadline(self.deadline_seconds) as deadline:
+            if session is None:
+                # Extract text from PDF
+                with span("extract", bytes=len(pdf_bytes)):
+                    original_text = extract_text_from_pdf_bytes(pdf_bytes, filename="resume.pdf")
+                session = self._start_session(pdf_bytes, original_text)
+
+            # Generate requested languages
+            results = self._generate_languages(
+                input_data={"raw_text": session.raw_text},
+                domain=domain,
+                is_enhance=True,
+                original_text=session.raw_text,
+                languages=languages,
+                analysis=dict(session.analysis),
+                session=session,
+            )
+        return self._attach_trace(results, root, deadline)
+
+    async def agenerate_from_pdf(
+        self,
+        pdf_bytes: Optional[bytes],
+        domain: str = "finance",
+        languages: Optional[List[str]] = None,
+        session: Optional[GenerationSession] = None,
+    ) -> Dict[str, CVGenerationResult]:
+        """
+        Async counterpart of generate_from_pdf().
+
+        LLM calls are awaited on the shared AsyncOpenAI client; rendering and
+        PFR measurement run in worker threads so the event loop stays free.
+
+        Raises:
+            ValueError: If generation fails, PFR < 70% or the session belongs
+                        to a different PDF
+        """
+        if session is None:
+            self._validate_pdf_bytes(pdf_bytes)
+        else:
+            self._check_session(session, pdf_bytes)
+
+        if languages is None:
+            languages = ["fr", "en"]
+
+        with start_trace("cv_generation", source="pdf", domain=domain,
+                         languages=",".join(languages),
+                         session_reused=session is not None) as root, \
+                use_deadline(self.deadline_seconds) as deadline:
+            if session is None:
+                with span("extract", bytes=len(pdf_bytes)):
+                    original_text = await aextract_text_from_pdf_bytes(pdf_bytes, filename="resume.pdf")
+                session = self._start_session(pdf_bytes, original_text)
+
+            results = await self._agenerate_languages(
+                input_data={"raw_text": session.raw_text},
+                domain=domain,
+                is_enhance=True,
+                original_text=session.raw_text,
+                languages=languages,
+                analysis=dict(session.analysis),
+                session=session,
+            )
+        return self._attach_trace(results, root, deadline)
+
+    def _start_session(self, pdf_bytes: bytes, original_text: str) -> GenerationSession:
+        """
+        Analyze the extracted text and open the session reused by later phases.
+
+        Raises:
+            ValueError: If extracted text is too short
+        """
+        analysis = self._analyze_source(original_text)
+        return GenerationSession(
+            pdf_sha256=hashlib.sha256(pdf_bytes).hexdigest(),
+            raw_text=original_text,
+            analysis=analysis,
+        )
+
+    @staticmethod
+    def _check_session(session: GenerationSession, pdf_bytes: Optional[bytes]) -> None:
+        """
+        Check that a session from a previous phase matches the PDF (if given).
+
+        Raises:
+            ValueError: If the session was built from a different PDF
+        """
+        if pdf_bytes is not None and hashlib.sha256(pdf_bytes).hexdigest() != session.pdf_sha256:
+            raise ValueError("Generation session belongs to a different PDF")
+        print(
+            f"\n[SESSION] Reusing extraction + analysis ({len(session.raw_text)} chars, "
+            f"{session.analysis.get('richness')}) - no PDF upload"
+        )
+
+    @staticmethod
+    def _validate_pdf_bytes(pdf_bytes: bytes) -> None:
+        """
+        Validate uploaded PDF bytes.
 
         Raises:
-            ValueError: If generation fails or PFR < 70%
+            ValueError: If the PDF is empty, too small/large or not a PDF
         """
         # VALIDATION: PDF input
         if not pdf_bytes:
@@ -174,31 +441,24 @@ class CVGenerator:
         if not pdf_bytes.startswith(b'%PDF'):
             raise ValueError("Invalid file format - not a valid PDF (missing PDF header)")
 
-        if languages is None:
-            languages = ["fr", "en"]
-
-        # Extract text from PDF
-        original_text = extract_text_from_pdf_bytes(pdf_bytes, filename="resume.pdf")
+    def _analyze_source(self, original_text: str) -> Dict:
+        """
+        Check extracted text and analyze source content richness.
 
+        Raises:
+            ValueError: If extracted text is too short
+        """
         if not original_text or len(original_text.strip()) < 100:
             raise ValueError(
                 "Failed to extract sufficient text from PDF. Please ensure PDF is readable."
             )
 
         # Analyze source content richness
-        analysis = self.analyzer.analyze(original_text)
+        with span("analyze", chars=len(original_text)):
+            analysis = self.analyzer.analyze(original_text)
         print(f"\n[ANALYSIS] Source: {analysis['richness']} ({len(original_text)} chars)")
         print(f"[ANALYSIS] Strategy: {analysis['strategy']} -> Target {analysis['target_pfr']}")
-
-        # Generate requested languages
-        return self._generate_languages(
-            input_data={"raw_text": original_text},
-            domain=domain,
-            is_enhance=True,
-            original_text=original_text,
-            languages=languages,
-            analysis=analysis,
-        )
+        return analysis
 
     def generate_from_data(
         self,
@@ -222,27 +482,139 @@ class CVGenerator:
         if languages is None:
             languages = ["fr", "en"]
 
-        domain = cv_content.domain
-        input_dict = cv_content.dict()
+        # Generate requested languages
+        with start_trace("cv_generation", source="data", domain=cv_content.domain,
+                         languages=",".join(languages)) as root, \
+                use_deadline(self.deadline_seconds) as deadline:
+            results = self._generate_languages(
+                input_data=cv_content.dict(),
+                domain=cv_content.domain,
+                is_enhance=False,
+                original_text=None,
+                languages=languages,
+                analysis=dict(self.STRUCTURED_DATA_ANALYSIS),
+            )
+        return self._attach_trace(results, root, deadline)
 
-        # For structured data, assume RICH content (no enrichment needed)
-        analysis = {
-            'richness': 'rich',
-            'strategy': 'minimal',
-            'target_pfr': '86-88%',
-            'target_chars': 2700,
-            'warning': 'green'
-        }
+    def regenerate_from_data(
+        self,
+        cv_content: CVContent,
+        previous_input: Dict,
+        previous_content: Dict,
+        language: str,
+    ) -> Dict[str, CVGenerationResult]:
+        """
+        Regenerate one language incrementally after a form edit.
+
+        Diffs the new structured input against the input of the last
+        generation (see incremental.plan_regeneration):
+        - render-only edits (contact, skills, languages): the last final
+          content is patched and re-rendered, no LLM call
+        - edited experiences: only their bullets are rewritten (one small
+          LLM call each), the rest of the content is kept
+        - anything else: full generate_from_data()
+        The patched content then goes through the usual single-pass
+        adjustment, so the page fill rules still apply.
 
-        # Generate requested languages
-        return self._generate_languages(
-            input_data=input_dict,
-            domain=domain,
-            is_enhance=False,
-            original_text=None,
-            languages=languages,
-            analysis=analysis,
-        )
+        Args:
+            cv_content: New structured CV content
+            previous_input: CVContent.dict() of the last generation
+            previous_content: Final content of the last generation in this language
+            language: Language to regenerate
+
+        Returns:
+            Dictionary with key language → CVGenerationResult
+
+        Raises:
+            ValueError: If generation fails
+        """
+        new_input = cv_content.dict()
+        plan = plan_regeneration(previous_input, new_input, previous_content)
+        print(f"[INCREMENTAL] {language.upper()}: {plan.describe()}")
+        if plan.mode == "full":
+            return self.generate_from_data(cv_content, [language])
+
+        with start_trace("cv_generation", source="incremental", domain=cv_content.domain,
+                         languages=language, mode=plan.mode) as root, \
+                use_deadline(self.deadline_seconds) as deadline:
+            content = apply_render_fields(previous_content, new_input, plan)
+            if plan.experiences:
+                content["work_experience"] = self._rewrite_experiences(
+                    content["work_experience"], previous_input, new_input,
+                    plan.experiences, cv_content.domain, language,
+                )
+
+            metrics = self._measure(content, trim=False)
+            result = self._adjust_language(
+                content, metrics, cv_content.domain, language, None,
+                dict(self.STRUCTURED_DATA_ANALYSIS),
+            )
+            result.warnings.insert(0, f"Incremental regeneration: {plan.describe()}")
+            results = {language: result}
+        return self._attach_trace(results, root, deadline)
+
+    def _rewrite_experiences(
+        self,
+        experiences: List[Dict],
+        previous_input: Dict,
+        new_input: Dict,
+        indexes: List[int],
+        domain: str,
+        language: str,
+    ) -> List[Dict]:
+        """Rewrite the bullets (and changed header fields) of the edited experiences."""
+        experiences = list(experiences)  # Untouched experiences stay shared
+        for index in indexes:
+            previous = previous_input["work_experience"][index]
+            edited = new_input["work_experience"][index]
+            entry = apply_experience_header(experiences[index], previous, edited)
+            with span("llm.rewrite_experience", index=index, language=language):
+                bullets = rewrite_experience_bullets(
+                    edited, entry.get("bullets") or [], domain, language
+                )
+            experiences[index] = {**entry, "bullets": bullets}
+        return experiences
+
+    async def agenerate_from_data(
+        self,
+        cv_content: CVContent,
+        languages: Optional[List[str]] = None,
+    ) -> Dict[str, CVGenerationResult]:
+        """
+        Async counterpart of generate_from_data().
+
+        Raises:
+            ValueError: If generation fails
+        """
+        if languages is None:
+            languages = ["fr", "en"]
+
+        with start_trace("cv_generation", source="data", domain=cv_content.domain,
+                         languages=",".join(languages)) as root, \
+                use_deadline(self.deadline_seconds) as deadline:
+            results = await self._agenerate_languages(
+                input_data=cv_content.dict(),
+                domain=cv_content.domain,
+                is_enhance=False,
+                original_text=None,
+                languages=languages,
+                analysis=dict(self.STRUCTURED_DATA_ANALYSIS),
+            )
+        return self._attach_trace(results, root, deadline)
+
+    @staticmethod
+    def _attach_trace(
+        results: Dict[str, CVGenerationResult], root: Span, deadline: Optional[Deadline] = None
+    ) -> Dict[str, CVGenerationResult]:
+        """Attach the finished span tree, the deadline degradations and the LLM usage to every language result."""
+        trace = root.to_dict()
+        degradations = deadline.degradations if deadline is not None else []
+        usage = usage_from_trace(root)
+        for result in results.values():
+            result.trace = trace
+            result.degradations = list(degradations)
+            result.usage = usage
+        return results
 
     def _generate_languages(
         self,
@@ -252,11 +624,16 @@ class CVGenerator:
         original_text: Optional[str],
         languages: List[str],
         analysis: Dict,
+        session: Optional[GenerationSession] = None,
     ) -> Dict[str, CVGenerationResult]:
         """
         PERFORMANCE-OPTIMIZED generation flow for requested languages (1-2 minute target).
         Supports PHASE 1 (FR only) and PHASE 2 (EN only) for faster perceived generation.
 
+        Languages are processed CONCURRENTLY on a bounded thread pool: the base
+        generation of FR and EN runs in parallel, then (after the shared block
+        check) the adjustment passes run in parallel too.
+
         Flow:
         1. Generate base content for requested language(s)
         2. Measure PFR for each language
@@ -272,6 +649,7 @@ class CVGenerator:
             is_enhance: True if from PDF
             original_text: Original text if from PDF
             languages: List of languages to generate (e.g., ["fr"] or ["en"] or ["fr", "en"])
+            session: PDF generation session (records base content, attached to results)
 
         Returns:
             Dictionary with requested language keys → CVGenerationResult
@@ -279,49 +657,552 @@ class CVGenerator:
         Raises:
             ValueError: If PFR < 70%
         """
-        # Step 1 & 2: Generate base content for requested languages and measure PFR
-        base_results = {}
-        base_content = {}
-        base_metrics = {}
+        generated, translated, source_lang = self._split_languages(languages, session)
+        results: Dict[str, CVGenerationResult] = {}
+
+        if generated:
+            # Step 1 & 2: Generate base content for requested languages and measure PFR
+            base_results = self._run_per_language(
+                generated,
+                lambda lang: self._generate_base_language(
+                    input_data=input_data,
+                    domain=domain,
+                    language=lang,
+                    analysis=analysis,
+                ),
+                stage="base",
+            )
+            base_content = {lang: base_results[lang][0] for lang in generated}
+            base_metrics = {lang: base_results[lang][1] for lang in generated}
+            if session is not None:
+                session.base_content.update(base_content)  # Shared: content is never mutated
+
+            # Step 3: Identify the LOWER PFR language (only if generating multiple languages)
+            if len(generated) > 1:
+                lower_lang = min(generated, key=lambda lang: base_metrics[lang].fill_percentage)
+                lower_pfr = base_metrics[lower_lang].fill_percentage
+            else:
+                # Single language generation - use that language
+                lower_lang = generated[0]
+                lower_pfr = base_metrics[lower_lang].fill_percentage
+
+            # Step 4: Check for BLOCK condition (< 65%)
+            if lower_pfr < self.density_calc.BLOCK_THRESHOLD:
+                raise ValueError(self._build_block_message(lower_lang, lower_pfr))
+
+            # Step 5 & 6: Process each requested language with SIMPLIFIED SINGLE-PASS LOGIC
+            # TARGET: 90-95% PFR with INCREMENTAL enrichment (no retry loops)
+            # PRODUCT RULE: One enrichment pass maximum, one trimming pass maximum
+            results = self._run_per_language(
+                generated,
+                lambda lang: self._adjust_language(
+                    base_content=base_content[lang],
+                    base_metrics=base_metrics[lang],
+                    domain=domain,
+                    language=lang,
+                    original_text=original_text,
+                    analysis=analysis,
+                ),
+                stage="adjust",
+            )
+
+        if translated:
+            # Second language: translate the finalized content (no regeneration)
+            source_content = self._translation_source(source_lang, results, session)
+            results.update(self._run_per_language(
+                translated,
+                lambda lang: self._translate_language(
+                    source_content=source_content,
+                    source_language=source_lang,
+                    input_data=input_data,
+                    domain=domain,
+                    language=lang,
+                    original_text=original_text,
+                    analysis=analysis,
+                ),
+                stage="translate",
+            ))
+
+        results = {lang: results[lang] for lang in languages}
+        return self._attach_session(results, session)
 
-        for lang in languages:
-            # Get adaptive enrichment instructions
-            enrichment_instructions = self.analyzer.get_enrichment_instructions(
-                analysis['strategy'], lang
+    async def _agenerate_languages(
+        self,
+        input_data: Dict,
+        domain: str,
+        is_enhance: bool,
+        original_text: Optional[str],
+        languages: List[str],
+        analysis: Dict,
+        session: Optional[GenerationSession] = None,
+    ) -> Dict[str, CVGenerationResult]:
+        """
+        Async counterpart of _generate_languages() (same flow and thresholds).
+
+        Languages are gathered concurrently on the event loop. CPU-bound steps
+        (render, PFR, DOCX) run via asyncio.to_thread; enrichment LLM calls are
+        scheduled back on the event loop through the AsyncOpenAI client.
+
+        Raises:
+            ValueError: If PFR < 70%
+        """
+        generated, translated, source_lang = self._split_languages(languages, session)
+        results: Dict[str, CVGenerationResult] = {}
+        loop = asyncio.get_running_loop()
+
+        def enrich_on_loop(**kwargs) -> Dict:
+            # Called from the adjustment thread: run async enrichment on the loop
+            return asyncio.run_coroutine_threadsafe(
+                self.enricher.aincremental_enrich_content(**kwargs), loop
+            ).result()
+
+        if generated:
+            base_results = await asyncio.gather(*[
+                self._agenerate_base_language(
+                    input_data=input_data,
+                    domain=domain,
+                    language=lang,
+                    analysis=analysis,
+                )
+                for lang in generated
+            ])
+            base_content = {lang: result[0] for lang, result in zip(generated, base_results)}
+            base_metrics = {lang: result[1] for lang, result in zip(generated, base_results)}
+            if session is not None:
+                session.base_content.update(base_content)  # Shared: content is never mutated
+
+            lower_lang = min(generated, key=lambda lang: base_metrics[lang].fill_percentage)
+            lower_pfr = base_metrics[lower_lang].fill_percentage
+
+            if lower_pfr < self.density_calc.BLOCK_THRESHOLD:
+                raise ValueError(self._build_block_message(lower_lang, lower_pfr))
+
+            def adjust(lang: str) -> CVGenerationResult:
+                return self._adjust_language(
+                    base_content=base_content[lang],
+                    base_metrics=base_metrics[lang],
+                    domain=domain,
+                    language=lang,
+                    original_text=original_text,
+                    analysis=analysis,
+                    enrich=enrich_on_loop,
+                )
+
+            final_results = await asyncio.gather(*[
+                asyncio.to_thread(self._traced_language, "adjust", lang, adjust)
+                for lang in generated
+            ])
+            results = dict(zip(generated, final_results))
+
+        if translated:
+            source_content = self._translation_source(source_lang, results, session)
+            translated_results = await asyncio.gather(*[
+                self._atranslate_language(
+                    source_content=source_content,
+                    source_language=source_lang,
+                    input_data=input_data,
+                    domain=domain,
+                    language=lang,
+                    original_text=original_text,
+                    analysis=analysis,
+                    enrich=enrich_on_loop,
+                )
+                for lang in translated
+            ])
+            results.update(zip(translated, translated_results))
+
+        results = {lang: results[lang] for lang in languages}
+        return self._attach_session(results, session)
+
+    def _split_languages(
+        self, languages: List[str], session: Optional[GenerationSession]
+    ) -> Tuple[List[str], List[str], Optional[str]]:
+        """
+        Split requested languages into generated and translated ones.
+
+        In "translate" mode the first requested language is generated and
+        the others are translated from its final content. With a session
+        holding the final content of another language (Phase 2), every
+        requested language is translated from it.
+
+        Returns:
+            Tuple (languages to generate, languages to translate, source language)
+        """
+        if self.second_language_mode != "translate":
+            return list(languages), [], None
+
+        if session is not None:
+            source_lang = next(
+                (lang for lang in session.final_content if lang not in languages), None
+            )
+            if source_lang is not None:
+                return [], list(languages), source_lang
+
+        if len(languages) < 2:
+            return list(languages), [], None
+        return list(languages[:1]), list(languages[1:]), languages[0]
+
+    @staticmethod
+    def _translation_source(
+        source_lang: str,
+        results: Dict[str, CVGenerationResult],
+        session: Optional[GenerationSession],
+    ) -> Dict:
+        """Final content of the source language (this call or the session)."""
+        if source_lang in results:
+            return results[source_lang].content
+        return session.final_content[source_lang]
+
+    def _translate_language(
+        self,
+        source_content: Dict,
+        source_language: str,
+        input_data: Dict,
+        domain: str,
+        language: str,
+        original_text: Optional[str],
+        analysis: Dict,
+    ) -> CVGenerationResult:
+        """
+        Derive one language by translating finalized content, then adjust it.
+
+        The translation keeps bullet lengths within tolerance, so the single
+        pass adjustment usually accepts it as-is. If translation fails, the
+        language is generated normally (base content + block check).
+
+        Returns:
+            Final CVGenerationResult for this language
+
+        Raises:
+            ValueError: If the CV cannot fit on one page or PFR is too low
+        """
+        try:
+            with span("llm.translate", source=source_language, language=language):
+                content = translate_cv_content(source_content, source_language, language)
+            metrics = self._measure(content, trim=False)
+        except ValueError as e:
+            print(f"[TRANSLATE] {source_language.upper()} -> {language.upper()} failed, generating instead: {e}")
+            content, metrics = self._generate_base_language(input_data, domain, language, analysis)
+            self._check_block(language, metrics)
+            return self._adjust_language(content, metrics, domain, language, original_text, analysis)
+
+        result = self._adjust_language(content, metrics, domain, language, original_text, analysis)
+        result.warnings.insert(0, f"Translated from {source_language.upper()} final content")
+        return result
+
+    async def _atranslate_language(
+        self,
+        source_content: Dict,
+        source_language: str,
+        input_data: Dict,
+        domain: str,
+        language: str,
+        original_text: Optional[str],
+        analysis: Dict,
+        enrich: Callable[..., Dict],
+    ) -> CVGenerationResult:
+        """Async counterpart of _translate_language()."""
+        with span("translate", language=language):
+            try:
+                with span("llm.translate", source=source_language, language=language):
+                    content = await atranslate_cv_content(source_content, source_language, language)
+                metrics = await asyncio.to_thread(self._measure, content, False)
+                translated = True
+            except ValueError as e:
+                print(f"[TRANSLATE] {source_language.upper()} -> {language.upper()} failed, generating instead: {e}")
+                content, metrics = await self._agenerate_base_language(
+                    input_data, domain, language, analysis
+                )
+                self._check_block(language, metrics)
+                translated = False
+
+            result = await asyncio.to_thread(
+                self._adjust_language,
+                content, metrics, domain, language, original_text, analysis, enrich,
             )
+        if translated:
+            result.warnings.insert(0, f"Translated from {source_language.upper()} final content")
+        return result
+
+    def _check_block(self, language: str, metrics: PageFillMetrics) -> None:
+        """
+        Raises:
+            ValueError: If base PFR is below the BLOCK threshold
+        """
+        if metrics.fill_percentage < self.density_calc.BLOCK_THRESHOLD:
+            raise ValueError(self._build_block_message(language, metrics.fill_percentage))
+
+    @staticmethod
+    def _attach_session(
+        results: Dict[str, CVGenerationResult], session: Optional[GenerationSession]
+    ) -> Dict[str, CVGenerationResult]:
+        """Attach the session (if any) to every result and record final content."""
+        if session is not None:
+            for lang, result in results.items():
+                session.final_content[lang] = result.content
+                result.session = session
+        return results
+
+    def _run_per_language(
+        self, languages: List[str], task: Callable[[str], T], stage: str = "language"
+    ) -> Dict[str, T]:
+        """
+        Run a per-language task for every requested language.
+
+        Uses a bounded thread pool when several languages are requested
+        (the work is dominated by LLM round trips). A single language runs
+        inline. The first exception raised by any language is propagated.
+
+        Args:
+            languages: Languages to process
+            task: Callable taking a language code
+            stage: Span name of each language run
+
+        Returns:
+            Dictionary language → task result (in requested order)
+        """
+        if len(languages) <= 1 or self.max_workers <= 1:
+            return {lang: self._traced_language(stage, lang, task) for lang in languages}
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(languages), self.max_workers),
+            thread_name_prefix="cvgen",
+        ) as executor:
+            # run_in_context: worker spans attach to the caller's trace
+            futures = {
+                lang: executor.submit(run_in_context(self._traced_language), stage, lang, task)
+                for lang in languages
+            }
+            return {lang: futures[lang].result() for lang in languages}
+
+    @staticmethod
+    def _traced_language(stage: str, language: str, task: Callable[[str], T]) -> T:
+        """Run a per-language task inside its own span."""
+        with span(stage, language=language):
+            return task(language)
+
+    def _generate_base_language(
+        self,
+        input_data: Dict,
+        domain: str,
+        language: str,
+        analysis: Dict,
+    ) -> Tuple[Dict, PageFillMetrics]:
+        """
+        Generate base content for one language and measure its PFR.
+
+        Args:
+            input_data: Input data dictionary
+            domain: Target domain
+            language: Output language
+            analysis: Content analysis (strategy, target_chars)
+
+        Returns:
+            Tuple (base content, base metrics)
+        """
+        # Get adaptive enrichment instructions
+        enrichment_instructions = self.analyzer.get_enrichment_instructions(
+            analysis['strategy'], language
+        )
 
-            # Generate base content with adaptive enrichment
+        # Generate base content with adaptive enrichment
+        with span("llm.generate_content", language=language):
             content = generate_cv_content(
                 input_data=input_data,
                 domain=domain,
-                language=lang,
+                language=language,
                 enrichment_mode=False,
                 enrichment_instructions=enrichment_instructions,
             )
 
-            # Apply intelligent padding if content too short (push-to-90 system)
-            content = self._pad_content_if_needed(content, analysis['target_chars'])
+        return self._pad_and_measure(content, analysis)
+
+    async def _agenerate_base_language(
+        self,
+        input_data: Dict,
+        domain: str,
+        language: str,
+        analysis: Dict,
+    ) -> Tuple[Dict, PageFillMetrics]:
+        """Async counterpart of _generate_base_language()."""
+        enrichment_instructions = self.analyzer.get_enrichment_instructions(
+            analysis['strategy'], language
+        )
+
+        with span("base", language=language):
+            with span("llm.generate_content", language=language):
+                content = await agenerate_cv_content(
+                    input_data=input_data,
+                    domain=domain,
+                    language=language,
+                    enrichment_mode=False,
+                    enrichment_instructions=enrichment_instructions,
+                )
+
+            return await asyncio.to_thread(self._pad_and_measure, content, analysis)
 
-            base_content[lang] = content
+    def _pad_and_measure(
+        self, content: Dict, analysis: Dict
+    ) -> Tuple[Dict, PageFillMetrics]:
+        """Pad base content if too short, then render and measure it."""
+        # Apply intelligent padding if content too short (push-to-90 system)
+        content = self._pad_content_if_needed(content, analysis['target_chars'])
 
-            # Render and measure
-            pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=False)
+        # Measure (estimate or render, depending on measure_mode)
+        metrics = self._measure(content, trim=False)
+
+        return content, metrics
+
+    def _measure(self, content: Dict, trim: bool) -> PageFillMetrics:
+        """
+        Measure PFR for a pipeline decision, according to measure_mode.
+
+        Args:
+            content: CV content dictionary
+            trim: Apply layout trimming if True
+
+        Returns:
+            PageFillMetrics (estimated or measured on a real render)
+        """
+        mode = self.measure_mode
+        if mode != "estimate" and not deadline_allows("render_measure"):
+            degrade("estimate_measure", f"{mode} measurement replaced by the estimate")
+            mode = "estimate"
+        with span("measure", mode=mode, trim=trim) as current:
+            if mode == "estimate":
+                layout = PageFillEstimator.estimate(content, trim=trim)
+                metrics = layout.to_metrics()
+                if (
+                    abs(layout.page_break_distance) < self.ESTIMATE_CONFIRM_MARGIN
+                    and deadline_allows("render_measure")
+                ):
+                    # Near the page break: one page or two decides the next step
+                    current.set(estimate=metrics.fill_percentage, confirmed=True)
+                    pdf_bytes, metrics = self._render_and_measure(content, trim=trim)
+            else:
+                pdf_bytes, metrics = self._render_and_measure(content, trim=trim)
+                if mode == "cross_check":
+                    estimate = self.density_calc.estimate_pfr(content, trim=trim)
+                    print(
+                        f"[PFR CROSS-CHECK] estimate {estimate.fill_percentage}% ({estimate.page_count}p) "
+                        f"vs real {metrics.fill_percentage}% ({metrics.page_count}p), "
+                        f"delta {estimate.fill_percentage - metrics.fill_percentage:+.1f}"
+                    )
+                    current.set(estimate=estimate.fill_percentage)
+            current.set(pfr=metrics.fill_percentage, pages=metrics.page_count)
+            return metrics
+
+    def _render_final(
+        self,
+        content: Dict,
+        trim: bool,
+        decision_metrics: PageFillMetrics,
+        warnings: List[str],
+    ) -> Tuple[Dict, bool, bytes, PageFillMetrics]:
+        """
+        Render the final artifact and measure it for real.
+
+        In estimate mode, if the estimate predicted one page but the real
+        render overflows (boundary case), ONE corrective trim is applied.
+
+        Args:
+            content: Final CV content
+            trim: Layout trim flag of the last decision
+            decision_metrics: Metrics the last decision was based on
+            warnings: Warnings list to append to
+
+        Returns:
+            Tuple (final content, final trim flag, PDF bytes, real PageFillMetrics)
+        """
+        pdf_bytes, metrics = self._render_and_measure(content, trim=trim)
+
+        if (
+            self.measure_mode == "estimate"
+            and metrics.page_count > 1
+            and decision_metrics.page_count == 1
+        ):
+            warnings.append(
+                f"Estimated {decision_metrics.fill_percentage}% but render overflowed "
+                f"({metrics.page_count} pages) - applying corrective trimming (step 1)"
+            )
+            content = self._trim_step(content, step=1)
+            trim = True
+            pdf_bytes, metrics = self._render_and_measure(content, trim=trim)
+
+        return content, trim, pdf_bytes, metrics
+
+    def _render_and_measure(
+        self, content: Dict, trim: bool
+    ) -> Tuple[bytes, PageFillMetrics]:
+        """
+        Render content to PDF and measure its PFR, memoized by content hash.
+
+        Args:
+            content: CV content dictionary
+            trim: Apply layout trimming if True
+
+        Returns:
+            Tuple (PDF bytes, PageFillMetrics)
+        """
+        with span("render", trim=trim) as current:
+            pdf_bytes, metrics = self.render_cache.get_or_render(
+                content, trim, self._render_uncached
+            )
+            # No child span: served from the render cache
+            current.set(cached=not current.children, bytes=len(pdf_bytes))
+            return pdf_bytes, metrics
+
+    def _render_uncached(
+        self, content: Dict, trim: bool
+    ) -> Tuple[bytes, PageFillMetrics]:
+        """Render with xhtml2pdf and measure with pdfplumber (no cache)."""
+        with span("render.xhtml2pdf") as current:
+            pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=trim)
+            current.set(bytes=len(pdf_bytes))
+        with span("measure.pdfplumber"):
             metrics = self.density_calc.calculate_pfr(pdf_bytes)
-            base_metrics[lang] = metrics
+        return pdf_bytes, metrics
 
-        # Step 3: Identify the LOWER PFR language (only if generating multiple languages)
-        if len(languages) > 1:
-            lower_lang = min(languages, key=lambda lang: base_metrics[lang].fill_percentage)
-            lower_pfr = base_metrics[lower_lang].fill_percentage
-        else:
-            # Single language generation - use that language
-            lower_lang = languages[0]
-            lower_pfr = base_metrics[lower_lang].fill_percentage
+    def _plan_trim(
+        self, content: Dict, warnings: List[str]
+    ) -> Optional[Tuple[Dict, PageFillMetrics]]:
+        """
+        Apply the minimal trim plan and measure it ONCE.
+
+        Args:
+            content: Overflowing CV content (not mutated)
+            warnings: Warnings list to append to
 
-        # Step 4: Check for BLOCK condition (< 65%)
-        if lower_pfr < self.density_calc.BLOCK_THRESHOLD:
-            block_message = f"""
-GENERATION BLOCKED: PFR {lower_pfr}% in {lower_lang.upper()} (minimum required: {self.density_calc.BLOCK_THRESHOLD}%)
+        Returns:
+            Tuple (trimmed content, metrics), or None if no plan lands on
+            one page (caller falls back to step trimming)
+        """
+        with span("trim.plan") as current:
+            plan = self.trim_planner.plan(content)
+            if plan is not None:
+                current.set(cuts=len(plan.cuts), predicted_pfr=plan.predicted_pfr)
+        if plan is None or not plan.cuts:
+            return None
+
+        planned = self.trim_planner.apply(content, plan)
+        metrics = self._measure(planned, trim=False)
+        if metrics.page_count > 1:
+            warnings.append(
+                f"Trim plan ({plan.describe()}) still overflows - falling back to step trimming"
+            )
+            return None
+
+        warnings.append(
+            f"Trim plan applied: {plan.describe()} "
+            f"(predicted {plan.predicted_pfr}%, measured {metrics.fill_percentage}%)"
+        )
+        return planned, metrics
+
+    @staticmethod
+    def _build_block_message(lower_lang: str, lower_pfr: float) -> str:
+        """Build the user-facing message for a BLOCKED generation."""
+        return f"""
+GENERATION BLOCKED: PFR {lower_pfr}% in {lower_lang.upper()} (minimum required: {DensityCalculator.BLOCK_THRESHOLD}%)
 
 Your CV does not contain enough content to meet Postulae standards.
 Please provide more detailed information using ONE OR BOTH options below:
@@ -358,37 +1239,71 @@ You may also add:
 
 After providing more information, regenerate your CV.
 """
-            raise ValueError(block_message)
-
-        # Step 5 & 6: Process each requested language with SIMPLIFIED SINGLE-PASS LOGIC
-        # TARGET: 90-95% PFR with INCREMENTAL enrichment (no retry loops)
-        # PRODUCT RULE: One enrichment pass maximum, one trimming pass maximum
-        final_results = {}
-        for lang in languages:
-            warnings = []
-            content = deepcopy(base_content[lang])
-            metrics = base_metrics[lang]
-
-            initial_pfr = metrics.fill_percentage
-            warnings.append(f"PFR initial: {initial_pfr}%")
-
-            # SINGLE-PASS ADJUSTMENT (no loops, no retries)
-            # TARGET: 86-95% PFR for rich CVs, 90-95% PFR for poor CVs
-            # Rich CVs (strategy=minimal) often plateau at 85-88% due to content density
-            OPTIMAL_MIN = 86.0  # Lowered from 90.0 to accept rich CVs at 86-90%
-            OPTIMAL_MAX = 95.0
-            HARD_MINIMUM = 40.0  # Block threshold (nouveau seuil push-to-90)
-
-            # CAS 1: Multi-pages - MUST trim to 1 page
-            if metrics.page_count > 1:
-                warnings.append(
-                    f"Multi-pages detected ({metrics.page_count} pages) - applying LIGHT trimming first (step 1)"
-                )
+
+    def _adjust_language(
+        self,
+        base_content: Dict,
+        base_metrics: PageFillMetrics,
+        domain: str,
+        language: str,
+        original_text: Optional[str],
+        analysis: Dict,
+        enrich: Optional[Callable[..., Dict]] = None,
+    ) -> CVGenerationResult:
+        """
+        Apply the SINGLE-PASS adjustment (trim / enrich / accept) for one language.
+
+        Args:
+            base_content: Base content for this language (not mutated)
+            base_metrics: Base metrics for this language
+            domain: Target domain
+            language: Output language
+            original_text: Original text if from PDF
+            analysis: Content analysis (strategy)
+            enrich: Enrichment callable (default: enricher.incremental_enrich_content)
+
+        Returns:
+            Final CVGenerationResult for this language
+
+        Raises:
+            ValueError: If the CV cannot fit on one page or final PFR < 40%
+        """
+        lang = language
+        if enrich is None:
+            enrich = self.enricher.incremental_enrich_content
+        warnings = []
+        content = base_content  # Copy-on-write: trim / enrich return new content
+        metrics = base_metrics
+        render_trim = False
+
+        initial_pfr = metrics.fill_percentage
+        warnings.append(f"PFR initial: {initial_pfr}%")
+
+        # SINGLE-PASS ADJUSTMENT (no loops, no retries)
+        # TARGET: 86-95% PFR for rich CVs, 90-95% PFR for poor CVs
+        # Rich CVs (strategy=minimal) often plateau at 85-88% due to content density
+        OPTIMAL_MIN = 86.0  # Lowered from 90.0 to accept rich CVs at 86-90%
+        OPTIMAL_MAX = 95.0
+        HARD_MINIMUM = 40.0  # Block threshold (nouveau seuil push-to-90)
+
+        # CAS 1: Multi-pages - MUST trim to 1 page
+        if metrics.page_count > 1:
+            warnings.append(
+                f"Multi-pages detected ({metrics.page_count} pages) - planning minimal trimming"
+            )
+
+            # Optimal trim plan (single measurement), step cascade as fallback
+            planned = self._plan_trim(content, warnings)
+            if planned is not None:
+                content, metrics = planned
+                render_trim = False
+            else:
+                warnings.append("No trim plan fits one page - applying LIGHT trimming first (step 1)")
 
                 # Start with LIGHT trimming (step 1) for multi-pages
-                content = self.enricher.trim_content(content, step=1)
-                pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=True)
-                metrics = self.density_calc.calculate_pfr(pdf_bytes)
+                content = self._trim_step(content, step=1)
+                render_trim = True
+                metrics = self._measure(content, trim=render_trim)
 
                 new_pfr = metrics.fill_percentage
                 warnings.append(
@@ -400,9 +1315,9 @@ After providing more information, regenerate your CV.
                     warnings.append(
                         f"Still multi-pages - applying moderate trimming (step 2)"
                     )
-                    content = self.enricher.trim_content(content, step=2)
-                    pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=True)
-                    metrics = self.density_calc.calculate_pfr(pdf_bytes)
+                    content = self._trim_step(content, step=2)
+                    render_trim = True
+                    metrics = self._measure(content, trim=render_trim)
                     warnings.append(f"After moderate trimming: {metrics.fill_percentage}%, {metrics.page_count} page(s)")
 
                     # If STILL multi-pages, apply aggressive trimming (step 3) - last resort
@@ -410,166 +1325,194 @@ After providing more information, regenerate your CV.
                         warnings.append(
                             f"Still multi-pages - applying aggressive trimming (step 3)"
                         )
-                        content = self.enricher.trim_content(content, step=3)
-                        pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=True)
-                        metrics = self.density_calc.calculate_pfr(pdf_bytes)
+                        content = self._trim_step(content, step=3)
+                        render_trim = True
+                        metrics = self._measure(content, trim=render_trim)
                         warnings.append(f"After aggressive trimming: {metrics.fill_percentage}%, {metrics.page_count} page(s)")
 
-                # If STILL multi-pages, block generation
-                if metrics.page_count > 1:
-                    raise ValueError(
-                        f"Unable to fit CV on one page. Current: {metrics.page_count} pages after trimming."
-                    )
-
-                # CORRECTION: If trimming made PFR < 85%, apply CONSERVATIVE incremental enrichment
-                # Only enrich if PFR is critically low (< 85%), and accept 85-90% range
-                if metrics.fill_percentage < 85.0:
-                    warnings.append(
-                        f"Trimming resulted in low PFR ({metrics.fill_percentage}%) - applying conservative incremental enrichment"
-                    )
-
-                    # Apply enrichment conservatively (reduce target to avoid overshoot)
-                    conservative_target = min(88.0, ContentEnricher.TARGET_PFR)
-                    original_target = ContentEnricher.TARGET_PFR
-                    ContentEnricher.TARGET_PFR = conservative_target
-
-                    content = self.enricher.incremental_enrich_content(
-                        content=content,
-                        current_metrics=metrics,
-                        domain=domain,
-                        language=lang,
-                        original_text=original_text,
-                    )
-
-                    # Restore original target
-                    ContentEnricher.TARGET_PFR = original_target
-
-                    pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=False)
-                    metrics = self.density_calc.calculate_pfr(pdf_bytes)
-                    warnings.append(f"After corrective enrichment: {metrics.fill_percentage}%, {metrics.page_count} page(s)")
-
-                    # If enrichment caused multi-pages again, revert to trimmed version
-                    if metrics.page_count > 1:
-                        warnings.append(
-                            f"Enrichment caused multi-pages - reverting to trimmed version"
-                        )
-                        # Re-trim without enrichment
-                        content = deepcopy(base_content[lang])
-                        content = self.enricher.trim_content(content, step=2)  # Use step 2 directly
-                        pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=True)
-                        metrics = self.density_calc.calculate_pfr(pdf_bytes)
-                        warnings.append(f"Reverted to trimmed version: {metrics.fill_percentage}%")
-
-                elif metrics.fill_percentage < 90.0:
-                    # PFR in [85-90%] - acceptable, no enrichment needed to avoid risk
-                    warnings.append(
-                        f"PFR {metrics.fill_percentage}% in acceptable range [85-90%] after trimming - no enrichment to avoid multi-pages risk"
-                    )
-
-            # CAS 2: PFR > 95% - Trim slightly to reach 90-95%
-            elif metrics.fill_percentage > 95.0:
-                warnings.append(
-                    f"PFR {metrics.fill_percentage}% > 95% - applying light trimming (step 1)"
+            # If STILL multi-pages, block generation
+            if metrics.page_count > 1:
+                raise ValueError(
+                    f"Unable to fit CV on one page. Current: {metrics.page_count} pages after trimming."
                 )
 
-                content = self.enricher.trim_content(content, step=1)
-                pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=True)
-                metrics = self.density_calc.calculate_pfr(pdf_bytes)
+            # CORRECTION: If trimming made PFR < 85%, apply CONSERVATIVE incremental enrichment
+            # Only enrich if PFR is critically low (< 85%), and accept 85-90% range
+            if metrics.fill_percentage < 85.0 and not deadline_allows("enrichment"):
+                self._skip_enrichment(lang, metrics, warnings)
 
+            elif metrics.fill_percentage < 85.0:
                 warnings.append(
-                    f"After trimming: {metrics.fill_percentage}% (delta: {metrics.fill_percentage - initial_pfr:+.1f}%)"
+                    f"Trimming resulted in low PFR ({metrics.fill_percentage}%) - applying conservative incremental enrichment"
                 )
 
-            # CAS 3: PFR < OPTIMAL_MIN (86%) - INCREMENTAL enrichment (ONE PASS ONLY)
-            elif metrics.fill_percentage < OPTIMAL_MIN:
-                warnings.append(
-                    f"PFR {metrics.fill_percentage}% < {OPTIMAL_MIN}% - applying INCREMENTAL enrichment (single pass)"
-                )
+                # Apply enrichment conservatively (reduce target to avoid overshoot)
+                # Passed per call: languages run concurrently, never mutate the class constant
+                conservative_target = min(88.0, ContentEnricher.TARGET_PFR)
 
-                # INCREMENTAL enrichment: adds N bullets (where N = estimated from PFR gap)
-                content = self.enricher.incremental_enrich_content(
+                content = self._enrich_pass(
+                    enrich,
+                    reason="corrective",
                     content=content,
                     current_metrics=metrics,
                     domain=domain,
                     language=lang,
                     original_text=original_text,
+                    target_pfr=conservative_target,
                 )
 
-                pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=False)
-                metrics = self.density_calc.calculate_pfr(pdf_bytes)
+                render_trim = False
+                metrics = self._measure(content, trim=render_trim)
+                warnings.append(f"After corrective enrichment: {metrics.fill_percentage}%, {metrics.page_count} page(s)")
 
-                new_pfr = metrics.fill_percentage
+                # If enrichment caused multi-pages again, revert to trimmed version
+                if metrics.page_count > 1:
+                    warnings.append(
+                        f"Enrichment caused multi-pages - reverting to trimmed version"
+                    )
+                    # Re-trim without enrichment (base_content was never mutated)
+                    content = self._trim_step(base_content, step=2)  # Use step 2 directly
+                    render_trim = True
+                    metrics = self._measure(content, trim=render_trim)
+                    warnings.append(f"Reverted to trimmed version: {metrics.fill_percentage}%")
+
+            elif metrics.fill_percentage < 90.0:
+                # PFR in [85-90%] - acceptable, no enrichment needed to avoid risk
                 warnings.append(
-                    f"After incremental enrichment: {new_pfr}% (delta: {new_pfr - initial_pfr:+.1f}%)"
+                    f"PFR {metrics.fill_percentage}% in acceptable range [85-90%] after trimming - no enrichment to avoid multi-pages risk"
                 )
 
-                # If enrichment caused overflow (> 95%), apply light trimming (ONE PASS)
-                if new_pfr > 95.0:
-                    warnings.append(
-                        f"Enrichment overshoot: {new_pfr}% > 95% - applying light trimming"
-                    )
-                    content = self.enricher.trim_content(content, step=1)
-                    pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=True)
-                    metrics = self.density_calc.calculate_pfr(pdf_bytes)
-                    warnings.append(f"After corrective trimming: {metrics.fill_percentage}%")
+        # CAS 2: PFR > 95% - Trim slightly to reach 90-95%
+        elif metrics.fill_percentage > 95.0:
+            warnings.append(
+                f"PFR {metrics.fill_percentage}% > 95% - applying planned trimming"
+            )
 
-            # CAS 4: PFR already in [90%, 95%] - ACCEPT as-is
+            planned = self._plan_trim(content, warnings)
+            if planned is not None:
+                content, metrics = planned
+                render_trim = False
             else:
-                warnings.append(
-                    f"PFR {metrics.fill_percentage}% already in optimal zone [90-95%] - no adjustment needed"
-                )
-                pdf_bytes = self.layout_engine.generate_pdf_from_data(content, trim=False)
+                content = self._trim_step(content, step=1)
+                render_trim = True
+                metrics = self._measure(content, trim=render_trim)
 
-            # Generate DOCX
-            docx_bytes = self._generate_docx_from_pdf(pdf_bytes)
+            warnings.append(
+                f"After trimming: {metrics.fill_percentage}% (delta: {metrics.fill_percentage - initial_pfr:+.1f}%)"
+            )
 
-            # FINAL VALIDATION
-            final_pfr = metrics.fill_percentage
+        # CAS 3: PFR < OPTIMAL_MIN (86%) but the deadline is short - accept as-is
+        elif metrics.fill_percentage < OPTIMAL_MIN and not deadline_allows("enrichment"):
+            self._skip_enrichment(lang, metrics, warnings)
 
-            # Strict page count validation
-            if metrics.page_count != 1:
-                raise ValueError(
-                    f"CV must be exactly one page. Current: {metrics.page_count} pages."
-                )
+        # CAS 3: PFR < OPTIMAL_MIN (86%) - INCREMENTAL enrichment (ONE PASS ONLY)
+        elif metrics.fill_percentage < OPTIMAL_MIN:
+            warnings.append(
+                f"PFR {metrics.fill_percentage}% < {OPTIMAL_MIN}% - applying INCREMENTAL enrichment (single pass)"
+            )
 
-            # PFR classification (ADJUSTED: Accept 86-95% for rich CVs, 90-95% for poor CVs)
-            if final_pfr >= OPTIMAL_MIN and final_pfr <= OPTIMAL_MAX:
-                warnings.append(
-                    f"SUCCESS: Final PFR {final_pfr}% in optimal zone [86-95%]"
-                )
-            elif final_pfr >= HARD_MINIMUM and final_pfr < OPTIMAL_MIN:
-                # Suboptimal but acceptable: 40-86%
-                # (Single-pass adjustment could not reach target - accept to avoid loops)
-                warnings.append(
-                    f"SUBOPTIMAL: Final PFR {final_pfr}% below target [40-86%] - accepted (single-pass limit)"
-                )
-            elif final_pfr > OPTIMAL_MAX:
-                # Above target: > 95%
-                # (Single-pass trimming could not reach target - accept to avoid loops)
+            # INCREMENTAL enrichment: adds N bullets (where N = estimated from PFR gap)
+            content = self._enrich_pass(
+                enrich,
+                reason="incremental",
+                content=content,
+                current_metrics=metrics,
+                domain=domain,
+                language=lang,
+                original_text=original_text,
+            )
+
+            render_trim = False
+            metrics = self._measure(content, trim=render_trim)
+
+            new_pfr = metrics.fill_percentage
+            warnings.append(
+                f"After incremental enrichment: {new_pfr}% (delta: {new_pfr - initial_pfr:+.1f}%)"
+            )
+
+            # If enrichment caused overflow (> 95%), apply light trimming (ONE PASS)
+            if new_pfr > 95.0:
                 warnings.append(
-                    f"SUBOPTIMAL: Final PFR {final_pfr}% above target (>95%) - accepted (single-pass limit)"
-                )
-            elif final_pfr < HARD_MINIMUM:
-                # Block if < 40% even after adjustments
-                raise ValueError(
-                    f"FINAL VALIDATION FAILED: {lang.upper()} must have PFR >= {HARD_MINIMUM}%. "
-                    f"Current: {final_pfr}%"
+                    f"Enrichment overshoot: {new_pfr}% > 95% - applying light trimming"
                 )
+                planned = self._plan_trim(content, warnings)
+                if planned is not None:
+                    content, metrics = planned
+                    render_trim = False
+                else:
+                    content = self._trim_step(content, step=1)
+                    render_trim = True
+                    metrics = self._measure(content, trim=render_trim)
+                warnings.append(f"After corrective trimming: {metrics.fill_percentage}%")
+
+        # CAS 4: PFR already in [90%, 95%] - ACCEPT as-is
+        else:
+            warnings.append(
+                f"PFR {metrics.fill_percentage}% already in optimal zone [90-95%] - no adjustment needed"
+            )
+
+        # Real render only for the final artifact (served from the render
+        # cache when the last decision already rendered this content)
+        content, render_trim, pdf_bytes, metrics = self._render_final(
+            content, render_trim, metrics, warnings
+        )
 
-            # Get warning message for user
-            warning_info = self.analyzer.get_warning_message(analysis['strategy'], lang)
+        # Generate DOCX (deferred: built on first download, off the request path)
+        docx_bytes = None
+        if self.docx_mode == "eager" and not deadline_allows("docx"):
+            degrade("defer_docx", f"{lang.upper()} DOCX built on download")
+            warnings.append("Deadline short - DOCX deferred to download")
+        elif self.docx_mode == "eager":
+            docx_bytes = self._generate_docx(content, render_trim, pdf_bytes)
 
-            final_results[lang] = CVGenerationResult(
-                pdf_bytes=pdf_bytes,
-                docx_bytes=docx_bytes,
-                page_count=metrics.page_count,
-                fill_percentage=metrics.fill_percentage,
-                char_count=metrics.char_count,
-                warnings=warnings,
-                warning_info=warning_info,
+        # FINAL VALIDATION
+        final_pfr = metrics.fill_percentage
+
+        # Strict page count validation
+        if metrics.page_count != 1:
+            raise ValueError(
+                f"CV must be exactly one page. Current: {metrics.page_count} pages."
+            )
+
+        # PFR classification (ADJUSTED: Accept 86-95% for rich CVs, 90-95% for poor CVs)
+        if final_pfr >= OPTIMAL_MIN and final_pfr <= OPTIMAL_MAX:
+            warnings.append(
+                f"SUCCESS: Final PFR {final_pfr}% in optimal zone [86-95%]"
+            )
+        elif final_pfr >= HARD_MINIMUM and final_pfr < OPTIMAL_MIN:
+            # Suboptimal but acceptable: 40-86%
+            # (Single-pass adjustment could not reach target - accept to avoid loops)
+            warnings.append(
+                f"SUBOPTIMAL: Final PFR {final_pfr}% below target [40-86%] - accepted (single-pass limit)"
+            )
+        elif final_pfr > OPTIMAL_MAX:
+            # Above target: > 95%
+            # (Single-pass trimming could not reach target - accept to avoid loops)
+            warnings.append(
+                f"SUBOPTIMAL: Final PFR {final_pfr}% above target (>95%) - accepted (single-pass limit)"
+            )
+        elif final_pfr < HARD_MINIMUM:
+            # Block if < 40% even after adjustments
+            raise ValueError(
+                f"FINAL VALIDATION FAILED: {lang.upper()} must have PFR >= {HARD_MINIMUM}%. "
+                f"Current: {final_pfr}%"
             )
 
-        return final_results
+        # Get warning message for user
+        warning_info = self.analyzer.get_warning_message(analysis['strategy'], lang)
+
+        return CVGenerationResult(
+            pdf_bytes=pdf_bytes,
+            docx_bytes=docx_bytes,
+            docx_deferred=docx_bytes is None,
+            content=content,
+            layout_trim=render_trim,
+            page_count=metrics.page_count,
+            fill_percentage=metrics.fill_percentage,
+            char_count=metrics.char_count,
+            warnings=warnings,
+            warning_info=warning_info,
+        )
 
     def _handle_overflow(
         self, content: Dict, metrics: PageFillMetrics, warnings: List[str]
@@ -601,58 +1544,110 @@ After providing more information, regenerate your CV.
             step = 1
 
         # Single trimming pass - no loops to maintain 1-2 minute generation time
-        trimmed = self.enricher.trim_content(content, step=step)
+        trimmed = self._trim_step(content, step=step)
         warnings.append(f"Trimming applied (step {step})")
 
         return trimmed
 
-    def _generate_docx_from_pdf(self, pdf_bytes: bytes) -> bytes:
+    def _trim_step(self, content: Dict, step: int) -> Dict:
+        """Apply one step of the trim cascade (see ContentEnricher.trim_content)."""
+        with span("trim.step", step=step):
+            return self.enricher.trim_content(content, step=step)
+
+    @staticmethod
+    def _skip_enrichment(language: str, metrics: PageFillMetrics, warnings: List[str]) -> None:
+        """Deadline short: accept the content below target PFR instead of enriching."""
+        degrade("skip_enrichment", f"{language.upper()} at {metrics.fill_percentage}%")
+        warnings.append(
+            f"PFR {metrics.fill_percentage}% below target but deadline is short - enrichment skipped"
+        )
+
+    @staticmethod
+    def _enrich_pass(enrich: Callable[..., Dict], reason: str, **kwargs) -> Dict:
+        """Run the enrichment pass and record the bullets it added."""
+        # Single enrichment pass per language (hard limit): pass_number is always 1
+        with span("enrich", reason=reason, pass_number=1) as current:
+            content = enrich(**kwargs)
+            current.set(
+                bullets_added=_bullet_count(content) - _bullet_count(kwargs["content"])
+            )
+            return content
+
+    def _generate_docx(self, content: Dict, trim: bool, pdf_bytes: bytes) -> bytes:
         """
-        Generate DOCX from PDF using pdf2docx conversion.
+        Generate DOCX natively from the final content (see DocxWriter).
 
-        Ensures DOCX matches PDF layout exactly.
+        Falls back to PDF → DOCX conversion if the native writer fails.
+        """
+        with span("docx", writer="native") as current:
+            try:
+                docx_bytes = DocxWriter.generate_docx_from_data(content, trim=trim)
+            except ValueError as e:
+                print(f"[DOCX] Native writer failed, falling back to pdf2docx: {e}")
+                current.set(writer="pdf2docx")
+                docx_bytes = self._generate_docx_from_pdf(pdf_bytes)
+            current.set(bytes=len(docx_bytes))
+            return docx_bytes
 
-        Args:
-            pdf_bytes: PDF bytes
+    def _generate_docx_from_pdf(self, pdf_bytes: bytes) -> bytes:
+        """Generate DOCX from PDF (see generate_docx_from_pdf)."""
+        return generate_docx_from_pdf(pdf_bytes)
 
-        Returns:
-            DOCX bytes
 
-        Raises:
-            ValueError: If DOCX generation fails
-        """
-        try:
-            from pdf2docx import Converter
-            import io
+def _bullet_count(content: Dict) -> int:
+    """Number of experience bullets in a CV content dictionary."""
+    return sum(len(exp.get("bullets", [])) for exp in content.get("work_experience", []))
 
-            # Create temp file for PDF
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
-                temp_pdf.write(pdf_bytes)
-                temp_pdf_path = temp_pdf.name
 
-            try:
-                # Convert PDF to DOCX
-                docx_stream = io.BytesIO()
-                converter = Converter(temp_pdf_path)
-                converter.convert(docx_stream)
-                converter.close()
+def generate_docx_from_pdf(pdf_bytes: bytes) -> bytes:
+    """
+    Generate DOCX from PDF using pdf2docx conversion.
+
+    Fallback path: DocxWriter builds the DOCX natively from content in
+    milliseconds. Used when only the PDF is available (e.g. CVs stored
+    without content) or if the native writer fails.
+
+    Args:
+        pdf_bytes: PDF bytes
+
+    Returns:
+        DOCX bytes
 
-                docx_bytes = docx_stream.getvalue()
+    Raises:
+        ValueError: If DOCX generation fails
+    """
+    try:
+        from pdf2docx import Converter
+        import io
+
+        # Create temp file for PDF
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
+            temp_pdf.write(pdf_bytes)
+            temp_pdf_path = temp_pdf.name
 
-                if not docx_bytes:
-                    raise ValueError("DOCX generation produced empty file")
+        try:
+            # Convert PDF to DOCX
+            docx_stream = io.BytesIO()
+            converter = Converter(temp_pdf_path)
+            converter.convert(docx_stream)
+            converter.close()
 
-                return docx_bytes
+            docx_bytes = docx_stream.getvalue()
 
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(temp_pdf_path)
-                except Exception:
-                    pass
+            if not docx_bytes:
+                raise ValueError("DOCX generation produced empty file")
 
-        except Exception as e:
-            raise ValueError(f"Failed to generate DOCX: {str(e)}")
+            return docx_bytes
+
+        finally:
+            # Clean up temp file
+            try:
+                os.unlink(temp_pdf_path)
+            except Exception:
+                pass
+
+    except Exception as e:
+        raise ValueError(f"Failed to generate DOCX: {str(e)}")
 
 
 # Convenience functions for simple usage
@@ -661,6 +1656,8 @@ def generate_cv_from_pdf(
     pdf_bytes: bytes,
     domain: str = "finance",
     languages: Optional[List[str]] = None,
+    docx_mode: Optional[str] = None,
+    second_language_mode: Optional[str] = None,
 ) -> Dict[str, CVGenerationResult]:
     """
     Generate CV from PDF bytes (convenience function).
@@ -670,17 +1667,22 @@ def generate_cv_from_pdf(
         pdf_bytes: PDF file as bytes
         domain: Target domain (finance, consulting, startup, government)
         languages: List of languages to generate (default: ["fr", "en"])
+        docx_mode: "eager" or "deferred" (default: DOCX_MODE from config)
+        second_language_mode: "generate" or "translate"
+                              (default: SECOND_LANGUAGE_MODE from config)
 
     Returns:
         Dictionary with requested language keys → CVGenerationResult
     """
-    generator = CVGenerator()
+    generator = CVGenerator(docx_mode=docx_mode, second_language_mode=second_language_mode)
     return generator.generate_from_pdf(pdf_bytes, domain, languages)
 
 
 def generate_cv_from_data(
     cv_content: CVContent,
     languages: Optional[List[str]] = None,
+    docx_mode: Optional[str] = None,
+    second_language_mode: Optional[str] = None,
 ) -> Dict[str, CVGenerationResult]:
     """
     Generate CV from structured data (convenience function).
@@ -689,14 +1691,69 @@ def generate_cv_from_data(
     Args:
         cv_content: Structured CV content
         languages: List of languages to generate (default: ["fr", "en"])
+        docx_mode: "eager" or "deferred" (default: DOCX_MODE from config)
+        second_language_mode: "generate" or "translate"
+                              (default: SECOND_LANGUAGE_MODE from config)
 
     Returns:
         Dictionary with requested language keys → CVGenerationResult
     """
-    generator = CVGenerator()
+    generator = CVGenerator(docx_mode=docx_mode, second_language_mode=second_language_mode)
     return generator.generate_from_data(cv_content, languages)
 
 
+async def agenerate_cv_from_pdf(
+    pdf_bytes: bytes,
+    domain: str = "finance",
+    languages: Optional[List[str]] = None,
+    docx_mode: Optional[str] = None,
+    second_language_mode: Optional[str] = None,
+) -> Dict[str, CVGenerationResult]:
+    """
+    Async counterpart of generate_cv_from_pdf() (convenience function).
+    Does not block the event loop; await it from async code (FastAPI routes).
+
+    Returns:
+        Dictionary with requested language keys → CVGenerationResult
+    """
+    generator = CVGenerator(docx_mode=docx_mode, second_language_mode=second_language_mode)
+    return await generator.agenerate_from_pdf(pdf_bytes, domain, languages)
+
+
+async def agenerate_cv_from_data(
+    cv_content: CVContent,
+    languages: Optional[List[str]] = None,
+    docx_mode: Optional[str] = None,
+    second_language_mode: Optional[str] = None,
+) -> Dict[str, CVGenerationResult]:
+    """
+    Async counterpart of generate_cv_from_data() (convenience function).
+
+    Returns:
+        Dictionary with requested language keys → CVGenerationResult
+    """
+    generator = CVGenerator(docx_mode=docx_mode, second_language_mode=second_language_mode)
+    return await generator.agenerate_from_data(cv_content, languages)
+
+
+def regenerate_cv_from_data(
+    cv_content: CVContent,
+    previous_input: Dict,
+    previous_content: Dict,
+    language: str,
+    docx_mode: Optional[str] = None,
+) -> Dict[str, CVGenerationResult]:
+    """
+    Incremental regeneration after a form edit (convenience function).
+    See CVGenerator.regenerate_from_data().
+
+    Returns:
+        Dictionary with key language → CVGenerationResult
+    """
+    generator = CVGenerator(docx_mode=docx_mode)
+    return generator.regenerate_from_data(cv_content, previous_input, previous_content, language)
+
+
 # Phase 1 & 2 convenience functions for faster perceived generation
 
 def generate_cv_phase1_from_pdf(
@@ -713,26 +1770,38 @@ def generate_cv_phase1_from_pdf(
         domain: Target domain (finance, consulting, startup, government)
 
     Returns:
-        Dictionary with key "fr" → CVGenerationResult (PDF only, no DOCX yet)
+        Dictionary with key "fr" → CVGenerationResult (PDF only, no DOCX yet);
+        result.session is the checkpoint to pass to Phase 2
     """
-    generator = CVGenerator()
+    generator = CVGenerator(docx_mode="deferred")
     return generator.generate_from_pdf(pdf_bytes, domain, languages=["fr"])
 
 
 def generate_cv_phase2_from_pdf(
-    pdf_bytes: bytes,
+    pdf_bytes: Optional[bytes],
     domain: str = "finance",
+    session: Optional[GenerationSession] = None,
+    second_language_mode: Optional[str] = None,
 ) -> Dict[str, CVGenerationResult]:
     """
     PHASE 2: Generate EN PDF + DOCX (deferred, asynchronous).
     Can be triggered in background after Phase 1 completes.
 
+    With the Phase 1 session, starts straight from the EN content call
+    (no second upload, extraction or analysis of the same PDF).
+
     Args:
-        pdf_bytes: PDF file as bytes
+        pdf_bytes: PDF file as bytes (optional when session is given)
         domain: Target domain (finance, consulting, startup, government)
+        session: Phase 1 checkpoint (phase1["fr"].session)
+        second_language_mode: "translate" derives EN from the Phase 1 FR final
+                              content (needs session); default from config
 
     Returns:
         Dictionary with key "en" → CVGenerationResult (PDF + DOCX)
+
+    Raises:
+        ValueError: If generation fails or the session belongs to a different PDF
     """
-    generator = CVGenerator()
-    return generator.generate_from_pdf(pdf_bytes, domain, languages=["en"])
+    generator = CVGenerator(docx_mode="eager", second_language_mode=second_language_mode)
+    return generator.generate_from_pdf(pdf_bytes, domain, languages=["en"], session=session)
@@ -0,0 +1,131 @@
+"""
+Incremental regeneration planning for Postulae CV Generator.
+
+Compares the structured input (CVContent.dict()) of a new form submission
+with the input of the user's last generation and decides how much of the
+pipeline must run again:
+- "render": only render-only fields changed (contact details, skills,
+  languages) or nothing changed → patch the last final content, re-render
+- "experiences": one or more experiences changed in place → rewrite only
+  their bullets through the LLM, keep everything else
+- "full": structure changed (experience added/removed/reordered, education,
+  summary, domain, activities...) → full generation
+
+The last final content must line up with its input (same number of
+experiences), otherwise the plan falls back to "full".
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .content_ops import with_sections
+
+# Copied verbatim from the form into the final content (language-neutral)
+RENDER_ONLY_FIELDS = ("contact_information", "it_skills", "language_skills")
+
+# Mirrors of other fields in CVContent (compared through their source field)
+ALIAS_FIELDS = {"experience": "work_experience", "languages": "language_skills"}
+
+# Experience header fields copied from the form when they change
+EXPERIENCE_HEADER_FIELDS = ("date", "company", "location", "position", "duration")
+
+
+@dataclass
+class RegenerationPlan:
+    """What must be regenerated for a new form submission."""
+    mode: str                                   # "render", "experiences" or "full"
+    render_fields: List[str] = field(default_factory=list)
+    experiences: List[int] = field(default_factory=list)  # Indexes whose bullets are rewritten
+    reason: str = ""
+
+    def describe(self) -> str:
+        if self.mode == "full":
+            return f"full regeneration ({self.reason})"
+        parts = []
+        if self.render_fields:
+            parts.append(f"re-render {', '.join(self.render_fields)}")
+        if self.experiences:
+            parts.append(f"rewrite experience(s) {', '.join(str(i + 1) for i in self.experiences)}")
+        return "; ".join(parts) or "unchanged, re-render only"
+
+
+def _full(reason: str) -> RegenerationPlan:
+    return RegenerationPlan(mode="full", reason=reason)
+
+
+def plan_regeneration(
+    previous_input: Dict,
+    new_input: Dict,
+    previous_content: Optional[Dict],
+) -> RegenerationPlan:
+    """
+    Diff two structured inputs and plan the regeneration.
+
+    Args:
+        previous_input: CVContent.dict() of the last generation
+        new_input: CVContent.dict() of the new submission
+        previous_content: Final content of the last generation (same language)
+
+    Returns:
+        RegenerationPlan
+    """
+    if not previous_content:
+        return _full("no previous content")
+
+    previous_experiences = previous_input.get("work_experience") or []
+    new_experiences = new_input.get("work_experience") or []
+    if len(previous_experiences) != len(new_experiences):
+        return _full("experiences added or removed")
+    if len(previous_content.get("work_experience") or []) != len(previous_experiences):
+        return _full("previous content does not match its form")
+
+    keys = set(previous_input) | set(new_input)
+    render_fields = []
+    for key in sorted(keys):
+        if key in ALIAS_FIELDS or key == "work_experience":
+            continue
+        if previous_input.get(key) == new_input.get(key):
+            continue
+        if key not in RENDER_ONLY_FIELDS:
+            return _full(f"{key} changed")
+        render_fields.append(key)
+
+    experiences = []
+    for index, (old, new) in enumerate(zip(previous_experiences, new_experiences)):
+        if old == new:
+            continue
+        if (old.get("company"), old.get("position")) != (new.get("company"), new.get("position")) \
+                and old.get("bullets") != new.get("bullets"):
+            # Different role at the same position: experiences were reordered or replaced
+            return _full(f"experience {index + 1} replaced")
+        experiences.append(index)
+
+    return RegenerationPlan(
+        mode="experiences" if experiences else "render",
+        render_fields=render_fields,
+        experiences=experiences,
+    )
+
+
+def apply_render_fields(content: Dict, new_input: Dict, plan: RegenerationPlan) -> Dict:
+    """
+    Copy the changed render-only fields of the new input into the final content.
+
+    Returns:
+        Patched content (shares every other section with content)
+    """
+    return with_sections(content, **{key: new_input.get(key) for key in plan.render_fields})
+
+
+def apply_experience_header(entry: Dict, previous: Dict, new: Dict) -> Dict:
+    """
+    Copy the header fields (date, company, ...) that changed in the form.
+
+    Returns:
+        Patched entry (entry itself when no header field changed)
+    """
+    changed = {
+        key: new.get(key)
+        for key in EXPERIENCE_HEADER_FIELDS
+        if previous.get(key) != new.get(key)
+    }
+    return {**entry, **changed} if changed else entry
@@ -16,10 +16,11 @@ import io
 import os
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from xhtml2pdf import pisa
 
 
@@ -40,6 +41,10 @@ class LayoutEngine:
         IMPORTANT: This normalization maintains compatibility with the precise
         layout template. Changes here can break the one-page layout.
 
+        The input is never mutated (copy-on-write, see content_ops): only
+        the education / experience entries it rewrites are copied, so
+        callers need no defensive deepcopy.
+
         Args:
             data: Raw CV content dictionary
             trim: If True, apply moderate trimming for overflow
@@ -58,7 +63,10 @@ class LayoutEngine:
             template_data["email"] = contact.get("email", "")
 
         # Education: normalize dates
+        education = []
         for edu in template_data.get("education", []) or []:
+            edu = dict(edu)
+            education.append(edu)
             if "year" in edu and "date" in edu:
                 year_val = str(edu.get("year", "")).strip()
                 date_val = str(edu.get("date", "")).strip()
@@ -81,6 +89,8 @@ class LayoutEngine:
             # Normalize location
             if edu.get("location"):
                 edu["location"] = LayoutEngine._shorten_location(str(edu["location"]))
+        if isinstance(template_data.get("education"), list):
+            template_data["education"] = education
 
         # Map keys: work_experience → experience
         template_data["experience"] = template_data.pop(
@@ -88,11 +98,16 @@ class LayoutEngine:
         )
 
         # Normalize experience dates and locations
+        experience = []
         for exp in template_data.get("experience", []) or []:
+            exp = dict(exp)
+            experience.append(exp)
             if exp.get("date"):
                 exp["date"] = LayoutEngine._shorten_date_range(str(exp["date"]))
             if exp.get("location"):
                 exp["location"] = LayoutEngine._shorten_location(str(exp["location"]))
+        if isinstance(template_data.get("experience"), list):
+            template_data["experience"] = experience
 
         # Map keys: language_skills → languages, etc.
         template_data["languages"] = template_data.pop(
@@ -159,7 +174,7 @@ class LayoutEngine:
                                 truncated = truncated.rstrip() + "…"
                             text = truncated
                         trimmed.append(text)
-                    exp["bullets"] = trimmed
+                    exp = {**exp, "bullets": trimmed}
                 limited_exp.append(exp)
             data["experience"] = limited_exp
 
@@ -368,14 +383,23 @@ class LayoutEngine:
         try:
             normalized_data = LayoutEngine.normalize_cv_data(data, trim=trim)
 
-            env = Environment(loader=FileSystemLoader(str(LayoutEngine.TEMPLATES_DIR)))
-            template = env.get_template("grid_template.html")
-
-            return template.render(**normalized_data)
+            return LayoutEngine._template().render(**normalized_data)
 
         except Exception as e:
             raise ValueError(f"Failed to render HTML template: {str(e)}")
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _template() -> Template:
+        """
+        Compiled grid template, loaded once per process.
+
+        Jinja templates are safe to render from several threads, so
+        concurrent generations (languages, batch items) share it.
+        """
+        env = Environment(loader=FileSystemLoader(str(LayoutEngine.TEMPLATES_DIR)))
+        return env.get_template("grid_template.html")
+
     @staticmethod
     def html_to_pdf(html: str) -> bytes:
         """
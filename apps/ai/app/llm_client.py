@@ -2,37 +2,336 @@
 LLM Client for Postulae CV Generator.
 Handles all interactions with OpenAI GPT models.
 Stateless, no file operations.
+
+Every call has a blocking version and an async counterpart prefixed with
+"a" so the API can await generations without blocking the event loop. Both
+go through the shared, pooled clients of openai_client.py (per-call-type
+timeouts, jittered backoff on 429 / 5xx).
 """
+import asyncio
+import contextvars
 import json
 import os
 import re
-from typing import Dict, Optional
+import threading
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
-from apps.config import OPENAI_API_KEY
-import openai
-# from dotenv import load_dotenv
+from apps.config import LOCAL_EXTRACTION_ENABLED, LOCAL_EXTRACTION_MIN_CONFIDENCE
 
 # Import bullet trimmer
 from .bullet_trimmer import trim_cv_bullets, validate_bullet_lengths
+from .cache import ExtractionCache, LLMResponseCache, get_extraction_cache, get_llm_cache, stable_hash
+from .cassette import configure_from_settings as configure_cassette, get_cassette
+from .deadline import allows as deadline_allows, degrade
+from .model_registry import get_profile, request_options
+from .openai_client import awith_backoff, get_async_client, get_client, timeout_for, with_backoff
+from .pdf_text import LOCAL_EXTRACTION_VERSION, extract_text_layer
+from .tracing import current_span, span
+from .uploads import UploadManager, get_upload_manager
+
+# Record / replay OpenAI calls when LLM_CASSETTE_MODE is set (see cassette.py)
+configure_cassette()
+
+# Prompts are read once, at import (not on every call)
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+PROMPTS: Dict[str, str] = {
+    path.name: path.read_text(encoding="utf-8") for path in sorted(PROMPTS_DIR.glob("*.txt"))
+}
 
-# load_dotenv()
-openai.api_key = OPENAI_API_KEY
+# Provider-side prompt caching (OpenAI: prefixes >= 1024 tokens) only hits on a
+# byte-identical prefix. Content and rewrite requests therefore start with the
+# base system prompt alone; language and instructions follow in a second message.
+BASE_SYSTEM_PROMPT = PROMPTS["base_system.txt"]
+LANGUAGE_INSTRUCTIONS = {"fr": "Output must be in French.", "en": "Output must be in English."}
 
-# Load prompts from files
-PROMPTS_DIR = Path(__file__).parent / "prompts"
+# Translation of finalized content: max bullet length drift vs source (keeps PFR in range)
+TRANSLATION_LENGTH_TOLERANCE = 0.10
+LANGUAGE_NAMES = {"fr": "French", "en": "English"}
+
+# Structured answers: every call type except single enrichment bullets
+JSON_RESPONSE = {"response_format": {"type": "json_object"}}
+
+# Concurrency budget of the current generation(s), see llm_budget()
+_llm_slots: contextvars.ContextVar[Optional[threading.BoundedSemaphore]] = contextvars.ContextVar(
+    "llm_slots", default=None
+)
+
+WORK_EXPERIENCE_FALLBACK_PROMPT = """CRITICAL: The previous extraction returned ZERO work experiences, but the source clearly contains work history.
+
+TASK: Extract ALL work experiences from the source. Look for:
+- Company/organization names
+- Job titles or roles
+- Date ranges (any format)
+- Responsibilities or achievements
+
+You MUST extract AT LEAST ONE work experience if ANY exists in the source.
+
+Return ONLY work experiences in this exact format:
+{
+    "work_experience": [{
+        "date": "Mon YYYY-Mon YYYY",
+        "company": "COMPANY NAME",
+        "location": "City, Country",
+        "position": "Job Title",
+        "duration": "X months",
+        "bullets": ["Achievement 1", "Achievement 2", "Achievement 3"]
+    }]
+}"""
+
+
+@contextmanager
+def llm_budget(budget: Union[int, threading.BoundedSemaphore]) -> Iterator[threading.BoundedSemaphore]:
+    """
+    Cap the chat completions in flight for everything run inside the block.
+
+    The budget propagates like trace spans (contextvars): worker threads
+    submitted through tracing.run_in_context() and asyncio tasks share it.
+    Passing the same semaphore to several blocks (e.g. one per batch item)
+    makes them share one budget, so a batch stays within the API quota.
+
+    Args:
+        budget: Max concurrent chat completions (>= 1), or a shared semaphore
+
+    Raises:
+        ValueError: If budget is an int < 1
+    """
+    if isinstance(budget, int):
+        if budget < 1:
+            raise ValueError("LLM concurrency budget must be >= 1")
+        budget = threading.BoundedSemaphore(budget)
+    token = _llm_slots.set(budget)
+    try:
+        yield budget
+    finally:
+        _llm_slots.reset(token)
+
+
+def _send(kind: str, request: Dict, send):
+    """Live call, or through the active cassette (record / replay)."""
+    cassette = get_cassette()
+    return send() if cassette is None else cassette.call(kind, request, send)
+
+
+async def _asend(kind: str, request: Dict, send):
+    """Async counterpart of _send() (send returns an awaitable)."""
+    cassette = get_cassette()
+    return await (send() if cassette is None else cassette.acall(kind, request, send))
+
+
+def _json_request(call_type: str) -> Dict:
+    """Registry parameters of a call type + JSON answer (extraction / content requests are cache key parts)."""
+    return {**request_options(call_type), **JSON_RESPONSE}
+
+
+def chat_completion(call_type: str = "content", **kwargs):
+    """
+    Blocking chat completion (single entry point for sync calls).
+
+    Args:
+        call_type: Call type of the model registry: selects the provider
+            (model_registry.py) and the timeout (openai_client.CALL_TIMEOUTS)
+        **kwargs: Chat completion request
+    """
+    slots = _llm_slots.get()
+    provider = get_profile(call_type).provider
+
+    def send():
+        return with_backoff(
+            lambda: get_client(provider).chat.completions.create(**kwargs, timeout=timeout_for(call_type)),
+            call_type,
+        )
+
+    with span("llm.chat", provider=provider, model=kwargs.get("model"), call_type=call_type) as current:
+        if slots is None:
+            response = _send("chat", kwargs, send)
+        else:
+            with slots:
+                response = _send("chat", kwargs, send)
+        current.record_usage(getattr(response, "usage", None))
+        return response
+
+
+async def achat_completion(call_type: str = "content", **kwargs):
+    """Async counterpart of chat_completion()."""
+    slots = _llm_slots.get()
+    provider = get_profile(call_type).provider
+
+    def send():
+        return awith_backoff(
+            lambda: get_async_client(provider).chat.completions.create(**kwargs, timeout=timeout_for(call_type)),
+            call_type,
+        )
+
+    with span("llm.chat", provider=provider, model=kwargs.get("model"), call_type=call_type) as current:
+        if slots is not None:
+            # Slots are shared with threads: poll instead of blocking the loop
+            while not slots.acquire(blocking=False):
+                await asyncio.sleep(0.05)
+        try:
+            response = await _asend("chat", kwargs, send)
+        finally:
+            if slots is not None:
+                slots.release()
+        current.record_usage(getattr(response, "usage", None))
+        return response
 
 
 def _load_prompt(filename: str) -> str:
-    """Load prompt template from file."""
-    prompt_path = PROMPTS_DIR / filename
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
-    return prompt_path.read_text(encoding="utf-8")
+    """Return a prompt template (preloaded from PROMPTS_DIR)."""
+    if filename not in PROMPTS:
+        raise FileNotFoundError(f"Prompt file not found: {PROMPTS_DIR / filename}")
+    return PROMPTS[filename]
+
+
+def _system_messages(instructions: List[str]) -> List[Dict]:
+    """Static base system prompt, then the per-request instructions (cache-friendly layout)."""
+    return [
+        {"role": "system", "content": BASE_SYSTEM_PROMPT},
+        {"role": "system", "content": "\n\n".join(instructions)},
+    ]
+
+
+def _build_extraction_messages(file_id: str) -> List[Dict]:
+    """Build the GPT-4o vision messages for an uploaded PDF."""
+    prompt = _load_prompt("extract_from_pdf.txt")
+    return [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": prompt},
+                {
+                    "type": "file",
+                    "file": {"file_id": file_id},
+                },
+            ],
+        }
+    ]
+
+
+def _extraction_prompt_version() -> str:
+    """Version of the extraction: changes with the model, parameters, prompt file or local extractor."""
+    return stable_hash({
+        "request": _json_request("extraction"),
+        "prompt": _load_prompt("extract_from_pdf.txt"),
+        "local": [LOCAL_EXTRACTION_VERSION, LOCAL_EXTRACTION_MIN_CONFIDENCE] if LOCAL_EXTRACTION_ENABLED else None,
+    })[:16]
+
+
+def _local_extraction(pdf_bytes: bytes) -> Optional[str]:
+    """
+    Read the PDF's text layer locally (see pdf_text.py).
+
+    Returns:
+        Extracted text, or None when the PDF needs the GPT-4o vision
+        extraction (disabled, unreadable, scanned or low confidence)
+    """
+    if not LOCAL_EXTRACTION_ENABLED:
+        return None
+    with span("extract.local") as current:
+        try:
+            layer = extract_text_layer(pdf_bytes)
+        except ValueError as e:
+            current.set(confidence=0.0)
+            print(f"[EXTRACTION] {e} - using GPT-4o")
+            return None
+        current.set(confidence=layer.confidence, pages=layer.page_count, chars=len(layer.text))
+
+    if layer.confidence < LOCAL_EXTRACTION_MIN_CONFIDENCE:
+        print(
+            f"[EXTRACTION] Text layer confidence {layer.confidence:.2f} < {LOCAL_EXTRACTION_MIN_CONFIDENCE} "
+            f"({'; '.join(layer.reasons)}) - using GPT-4o"
+        )
+        return None
+    print(f"[EXTRACTION] Text layer read locally ({len(layer.text)} chars, confidence {layer.confidence:.2f}) - no upload")
+    return layer.text
+
+
+def _record_extractor(extractor: str) -> None:
+    """Record which extractor produced the text on the current span."""
+    current = current_span()
+    if current is not None:
+        current.set(extractor=extractor)
+
+
+def _cached_extraction(pdf_bytes: bytes) -> Tuple[Optional[ExtractionCache], Optional[str], Optional[str]]:
+    """
+    Look a PDF up in the extraction cache.
+
+    Returns:
+        Tuple (cache or None when disabled, key, cached raw text or None)
+    """
+    cache = get_extraction_cache()
+    if cache is None:
+        return None, None, None
+    key = cache.make_key(pdf_bytes, _extraction_prompt_version())
+    raw_text = cache.get_text(key)
+    current = current_span()
+    if current is not None:
+        current.set(extraction_cache="hit" if raw_text is not None else "miss")
+    if raw_text is not None:
+        print(f"[EXTRACTION CACHE] PDF already extracted ({len(raw_text)} chars) - no upload")
+    return cache, key, raw_text
+
+
+def forget_extraction(pdf_bytes: bytes) -> None:
+    """Drop the cached text of a PDF (its upload was deleted)."""
+    cache = get_extraction_cache()
+    if cache is not None:
+        cache.delete(cache.make_key(pdf_bytes, _extraction_prompt_version()))
+
+
+def _store_extraction(cache: Optional[ExtractionCache], key: Optional[str], raw_text: str) -> str:
+    """Cache extracted text (empty extractions are not cached) and return it."""
+    if cache is not None and raw_text.strip():
+        cache.set_text(key, raw_text)
+    return raw_text
+
+
+def _reusable_upload(pdf_bytes: bytes) -> Tuple[Optional[UploadManager], Optional[str], Optional[str]]:
+    """
+    Look the PDF up in the upload manager.
+
+    Returns:
+        Tuple (manager or None when disabled, PDF digest, live file_id to reuse or None)
+    """
+    manager = get_upload_manager()
+    if manager is None or get_cassette() is not None:  # Replayed file ids do not exist remotely
+        return None, None, None
+    digest = manager.digest(pdf_bytes)
+    return manager, digest, manager.acquire(digest)
+
+
+def _register_upload(manager: Optional[UploadManager], digest: Optional[str], file_id: str) -> str:
+    """Hand a new upload to the manager (deleted in the background) and return the file_id to use."""
+    if manager is None:
+        return file_id
+    client = get_client()  # Deletions run later, from the cleanup thread
+    return manager.register(
+        digest, file_id, delete=lambda fid: client.files.delete(fid, timeout=timeout_for("file"))
+    )
+
+
+def _release_upload(manager: Optional[UploadManager], file_id: Optional[str], text_cached: bool) -> None:
+    """Release an upload: deleted now if its text is cached, otherwise reusable until its TTL."""
+    if manager is not None and file_id is not None:
+        manager.release(file_id, keep=not text_cached)
 
 
 def extract_text_from_pdf_bytes(pdf_bytes: bytes, filename: str = "resume.pdf") -> str:
     """
-    Extract text from PDF bytes using GPT-4 Vision.
+    Extract text from PDF bytes: local text layer first, GPT-4 Vision otherwise.
+
+    Born-digital PDFs are read locally with pdfplumber (see pdf_text.py);
+    only scanned or low-confidence PDFs (below
+    LOCAL_EXTRACTION_MIN_CONFIDENCE) are uploaded for a vision extraction.
+
+    Results are cached by PDF SHA-256 + prompt version (see
+    cache.ExtractionCache): a PDF already extracted skips the upload and
+    the vision call. Uploads go through the upload manager (see
+    uploads.py): a live upload of the same PDF is reused, and uploaded
+    files are deleted in the background once no longer needed.
 
     Args:
         pdf_bytes: PDF file as bytes
@@ -45,39 +344,294 @@ def extract_text_from_pdf_bytes(pdf_bytes: bytes, filename: str = "resume.pdf")
         ValueError: If extraction fails
     """
     try:
-        # Create file object in memory for OpenAI API
-        file_obj = openai.files.create(
-            file=(filename, pdf_bytes),
-            purpose="user_data",
-        )
+        cache, key, cached = _cached_extraction(pdf_bytes)
+        if cached is not None:
+            return cached
+
+        local_text = _local_extraction(pdf_bytes)
+        if local_text is not None:
+            _record_extractor("local")
+            return _store_extraction(cache, key, local_text)
+        _record_extractor("gpt-4o")
+
+        manager, digest, file_id = _reusable_upload(pdf_bytes)
+        raw_text = ""
+        try:
+            if file_id is None:
+                # Create file object in memory for OpenAI API
+                file_obj = _send(
+                    "file",
+                    {"filename": filename, "file": pdf_bytes, "purpose": "user_data"},
+                    lambda: with_backoff(lambda: get_client().files.create(
+                        file=(filename, pdf_bytes), purpose="user_data", timeout=timeout_for("file")
+                    ), "file"),
+                )
+                file_id = _register_upload(manager, digest, file_obj.id)
 
-        prompt = _load_prompt("extract_from_pdf.txt")
+            response = chat_completion(
+                call_type="extraction", messages=_build_extraction_messages(file_id), **_json_request("extraction")
+            )
 
-        response = openai.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "file",
-                            "file": {"file_id": file_obj.id},
-                        },
-                    ],
-                }
-            ],
-            temperature=0.2,
-            response_format={"type": "json_object"},
-        )
+            content = json.loads(response.choices[0].message.content)
+            raw_text = _store_extraction(cache, key, content.get("raw_text", ""))
+            return raw_text
+        finally:
+            _release_upload(manager, file_id, text_cached=cache is not None and bool(raw_text.strip()))
 
-        content = json.loads(response.choices[0].message.content)
-        return content.get("raw_text", "")
+    except Exception as e:
+        raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+
+
+async def aextract_text_from_pdf_bytes(pdf_bytes: bytes, filename: str = "resume.pdf") -> str:
+    """
+    Async counterpart of extract_text_from_pdf_bytes().
+
+    Raises:
+        ValueError: If extraction fails
+    """
+    try:
+        cache, key, cached = _cached_extraction(pdf_bytes)
+        if cached is not None:
+            return cached
+
+        # pdfplumber is CPU-bound: keep the event loop free
+        local_text = await asyncio.to_thread(_local_extraction, pdf_bytes)
+        if local_text is not None:
+            _record_extractor("local")
+            return _store_extraction(cache, key, local_text)
+        _record_extractor("gpt-4o")
+
+        manager, digest, file_id = _reusable_upload(pdf_bytes)
+        raw_text = ""
+        try:
+            if file_id is None:
+                file_obj = await _asend(
+                    "file",
+                    {"filename": filename, "file": pdf_bytes, "purpose": "user_data"},
+                    lambda: awith_backoff(lambda: get_async_client().files.create(
+                        file=(filename, pdf_bytes), purpose="user_data", timeout=timeout_for("file")
+                    ), "file"),
+                )
+                file_id = _register_upload(manager, digest, file_obj.id)
+
+            response = await achat_completion(
+                call_type="extraction", messages=_build_extraction_messages(file_id), **_json_request("extraction")
+            )
+
+            content = json.loads(response.choices[0].message.content)
+            raw_text = _store_extraction(cache, key, content.get("raw_text", ""))
+            return raw_text
+        finally:
+            _release_upload(manager, file_id, text_cached=cache is not None and bool(raw_text.strip()))
 
     except Exception as e:
         raise ValueError(f"Failed to extract text from PDF: {str(e)}")
 
 
+def _build_content_messages(
+    input_data: Dict,
+    language: str,
+    enrichment_mode: bool,
+    current_metrics: Optional[Dict],
+    enrichment_instructions: Optional[str],
+) -> List[Dict]:
+    """
+    Build the messages for generate_cv_content().
+
+    Layout: base system prompt (static, cached by the provider), then the
+    language and enrichment instructions, then the resume data.
+    """
+    # Add language specification
+    instructions = [LANGUAGE_INSTRUCTIONS["fr" if language == "fr" else "en"]]
+
+    # Add adaptive enrichment instructions (NEW SYSTEM)
+    if enrichment_instructions:
+        instructions.append(enrichment_instructions)
+
+    # Add enrichment instructions if in enrichment mode (LEGACY - for backwards compatibility)
+    elif enrichment_mode and current_metrics:
+        enrich_prompt = _load_prompt("enrich_content.txt")
+        enrich_prompt = enrich_prompt.format(
+            fill_percentage=current_metrics.get("fill_percentage", 0),
+            char_count=current_metrics.get("char_count", 0),
+        )
+        instructions.append(enrich_prompt)
+
+    # Prepare user content
+    if "raw_text" in input_data:
+        user_content = f"Resume data: {input_data['raw_text']}"
+    else:
+        user_content = f"Resume data: {json.dumps(input_data, ensure_ascii=False)}"
+
+    return _system_messages(instructions) + [{"role": "user", "content": user_content}]
+
+
+def _needs_work_experience_fallback(content: Dict, input_data: Dict) -> bool:
+    """
+    SAFETY CHECK: Detect empty work_experience when source contains experiences.
+
+    Returns:
+        True if the one-shot fallback extraction should run
+    """
+    if not (
+        "raw_text" in input_data
+        and isinstance(content.get("work_experience"), list)
+        and len(content.get("work_experience", [])) == 0
+    ):
+        return False
+
+    # Check if raw text contains work experience signals
+    raw_text_lower = input_data["raw_text"].lower()
+    experience_signals = [
+        "experience", "expérience", "work", "job", "position",
+        "consultant", "analyst", "manager", "intern", "stage",
+        "company", "entreprise", "société"
+    ]
+
+    has_experience_signals = any(signal in raw_text_lower for signal in experience_signals)
+
+    # Also check for date patterns (YYYY, Mon YYYY, etc.)
+    has_dates = bool(re.search(r'\b(19|20)\d{2}\b', input_data["raw_text"]))
+
+    return has_experience_signals and has_dates
+
+
+def _should_run_fallback(content: Dict, input_data: Dict) -> bool:
+    """Fallback extraction needed AND the generation deadline leaves time for it."""
+    if not _needs_work_experience_fallback(content, input_data):
+        return False
+    if not deadline_allows("fallback_extraction"):
+        degrade("skip_fallback_extraction", "work_experience left empty")
+        return False
+    return True
+
+
+def _build_fallback_messages(raw_text: str) -> List[Dict]:
+    """Build messages for the one-shot targeted work experience extraction."""
+    return [
+        {"role": "system", "content": WORK_EXPERIENCE_FALLBACK_PROMPT},
+        {"role": "user", "content": f"Source text:\n\n{raw_text}"}
+    ]
+
+
+def _merge_fallback_content(content: Dict, fallback_content: Dict) -> None:
+    """Merge fallback work_experience into content (in place)."""
+    if fallback_content.get("work_experience") and len(fallback_content["work_experience"]) > 0:
+        content["work_experience"] = fallback_content["work_experience"]
+
+
+def _log_bullet_stats(content: Dict) -> None:
+    """Print bullet length statistics for generated content."""
+    # TRIMMING DISABLED: PDF reference has LONG bullets (140-210 chars), not short ones!
+    # The JSON with short bullets was created by truncating, not by LLM generation.
+    print("\n[BULLET TRIMMING] DISABLED - Elite PDFs use long bullets (140-210 chars)")
+    # content = trim_cv_bullets(content)
+
+    # Validate bullet lengths after trimming
+    stats = validate_bullet_lengths(content)
+    if stats["total_bullets"] > 0:
+        print(f"\n[BULLET STATS AFTER TRIMMING]")
+        print(f"   Total bullets: {stats['total_bullets']}")
+        print(f"   Average length: {stats['avg_length']:.1f} chars")
+        print(f"   Range: {stats['min_length']}-{stats['max_length']} chars")
+        print(f"   Optimal (110-155): {stats['optimal']}/{stats['total_bullets']} ({stats['optimal']/stats['total_bullets']*100:.1f}%)")
+        if stats["too_long"] > 0:
+            print(f"   WARNING:  Still too long (>155): {stats['too_long']} bullets")
+        if stats["too_short"] > 0:
+            print(f"   WARNING:  Too short (<110): {stats['too_short']} bullets")
+
+
+def _log_content_quality(content: Dict, input_data: Dict) -> None:
+    """Print quality validation warnings (bullet length, coursework, empty experience)."""
+    # QUALITY VALIDATION: Check bullet length (elite CV standard: 120-145 chars, avg ~127)
+    if "work_experience" in content:
+        for idx, exp in enumerate(content["work_experience"]):
+            if "bullets" in exp:
+                for bullet_idx, bullet in enumerate(exp["bullets"]):
+                    bullet_len = len(bullet)
+                    if bullet_len < 100:
+                        print(f"WARNING:  WARNING: Work experience bullet too short (elite standard: 120-145 chars)")
+                        print(f"    Experience #{idx+1} ({exp.get('company', 'Unknown')}), Bullet #{bullet_idx+1}: {bullet_len} chars")
+                        print(f"    Text: {bullet[:80]}...")
+                        print(f"    → This will reduce PFR below elite standards (90%+ requires 120-145 chars)")
+                    elif bullet_len < 110:
+                        print(f"WARNING:  INFO: Bullet below optimal length")
+                        print(f"    Experience #{idx+1} ({exp.get('company', 'Unknown')}), Bullet #{bullet_idx+1}: {bullet_len} chars (optimal: 120-145)")
+                    elif bullet_len > 150:
+                        print(f"WARNING:  INFO: Bullet above optimal length (may reduce space for other sections)")
+                        print(f"    Experience #{idx+1} ({exp.get('company', 'Unknown')}), Bullet #{bullet_idx+1}: {bullet_len} chars (optimal: 120-145)")
+
+    # QUALITY VALIDATION: Check coursework count (elite standard: 5-7 items, NEVER empty for university/prépa)
+    if "education" in content:
+        for idx, edu in enumerate(content["education"]):
+            institution = edu.get('institution', 'Unknown').lower()
+            degree = edu.get('degree', '').lower()
+            coursework_count = len(edu.get("coursework", []))
+
+            # Detect if university/master or classe préparatoire
+            is_university = any(keyword in institution or keyword in degree for keyword in ['university', 'université', 'master', 'hec', 'business school', 'grande école'])
+            is_prepa = any(keyword in institution or keyword in degree for keyword in ['préparatoire', 'preparatoire', 'prepa', 'lycée saint-louis', 'lycée louis'])
+
+            if (is_university or is_prepa) and coursework_count == 0:
+                print(f"WARNING:  CRITICAL: Coursework empty for university/prépa (MUST have 4-7 items)")
+                print(f"    Education #{idx+1} ({edu.get('institution', 'Unknown')}): {coursework_count} items")
+                print(f"    → This is a CRITICAL ERROR - infer coursework from specialty/degree if not in source")
+            elif (is_university or is_prepa) and coursework_count < 4:
+                print(f"WARNING:  WARNING: Coursework too short for university/prépa")
+                print(f"    Education #{idx+1} ({edu.get('institution', 'Unknown')}): {coursework_count} items (need 5-7)")
+            elif is_university and coursework_count >= 5:
+                # Good
+                pass
+            elif not is_university and not is_prepa and coursework_count < 5 and coursework_count > 0:
+                print(f"WARNING:  INFO: High school coursework present but limited")
+                print(f"    Education #{idx+1} ({edu.get('institution', 'Unknown')}): {coursework_count} items (acceptable for high school)")
+
+    # QUALITY VALIDATION: Check for empty work_experience when it shouldn't be
+    if "raw_text" in input_data and len(content.get("work_experience", [])) == 0:
+        print(f"WARNING:  CRITICAL: work_experience is empty but source may contain work history")
+        print(f"    This will result in PFR < 65% and generation will be blocked")
+
+
+def _cached_content(
+    messages: List[Dict],
+    enrichment_instructions: Optional[str],
+    language: str,
+    input_data: Dict,
+    use_cache: bool,
+) -> Tuple[Optional[LLMResponseCache], Optional[str], Optional[Dict]]:
+    """
+    Look a content request up in the LLM response cache.
+
+    Returns:
+        Tuple (cache or None when disabled, key, cached content or None)
+    """
+    cache = get_llm_cache() if use_cache else None
+    if cache is None:
+        return None, None, None
+    key = cache.make_key(
+        system_prompt="\n\n".join(message["content"] for message in messages[:-1]),
+        enrichment_instructions=enrichment_instructions,
+        language=language,
+        input_data=input_data,
+        **_json_request("content"),
+    )
+    content = cache.get(key)
+    current = current_span()
+    if current is not None:
+        current.set(llm_cache="hit" if content is not None else "miss")
+    if content is not None:
+        print(f"[LLM CACHE] Content served from cache ({language.upper()})")
+    return cache, key, content
+
+
+def _store_content(
+    cache: Optional[LLMResponseCache], key: Optional[str], content: Dict, input_data: Dict
+) -> None:
+    """Cache generated content (not when work_experience is still missing: a retry may fix it)."""
+    if cache is not None and not _needs_work_experience_fallback(content, input_data):
+        cache.set(key, content)
+
+
 def generate_cv_content(
     input_data: Dict,
     domain: str = "finance",
@@ -85,16 +639,22 @@ def generate_cv_content(
     enrichment_mode: bool = False,
     current_metrics: Optional[Dict] = None,
     enrichment_instructions: Optional[str] = None,
+    use_cache: bool = True,
 ) -> Dict:
     """
     Generate CV content from input data using GPT.
 
+    Identical requests are served from the LLM response cache
+    (cache.get_llm_cache()) unless use_cache is False.
+
     Args:
         input_data: Input data (raw_text from PDF or structured data)
         domain: Target domain (finance, consulting, startup, government)
         language: Output language (en, fr)
         enrichment_mode: If True, generate comprehensive content for low PFR
         current_metrics: Current page fill metrics for enrichment context
+        enrichment_instructions: Adaptive enrichment instructions (ContentAnalyzer)
+        use_cache: Read / write the LLM response cache (False forces a fresh call)
 
     Returns:
         Structured CV content as dictionary
@@ -103,176 +663,288 @@ def generate_cv_content(
         ValueError: If generation fails
     """
     try:
-        # Load base system prompt
-        system_prompt = _load_prompt("base_system.txt")
+        messages = _build_content_messages(
+            input_data, language, enrichment_mode, current_metrics, enrichment_instructions
+        )
+        cache, key, cached = _cached_content(
+            messages, enrichment_instructions, language, input_data, use_cache
+        )
+        if cached is not None:
+            return cached
 
-        # Add language specification
-        if language == "fr":
-            system_prompt += "\n\nOutput must be in French."
-        else:
-            system_prompt += "\n\nOutput must be in English."
-
-        # Add adaptive enrichment instructions (NEW SYSTEM)
-        if enrichment_instructions:
-            system_prompt += "\n\n" + enrichment_instructions
-
-        # Add enrichment instructions if in enrichment mode (LEGACY - for backwards compatibility)
-        elif enrichment_mode and current_metrics:
-            enrich_prompt = _load_prompt("enrich_content.txt")
-            enrich_prompt = enrich_prompt.format(
-                fill_percentage=current_metrics.get("fill_percentage", 0),
-                char_count=current_metrics.get("char_count", 0),
+        # Call GPT
+        response = chat_completion(call_type="content", messages=messages, **_json_request("content"))
+
+        content = json.loads(response.choices[0].message.content)
+        _log_bullet_stats(content)
+
+        if _should_run_fallback(content, input_data):
+            # FALLBACK: One-shot targeted extraction
+            fallback_response = chat_completion(
+                call_type="fallback",
+                messages=_build_fallback_messages(input_data["raw_text"]),
+                **_json_request("fallback"),
+            )
+            _merge_fallback_content(
+                content, json.loads(fallback_response.choices[0].message.content)
             )
-            system_prompt += "\n\n" + enrich_prompt
 
-        # Prepare user content
-        if "raw_text" in input_data:
-            user_content = f"Resume data: {input_data['raw_text']}"
-        else:
-            user_content = f"Resume data: {json.dumps(input_data, ensure_ascii=False)}"
+        _log_content_quality(content, input_data)
+        _store_content(cache, key, content, input_data)
+        return content
 
-        # Call GPT
-        response = openai.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_content},
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"},
+    except Exception as e:
+        raise ValueError(f"Failed to generate CV content: {str(e)}")
+
+
+async def agenerate_cv_content(
+    input_data: Dict,
+    domain: str = "finance",
+    language: str = "en",
+    enrichment_mode: bool = False,
+    current_metrics: Optional[Dict] = None,
+    enrichment_instructions: Optional[str] = None,
+    use_cache: bool = True,
+) -> Dict:
+    """
+    Async counterpart of generate_cv_content() (same prompts, validation and cache).
+
+    Raises:
+        ValueError: If generation fails
+    """
+    try:
+        messages = _build_content_messages(
+            input_data, language, enrichment_mode, current_metrics, enrichment_instructions
         )
+        cache, key, cached = _cached_content(
+            messages, enrichment_instructions, language, input_data, use_cache
+        )
+        if cached is not None:
+            return cached
+
+        response = await achat_completion(call_type="content", messages=messages, **_json_request("content"))
 
         content = json.loads(response.choices[0].message.content)
+        _log_bullet_stats(content)
 
-        # TRIMMING DISABLED: PDF reference has LONG bullets (140-210 chars), not short ones!
-        # The JSON with short bullets was created by truncating, not by LLM generation.
-        print("\n[BULLET TRIMMING] DISABLED - Elite PDFs use long bullets (140-210 chars)")
-        # content = trim_cv_bullets(content)
-
-        # Validate bullet lengths after trimming
-        stats = validate_bullet_lengths(content)
-        if stats["total_bullets"] > 0:
-            print(f"\n[BULLET STATS AFTER TRIMMING]")
-            print(f"   Total bullets: {stats['total_bullets']}")
-            print(f"   Average length: {stats['avg_length']:.1f} chars")
-            print(f"   Range: {stats['min_length']}-{stats['max_length']} chars")
-            print(f"   Optimal (110-155): {stats['optimal']}/{stats['total_bullets']} ({stats['optimal']/stats['total_bullets']*100:.1f}%)")
-            if stats["too_long"] > 0:
-                print(f"   WARNING:  Still too long (>155): {stats['too_long']} bullets")
-            if stats["too_short"] > 0:
-                print(f"   WARNING:  Too short (<110): {stats['too_short']} bullets")
-
-        # SAFETY CHECK: Prevent empty work_experience when source contains experiences
-        if (
-            "raw_text" in input_data
-            and isinstance(content.get("work_experience"), list)
-            and len(content.get("work_experience", [])) == 0
-        ):
-            # Check if raw text contains work experience signals
-            raw_text_lower = input_data["raw_text"].lower()
-            experience_signals = [
-                "experience", "expérience", "work", "job", "position",
-                "consultant", "analyst", "manager", "intern", "stage",
-                "company", "entreprise", "société"
-            ]
-
-            has_experience_signals = any(signal in raw_text_lower for signal in experience_signals)
-
-            # Also check for date patterns (YYYY, Mon YYYY, etc.)
-            has_dates = bool(re.search(r'\b(19|20)\d{2}\b', input_data["raw_text"]))
-
-            if has_experience_signals and has_dates:
-                # FALLBACK: One-shot targeted extraction
-                fallback_prompt = """CRITICAL: The previous extraction returned ZERO work experiences, but the source clearly contains work history.
+        if _should_run_fallback(content, input_data):
+            fallback_response = await achat_completion(
+                call_type="fallback",
+                messages=_build_fallback_messages(input_data["raw_text"]),
+                **_json_request("fallback"),
+            )
+            _merge_fallback_content(
+                content, json.loads(fallback_response.choices[0].message.content)
+            )
 
-TASK: Extract ALL work experiences from the source. Look for:
-- Company/organization names
-- Job titles or roles
-- Date ranges (any format)
-- Responsibilities or achievements
+        _log_content_quality(content, input_data)
+        _store_content(cache, key, content, input_data)
+        return content
 
-You MUST extract AT LEAST ONE work experience if ANY exists in the source.
+    except Exception as e:
+        raise ValueError(f"Failed to generate CV content: {str(e)}")
 
-Return ONLY work experiences in this exact format:
-{
-    "work_experience": [{
-        "date": "Mon YYYY-Mon YYYY",
-        "company": "COMPANY NAME",
-        "location": "City, Country",
-        "position": "Job Title",
-        "duration": "X months",
-        "bullets": ["Achievement 1", "Achievement 2", "Achievement 3"]
-    }]
-}"""
 
-                fallback_response = openai.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[
-                        {"role": "system", "content": fallback_prompt},
-                        {"role": "user", "content": f"Source text:\n\n{input_data['raw_text']}"}
-                    ],
-                    temperature=0.1,
-                    response_format={"type": "json_object"},
-                )
+def _build_translation_messages(
+    content: Dict, source_language: str, target_language: str
+) -> List[Dict]:
+    """Build the compact translation messages (no base system prompt, no source text)."""
+    system_prompt = _load_prompt("translate_content.txt").format(
+        source_language=LANGUAGE_NAMES.get(source_language, source_language),
+        target_language=LANGUAGE_NAMES.get(target_language, target_language),
+        tolerance=int(TRANSLATION_LENGTH_TOLERANCE * 100),
+    )
+    # Contact details are language-independent: not sent, copied back as-is
+    payload = {key: value for key, value in content.items() if key != "contact_information"}
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": json.dumps(payload, ensure_ascii=False, separators=(",", ":"))},
+    ]
+
+
+def _fit_translated_length(source: str, translated: str) -> str:
+    """Cut a translated item exceeding the length tolerance at a word boundary."""
+    if not isinstance(source, str) or not isinstance(translated, str):
+        return translated
+    limit = int(len(source) * (1 + TRANSLATION_LENGTH_TOLERANCE))
+    if len(translated) <= limit:
+        return translated
+    cut = translated[:limit].rfind(" ")
+    if cut < limit * 0.8:
+        cut = limit
+    return translated[:cut].rstrip(" ,;:(")
+
+
+def _fit_list(source: List, translated: List) -> List:
+    """Apply the length tolerance item by item (lists must have the same size)."""
+    return [_fit_translated_length(s, t) for s, t in zip(source, translated)]
+
+
+def _merge_translation(source: Dict, translated: Dict) -> Dict:
+    """
+    Check the translated structure against the source and enforce lengths.
 
-                fallback_content = json.loads(fallback_response.choices[0].message.content)
-
-                # Merge fallback work_experience into content
-                if fallback_content.get("work_experience") and len(fallback_content["work_experience"]) > 0:
-                    content["work_experience"] = fallback_content["work_experience"]
-
-        # QUALITY VALIDATION: Check bullet length (elite CV standard: 120-145 chars, avg ~127)
-        if "work_experience" in content:
-            for idx, exp in enumerate(content["work_experience"]):
-                if "bullets" in exp:
-                    for bullet_idx, bullet in enumerate(exp["bullets"]):
-                        bullet_len = len(bullet)
-                        if bullet_len < 100:
-                            print(f"WARNING:  WARNING: Work experience bullet too short (elite standard: 120-145 chars)")
-                            print(f"    Experience #{idx+1} ({exp.get('company', 'Unknown')}), Bullet #{bullet_idx+1}: {bullet_len} chars")
-                            print(f"    Text: {bullet[:80]}...")
-                            print(f"    → This will reduce PFR below elite standards (90%+ requires 120-145 chars)")
-                        elif bullet_len < 110:
-                            print(f"WARNING:  INFO: Bullet below optimal length")
-                            print(f"    Experience #{idx+1} ({exp.get('company', 'Unknown')}), Bullet #{bullet_idx+1}: {bullet_len} chars (optimal: 120-145)")
-                        elif bullet_len > 150:
-                            print(f"WARNING:  INFO: Bullet above optimal length (may reduce space for other sections)")
-                            print(f"    Experience #{idx+1} ({exp.get('company', 'Unknown')}), Bullet #{bullet_idx+1}: {bullet_len} chars (optimal: 120-145)")
-
-        # QUALITY VALIDATION: Check coursework count (elite standard: 5-7 items, NEVER empty for university/prépa)
-        if "education" in content:
-            for idx, edu in enumerate(content["education"]):
-                institution = edu.get('institution', 'Unknown').lower()
-                degree = edu.get('degree', '').lower()
-                coursework_count = len(edu.get("coursework", []))
-
-                # Detect if university/master or classe préparatoire
-                is_university = any(keyword in institution or keyword in degree for keyword in ['university', 'université', 'master', 'hec', 'business school', 'grande école'])
-                is_prepa = any(keyword in institution or keyword in degree for keyword in ['préparatoire', 'preparatoire', 'prepa', 'lycée saint-louis', 'lycée louis'])
-
-                if (is_university or is_prepa) and coursework_count == 0:
-                    print(f"WARNING:  CRITICAL: Coursework empty for university/prépa (MUST have 4-7 items)")
-                    print(f"    Education #{idx+1} ({edu.get('institution', 'Unknown')}): {coursework_count} items")
-                    print(f"    → This is a CRITICAL ERROR - infer coursework from specialty/degree if not in source")
-                elif (is_university or is_prepa) and coursework_count < 4:
-                    print(f"WARNING:  WARNING: Coursework too short for university/prépa")
-                    print(f"    Education #{idx+1} ({edu.get('institution', 'Unknown')}): {coursework_count} items (need 5-7)")
-                elif is_university and coursework_count >= 5:
-                    # Good
-                    pass
-                elif not is_university and not is_prepa and coursework_count < 5 and coursework_count > 0:
-                    print(f"WARNING:  INFO: High school coursework present but limited")
-                    print(f"    Education #{idx+1} ({edu.get('institution', 'Unknown')}): {coursework_count} items (acceptable for high school)")
-
-        # QUALITY VALIDATION: Check for empty work_experience when it shouldn't be
-        if "raw_text" in input_data and len(content.get("work_experience", [])) == 0:
-            print(f"WARNING:  CRITICAL: work_experience is empty but source may contain work history")
-            print(f"    This will result in PFR < 65% and generation will be blocked")
+    Experience / education entries and bullet counts must match exactly
+    (the layout and page fill depend on them). Other lists fall back to
+    the source list if the translation changed their size.
 
-        return content
+    Raises:
+        ValueError: If experiences, education entries or bullets do not match
+    """
+    result = deepcopy(source)
+    fitted_count = 0
+
+    for key in ("work_experience", "education"):
+        source_entries = source.get(key) or []
+        translated_entries = translated.get(key) or []
+        if len(source_entries) != len(translated_entries):
+            raise ValueError(
+                f"Translation changed {key} entries ({len(source_entries)} -> {len(translated_entries)})"
+            )
+        for idx, (src, trg) in enumerate(zip(source_entries, translated_entries)):
+            entry = result[key][idx]
+            for field, value in trg.items():
+                if field not in src or not isinstance(value, type(src[field])):
+                    continue
+                if field in ("bullets", "coursework"):
+                    if len(value) != len(src[field]):
+                        raise ValueError(
+                            f"Translation changed {key}[{idx}].{field} count "
+                            f"({len(src[field])} -> {len(value)})"
+                        )
+                    entry[field] = _fit_list(src[field], value)
+                    fitted_count += sum(a != b for a, b in zip(entry[field], value))
+                else:
+                    entry[field] = value
+
+    for key, value in translated.items():
+        if key in ("work_experience", "education", "contact_information") or key not in source:
+            continue
+        if isinstance(value, list) and isinstance(source[key], list):
+            if len(value) == len(source[key]):
+                result[key] = _fit_list(source[key], value)
+        elif isinstance(value, type(source[key])):
+            result[key] = value
+
+    if fitted_count:
+        print(f"[TRANSLATE] {fitted_count} item(s) cut to the +{int(TRANSLATION_LENGTH_TOLERANCE * 100)}% length tolerance")
+    return result
+
+
+def translate_cv_content(
+    content: Dict,
+    source_language: str,
+    target_language: str,
+) -> Dict:
+    """
+    Translate finalized CV content into another language.
 
+    Much cheaper than generate_cv_content() for the second language: only
+    the finished content is sent (no base system prompt, no source text)
+    and bullet lengths are kept within TRANSLATION_LENGTH_TOLERANCE so the
+    page fill stays in range.
+
+    Args:
+        content: Finalized CV content of the source language
+        source_language: Language of content (fr, en)
+        target_language: Output language (fr, en)
+
+    Returns:
+        Translated content with the same structure
+
+    Raises:
+        ValueError: If translation fails or changes the CV structure
+    """
+    try:
+        response = chat_completion(
+            call_type="translation",
+            messages=_build_translation_messages(content, source_language, target_language),
+            **_json_request("translation"),
+        )
+        translated = json.loads(response.choices[0].message.content)
     except Exception as e:
-        raise ValueError(f"Failed to generate CV content: {str(e)}")
+        raise ValueError(f"Failed to translate CV content: {str(e)}")
+
+    return _merge_translation(content, translated)
+
+
+async def atranslate_cv_content(
+    content: Dict,
+    source_language: str,
+    target_language: str,
+) -> Dict:
+    """
+    Async counterpart of translate_cv_content().
+
+    Raises:
+        ValueError: If translation fails or changes the CV structure
+    """
+    try:
+        response = await achat_completion(
+            call_type="translation",
+            messages=_build_translation_messages(content, source_language, target_language),
+            **_json_request("translation"),
+        )
+        translated = json.loads(response.choices[0].message.content)
+    except Exception as e:
+        raise ValueError(f"Failed to translate CV content: {str(e)}")
+
+    return _merge_translation(content, translated)
+
+
+def _build_rewrite_messages(
+    experience: Dict, previous_bullets: List[str], language: str
+) -> List[Dict]:
+    """Build the messages rewriting one experience (base rules + incremental task)."""
+    task = _load_prompt("rewrite_experience.txt").format(
+        bullet_count=max(len(previous_bullets), 1),
+        previous_chars=sum(len(bullet) for bullet in previous_bullets),
+    )
+    payload = {"experience": experience, "previous_bullets": previous_bullets}
+    return _system_messages([LANGUAGE_INSTRUCTIONS["fr" if language == "fr" else "en"], task]) + [
+        {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+    ]
+
+
+def rewrite_experience_bullets(
+    experience: Dict,
+    previous_bullets: List[str],
+    domain: str = "finance",
+    language: str = "en",
+) -> List[str]:
+    """
+    Rewrite the bullets of ONE edited experience (incremental regeneration).
+
+    Only the edited experience and its current bullets are sent, with the
+    previous bullet count and total length as the target, so the rest of
+    the CV and its page fill are kept.
+
+    Args:
+        experience: Edited experience from the form (date, company, position, bullets)
+        previous_bullets: Bullets of this experience on the last generated CV
+        domain: Target domain (finance, consulting, startup, government)
+        language: Output language (en, fr)
+
+    Returns:
+        New bullets for this experience
+
+    Raises:
+        ValueError: If the rewrite fails or returns no bullets
+    """
+    try:
+        response = chat_completion(
+            call_type="rewrite",
+            messages=_build_rewrite_messages(experience, previous_bullets, language),
+            **_json_request("rewrite"),
+        )
+        bullets = json.loads(response.choices[0].message.content).get("bullets")
+    except Exception as e:
+        raise ValueError(f"Failed to rewrite experience: {str(e)}")
+
+    bullets = [b.strip() for b in bullets or [] if isinstance(b, str) and b.strip()]
+    if not bullets:
+        raise ValueError("Failed to rewrite experience: no bullets returned")
+    return bullets
 
 
 def enhance_specific_section(
@@ -299,14 +971,13 @@ Output in {"French" if language == "fr" else "English"}.
 Return the enhanced data in the same JSON structure."""
 
     try:
-        response = openai.chat.completions.create(
-            model="gpt-4o",
+        response = chat_completion(
+            call_type="rewrite",
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": json.dumps(section_data, ensure_ascii=False)},
             ],
-            temperature=0.3,
-            response_format={"type": "json_object"},
+            **_json_request("rewrite"),
         )
 
         return json.loads(response.choices[0].message.content)
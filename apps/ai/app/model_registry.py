@@ -0,0 +1,120 @@
+"""
+Model registry for Postulae CV Generator.
+
+Maps each LLM call type to a profile (provider, model, temperature,
+max_tokens), so a latency-insensitive step can move to a faster or cheaper
+model through configuration instead of code:
+
+    LLM_MODEL_PROFILES='{"enrichment": {"provider": "groq", "model": "llama-3.1-8b-instant"}}'
+
+Overrides are merged field by field into DEFAULT_PROFILES (the models the
+pipeline always used). Call types are the keys of openai_client.CALL_TIMEOUTS
+minus "file"; providers are the keys of openai_client.PROVIDERS. The PDF
+extraction sends an uploaded OpenAI file, so it stays on the openai provider.
+
+Usage:
+    response = chat_completion(call_type="fallback", messages=messages, **request_options("fallback"))
+"""
+import json
+import threading
+from dataclasses import dataclass, fields, replace
+from typing import Dict, Mapping, Optional, Union
+
+from .openai_client import PROVIDERS
+
+
+@dataclass(frozen=True)
+class ModelProfile:
+    """Provider and request parameters of one call type."""
+    provider: str
+    model: str
+    temperature: Optional[float] = None
+    max_tokens: Optional[int] = None
+
+
+DEFAULT_PROFILES: Dict[str, ModelProfile] = {
+    "extraction": ModelProfile("openai", "gpt-4o", temperature=0.2),
+    "content": ModelProfile("openai", "gpt-4o", temperature=0.3),
+    "fallback": ModelProfile("openai", "gpt-4o", temperature=0.1),
+    "translation": ModelProfile("openai", "gpt-4o", temperature=0.2),
+    "rewrite": ModelProfile("openai", "gpt-4o", temperature=0.3),
+    "enrichment": ModelProfile("openai", "gpt-4-turbo-preview", temperature=0.7, max_tokens=100),
+}
+
+# Call types whose request references an uploaded OpenAI file
+FILE_INPUT_CALL_TYPES = {"extraction"}
+
+_profiles: Optional[Dict[str, ModelProfile]] = None
+_profiles_lock = threading.Lock()
+
+
+def load_profiles(overrides: Union[str, Mapping, None] = None) -> Dict[str, ModelProfile]:
+    """
+    Build the registry from DEFAULT_PROFILES and overrides.
+
+    Args:
+        overrides: {call_type: {field: value}} or its JSON (empty = defaults)
+
+    Returns:
+        Profile per call type
+
+    Raises:
+        ValueError: If the JSON is invalid, or a call type, field or provider is unknown
+    """
+    if isinstance(overrides, str):
+        try:
+            overrides = json.loads(overrides) if overrides.strip() else {}
+        except ValueError as e:
+            raise ValueError(f"Invalid LLM_MODEL_PROFILES JSON: {e}")
+    profiles = dict(DEFAULT_PROFILES)
+    known_fields = {field.name for field in fields(ModelProfile)}
+
+    for call_type, override in (overrides or {}).items():
+        if call_type not in profiles:
+            raise ValueError(f"Unknown LLM call type: {call_type} (expected one of {', '.join(profiles)})")
+        if not isinstance(override, Mapping) or set(override) - known_fields:
+            raise ValueError(f"Invalid profile for {call_type}: expected fields among {', '.join(sorted(known_fields))}")
+        profile = replace(profiles[call_type], **override)
+        if profile.provider not in PROVIDERS:
+            raise ValueError(f"Unknown LLM provider for {call_type}: {profile.provider}")
+        if call_type in FILE_INPUT_CALL_TYPES and profile.provider != "openai":
+            raise ValueError(f"{call_type} sends an OpenAI file upload and must use the openai provider")
+        profiles[call_type] = profile
+    return profiles
+
+
+def get_profile(call_type: str) -> ModelProfile:
+    """
+    Profile of a call type (registry configured from apps.config on first use).
+
+    Raises:
+        ValueError: If LLM_MODEL_PROFILES is invalid
+        KeyError: If the call type is unknown
+    """
+    global _profiles
+    with _profiles_lock:
+        if _profiles is None:
+            try:
+                from apps.config import LLM_MODEL_PROFILES
+            except ImportError:
+                LLM_MODEL_PROFILES = ""
+            _profiles = load_profiles(LLM_MODEL_PROFILES)
+        return _profiles[call_type]
+
+
+def set_profiles(profiles: Optional[Dict[str, ModelProfile]]) -> None:
+    """Replace the registry (None reloads it from apps.config on next use)."""
+    global _profiles
+    with _profiles_lock:
+        _profiles = profiles
+
+
+def request_options(call_type: str) -> Dict:
+    """Chat completion parameters of a call type (model, temperature, max_tokens when set)."""
+    profile = get_profile(call_type)
+    options = {"model": profile.model}
+    if profile.temperature is not None:
+        options["temperature"] = profile.temperature
+    if profile.max_tokens is not None:
+        options["max_tokens"] = profile.max_tokens
+    return options
@@ -56,15 +56,72 @@ class CVContent(BaseModel):
     certifications: List[str] = Field(default_factory=list)
 
 
+class GenerationSession(BaseModel):
+    """
+    Checkpoint of a PDF generation, reusable by a later phase.
+
+    Phase 1 returns it (on each result), Phase 2 accepts it and starts
+    straight from the LLM content call: no upload, extraction or analysis.
+    """
+    pdf_sha256: str                    # Source PDF fingerprint (guards against mix-ups)
+    raw_text: str                      # Extracted text (GPT-4o extraction)
+    analysis: Dict                     # ContentAnalyzer result (richness, strategy, targets)
+    base_content: Dict[str, Dict] = Field(default_factory=dict)  # Language → base LLM content
+    final_content: Dict[str, Dict] = Field(default_factory=dict)  # Language → final content (translation source)
+
+
+class LLMUsageTotals(BaseModel):
+    """Tokens, latency, retries and cost of a group of LLM calls."""
+    calls: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0              # Prompt tokens served by the provider prompt cache
+    completion_tokens: int = 0
+    retries: int = 0
+    latency_ms: float = 0.0             # Sum over the calls (not wall time)
+    cost_usd: float = 0.0               # Estimated from usage.MODEL_PRICES
+
+
+class LLMUsage(LLMUsageTotals):
+    """LLM usage of one generation: totals, per call type and per model (see usage.py)."""
+    by_call_type: Dict[str, LLMUsageTotals] = Field(default_factory=dict)  # extraction, content, enrichment...
+    by_model: Dict[str, LLMUsageTotals] = Field(default_factory=dict)
+
+
 class CVGenerationResult(BaseModel):
     """Result of CV generation with PDF and DOCX bytes."""
     pdf_bytes: bytes
-    docx_bytes: bytes
+    docx_bytes: Optional[bytes] = None  # None when DOCX is deferred
+    docx_deferred: bool = False         # True: build later (DocxWriter from content, or from pdf_bytes)
+    content: Optional[Dict] = None      # Final CV content rendered in the PDF (DOCX source)
+    layout_trim: bool = False           # Layout trim flag of the final render
     page_count: int
     fill_percentage: float
     char_count: int
     warnings: List[str] = Field(default_factory=list)
     warning_info: Optional[Dict] = None  # Adaptive enrichment warning (level, title, message)
+    trace: Optional[Dict] = None         # Span tree of the generation (stage, duration_ms, bytes, tokens)
+    session: Optional[GenerationSession] = None  # PDF generations: pass to a later phase to skip extraction
+    degradations: List[str] = Field(default_factory=list)  # Cheaper paths taken to meet the deadline (see deadline.py)
+    usage: Optional[LLMUsage] = None     # LLM calls of the generation (shared by every language result)
+
+
+class BatchItem(BaseModel):
+    """One CV of a batch: structured data OR a PDF."""
+    item_id: str                        # Caller's reference (echoed on the result)
+    cv_content: Optional[CVContent] = None
+    pdf_bytes: Optional[bytes] = None
+    domain: str = "finance"             # PDF items only
+    languages: Optional[List[str]] = None  # Default: ["fr", "en"]
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one batch item, streamed as soon as it finishes."""
+    item_id: str
+    index: int                          # Position in the submitted batch
+    status: str                         # "done" or "failed"
+    results: Dict[str, CVGenerationResult] = Field(default_factory=dict)  # Language → result
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
 
 
 class PageFillMetrics(BaseModel):
@@ -0,0 +1,231 @@
+"""
+Shared OpenAI clients for Postulae CV Generator.
+
+One sync and one async client per provider and process, built on an
+explicit httpx connection pool with keep-alive, so every LLM call
+(extraction, content, enrichment bullets, translation, rewrite, file upload
+/ delete) reuses warm TLS connections instead of the module-level default
+client. Providers (PROVIDERS) are OpenAI-compatible APIs; which one serves
+a call type is decided by model_registry.py.
+
+- Timeouts per call type (CALL_TIMEOUTS): a stuck bullet call fails after
+  30 s instead of holding a generation for the SDK default of 10 minutes
+- Retries: 429 / 408 / 409 / 5xx and connection errors are retried with
+  jittered exponential backoff (full jitter, Retry-After honoured); the SDK's
+  own retries are disabled so attempts are not multiplied. A retry that
+  would not fit in the generation deadline is not attempted.
+- Shutdown: close_clients() / aclose_clients() release the pools (called at
+  process exit and on FastAPI shutdown)
+
+Usage:
+    response = with_backoff(
+        lambda: get_client().chat.completions.create(**request, timeout=timeout_for("content")),
+        "content",
+    )
+"""
+import asyncio
+import atexit
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+import openai
+from openai import AsyncOpenAI, OpenAI
+
+from apps.config import (
+    GROQ_API_KEY,
+    OPENAI_API_KEY,
+    OPENAI_BACKOFF_BASE,
+    OPENAI_BACKOFF_MAX,
+    OPENAI_CONNECT_TIMEOUT,
+    OPENAI_KEEPALIVE_EXPIRY,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_MAX_KEEPALIVE,
+    OPENAI_MAX_RETRIES,
+)
+
+from .deadline import current_deadline
+from .tracing import current_span
+
+# Read timeout (seconds) per call type
+CALL_TIMEOUTS = {
+    "extraction": 120.0,   # GPT-4o vision on an uploaded PDF
+    "content": 120.0,      # Full CV JSON from the base system prompt
+    "fallback": 60.0,      # Work experience re-extraction
+    "translation": 60.0,
+    "rewrite": 45.0,       # One experience
+    "enrichment": 30.0,    # One bullet
+    "file": 60.0,          # PDF upload / delete
+}
+DEFAULT_TIMEOUT = 60.0
+
+RETRYABLE_STATUS = {408, 409, 429}  # + every 5xx
+
+# OpenAI-compatible providers: client arguments
+PROVIDERS: Dict[str, Dict[str, Optional[str]]] = {
+    "openai": {"api_key": OPENAI_API_KEY, "base_url": None},
+    "groq": {"api_key": GROQ_API_KEY, "base_url": "https://api.groq.com/openai/v1"},
+}
+
+# Backoff waits (module attributes so tests can skip them)
+_sleep = time.sleep
+_asleep = asyncio.sleep
+
+_clients: Dict[str, OpenAI] = {}
+_async_clients: Dict[str, AsyncOpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def _limits() -> httpx.Limits:
+    """Connection pool shared by every call of one client."""
+    return httpx.Limits(
+        max_connections=OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=OPENAI_MAX_KEEPALIVE,
+        keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY,
+    )
+
+
+def _timeout() -> httpx.Timeout:
+    """Client default timeout (calls override the read timeout, see timeout_for())."""
+    return httpx.Timeout(DEFAULT_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT)
+
+
+def _provider(provider: str) -> Dict[str, Optional[str]]:
+    """
+    Raises:
+        ValueError: If the provider is unknown
+    """
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown LLM provider: {provider} (expected one of {', '.join(PROVIDERS)})")
+    return PROVIDERS[provider]
+
+
+def get_client(provider: str = "openai") -> OpenAI:
+    """Return the process-wide client of a provider (pooled, keep-alive, no SDK retries)."""
+    settings = _provider(provider)
+    with _clients_lock:
+        if provider not in _clients:
+            _clients[provider] = OpenAI(
+                **settings,
+                http_client=openai.DefaultHttpxClient(limits=_limits()),
+                timeout=_timeout(),
+                max_retries=0,
+            )
+        return _clients[provider]
+
+
+def get_async_client(provider: str = "openai") -> AsyncOpenAI:
+    """Return the process-wide async client of a provider (pooled, keep-alive, no SDK retries)."""
+    settings = _provider(provider)
+    with _clients_lock:
+        if provider not in _async_clients:
+            _async_clients[provider] = AsyncOpenAI(
+                **settings,
+                http_client=openai.DefaultAsyncHttpxClient(limits=_limits()),
+                timeout=_timeout(),
+                max_retries=0,
+            )
+        return _async_clients[provider]
+
+
+def timeout_for(call_type: str) -> httpx.Timeout:
+    """Timeout of one call (read timeout by call type, shared connect timeout)."""
+    return httpx.Timeout(CALL_TIMEOUTS.get(call_type, DEFAULT_TIMEOUT), connect=OPENAI_CONNECT_TIMEOUT)
+
+
+def is_retryable(error: Exception) -> bool:
+    """True for rate limits, server errors, timeouts and connection errors."""
+    if isinstance(error, openai.APIConnectionError):  # Includes APITimeoutError
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS or error.status_code >= 500
+    return False
+
+
+def backoff_delay(attempt: int, error: Optional[Exception] = None) -> float:
+    """
+    Seconds to wait before retry number attempt (0-based).
+
+    Full jitter: uniform in [0, min(max, base * 2^attempt)], at least the
+    Retry-After the API asked for.
+    """
+    delay = random.uniform(0, min(OPENAI_BACKOFF_MAX, OPENAI_BACKOFF_BASE * 2 ** attempt))
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        return max(delay, min(float(retry_after), OPENAI_BACKOFF_MAX)) if retry_after else delay
+    except ValueError:  # HTTP-date form: keep the jittered delay
+        return delay
+
+
+def _retry_delay(error: Exception, attempt: int, call_type: str) -> Optional[float]:
+    """Delay before the next attempt, or None to give up (not retryable, out of retries or time)."""
+    if not is_retryable(error) or attempt >= OPENAI_MAX_RETRIES:
+        return None
+    delay = backoff_delay(attempt, error)
+    deadline = current_deadline()
+    if deadline is not None and deadline.remaining() < delay + CALL_TIMEOUTS.get(call_type, DEFAULT_TIMEOUT) / 4:
+        print(f"[OPENAI] {call_type}: {type(error).__name__}, no retry ({deadline.remaining():.1f}s left)")
+        return None
+    span = current_span()
+    if span is not None:
+        span.add("retries", 1)
+    print(f"[OPENAI] {call_type}: {type(error).__name__}, retry {attempt + 1}/{OPENAI_MAX_RETRIES} in {delay:.1f}s")
+    return delay
+
+
+def with_backoff(send: Callable[[], Any], call_type: str) -> Any:
+    """
+    Run a blocking OpenAI call, retrying transient failures.
+
+    Raises:
+        The last error once retries are exhausted (or for non-retryable errors)
+    """
+    attempt = 0
+    while True:
+        try:
+            return send()
+        except Exception as e:
+            delay = _retry_delay(e, attempt, call_type)
+            if delay is None:
+                raise
+            _sleep(delay)
+            attempt += 1
+
+
+async def awith_backoff(send: Callable[[], Awaitable[Any]], call_type: str) -> Any:
+    """Async counterpart of with_backoff() (send returns an awaitable)."""
+    attempt = 0
+    while True:
+        try:
+            return await send()
+        except Exception as e:
+            delay = _retry_delay(e, attempt, call_type)
+            if delay is None:
+                raise
+            await _asleep(delay)
+            attempt += 1
+
+
+def close_clients() -> None:
+    """Close the sync clients' pools (the async ones need aclose_clients())."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_clients() -> None:
+    """Close every client's pool (FastAPI shutdown)."""
+    with _clients_lock:
+        clients = list(_async_clients.values())
+        _async_clients.clear()
+    for client in clients:
+        await client.close()
+    close_clients()
+
+
+atexit.register(close_clients)
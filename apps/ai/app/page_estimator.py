@@ -0,0 +1,388 @@
+"""
+Analytical Page Fill Rate estimator for Postulae CV Generator.
+
+Predicts the PFR that DensityCalculator.calculate_pfr() would measure,
+WITHOUT rendering: lines are wrapped with reportlab font metrics for the
+fonts and sizes used in grid_template.html, and vertical positions are
+accumulated with spacing constants calibrated against xhtml2pdf renders
+of that template.
+
+Runs in ~1 ms (vs xhtml2pdf + pdfplumber), so the generator can use it
+for every decision and render only the final artifact (and the rare
+estimates within ESTIMATE_ERROR_MARGIN of the page break).
+
+CRITICAL: constants mirror grid_template.html. If the template changes,
+re-calibrate them against real renders (see tests/test_page_estimator.py).
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from .layout import LayoutEngine
+from .models import PageFillMetrics
+
+
+# A4 page (points) and @page margin 11mm
+PAGE_WIDTH = 595.2756
+PAGE_HEIGHT = 841.8898
+PAGE_MARGIN = 31.18
+CONTENT_WIDTH = PAGE_WIDTH - 2 * PAGE_MARGIN
+CONTENT_BOTTOM = PAGE_HEIGHT - PAGE_MARGIN
+
+# Fonts ("Times New Roman" is mapped to the Times base-14 family by xhtml2pdf)
+FONT_REGULAR = "Times-Roman"
+FONT_BOLD = "Times-Bold"
+FONT_ITALIC = "Times-Italic"
+FONT_BOLD_ITALIC = "Times-BoldItalic"
+
+# Column text widths (grid: date 12% | content 70% | location 18%)
+CELL_PADDING = 2.25                                 # padding: 0 3px
+CONTENT_CELL_WIDTH = CONTENT_WIDTH * 0.70 - CELL_PADDING
+SKILLS_CELL_WIDTH = CONTENT_WIDTH * 0.88 - CELL_PADDING
+LIST_MARGIN = 11.34                                 # ul margin-left 4mm
+BULLET_INDENT = 10.0                                # first line only (wrapped lines start under the glyph)
+
+# Vertical metrics (top of line → top of next line), calibrated on renders
+NAME_TOP = 29.5
+NAME_ADVANCE = 18.9
+CONTACT_ADVANCE = 9.2
+TITLE_TO_TABLE = 33.8
+TITLE_TO_LIST = 18.3
+INST_ADVANCE = 10.5
+DEGREE_ADVANCE = 8.95
+DETAIL_MARGIN = 4.25
+DETAIL_LINE = 10.95
+COMPANY_ADVANCE = 10.6
+ROLE_TO_BULLETS = 8.9
+BULLET_LINE = 11.6
+BULLET_GAP = 2.7
+EDUCATION_ENTRY_GAP = 18.35
+EXPERIENCE_ENTRY_GAP = 15.5
+EDUCATION_SECTION_GAP = 2.55
+EXPERIENCE_SECTION_GAP = 0.0
+LIST_SECTION_GAP = 2.6
+
+# Glyph height of the last line (bottom = top + size)
+LAST_LINE_HEIGHT = 9.5
+# Room the last line needs to stay on the page: xhtml2pdf moves a list item
+# whose full line box (line + item gap) crosses the bottom margin
+LAST_LINE_BOX = BULLET_LINE + BULLET_GAP
+
+# Largest |estimate - real| in PFR points, with headroom: the sweeps against
+# real renders (see tests/test_page_estimator.py) measure at most 1.4. Only
+# estimates closer than this to the page break can get the page count wrong
+ESTIMATE_ERROR_MARGIN = 2.0
+
+
+@lru_cache(maxsize=8192)
+def _word_width(word: str, font: str, size: float) -> float:
+    """Width of a word in points (cached; unknown glyphs use an average width)."""
+    try:
+        return stringWidth(word, font, size)
+    except Exception:
+        return len(word) * size * 0.5
+
+
+def count_lines(
+    text: str,
+    font: str,
+    size: float,
+    width: float,
+    continuation_width: Optional[float] = None,
+) -> int:
+    """
+    Number of lines a text wraps to (greedy word wrap, like xhtml2pdf).
+
+    Args:
+        text: Text to wrap
+        font: Base-14 font name
+        size: Font size in points
+        width: Available width of the first line in points
+        continuation_width: Width of the following lines (list items wrap
+                            under the bullet glyph, so they are wider)
+
+    Returns:
+        Line count (0 for empty text)
+    """
+    words = str(text).split()
+    if not words:
+        return 0
+
+    space = _word_width(" ", font, size)
+    lines = 1
+    limit = width
+    line_width = 0.0
+    for word in words:
+        w = _word_width(word, font, size)
+        if line_width == 0.0:
+            line_width = w
+        elif line_width + space + w <= limit:
+            line_width += space + w
+        else:
+            lines += 1
+            line_width = w
+            limit = continuation_width or width
+    return lines
+
+
+@dataclass
+class BlockEstimate:
+    """Estimated vertical footprint of one removable/shortenable block."""
+    kind: str                 # bullet, coursework, interest, experience, education
+    path: Tuple               # location in normalized data, e.g. ("experience", 0, "bullets", 2)
+    lines: int
+    height: float             # vertical space freed if the block is removed
+    line_height: float = 0.0  # vertical space freed per line removed
+    text: str = ""
+
+
+@dataclass
+class LayoutEstimate:
+    """Result of an analytical layout pass."""
+    text_top: float
+    text_bottom: float
+    page_count: int
+    char_count: int
+    blocks: List[BlockEstimate] = field(default_factory=list)
+
+    @property
+    def text_height(self) -> float:
+        return max(0.0, self.text_bottom - self.text_top)
+
+    @property
+    def fill_percentage(self) -> float:
+        if self.page_count > 1:
+            return 100.0
+        return round(self.text_height / PAGE_HEIGHT * 100, 1)
+
+    @property
+    def page_break_distance(self) -> float:
+        """PFR points left before the last line moves to a new page (negative once it has)."""
+        last_top = self.text_bottom - LAST_LINE_HEIGHT
+        return round((CONTENT_BOTTOM - last_top - LAST_LINE_BOX) / PAGE_HEIGHT * 100, 1)
+
+    def to_metrics(self) -> PageFillMetrics:
+        """Convert to PageFillMetrics (same semantics as calculate_pfr)."""
+        single_page = self.page_count == 1
+        return PageFillMetrics(
+            page_count=self.page_count,
+            fill_percentage=self.fill_percentage,
+            char_count=self.char_count,
+            text_height=self.text_height if single_page else None,
+            page_height=PAGE_HEIGHT if single_page else None,
+        )
+
+
+class PageFillEstimator:
+    """Simulates the grid template layout to predict PFR without rendering."""
+
+    @staticmethod
+    def estimate(content: Dict, trim: bool = False) -> LayoutEstimate:
+        """
+        Estimate layout of CV content (same input as LayoutEngine).
+
+        Args:
+            content: Raw CV content dictionary
+            trim: Apply layout trimming if True (mirrors render trim flag)
+
+        Returns:
+            LayoutEstimate with page count, text extent and per-block heights
+        """
+        data = LayoutEngine.normalize_cv_data(content, trim=trim)
+        return PageFillEstimator._estimate_normalized(data)
+
+    @staticmethod
+    def estimate_pfr(content: Dict, trim: bool = False) -> PageFillMetrics:
+        """Estimate PageFillMetrics for CV content."""
+        return PageFillEstimator.estimate(content, trim=trim).to_metrics()
+
+    @staticmethod
+    def count_bullet_lines(text: str) -> int:
+        """Number of lines an experience bullet wraps to (at least 1)."""
+        return max(1, count_lines(
+            text, FONT_REGULAR, 9.5,
+            CONTENT_CELL_WIDTH - LIST_MARGIN - BULLET_INDENT,
+            CONTENT_CELL_WIDTH - LIST_MARGIN,
+        ))
+
+    @staticmethod
+    def _estimate_normalized(data: Dict) -> LayoutEstimate:
+        """Run the layout simulation on normalized template data."""
+        blocks: List[BlockEstimate] = []
+        chars = 0
+        y = NAME_TOP
+        text_top: Optional[float] = None
+        last_top = y
+
+        def emit(top: float, text: str) -> None:
+            nonlocal text_top, last_top, chars
+            if text_top is None:
+                text_top = top
+            last_top = top
+            chars += len(text)
+
+        # HEADER
+        name = data.get("name", "")
+        if name:
+            emit(y, name)
+            y += NAME_ADVANCE
+        contact = " • ".join(
+            str(data[k]) for k in ("address", "phone", "email") if data.get(k)
+        )
+        if contact:
+            for _ in range(count_lines(contact, FONT_REGULAR, 9.0, CONTENT_WIDTH)):
+                emit(y, contact)
+                y += CONTACT_ADVANCE
+        elif name:
+            y += CONTACT_ADVANCE
+
+        # EDUCATION
+        emit(y, "FORMATION")
+        y += TITLE_TO_TABLE
+        education = data.get("education") or []
+        for idx, edu in enumerate(education):
+            entry_start = y
+            inst = str(edu.get("institution", "")).upper()
+            for _ in range(max(1, count_lines(inst, FONT_BOLD, 10.0, CONTENT_CELL_WIDTH))):
+                emit(y, inst)
+                y += INST_ADVANCE
+            if edu.get("degree"):
+                for _ in range(count_lines(edu["degree"], FONT_BOLD_ITALIC, 10.0, CONTENT_CELL_WIDTH)):
+                    emit(y, edu["degree"])
+                    y += DEGREE_ADVANCE
+            else:
+                y -= INST_ADVANCE - DEGREE_ADVANCE
+
+            details = [str(edu[k]) for k in ("honors", "major") if edu.get(k)]
+            if details:
+                y += DETAIL_MARGIN
+                for text in details:
+                    for _ in range(count_lines(text, FONT_REGULAR, 9.0, CONTENT_CELL_WIDTH)):
+                        emit(y, text)
+                        y += DETAIL_LINE
+
+            coursework = edu.get("coursework") or []
+            if coursework:
+                text = "Relevant coursework: " + ", ".join(str(c) for c in coursework)
+                lines = count_lines(text, FONT_REGULAR, 9.0, CONTENT_CELL_WIDTH)
+                y += DETAIL_MARGIN
+                for _ in range(lines):
+                    emit(y, text)
+                    y += DETAIL_LINE
+                blocks.append(BlockEstimate(
+                    kind="coursework", path=("education", idx, "coursework"),
+                    lines=lines, height=DETAIL_MARGIN + lines * DETAIL_LINE,
+                    line_height=DETAIL_LINE, text=text,
+                ))
+
+            is_last = idx == len(education) - 1
+            y += EDUCATION_SECTION_GAP if is_last else EDUCATION_ENTRY_GAP
+            blocks.append(BlockEstimate(
+                kind="education", path=("education", idx), lines=0,
+                height=y - entry_start,
+            ))
+        if not education:
+            y -= TITLE_TO_TABLE - TITLE_TO_LIST
+
+        # WORK EXPERIENCE
+        emit(y, "EXPÉRIENCES PROFESSIONNELLES")
+        y += TITLE_TO_TABLE
+        experiences = data.get("experience") or []
+        for idx, exp in enumerate(experiences):
+            entry_start = y
+            company = str(exp.get("company", "")).upper()
+            for _ in range(max(1, count_lines(company, FONT_BOLD, 10.0, CONTENT_CELL_WIDTH))):
+                emit(y, company)
+                y += COMPANY_ADVANCE
+            if exp.get("position"):
+                for _ in range(count_lines(exp["position"], FONT_BOLD_ITALIC, 10.0, CONTENT_CELL_WIDTH)):
+                    emit(y, exp["position"])
+                    y += COMPANY_ADVANCE
+                y += ROLE_TO_BULLETS - COMPANY_ADVANCE
+
+            bullets = exp.get("bullets") or []
+            if bullets:
+                y += ROLE_TO_BULLETS if not exp.get("position") else 0.0
+                for b_idx, bullet in enumerate(bullets):
+                    lines = PageFillEstimator.count_bullet_lines(bullet)
+                    for _ in range(lines):
+                        emit(y, bullet)
+                        y += BULLET_LINE
+                    y += BULLET_GAP
+                    blocks.append(BlockEstimate(
+                        kind="bullet", path=("experience", idx, "bullets", b_idx),
+                        lines=lines, height=lines * BULLET_LINE + BULLET_GAP,
+                        line_height=BULLET_LINE, text=str(bullet),
+                    ))
+            else:
+                y += BULLET_LINE - ROLE_TO_BULLETS
+
+            # Duration below the date may be taller than a short content cell
+            if exp.get("duration"):
+                y = max(y, entry_start + 13.2 + BULLET_LINE)
+
+            is_last = idx == len(experiences) - 1
+            y += EXPERIENCE_SECTION_GAP if is_last else EXPERIENCE_ENTRY_GAP
+            blocks.append(BlockEstimate(
+                kind="experience", path=("experience", idx), lines=0,
+                height=y - entry_start,
+            ))
+        if not experiences:
+            y -= TITLE_TO_TABLE - TITLE_TO_LIST
+
+        # LANGUAGES & IT SKILLS
+        emit(y, "LANGUES & COMPÉTENCES")
+        y += TITLE_TO_LIST
+        skill_lines = []
+        for key, label in (("languages", "Language:"), ("it_skills", "IT:"), ("databases", "Financial Databases:")):
+            items = data.get(key) or []
+            if items:
+                skill_lines.append(f"{label} " + ", ".join(str(i) for i in items))
+        for text in skill_lines:
+            for _ in range(max(1, count_lines(
+                text, FONT_REGULAR, 9.5,
+                SKILLS_CELL_WIDTH - LIST_MARGIN - BULLET_INDENT,
+                SKILLS_CELL_WIDTH - LIST_MARGIN,
+            ))):
+                emit(y, text)
+                y += BULLET_LINE
+            y += BULLET_GAP
+        y += LIST_SECTION_GAP
+
+        # ACTIVITIES & INTERESTS
+        interests = data.get("interests") or []
+        if interests:
+            emit(y, "ACTIVITÉS & CENTRES D'INTÉRÊT")
+            y += TITLE_TO_LIST
+            for i_idx, activity in enumerate(interests):
+                lines = max(1, count_lines(
+                    activity, FONT_REGULAR, 9.5,
+                    SKILLS_CELL_WIDTH - LIST_MARGIN - BULLET_INDENT,
+                    SKILLS_CELL_WIDTH - LIST_MARGIN,
+                ))
+                for _ in range(lines):
+                    emit(y, str(activity))
+                    y += BULLET_LINE
+                y += BULLET_GAP
+                blocks.append(BlockEstimate(
+                    kind="interest", path=("interests", i_idx),
+                    lines=lines, height=lines * BULLET_LINE + BULLET_GAP,
+                    line_height=BULLET_LINE, text=str(activity),
+                ))
+
+        text_bottom = last_top + LAST_LINE_HEIGHT
+        if last_top + LAST_LINE_BOX <= CONTENT_BOTTOM:
+            page_count = 1
+        else:
+            usable = CONTENT_BOTTOM - PAGE_MARGIN
+            page_count = 2 + int(max(0.0, text_bottom - CONTENT_BOTTOM) // usable)
+
+        return LayoutEstimate(
+            text_top=text_top if text_top is not None else NAME_TOP,
+            text_bottom=text_bottom,
+            page_count=page_count,
+            char_count=chars,
+            blocks=blocks,
+        )
@@ -0,0 +1,356 @@
+"""
+Local PDF text-layer extraction for Postulae CV Generator.
+
+Most uploaded CVs are born-digital (Word, Canva, LaTeX exports) and carry
+a usable text layer. Reading it with pdfplumber takes well under a second,
+where the GPT-4o vision extraction takes 10-30 s and a paid call.
+
+The extractor rebuilds a reading order close to the one GPT-4o returns:
+- Two-column layouts (sidebar CVs): a vertical gutter is detected per page;
+  full-width lines (name, headers) stay in place, the columns between them
+  are read left column first, then right column
+- Tables: read row by row, cells joined with " | "
+- Bullet glyphs (•, ◦, ▪, Symbol-font bullets...) become "- "
+- Letter-spaced titles ("L é o n i e") are re-joined, LaTeX spacing
+  accents ("exp´erience") are composed ("expérience"), icon glyphs
+  ("(cid:132)") are dropped
+
+It then scores its own output (0.0 - 1.0). Scanned pages, unreadable
+glyphs, glued words or too little text lower the confidence; below
+LOCAL_EXTRACTION_MIN_CONFIDENCE the caller falls back to GPT-4o (see
+llm_client.extract_text_from_pdf_bytes).
+
+Usage:
+    layer = extract_text_layer(pdf_bytes)
+    if layer.confidence >= 0.8:
+        raw_text = layer.text
+"""
+import io
+import re
+import statistics
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pdfplumber
+
+# Bump when the extraction output changes (part of the extraction cache key)
+LOCAL_EXTRACTION_VERSION = "1"
+
+WORD_X_TOLERANCE = 1.5      # pdfplumber's default (3) glues words in LaTeX / justified PDFs
+LINE_TOLERANCE = 3.0        # Max top difference (pt) between words of one line
+TOUCHING_GAP = 0.5          # Words closer than this (pt) are one word split by pdfplumber
+GUTTER_MIN_WIDTH = 12.0     # Narrowest blank vertical strip treated as a column gutter
+GUTTER_MAX_CROSSING = 0.1   # Share of lines allowed to cross the gutter (name, headers)
+COLUMN_MIN_SHARE = 0.2      # Each column holds at least this share of the words
+
+BULLET_GLYPHS = "•●▪■◦‣∙○◆◇►▶➢➤✓✔" "\uf0b7\uf0a7\uf0d8\uf076"  # + Symbol / Wingdings bullets (Word)
+SPACING_ACCENTS = {
+    "´": "\u0301",  # acute
+    "`": "\u0300",  # grave
+    "ˆ": "\u0302",  # circumflex
+    "¨": "\u0308",  # diaeresis
+    "˜": "\u0303",  # tilde
+    "¸": "\u0327",  # cedilla
+}
+_CID_PATTERN = re.compile(r"\(cid:\d+\)")
+
+# Confidence scoring
+MIN_TEXT_CHARS = 400        # A one-page CV has 1500-4000 non-blank characters
+MIN_PAGE_CHARS = 50         # Below this, a page covered by an image is a scan
+SCAN_IMAGE_COVERAGE = 0.3   # Image area share of a page that makes it a scan candidate
+MIN_LETTER_RATIO = 0.5      # Letters among non-blank characters (CVs: ~0.8)
+GLUED_WORD_LENGTH = 25      # Longer tokens (no URL / e-mail / compound) are words missing spaces
+
+
+@dataclass
+class TextLayer:
+    """Text read from a PDF's text layer and how much to trust it."""
+    text: str
+    confidence: float
+    page_count: int
+    reasons: List[str] = field(default_factory=list)
+
+
+def extract_text_layer(pdf_bytes: bytes) -> TextLayer:
+    """
+    Extract a PDF's text layer in reading order and score it.
+
+    Args:
+        pdf_bytes: PDF file as bytes
+
+    Returns:
+        TextLayer (confidence 0.0 when the PDF has no text layer)
+
+    Raises:
+        ValueError: If the PDF cannot be opened
+    """
+    try:
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            pages = [_read_page(page) for page in pdf.pages]
+    except Exception as e:
+        raise ValueError(f"Cannot read PDF text layer: {str(e)}")
+
+    text = "\n\n".join(page_text for page_text, _ in pages if page_text).strip()
+    confidence, reasons = _score(text, [stats for _, stats in pages])
+    return TextLayer(text=text, confidence=confidence, page_count=len(pages), reasons=reasons)
+
+
+# ---------------------------------------------------------------------------
+# Reading order
+# ---------------------------------------------------------------------------
+
+def _read_page(page) -> Tuple[str, Dict]:
+    """Read one page; returns (text, stats used by the confidence score)."""
+    words = [
+        _compose_accents(word)
+        for word in page.extract_words(x_tolerance=WORD_X_TOLERANCE, return_chars=True)
+    ]
+    page_area = float(page.width * page.height) or 1.0
+    image_area = sum(
+        max(0.0, min(image["x1"], page.width) - max(image["x0"], 0))
+        * max(0.0, min(image["bottom"], page.height) - max(image["top"], 0))
+        for image in page.images
+    )
+    stats = {
+        "cid_glyphs": sum(len(_CID_PATTERN.findall(word["text"])) for word in words),
+        "image_coverage": image_area / page_area,
+    }
+
+    blocks = []  # (top, text): tables and lines, sorted by position
+    table_boxes = []
+    for table in page.find_tables():
+        rows = [" | ".join(cell.strip() for cell in row if cell and cell.strip()) for row in table.extract()]
+        rows = [row for row in rows if row]
+        if rows:
+            table_boxes.append(table.bbox)
+            blocks.append((table.bbox[1], "\n".join(rows)))
+
+    words = [word for word in words if not any(_inside(word, box) for box in table_boxes)]
+    blocks.extend(_read_words(words, page.width))
+    blocks.sort(key=lambda block: block[0])
+
+    text = _clean("\n".join(block_text for _, block_text in blocks))
+    stats["chars"] = sum(1 for char in text if not char.isspace())
+    return text, stats
+
+
+def _read_words(words: List[Dict], page_width: float) -> List[Tuple[float, str]]:
+    """Order words into (top, line) blocks, reading detected columns one after the other."""
+    lines = _group_lines(words)
+    gutter = _find_gutter(lines, page_width)
+    if gutter is None:
+        return [(line[0]["top"], _join_line(line)) for line in lines]
+
+    middle = sum(gutter) / 2
+    blocks = []
+    band: List[Dict] = []
+
+    def flush_band():
+        # Columns between two full-width lines: left column, then right column
+        if not band:
+            return
+        top = band[0]["top"]
+        left = [word for word in band if word["x1"] <= middle]
+        right = [word for word in band if word["x0"] >= middle]
+        column_text = [_join_line(line) for column in (left, right) for line in _group_lines(column)]
+        blocks.append((top, "\n".join(column_text)))
+        band.clear()
+
+    for line in lines:
+        if _crosses(line, middle):
+            flush_band()
+            blocks.append((line[0]["top"], _join_line(line)))
+        else:
+            band.extend(line)
+    flush_band()
+    return blocks
+
+
+def _crosses(line: List[Dict], middle: float) -> bool:
+    """True if the line runs across the gutter (a word on it, or a normal word gap around it)."""
+    left = [word["x1"] for word in line if word["x1"] <= middle]
+    right = [word["x0"] for word in line if word["x0"] >= middle]
+    if len(left) + len(right) < len(line):
+        return True
+    return bool(left and right) and min(right) - max(left) < GUTTER_MIN_WIDTH
+
+
+def _group_lines(words: List[Dict]) -> List[List[Dict]]:
+    """Group words sharing a baseline into lines (top to bottom, left to right)."""
+    lines: List[List[Dict]] = []
+    for word in sorted(words, key=lambda w: (w["top"], w["x0"])):
+        if lines and word["top"] - lines[-1][0]["top"] <= LINE_TOLERANCE:
+            lines[-1].append(word)
+        else:
+            lines.append([word])
+    return [sorted(line, key=lambda w: w["x0"]) for line in lines]
+
+
+def _find_gutter(lines: List[List[Dict]], page_width: float) -> Optional[Tuple[float, float]]:
+    """
+    Find the blank vertical strip separating two columns, if any.
+
+    Only the middle of the page is searched (date / location columns on the
+    page edges are part of their line). A few lines may cross the gutter
+    (name, full-width headers).
+
+    Returns:
+        (left edge, right edge) of the gutter, or None for single-column pages
+    """
+    if len(lines) < 5:
+        return None
+    start, end = int(page_width * 0.2), int(page_width * 0.8)
+    crossing = [0] * (end - start)
+    for line in lines:
+        for word in line:
+            for x in range(max(start, int(word["x0"])), min(end, int(word["x1"]) + 1)):
+                crossing[x - start] += 1  # Words of one line never overlap
+
+    limit = len(lines) * GUTTER_MAX_CROSSING
+    best, run_start = None, None
+    for offset, count in enumerate(crossing + [limit + 1]):
+        if count <= limit:
+            run_start = offset if run_start is None else run_start
+            continue
+        if run_start is not None and offset - run_start >= GUTTER_MIN_WIDTH:
+            if best is None or offset - run_start > best[1] - best[0]:
+                best = (run_start + start, offset + start)
+        run_start = None
+    if best is None:
+        return None
+
+    words = [word for line in lines for word in line]
+    left = sum(1 for word in words if word["x1"] <= best[0])
+    right = sum(1 for word in words if word["x0"] >= best[1])
+    if min(left, right) < len(words) * COLUMN_MIN_SHARE:
+        return None
+    return best
+
+
+def _join_line(line: List[Dict]) -> str:
+    """
+    Join a line's words.
+
+    Touching words are one word written out of order (drop caps, small
+    caps: "E" + "DUCATION"); letter-spaced titles are re-joined
+    ("L é o n i e" -> "Léonie").
+    """
+    merged: List[Dict] = []
+    for word in line:
+        if merged and word["x0"] - merged[-1]["x1"] <= TOUCHING_GAP:
+            merged[-1] = {**merged[-1], "text": merged[-1]["text"] + word["text"], "x1": word["x1"]}
+        else:
+            merged.append(word)
+    line = merged
+
+    texts = [word["text"] for word in line]
+    if len(line) < 4 or any(len(text) != 1 for text in texts):
+        return " ".join(texts)
+
+    gaps = [line[i + 1]["x0"] - line[i]["x1"] for i in range(len(line) - 1)]
+    letter_gap = statistics.median(gaps)
+    joined = texts[0]
+    for gap, text in zip(gaps, texts[1:]):
+        joined += (" " if gap > 2 * letter_gap + 1 else "") + text
+    return joined
+
+
+def _compose_accents(word: Dict) -> Dict:
+    """
+    Put LaTeX spacing accents on the letter they are drawn over.
+
+    The accent glyph comes before or after its letter in the text stream
+    ("exp´erience", "E´trangeres"), so it is matched by horizontal overlap.
+    """
+    chars = word.pop("chars")
+    if not any(char["text"] in SPACING_ACCENTS for char in chars):
+        return word
+
+    letters = [dict(char) for char in chars if char["text"] not in SPACING_ACCENTS]
+    for accent in (char for char in chars if char["text"] in SPACING_ACCENTS):
+        overlaps = [
+            min(accent["x1"], letter["x1"]) - max(accent["x0"], letter["x0"]) for letter in letters
+        ]
+        if not letters or max(overlaps) <= 0:
+            continue
+        letter = letters[overlaps.index(max(overlaps))]
+        base = "i" if letter["text"] == "ı" else letter["text"]  # Dotless i under an accent
+        letter["text"] = unicodedata.normalize("NFC", base + SPACING_ACCENTS[accent["text"]])
+    return {**word, "text": "".join(letter["text"] for letter in letters)}
+
+
+def _inside(word: Dict, box: Tuple[float, float, float, float]) -> bool:
+    """True if the word's center lies in the box (x0, top, x1, bottom)."""
+    x = (word["x0"] + word["x1"]) / 2
+    y = (word["top"] + word["bottom"]) / 2
+    return box[0] <= x <= box[2] and box[1] <= y <= box[3]
+
+
+def _clean(text: str) -> str:
+    """Normalize glyphs: icons dropped, bullets as "- ", blank lines removed."""
+    text = _CID_PATTERN.sub("", text)
+    lines = []
+    for line in text.split("\n"):
+        line = re.sub(r"[ \t]+", " ", line).strip()
+        if line[:1] and line[0] in BULLET_GLYPHS:
+            line = "- " + line.lstrip(BULLET_GLYPHS + " ")
+        if line and line != "-":
+            lines.append(line)
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Confidence
+# ---------------------------------------------------------------------------
+
+def _score(text: str, page_stats: List[Dict]) -> Tuple[float, List[str]]:
+    """
+    Score extracted text (1.0 = as good as the vision extraction).
+
+    Returns:
+        Tuple (confidence rounded to 2 decimals, reasons it was lowered)
+    """
+    visible = [char for char in text if not char.isspace()]
+    if not visible:
+        return 0.0, ["no text layer (scanned or image-only PDF)"]
+
+    score, reasons = 1.0, []
+
+    if len(visible) < MIN_TEXT_CHARS:
+        score *= len(visible) / MIN_TEXT_CHARS
+        reasons.append(f"only {len(visible)} characters of text")
+
+    scanned = sum(
+        1 for stats in page_stats
+        if stats["chars"] < MIN_PAGE_CHARS and stats["image_coverage"] >= SCAN_IMAGE_COVERAGE
+    )
+    if scanned:
+        score *= 1 - scanned / len(page_stats)
+        reasons.append(f"{scanned}/{len(page_stats)} page(s) look scanned")
+
+    unreadable = sum(stats["cid_glyphs"] for stats in page_stats) + sum(
+        1 for char in visible
+        if char == "\ufffd" or unicodedata.category(char) in ("Co", "Cc")
+    )
+    unreadable_ratio = unreadable / (len(visible) + unreadable)
+    if unreadable_ratio > 0.005:
+        score *= max(0.0, 1 - 10 * unreadable_ratio)
+        reasons.append(f"{unreadable_ratio:.1%} unreadable glyphs")
+
+    letter_ratio = sum(1 for char in visible if char.isalpha()) / len(visible)
+    if letter_ratio < MIN_LETTER_RATIO:
+        score *= letter_ratio / MIN_LETTER_RATIO
+        reasons.append(f"only {letter_ratio:.0%} letters")
+
+    tokens = text.split()
+    glued = sum(
+        1 for token in tokens
+        if len(token) > GLUED_WORD_LENGTH and not re.search(r"[@/.:_-]", token)
+    )
+    glued_ratio = glued / len(tokens)
+    if glued:
+        score *= max(0.0, 1 - 20 * glued_ratio)
+        reasons.append(f"{glued} glued word(s) (missing spaces)")
+
+    return round(score, 2), reasons
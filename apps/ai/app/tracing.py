@@ -0,0 +1,206 @@
+"""
+Per-stage timing instrumentation for Postulae CV Generator.
+
+Records a span tree per generation (stage name, attributes such as
+language / pass / bytes / tokens, duration) so a slow generation can be
+attributed to extraction, LLM content, enrichment, render, PFR measurement
+or DOCX.
+
+Usage:
+    with start_trace("cv_generation", source="pdf") as root:
+        with span("llm.generate_content", language="fr"):
+            ...
+    root.to_dict()  # also emitted to registered sinks
+
+Spans propagate through contextvars: asyncio tasks and asyncio.to_thread
+inherit the current span automatically; thread pools must submit through
+run_in_context(). Outside a trace, span() is a cheap no-op.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+@dataclass
+class Span:
+    """One timed stage of a generation."""
+    name: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start: float = 0.0
+    duration_ms: Optional[float] = None
+    children: List["Span"] = field(default_factory=list)
+
+    def set(self, **attributes: Any) -> None:
+        """Set attributes (e.g. bytes, page_count) on the span."""
+        self.attributes.update(attributes)
+
+    def add(self, key: str, value: float) -> None:
+        """Accumulate a numeric attribute (e.g. tokens over several calls)."""
+        self.attributes[key] = self.attributes.get(key, 0) + value
+
+    def record_usage(self, usage: Any) -> None:
+        """
+        Record token usage of an OpenAI response (usage object or None).
+
+        cached_tokens: prompt tokens served by the provider-side prompt cache
+        (usage.prompt_tokens_details.cached_tokens).
+        """
+        if usage is None:
+            return
+        for key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            value = getattr(usage, key, None)
+            if value is not None:
+                self.add(key, value)
+        cached = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+        if cached is not None:
+            self.add("cached_tokens", cached)
+
+    def total(self, key: str) -> float:
+        """Sum of a numeric attribute over this span and all descendants."""
+        own = self.attributes.get(key, 0) or 0
+        return own + sum(child.total(key) for child in self.children)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable span tree."""
+        return {
+            "name": self.name,
+            "duration_ms": self.duration_ms,
+            "attributes": dict(self.attributes),
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def format(self, indent: int = 0) -> str:
+        """Human-readable tree (one line per span)."""
+        attrs = " ".join(f"{k}={v}" for k, v in self.attributes.items())
+        duration = f"{self.duration_ms:.1f}ms" if self.duration_ms is not None else "running"
+        lines = [f"{'  ' * indent}{self.name} {duration} {attrs}".rstrip()]
+        lines.extend(child.format(indent + 1) for child in self.children)
+        return "\n".join(lines)
+
+
+class TraceSink:
+    """Receives each finished root span. Subclass and register with add_sink()."""
+
+    def emit(self, trace: Span) -> None:
+        raise NotImplementedError
+
+
+class PrintSink(TraceSink):
+    """Prints the span tree (same logging style as the rest of the pipeline)."""
+
+    def emit(self, trace: Span) -> None:
+        print(f"[TRACE]\n{trace.format()}")
+
+
+class MemorySink(TraceSink):
+    """Keeps the last finished traces in memory (tests, debugging)."""
+
+    def __init__(self, max_traces: int = 100):
+        self.max_traces = max_traces
+        self.traces: List[Span] = []
+        self._lock = threading.Lock()
+
+    def emit(self, trace: Span) -> None:
+        with self._lock:
+            self.traces.append(trace)
+            del self.traces[:-self.max_traces]
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "postulae_current_span", default=None
+)
+_children_lock = threading.Lock()
+_sinks: List[TraceSink] = []
+
+
+def add_sink(sink: TraceSink) -> None:
+    """Register a sink receiving every finished trace."""
+    if sink not in _sinks:
+        _sinks.append(sink)
+
+
+def remove_sink(sink: TraceSink) -> None:
+    """Unregister a sink."""
+    if sink in _sinks:
+        _sinks.remove(sink)
+
+
+def current_span() -> Optional[Span]:
+    """Span active in the current context (None outside a trace)."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Time a stage as a child of the current span.
+
+    Outside a trace the span is created but not attached anywhere.
+    """
+    parent = _current_span.get()
+    current = Span(name=name, attributes=dict(attributes), start=time.perf_counter())
+    if parent is not None:
+        with _children_lock:
+            parent.children.append(current)
+
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.set(error=type(e).__name__)
+        raise
+    finally:
+        current.duration_ms = round((time.perf_counter() - current.start) * 1000, 2)
+        _current_span.reset(token)
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Open a root span (nested under the current span if one is active)
+    and emit it to the registered sinks when it finishes.
+    """
+    nested = _current_span.get() is not None
+    root = None
+    try:
+        with span(name, **attributes) as root:
+            yield root
+    finally:
+        if root is not None and not nested:
+            _emit(root)
+
+
+def _emit(trace: Span) -> None:
+    """Send a finished trace to every sink (sink errors never break generation)."""
+    for sink in list(_sinks):
+        try:
+            sink.emit(trace)
+        except Exception as e:
+            print(f"[TRACE] Sink {type(sink).__name__} failed: {e}")
+
+
+def run_in_context(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Bind fn to a copy of the current context (for executor.submit),
+    so spans opened in worker threads attach to the current span.
+    """
+    context = contextvars.copy_context()
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Fresh copy per call: a context cannot be entered by two threads at once
+        return context.copy().run(fn, *args, **kwargs)
+
+    return wrapper
+
+
+def configure_from_settings() -> None:
+    """Register the PrintSink when TRACE_LOG is enabled in apps.config."""
+    try:
+        from apps.config import TRACE_LOG
+    except ImportError:
+        return
+    if TRACE_LOG and not any(isinstance(s, PrintSink) for s in _sinks):
+        add_sink(PrintSink())
@@ -0,0 +1,306 @@
+"""
+Trim planner for Postulae CV Generator.
+
+Replaces the fixed step-1/2/3 trim cascade for overflowing CVs: uses the
+per-block height estimates of PageFillEstimator and solves for the
+CHEAPEST set of cuts that lands the page in the target PFR window, so the
+plan can be applied with a single render.
+
+Cuts considered (cheapest first, in content-loss terms):
+- Shorten a bullet by one line (drop trailing words)
+- Drop an interest (the first one is always kept)
+- Drop a bullet (longest experiences first, MIN_BULLETS kept per experience)
+- Drop an education coursework line
+- Drop a whole experience (oldest first, MIN_EXPERIENCES kept)
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .content_ops import with_entry, without_indices
+from .layout import LayoutEngine
+from .page_estimator import CONTENT_BOTTOM, PAGE_HEIGHT, BlockEstimate, PageFillEstimator
+
+
+def _raw_indices(items: Optional[List]) -> List[int]:
+    """
+    Raw index of each item normalization keeps, by normalized index.
+
+    normalize_cv_data() drops N/A / empty placeholders from lists, which
+    shifts the indexes of the items after them.
+    """
+    return [i for i, item in enumerate(items or []) if LayoutEngine._replace_na_values(item) != ""]
+
+
+@dataclass
+class TrimCut:
+    """One planned cut (path refers to normalized template data)."""
+    action: str              # shorten, drop
+    kind: str                # bullet, coursework, interest, experience
+    path: Tuple
+    freed_height: float
+    cost: float
+    new_text: str = ""       # shortened text (action == "shorten")
+
+
+@dataclass
+class TrimPlan:
+    """Set of cuts and the PFR they are predicted to produce."""
+    cuts: List[TrimCut] = field(default_factory=list)
+    initial_pfr: float = 0.0
+    predicted_pfr: float = 0.0
+
+    @property
+    def freed_height(self) -> float:
+        return sum(cut.freed_height for cut in self.cuts)
+
+    def describe(self) -> str:
+        """Short human-readable summary, e.g. '2 bullet(s) dropped, 1 shortened'."""
+        dropped: Dict[str, int] = {}
+        shortened = 0
+        for cut in self.cuts:
+            if cut.action == "shorten":
+                shortened += 1
+            else:
+                dropped[cut.kind] = dropped.get(cut.kind, 0) + 1
+        parts = [f"{count} {kind}(s) dropped" for kind, count in sorted(dropped.items())]
+        if shortened:
+            parts.append(f"{shortened} bullet(s) shortened")
+        return ", ".join(parts) or "no cut"
+
+
+class TrimPlanner:
+    """Plans minimal content cuts to bring an overflowing CV into the PFR window."""
+
+    TARGET_MIN = 86.0        # Same window as the generator (OPTIMAL_MIN / OPTIMAL_MAX)
+    TARGET_MAX = 95.0
+    SAFETY_MARGIN = 1.0      # PFR points kept from the window edges (estimator error)
+    MIN_BULLETS = 2          # Bullets always kept per experience
+    MIN_EXPERIENCES = 2      # Experiences always kept
+    MIN_WORDS = 10           # Shortened bullets keep at least this many words
+    RESOLUTION = 0.5         # Height quantization for the solver (points)
+
+    # Content-loss cost of each cut
+    SHORTEN_COST = 1.0
+    INTEREST_COST = 1.5
+    BULLET_COST = 3.0
+    COURSEWORK_COST = 4.0
+    EXPERIENCE_COST = 10.0
+
+    def plan(self, content: Dict, trim: bool = False) -> Optional[TrimPlan]:
+        """
+        Find the cheapest set of cuts landing the CV in the target window.
+
+        Args:
+            content: Raw CV content dictionary
+            trim: Layout trim flag the content will be rendered with
+
+        Returns:
+            TrimPlan (empty if already in the window), or None if no
+            combination of cuts reaches the window
+        """
+        layout = PageFillEstimator.estimate(content, trim=trim)
+        text_height = layout.text_height
+
+        # A single page caps the fill below TARGET_MAX (top/bottom margins)
+        one_page_max = (CONTENT_BOTTOM - layout.text_top) / PAGE_HEIGHT * 100
+        upper = min(self.TARGET_MAX, one_page_max) - self.SAFETY_MARGIN
+        lower = self.TARGET_MIN + self.SAFETY_MARGIN
+
+        initial_pfr = round(text_height / PAGE_HEIGHT * 100, 1)
+        min_freed = text_height - upper * PAGE_HEIGHT / 100
+        max_freed = text_height - lower * PAGE_HEIGHT / 100
+
+        if min_freed <= 0:
+            return TrimPlan(initial_pfr=initial_pfr, predicted_pfr=layout.fill_percentage)
+        if max_freed < min_freed:
+            return None
+
+        capacity = int(max_freed / self.RESOLUTION)
+        best = self._combine(self._candidate_groups(layout.blocks, capacity), capacity)
+
+        # Cheapest combination inside the window (ties: fewest points freed)
+        minimum = int(-(-min_freed // self.RESOLUTION))  # ceil
+        feasible = [(cost, used, cuts) for used, (cost, cuts) in best.items() if used >= minimum]
+        if not feasible:
+            return None
+        _, _, cuts = min(feasible, key=lambda item: (item[0], item[1]))
+
+        plan = TrimPlan(cuts=cuts, initial_pfr=initial_pfr)
+        plan.predicted_pfr = round((text_height - plan.freed_height) / PAGE_HEIGHT * 100, 1)
+        return plan
+
+    def _candidate_groups(
+        self, blocks: List[BlockEstimate], capacity: int
+    ) -> List[List[Tuple[int, float, List[TrimCut]]]]:
+        """
+        Build groups of mutually exclusive options (keeping is implicit).
+
+        Each option is (quantized freed height, cost, cuts). A bullet can be
+        shortened OR dropped; an experience is either dropped as a whole OR
+        has its bullets cut, so each experience is pre-solved into one group.
+        """
+        bullets_per_exp: Dict[int, List[BlockEstimate]] = {}
+        groups: List[List[Tuple[int, float, List[TrimCut]]]] = []
+
+        for block in blocks:
+            if block.kind == "bullet":
+                bullets_per_exp.setdefault(block.path[1], []).append(block)
+            elif block.kind == "interest" and block.path[1] > 0:
+                groups.append([self._option(TrimCut(
+                    action="drop", kind="interest", path=block.path,
+                    freed_height=block.height, cost=self.INTEREST_COST,
+                ))])
+            elif block.kind == "coursework":
+                groups.append([self._option(TrimCut(
+                    action="drop", kind="coursework", path=block.path,
+                    freed_height=block.height, cost=self.COURSEWORK_COST,
+                ))])
+
+        for block in blocks:
+            if block.kind != "experience":
+                continue
+            exp_idx = block.path[1]
+            bullets = bullets_per_exp.get(exp_idx, [])
+            bullet_groups = [
+                options for options in (
+                    self._bullet_options(bullet, len(bullets)) for bullet in bullets
+                ) if options
+            ]
+            inner = self._combine(bullet_groups, capacity)
+            options = [(used, cost, cuts) for used, (cost, cuts) in inner.items() if used > 0]
+            if exp_idx >= self.MIN_EXPERIENCES:
+                # Oldest experiences (listed last) are dropped first
+                options.append(self._option(TrimCut(
+                    action="drop", kind="experience", path=block.path,
+                    freed_height=block.height, cost=self.EXPERIENCE_COST - 0.01 * exp_idx,
+                )))
+            if options:
+                groups.append(options)
+
+        return groups
+
+    def _bullet_options(
+        self, block: BlockEstimate, bullet_count: int
+    ) -> List[Tuple[int, float, List[TrimCut]]]:
+        """Shorten-by-one-line and drop options for one bullet."""
+        options = []
+        bullet_idx = block.path[3]
+        if block.lines > 1:
+            shortened = self._shorten_to_lines(block.text, block.lines - 1)
+            if shortened:
+                options.append(self._option(TrimCut(
+                    action="shorten", kind="bullet", path=block.path,
+                    freed_height=block.line_height, cost=self.SHORTEN_COST,
+                    new_text=shortened,
+                )))
+        if bullet_idx >= self.MIN_BULLETS:
+            # Longest experiences and last bullets are cut first
+            cost = self.BULLET_COST - 0.1 * bullet_count - 0.01 * bullet_idx
+            options.append(self._option(TrimCut(
+                action="drop", kind="bullet", path=block.path,
+                freed_height=block.height, cost=cost,
+            )))
+        return options
+
+    def _option(self, cut: TrimCut) -> Tuple[int, float, List[TrimCut]]:
+        """Wrap a single cut as a solver option."""
+        return int(round(cut.freed_height / self.RESOLUTION)), cut.cost, [cut]
+
+    @staticmethod
+    def _combine(
+        groups: List[List[Tuple[int, float, List[TrimCut]]]], capacity: int
+    ) -> Dict[int, Tuple[float, List[TrimCut]]]:
+        """
+        Multiple-choice knapsack: at most one option per group.
+
+        Returns:
+            For each reachable quantized freed height (<= capacity),
+            the cheapest (cost, cuts) reaching it exactly
+        """
+        best: Dict[int, Tuple[float, List[TrimCut]]] = {0: (0.0, [])}
+        for options in groups:
+            updated = dict(best)
+            for used, (cost, cuts) in best.items():
+                for freed, option_cost, option_cuts in options:
+                    total = used + freed
+                    if total > capacity:
+                        continue
+                    candidate = cost + option_cost
+                    if total not in updated or candidate < updated[total][0]:
+                        updated[total] = (candidate, cuts + option_cuts)
+            best = updated
+        return best
+
+    def _shorten_to_lines(self, text: str, lines: int) -> Optional[str]:
+        """Drop trailing words until the bullet wraps to `lines` lines."""
+        words = text.split()
+        for count in range(len(words) - 1, self.MIN_WORDS - 1, -1):
+            shortened = " ".join(words[:count]).rstrip(",;:")
+            if not shortened.endswith("."):
+                shortened += "..."
+            if PageFillEstimator.count_bullet_lines(shortened) <= lines:
+                return shortened
+        return None
+
+    @staticmethod
+    def apply(content: Dict, plan: TrimPlan) -> Dict:
+        """
+        Apply a plan to raw CV content (input is not mutated).
+
+        Paths refer to normalized data and are mapped back to raw indexes
+        (N/A entries filtered by normalization shift them); raw keys may be
+        "work_experience" (LLM output) or "experience",
+        "activities_interests" or "interests".
+
+        Args:
+            content: Raw CV content dictionary
+            plan: Plan returned by plan()
+
+        Returns:
+            Trimmed content
+        """
+        exp_key = "work_experience" if "work_experience" in content else "experience"
+        interest_key = "activities_interests" if "activities_interests" in content else "interests"
+        experiences = _raw_indices(content.get(exp_key))
+        education = _raw_indices(content.get("education"))
+        interests = _raw_indices(content.get(interest_key))
+
+        shortened_bullets: Dict[int, Dict[int, str]] = {}
+        dropped_bullets: Dict[int, List[int]] = {}
+        cleared_coursework: List[int] = []
+        dropped_interests: List[int] = []
+        dropped_experiences: List[int] = []
+        for cut in plan.cuts:
+            if cut.kind == "bullet":
+                exp_idx = experiences[cut.path[1]]
+                bullet_idx = _raw_indices(content[exp_key][exp_idx].get("bullets"))[cut.path[3]]
+                if cut.action == "shorten":
+                    shortened_bullets.setdefault(exp_idx, {})[bullet_idx] = cut.new_text
+                else:
+                    dropped_bullets.setdefault(exp_idx, []).append(bullet_idx)
+            elif cut.kind == "coursework":
+                cleared_coursework.append(education[cut.path[1]])
+            elif cut.kind == "interest":
+                dropped_interests.append(interests[cut.path[1]])
+            elif cut.kind == "experience":
+                dropped_experiences.append(experiences[cut.path[1]])
+
+        # Copy-on-write: only the sections and entries cut are copied
+        trimmed = dict(content)
+        for exp_idx in set(shortened_bullets) | set(dropped_bullets):
+            texts = shortened_bullets.get(exp_idx, {})
+            dropped = set(dropped_bullets.get(exp_idx, []))
+            bullets = [
+                texts.get(bullet_idx, bullet)
+                for bullet_idx, bullet in enumerate(trimmed[exp_key][exp_idx]["bullets"])
+                if bullet_idx not in dropped
+            ]
+            trimmed = with_entry(trimmed, exp_key, exp_idx, bullets=bullets)
+        for edu_idx in cleared_coursework:
+            trimmed = with_entry(trimmed, "education", edu_idx, coursework=[])
+        if dropped_interests:
+            trimmed[interest_key] = without_indices(trimmed[interest_key], dropped_interests)
+        if dropped_experiences:
+            trimmed[exp_key] = without_indices(trimmed[exp_key], dropped_experiences)
+
+        return trimmed
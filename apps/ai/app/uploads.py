@@ -0,0 +1,312 @@
+"""
+OpenAI file upload bookkeeping for Postulae CV Generator.
+
+The GPT-4o vision extraction uploads the PDF (purpose="user_data") before
+the chat call. Without bookkeeping every request pays the upload latency
+and leaves one more file on the OpenAI account. UploadManager keeps:
+- a PDF SHA-256 -> file_id mapping with a TTL: an identical PDF extracted
+  while its upload is alive (concurrent /cv/evaluate + generation, retry
+  after a failed or empty extraction) reuses the file_id
+- a deletion queue: an upload is deleted once its extraction finished and
+  the text is cached (nothing will need the file again), or once its TTL
+  expired and no extraction still uses it
+
+Deletions never run on the request path: a background thread sweeps the
+queue every cleanup_interval seconds (sooner when batch_size deletions are
+waiting) and retries failed deletions a few times.
+
+Usage:
+    manager = get_upload_manager()
+    digest = manager.digest(pdf_bytes)
+    file_id = manager.acquire(digest)
+    if file_id is None:
+        file_id = manager.register(digest, upload(pdf_bytes).id, delete=client.files.delete)
+    try:
+        ...  # vision call with file_id
+    finally:
+        manager.release(file_id, keep=not text_cached)
+"""
+import atexit
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+MAX_DELETE_ATTEMPTS = 3
+
+
+@dataclass
+class _Upload:
+    """One live upload and the extractions using it."""
+    digest: str
+    file_id: str
+    delete: Callable[[str], object]
+    expires_at: float
+    refs: int = 1
+    done: bool = False
+
+
+@dataclass
+class _Deletion:
+    """A file waiting for deletion."""
+    file_id: str
+    delete: Callable[[str], object]
+    attempts: int = 0
+
+
+class UploadManager:
+    """Reuses live uploads of identical PDFs and deletes them in the background."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 900,
+        cleanup_interval: float = 30.0,
+        batch_size: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl_seconds: How long an upload can be reused
+            cleanup_interval: Seconds between background sweeps
+            batch_size: Max deletions per sweep (a full batch wakes the sweeper early)
+            clock: Monotonic clock (injectable for tests)
+
+        Raises:
+            ValueError: If ttl_seconds, cleanup_interval or batch_size is not positive
+        """
+        if ttl_seconds <= 0 or cleanup_interval <= 0 or batch_size < 1:
+            raise ValueError("Upload TTL, cleanup interval and batch size must be > 0")
+        self.ttl_seconds = ttl_seconds
+        self.cleanup_interval = cleanup_interval
+        self.batch_size = batch_size
+        self._clock = clock
+        self._uploads: Dict[str, _Upload] = {}      # file_id -> upload
+        self._by_digest: Dict[str, str] = {}        # PDF digest -> reusable file_id
+        self._pending: List[_Deletion] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {"uploads": 0, "reuses": 0, "deleted": 0, "delete_failures": 0}
+
+    @staticmethod
+    def digest(pdf_bytes: bytes) -> str:
+        """Mapping key of a PDF."""
+        return hashlib.sha256(pdf_bytes).hexdigest()
+
+    def acquire(self, digest: str) -> Optional[str]:
+        """
+        Reuse a live upload of this PDF.
+
+        Returns:
+            file_id (a reference is taken, see release()), or None to upload
+        """
+        with self._lock:
+            upload = self._reusable(digest)
+            if upload is None:
+                return None
+            upload.refs += 1
+            self._stats["reuses"] += 1
+            print(f"[UPLOADS] Reusing upload {upload.file_id} - no upload")
+            return upload.file_id
+
+    def register(self, digest: str, file_id: str, delete: Callable[[str], object]) -> str:
+        """
+        Record a new upload (a reference is taken, see release()).
+
+        If another extraction of the same PDF registered its upload first,
+        this one is queued for deletion and the existing file_id returned.
+
+        Args:
+            digest: digest() of the uploaded PDF
+            file_id: OpenAI file id
+            delete: Deletes a file by id (called from the background sweeper)
+
+        Returns:
+            file_id to use for the extraction
+        """
+        with self._lock:
+            self._stats["uploads"] += 1
+            upload = self._reusable(digest)
+            if upload is not None:
+                upload.refs += 1
+                self._queue(_Deletion(file_id, delete))
+                return upload.file_id
+            self._uploads[file_id] = _Upload(digest, file_id, delete, self._clock() + self.ttl_seconds)
+            self._by_digest[digest] = file_id
+        self._ensure_worker()
+        return file_id
+
+    def release(self, file_id: str, keep: bool = True) -> None:
+        """
+        Drop the reference taken by acquire() / register().
+
+        Args:
+            file_id: file_id returned by acquire() / register()
+            keep: False when nothing will need the file again (text cached):
+                it is deleted as soon as no extraction uses it. True keeps
+                it reusable until its TTL.
+        """
+        with self._lock:
+            upload = self._uploads.get(file_id)
+            if upload is None:
+                return
+            upload.refs = max(0, upload.refs - 1)
+            upload.done = upload.done or not keep
+            if upload.refs == 0 and (upload.done or upload.expires_at <= self._clock()):
+                self._retire(upload)
+
+    def sweep(self) -> int:
+        """
+        Delete one batch of queued and expired uploads.
+
+        Returns:
+            Number of files deleted
+        """
+        with self._lock:
+            self._collect_expired()
+            batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+
+        deleted, failed = 0, []
+        for deletion in batch:
+            try:
+                deletion.delete(deletion.file_id)
+                deleted += 1
+            except Exception as e:
+                deletion.attempts += 1
+                if deletion.attempts < MAX_DELETE_ATTEMPTS:
+                    failed.append(deletion)
+                else:
+                    print(f"[UPLOADS] Giving up deleting {deletion.file_id}: {e}")
+
+        with self._lock:
+            self._pending.extend(failed)
+            self._stats["deleted"] += deleted
+            self._stats["delete_failures"] += len(batch) - deleted
+        if batch:
+            print(f"[UPLOADS] Deleted {deleted}/{len(batch)} uploaded file(s)")
+        return deleted
+
+    def flush(self) -> int:
+        """
+        Delete every upload no extraction is using, TTL or not (shutdown).
+
+        Returns:
+            Number of files deleted
+        """
+        with self._lock:
+            for upload in list(self._uploads.values()):
+                if upload.refs == 0:
+                    self._retire(upload)
+        deleted = 0
+        for _ in range(MAX_DELETE_ATTEMPTS * (len(self._pending) // self.batch_size + 1)):
+            if not self._pending:
+                break
+            deleted += self.sweep()
+        return deleted
+
+    def close(self) -> None:
+        """Stop the background sweeper and flush the deletion queue."""
+        with self._lock:
+            self._closed = True
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join(timeout=self.cleanup_interval)
+        self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """Uploads, reuses, deletions and files still alive / queued."""
+        with self._lock:
+            return {**self._stats, "live": len(self._uploads), "pending": len(self._pending)}
+
+    def _reusable(self, digest: str) -> Optional[_Upload]:
+        """Live upload of a PDF that can still be reused (lock held)."""
+        upload = self._uploads.get(self._by_digest.get(digest, ""))
+        if upload is None or upload.done or upload.expires_at <= self._clock():
+            return None
+        return upload
+
+    def _retire(self, upload: _Upload) -> None:
+        """Forget an unused upload and queue its deletion (lock held)."""
+        del self._uploads[upload.file_id]
+        if self._by_digest.get(upload.digest) == upload.file_id:
+            del self._by_digest[upload.digest]
+        self._queue(_Deletion(upload.file_id, upload.delete))
+
+    def _queue(self, deletion: _Deletion) -> None:
+        """Queue a deletion (lock held); a full batch wakes the sweeper."""
+        self._pending.append(deletion)
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def _collect_expired(self) -> None:
+        """Queue expired uploads no extraction is using (lock held)."""
+        now = self._clock()
+        for upload in list(self._uploads.values()):
+            if upload.refs == 0 and upload.expires_at <= now:
+                self._retire(upload)
+
+    def _ensure_worker(self) -> None:
+        """Start the background sweeper (daemon thread) on first upload."""
+        with self._lock:
+            if self._closed or (self._worker is not None and self._worker.is_alive()):
+                return
+            self._worker = threading.Thread(target=self._run, name="upload-cleanup", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Background sweeper: one batch per interval (or per full batch)."""
+        while not self._closed:
+            self._wakeup.wait(self.cleanup_interval)
+            self._wakeup.clear()
+            if self._closed:
+                return
+            try:
+                self.sweep()
+            except Exception as e:  # The sweeper must never die
+                print(f"[UPLOADS] Cleanup sweep failed: {e}")
+
+
+_default_upload_manager: Optional[UploadManager] = None
+_upload_manager_configured = False
+_default_upload_manager_lock = threading.Lock()
+
+
+def get_upload_manager() -> Optional[UploadManager]:
+    """
+    Return the process-wide upload manager (None when disabled).
+
+    Configured from apps.config (UPLOAD_REUSE_ENABLED, UPLOAD_TTL,
+    UPLOAD_CLEANUP_INTERVAL, UPLOAD_CLEANUP_BATCH). Queued deletions are
+    flushed at process exit.
+    """
+    global _default_upload_manager, _upload_manager_configured
+    with _default_upload_manager_lock:
+        if not _upload_manager_configured:
+            _upload_manager_configured = True
+            try:
+                from apps.config import (
+                    UPLOAD_CLEANUP_BATCH,
+                    UPLOAD_CLEANUP_INTERVAL,
+                    UPLOAD_REUSE_ENABLED,
+                    UPLOAD_TTL,
+                )
+            except ImportError:
+                return None
+            if UPLOAD_REUSE_ENABLED:
+                _default_upload_manager = UploadManager(
+                    ttl_seconds=UPLOAD_TTL,
+                    cleanup_interval=UPLOAD_CLEANUP_INTERVAL,
+                    batch_size=UPLOAD_CLEANUP_BATCH,
+                )
+                atexit.register(_default_upload_manager.close)
+        return _default_upload_manager
+
+
+def set_upload_manager(manager: Optional[UploadManager]) -> None:
+    """Replace the process-wide upload manager (None disables reuse and cleanup)."""
+    global _default_upload_manager, _upload_manager_configured
+    with _default_upload_manager_lock:
+        _default_upload_manager = manager
+        _upload_manager_configured = True
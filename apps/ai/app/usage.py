@@ -0,0 +1,107 @@
+"""
+LLM usage and cost accounting for Postulae CV Generator.
+
+Every chat completion runs in an "llm.chat" span (see llm_client) carrying
+its model, call type, token usage (prompt / cached / completion), retry
+count and duration. usage_from_trace() folds the spans of one generation
+into an LLMUsage (totals, per call type, per model) with an estimated cost;
+the generator attaches it to CVGenerationResult.usage.
+
+Costs are estimates from MODEL_PRICES (USD per 1M tokens); cached prompt
+tokens are billed at the cached input price. Unknown models cost 0.
+
+Usage:
+    with start_trace("cv_generation") as root:
+        ...
+    usage = usage_from_trace(root)
+    usage.cost_usd, usage.by_call_type["enrichment"].calls
+"""
+from typing import Dict, Iterator, Optional, Tuple
+
+from .models import LLMUsage, LLMUsageTotals
+from .tracing import Span
+
+LLM_SPAN = "llm.chat"
+
+# USD per 1M tokens: (input, cached input, output). Dated snapshots
+# ("gpt-4o-2024-08-06") use the price of their longest known prefix.
+MODEL_PRICES: Dict[str, Tuple[float, float, float]] = {
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4-turbo": (10.00, 10.00, 30.00),  # No prompt caching discount
+    # groq provider (see model_registry.py)
+    "llama-3.1-8b-instant": (0.05, 0.05, 0.08),
+    "llama-3.3-70b-versatile": (0.59, 0.59, 0.79),
+}
+
+
+def model_prices(model: Optional[str]) -> Optional[Tuple[float, float, float]]:
+    """Prices of a model (longest matching prefix), None if unknown."""
+    if not model:
+        return None
+    matches = [name for name in MODEL_PRICES if model == name or model.startswith(name + "-")]
+    return MODEL_PRICES[max(matches, key=len)] if matches else None
+
+
+def call_cost(model: Optional[str], prompt_tokens: int, cached_tokens: int, completion_tokens: int) -> float:
+    """Estimated cost (USD) of one call."""
+    prices = model_prices(model)
+    if prices is None:
+        return 0.0
+    input_price, cached_price, output_price = prices
+    cached_tokens = min(cached_tokens, prompt_tokens)
+    return (
+        (prompt_tokens - cached_tokens) * input_price
+        + cached_tokens * cached_price
+        + completion_tokens * output_price
+    ) / 1_000_000
+
+
+def _llm_spans(root: Span) -> Iterator[Span]:
+    """LLM call spans of a trace (depth first)."""
+    if root.name == LLM_SPAN:
+        yield root
+    for child in root.children:
+        yield from _llm_spans(child)
+
+
+def _add(totals: LLMUsageTotals, call: LLMUsageTotals) -> None:
+    """Accumulate one call into a group."""
+    for key in ("calls", "prompt_tokens", "cached_tokens", "completion_tokens", "retries", "latency_ms", "cost_usd"):
+        setattr(totals, key, getattr(totals, key) + getattr(call, key))
+
+
+def usage_from_trace(root: Span) -> LLMUsage:
+    """
+    Aggregate the LLM calls of a finished trace.
+
+    Args:
+        root: Root span of a generation (start_trace)
+
+    Returns:
+        LLMUsage with totals, per call type and per model
+    """
+    usage = LLMUsage()
+    for llm_span in _llm_spans(root):
+        attributes = llm_span.attributes
+        model = attributes.get("model") or "unknown"
+        prompt_tokens = int(attributes.get("prompt_tokens", 0))
+        cached_tokens = int(attributes.get("cached_tokens", 0))
+        completion_tokens = int(attributes.get("completion_tokens", 0))
+        call = LLMUsageTotals(
+            calls=1,
+            prompt_tokens=prompt_tokens,
+            cached_tokens=cached_tokens,
+            completion_tokens=completion_tokens,
+            retries=int(attributes.get("retries", 0)),
+            latency_ms=llm_span.duration_ms or 0.0,
+            cost_usd=call_cost(model, prompt_tokens, cached_tokens, completion_tokens),
+        )
+        _add(usage, call)
+        _add(usage.by_call_type.setdefault(attributes.get("call_type") or "other", LLMUsageTotals()), call)
+        _add(usage.by_model.setdefault(model, LLMUsageTotals()), call)
+
+    for totals in (usage, *usage.by_call_type.values(), *usage.by_model.values()):
+        totals.latency_ms = round(totals.latency_ms, 1)
+        totals.cost_usd = round(totals.cost_usd, 6)
+    return usage
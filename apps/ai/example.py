@@ -12,7 +12,12 @@ Set TWO_PHASE_MODE = True to use optimized two-phase generation.
 import os
 import time
 from pathlib import Path
-from app import generate_cv_from_pdf, generate_cv_phase1_from_pdf, generate_cv_phase2_from_pdf
+from app import (
+    generate_cv_from_pdf,
+    generate_cv_phase1_from_pdf,
+    generate_cv_phase2_from_pdf,
+    DocxWriter,
+)
 
 # Set to True for SaaS-optimized two-phase generation (FR first, EN deferred)
 # Set to False for standard generation (both languages at once)
@@ -105,7 +110,7 @@ def main():
                     f.write(result_fr.pdf_bytes)
 
                 with open(output_docx_fr, "wb") as f:
-                    f.write(result_fr.docx_bytes)
+                    f.write(result_fr.docx_bytes or DocxWriter.generate_docx_from_data(result_fr.content, trim=result_fr.layout_trim))
 
                 print(f"Files saved:")
                 print(f"  - {output_pdf_fr}")
@@ -139,7 +144,7 @@ def main():
                     f.write(result_en.pdf_bytes)
 
                 with open(output_docx_en, "wb") as f:
-                    f.write(result_en.docx_bytes)
+                    f.write(result_en.docx_bytes or DocxWriter.generate_docx_from_data(result_en.content, trim=result_en.layout_trim))
 
                 print(f"Files saved:")
                 print(f"  - {output_pdf_en}")
@@ -179,7 +184,7 @@ def main():
                         f.write(result.pdf_bytes)
 
                     with open(output_docx, "wb") as f:
-                        f.write(result.docx_bytes)
+                        f.write(result.docx_bytes or DocxWriter.generate_docx_from_data(result.content, trim=result.layout_trim))
 
                     print(f"Files saved:")
                     print(f"  - {output_pdf}")
@@ -0,0 +1,148 @@
+"""
+Test de la génération par lot - cohortes d'écoles sur un pool partagé.
+
+Validates:
+1. Every item is streamed once, in completion order, with its index
+2. A failing item is reported and does not stop the batch
+3. The LLM budget caps chat completions across all items and languages
+4. The grid template is compiled once and shared
+"""
+import sys
+import threading
+import time
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.generator as generator_module
+import app.llm_client as llm_client
+from app.batch import generate_cv_batch
+from app.generator import CVGenerator
+from app.layout import LayoutEngine
+from app.models import BatchItem, CVContent
+from test_deferred_docx import SAMPLE_CONTENT
+
+
+class FakeOpenAI:
+    """Stands in for the OpenAI module; records peak concurrent completions."""
+
+    def __init__(self, delay=0.03):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return SimpleNamespace(usage=None)
+
+
+# "slow" CVs are held until the test releases them
+release_slow = threading.Event()
+
+
+def fake_generate(input_data, domain, language, **kwargs):
+    """Content call through chat_completion (budgeted), held for "slow" CVs."""
+    llm_client.chat_completion(model="gpt-4o", messages=[])
+    if input_data.get("summary") == "slow":
+        release_slow.wait(timeout=30)
+    return deepcopy(SAMPLE_CONTENT)
+
+
+def run_batch(items, fake, on_result=None, **kwargs):
+    """Run the batch with fake LLM calls; on_result(results so far) after each item."""
+    original = (llm_client.get_client, generator_module.generate_cv_content)
+    llm_client.get_client = lambda provider="openai": fake
+    generator_module.generate_cv_content = fake_generate
+    results = []
+    try:
+        generator = CVGenerator(docx_mode="deferred", second_language_mode="generate")
+        for result in generate_cv_batch(items, generator=generator, **kwargs):
+            results.append(result)
+            if on_result:
+                on_result(results)
+        return results
+    finally:
+        llm_client.get_client, generator_module.generate_cv_content = original
+
+
+def make_item(item_id, summary=None, languages=None):
+    content = CVContent(**deepcopy(SAMPLE_CONTENT))
+    content.summary = summary
+    return BatchItem(item_id=item_id, cv_content=content, languages=languages or ["fr", "en"])
+
+
+def test_items_streamed_in_completion_order():
+    items = [make_item("slow", summary="slow", languages=["fr"])] + [
+        make_item(f"cv{i}", languages=["fr"]) for i in range(3)
+    ]
+
+    def release_after_others(results):
+        if len(results) == len(items) - 1:
+            release_slow.set()
+
+    release_slow.clear()
+    try:
+        results = run_batch(items, FakeOpenAI(), on_result=release_after_others, max_workers=4, llm_concurrency=4)
+    finally:
+        release_slow.set()
+
+    assert sorted(r.index for r in results) == [0, 1, 2, 3]
+    assert results[-1].item_id == "slow"  # finished last, streamed last
+    assert all(r.status == "done" and r.results["fr"].page_count == 1 for r in results)
+
+
+def test_failed_item_does_not_stop_batch():
+    items = [
+        make_item("ok"),
+        BatchItem(item_id="broken.pdf", pdf_bytes=b"not a pdf", languages=["fr"]),
+    ]
+    results = {r.item_id: r for r in run_batch(items, FakeOpenAI(), max_workers=2, llm_concurrency=2)}
+
+    assert results["ok"].status == "done"
+    assert set(results["ok"].results) == {"fr", "en"}
+    assert results["broken.pdf"].status == "failed"
+    assert results["broken.pdf"].error
+    assert results["broken.pdf"].results == {}
+
+
+def test_llm_budget_shared_by_batch():
+    fake = FakeOpenAI()
+    items = [make_item(f"cv{i}") for i in range(6)]  # 6 items x 2 languages
+    results = run_batch(items, fake, max_workers=6, llm_concurrency=3)
+
+    assert all(r.status == "done" for r in results)
+    assert fake.calls == 12
+    assert fake.peak <= 3
+
+
+def test_invalid_item_rejected_before_start():
+    try:
+        list(generate_cv_batch([BatchItem(item_id="empty")], max_workers=1, llm_concurrency=1))
+        assert False, "Expected ValueError"
+    except ValueError as e:
+        assert "exactly one of cv_content or pdf_bytes" in str(e)
+
+
+def test_template_compiled_once():
+    assert LayoutEngine._template() is LayoutEngine._template()
+
+
+if __name__ == "__main__":
+    test_items_streamed_in_completion_order()
+    test_failed_item_does_not_stop_batch()
+    test_llm_budget_shared_by_batch()
+    test_invalid_item_rejected_before_start()
+    test_template_compiled_once()
+    print("[OK] Batch generation tests passed")
@@ -0,0 +1,154 @@
+"""
+Test de l'enrichissement groupé - un seul appel LLM pour tous les bullets.
+
+Validates:
+1. All selected experiences get their bullet from ONE JSON call
+2. Invalid items (missing, too short, duplicated) are regenerated individually
+3. A malformed answer falls back to individual calls for every item
+4. Async path: one batched call, concurrent individual retries
+5. Short deadline: batched bullets kept, individual retries skipped
+6. Nothing to enrich (gap under one bullet, experiences full): no LLM call
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.enrichment as enrichment_module
+from app.deadline import use_deadline
+from app.enrichment import ContentEnricher
+from app.models import PageFillMetrics
+
+CONTENT = {
+    "experience": [
+        {"title": f"Analyst {i}", "company": f"Company {i}",
+         "bullets": [f"Existing bullet {i}.{j} on deal execution" for j in range(2)]}
+        for i in range(4)
+    ]
+}
+METRICS = PageFillMetrics(page_count=1, fill_percentage=82.0, char_count=0)  # 4 bullets needed
+
+SINGLE_BULLET = "Prepared weekly pipeline reviews for the coverage team across three industry verticals"
+
+
+def batch_bullet(idx):
+    return f"Built valuation models for experience {idx} covering comparable companies and precedent transactions"
+
+
+class FakeChat:
+    """Answers the batched call with `batch` (dict or raw text), single calls with SINGLE_BULLET."""
+
+    def __init__(self, batch):
+        self.batch = batch
+        self.requests = []
+
+    def response(self, kwargs):
+        self.requests.append(kwargs)
+        if kwargs.get("response_format"):
+            content = self.batch if isinstance(self.batch, str) else json.dumps(self.batch)
+        else:
+            content = SINGLE_BULLET
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    def __call__(self, **kwargs):
+        return self.response(kwargs)
+
+    async def acall(self, **kwargs):
+        return self.response(kwargs)
+
+    @property
+    def individual_calls(self):
+        return sum(not request.get("response_format") for request in self.requests)
+
+
+def enrich(fake, asynchronous=False, content=CONTENT, metrics=METRICS):
+    original = (enrichment_module.chat_completion, enrichment_module.achat_completion)
+    enrichment_module.chat_completion, enrichment_module.achat_completion = fake, fake.acall
+    try:
+        if asynchronous:
+            return asyncio.run(ContentEnricher.aincremental_enrich_content(content, metrics))
+        return ContentEnricher.incremental_enrich_content(content, metrics)
+    finally:
+        enrichment_module.chat_completion, enrichment_module.achat_completion = original
+
+
+def new_bullets(enriched):
+    return [exp["bullets"][-1] if len(exp["bullets"]) == 3 else None for exp in enriched["experience"]]
+
+
+def test_one_call_for_all_experiences():
+    fake = FakeChat({"bullets": [{"id": i, "bullet": batch_bullet(i)} for i in range(4)]})
+    enriched = enrich(fake)
+
+    assert len(fake.requests) == 1
+    prompt = fake.requests[0]["messages"][1]["content"]
+    assert all(f"[id {i}] Analyst {i} | Company {i}" in prompt for i in range(4))
+    assert new_bullets(enriched) == [batch_bullet(i) for i in range(4)]
+    assert CONTENT["experience"][0]["bullets"] == [f"Existing bullet 0.{j} on deal execution" for j in range(2)]
+
+
+def test_invalid_items_regenerated_individually():
+    fake = FakeChat({"bullets": [
+        {"id": 0, "bullet": "- " + batch_bullet(0)},                    # Dash cleaned, kept
+        {"id": 2, "bullet": "Too short"},                               # Below min words
+        {"id": 3, "bullet": CONTENT["experience"][3]["bullets"][0]},    # Existing bullet
+        {"id": 0, "bullet": batch_bullet(9)},                           # Repeated id ignored
+        {"id": 7, "bullet": batch_bullet(7)},                           # Unknown id
+    ]})
+    enriched = enrich(fake)
+
+    assert fake.individual_calls == 3  # ids 1 (missing), 2, 3
+    assert new_bullets(enriched) == [batch_bullet(0), SINGLE_BULLET, SINGLE_BULLET, SINGLE_BULLET]
+
+
+def test_malformed_answer_falls_back():
+    fake = FakeChat("Here are your bullets: ...")
+    enriched = enrich(fake)
+    assert len(fake.requests) == 5 and fake.individual_calls == 4
+    assert new_bullets(enriched) == [SINGLE_BULLET] * 4
+
+
+def test_async_batch():
+    fake = FakeChat({"bullets": [{"id": i, "bullet": batch_bullet(i)} for i in (0, 1, 3)]})
+    enriched = enrich(fake, asynchronous=True)
+    assert len(fake.requests) == 2 and fake.individual_calls == 1
+    assert new_bullets(enriched) == [batch_bullet(0), batch_bullet(1), SINGLE_BULLET, batch_bullet(3)]
+
+
+def test_short_deadline_skips_individual_retries():
+    for asynchronous in (False, True):
+        fake = FakeChat({"bullets": [{"id": i, "bullet": batch_bullet(i)} for i in (0, 1)]})
+        with use_deadline(1) as deadline:  # Less than one individual bullet call
+            enriched = enrich(fake, asynchronous=asynchronous)
+
+        assert len(fake.requests) == 1
+        assert new_bullets(enriched) == [batch_bullet(0), batch_bullet(1), None, None]
+        assert deadline.degradations == ["partial_enrichment"]
+
+
+def test_nothing_to_enrich_makes_no_call():
+    full = {"experience": [
+        {**exp, "bullets": [f"Existing bullet {j}" for j in range(ContentEnricher.MAX_BULLETS_PER_EXPERIENCE)]}
+        for exp in CONTENT["experience"]
+    ]}
+    small_gap = PageFillMetrics(page_count=1, fill_percentage=91.0, char_count=0)  # Under one bullet
+
+    for content, metrics in ((CONTENT, small_gap), (full, METRICS)):
+        for asynchronous in (False, True):
+            fake = FakeChat({"bullets": []})
+            assert enrich(fake, asynchronous, content, metrics) is content
+            assert fake.requests == []
+
+
+if __name__ == "__main__":
+    test_one_call_for_all_experiences()
+    test_invalid_items_regenerated_individually()
+    test_malformed_answer_falls_back()
+    test_async_batch()
+    test_short_deadline_skips_individual_retries()
+    test_nothing_to_enrich_makes_no_call()
+    print("[OK] Batched enrichment tests passed")
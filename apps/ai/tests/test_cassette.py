@@ -0,0 +1,174 @@
+"""
+Test des cassettes LLM - enregistrement / rejeu des appels OpenAI.
+
+Validates:
+1. A full CVGenerator run recorded once replays with no network, same output
+2. Requests are fingerprinted independently of key order; PDFs by content
+3. Replay misses raise CassetteMiss; "auto" records them instead
+4. Recorded latency is re-injected with latency_scale
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.llm_client as llm_client
+from app.cache import (
+    RenderCache, get_extraction_cache, get_llm_cache, set_extraction_cache, set_llm_cache,
+)
+from app.cassette import Cassette, CassetteMiss, use_cassette
+from app.generator import CVGenerator
+from openai.types import FileObject
+from openai.types.chat import ChatCompletion
+from test_deferred_docx import SAMPLE_CONTENT
+from test_generation_session import PDF_BYTES, RAW_TEXT
+
+
+def chat_response(content):
+    return ChatCompletion.model_validate({
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": content},
+        }],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150},
+    })
+
+
+class FakeOpenAI:
+    """Live OpenAI stand-in (uploads + chat), counts the calls that reach it."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self.deleted = []  # File deletions (background cleanup, not counted in calls)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        self.files = SimpleNamespace(create=self.upload, delete=self.delete)
+
+    def upload(self, file, purpose, **options):
+        self.calls += 1
+        return FileObject.model_validate({
+            "id": f"file-{self.calls}", "object": "file", "bytes": len(file[1]), "created_at": 0,
+            "filename": file[0], "purpose": purpose, "status": "processed",
+        })
+
+    def delete(self, file_id, **options):
+        self.deleted.append(file_id)
+
+    def create(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        if isinstance(kwargs["messages"][0]["content"], list):  # PDF extraction
+            return chat_response(json.dumps({"raw_text": RAW_TEXT}))
+        if kwargs.get("response_format"):
+            return chat_response(json.dumps(SAMPLE_CONTENT))
+        return chat_response("Built a three-statement model for a EUR 40m carve-out")
+
+
+class NoNetwork:
+    """Any live call fails: replay must not need it."""
+    def __getattr__(self, name):
+        raise AssertionError(f"Live OpenAI call during replay: {name}")
+
+
+def run_generation(openai_module):
+    original = (llm_client.get_client, get_llm_cache(), get_extraction_cache())
+    llm_client.get_client = lambda provider="openai": openai_module
+    set_llm_cache(None)  # Every call reaches the cassette
+    set_extraction_cache(None)
+    try:
+        generator = CVGenerator(
+            docx_mode="deferred",
+            second_language_mode="generate",
+            max_workers=1,
+            render_cache=RenderCache(),  # Cold cache: both runs go through the full pipeline
+        )
+        return generator.generate_from_pdf(PDF_BYTES, languages=["fr", "en"])
+    finally:
+        llm_client.get_client = original[0]
+        set_llm_cache(original[1])
+        set_extraction_cache(original[2])
+
+
+def test_full_run_replays_offline():
+    with tempfile.TemporaryDirectory() as directory:
+        live = FakeOpenAI()
+        with use_cassette(directory, mode="record") as recorder:
+            recorded = run_generation(live)
+
+        assert recorder.stats["recorded"] == live.calls  # upload + extraction + content calls
+        with use_cassette(directory, mode="replay") as player:
+            replayed = run_generation(NoNetwork())
+
+        assert player.stats["replayed"] == live.calls
+        for lang in ("fr", "en"):
+            assert replayed[lang].content == recorded[lang].content
+            assert replayed[lang].fill_percentage == recorded[lang].fill_percentage
+        llm_span = replayed["fr"].trace["children"]
+        assert "cassette" in json.dumps(llm_span)
+
+
+def test_fingerprint_is_canonical():
+    first = Cassette.fingerprint("chat", {"model": "gpt-4o", "temperature": 0.3, "messages": []})
+    same = Cassette.fingerprint("chat", {"messages": [], "temperature": 0.3, "model": "gpt-4o"})
+    other = Cassette.fingerprint("chat", {"messages": [], "temperature": 0.7, "model": "gpt-4o"})
+
+    assert first == same and first != other
+    assert Cassette.fingerprint("file", {"file": b"%PDF-a"}) != Cassette.fingerprint("file", {"file": b"%PDF-b"})
+
+
+def test_replay_miss_and_auto_record():
+    with tempfile.TemporaryDirectory() as directory:
+        request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}]}
+        live = FakeOpenAI()
+
+        try:
+            Cassette(directory, mode="replay").call("chat", request, lambda: live.create(**request))
+            assert False, "Expected CassetteMiss"
+        except CassetteMiss as e:
+            assert "gpt-4o" in str(e)
+
+        auto = Cassette(directory, mode="auto")
+        auto.call("chat", request, lambda: live.create(**request))
+        auto.call("chat", request, lambda: live.create(**request))
+
+        assert live.calls == 1
+        assert auto.stats == {"replayed": 1, "recorded": 1}
+
+
+def test_latency_injection():
+    with tempfile.TemporaryDirectory() as directory:
+        request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}]}
+        live = FakeOpenAI(delay=0.2)
+        Cassette(directory, mode="record").call("chat", request, lambda: live.create(**request))
+
+        start = time.time()
+        Cassette(directory, mode="replay").call("chat", request, lambda: live.create(**request))
+        instant = time.time() - start
+
+        start = time.time()
+        Cassette(directory, mode="replay", latency_scale=1.0).call(
+            "chat", request, lambda: live.create(**request)
+        )
+        realistic = time.time() - start
+
+        assert instant < 0.1
+        assert realistic >= 0.2
+        assert live.calls == 1
+
+
+if __name__ == "__main__":
+    test_full_run_replays_offline()
+    test_fingerprint_is_canonical()
+    test_replay_miss_and_auto_record()
+    test_latency_injection()
+    print("[OK] Cassette tests passed")
@@ -0,0 +1,110 @@
+"""
+Test du modèle copy-on-write - les étapes du pipeline ne modifient jamais leur entrée.
+
+Validates:
+1. normalize_cv_data, trim, enrichment and trim plans leave their input untouched
+2. Untouched sections / experiences are shared with the input (no deepcopy)
+3. Rendering the same content twice gives the same normalized data
+4. A full adjustment keeps the base content intact (revert / session reuse)
+"""
+import sys
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.enrichment as enrichment_module
+from app.content_ops import map_entries, with_entry, without_indices, without_sections
+from app.enrichment import ContentEnricher
+from app.generator import CVGenerator
+from app.layout import LayoutEngine
+from app.models import PageFillMetrics
+from app.trim_planner import TrimPlanner
+from test_deferred_docx import SAMPLE_CONTENT
+
+
+def test_helpers_share_untouched_entries():
+    content = deepcopy(SAMPLE_CONTENT)
+    snapshot = deepcopy(content)
+
+    updated = with_entry(content, "work_experience", 1, bullets=["New bullet"])
+    assert updated["work_experience"][1]["bullets"] == ["New bullet"]
+    assert updated["work_experience"][0] is content["work_experience"][0]
+    assert updated["education"] is content["education"]
+
+    same = map_entries(content, "work_experience", lambda exp: exp)
+    assert all(a is b for a, b in zip(same["work_experience"], content["work_experience"]))
+    assert map_entries(content, "missing", lambda exp: {}) is content
+    assert "education" not in without_sections(content, "education")
+    assert without_indices(["a", "b", "c"], [0, 2]) == ["b"]
+    assert content == snapshot
+
+
+def test_normalize_does_not_mutate():
+    content = deepcopy(SAMPLE_CONTENT)
+    content["education"][0]["year"] = "2024"
+    content["work_experience"][0]["date"] = "January 2023 - June 2023"
+    snapshot = deepcopy(content)
+
+    first = LayoutEngine.normalize_cv_data(content, trim=True)
+    second = LayoutEngine.normalize_cv_data(content, trim=True)
+
+    assert content == snapshot
+    assert first == second
+    assert first["experience"][0]["date"] == "Jan 2023-Jun 2023"
+
+
+def test_trim_and_enrich_do_not_mutate():
+    content = deepcopy(SAMPLE_CONTENT)
+    content["experience"] = content["work_experience"]  # Key used by the enricher
+    snapshot = deepcopy(content)
+
+    for step in (1, 2, 3):
+        trimmed = ContentEnricher.trim_content(content, step=step)
+        assert trimmed["contact_information"] is content["contact_information"]
+    assert content == snapshot
+
+    content["experience"][2]["bullets"] = content["experience"][2]["bullets"][:3]
+    snapshot = deepcopy(content)
+    original = enrichment_module.chat_completion
+    enrichment_module.chat_completion = lambda **kwargs: SimpleNamespace(choices=[
+        SimpleNamespace(message=SimpleNamespace(content="Led the refinancing of a EUR 5m credit line"))
+    ])
+    try:
+        metrics = PageFillMetrics(page_count=1, fill_percentage=85.0, char_count=0)
+        enriched = ContentEnricher.incremental_enrich_content(content, metrics, target_pfr=88.0)
+    finally:
+        enrichment_module.chat_completion = original
+
+    assert content == snapshot
+    changed = [i for i, exp in enumerate(enriched["experience"]) if exp is not content["experience"][i]]
+    assert changed == [2]
+    assert len(enriched["experience"][2]["bullets"]) == 4
+
+
+def test_trim_plan_and_adjustment_keep_base_content():
+    content = deepcopy(SAMPLE_CONTENT)
+    snapshot = deepcopy(content)
+
+    plan = TrimPlanner().plan(content)
+    trimmed = TrimPlanner.apply(content, plan)
+    assert plan.cuts and content == snapshot
+    assert trimmed["education"] is content["education"]
+
+    generator = CVGenerator(docx_mode="deferred")
+    metrics = generator._measure(content, trim=False)
+    result = generator._adjust_language(
+        content, metrics, "finance", "fr", None, CVGenerator.STRUCTURED_DATA_ANALYSIS,
+    )
+    assert result.page_count == 1
+    assert content == snapshot
+
+
+if __name__ == "__main__":
+    test_helpers_share_untouched_entries()
+    test_normalize_does_not_mutate()
+    test_trim_and_enrich_do_not_mutate()
+    test_trim_plan_and_adjustment_keep_base_content()
+    print("[OK] Copy-on-write tests passed")
@@ -0,0 +1,86 @@
+"""
+Test des routes de jobs /cv/jobs - statut et résultat d'une génération.
+
+Validates:
+1. A finished job's result is returned as produced by the handler
+   (degradations list included, not only strings)
+2. An unfinished job answers 409, another user's job 404
+
+Runs the CV router alone on an in-process queue (InMemoryRedis), with the
+authenticated user overridden.
+"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add repository root to path (apps.routers)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import apps.jobs as jobs
+from apps.authentication.users_oauth import get_current_user
+from apps.jobs import InMemoryRedis, JobQueue
+from apps.jobs.handlers import CV_GENERATE
+from apps.routers.cv_router import router
+
+USER = SimpleNamespace(id="user-1", plan="essential")
+
+RESULT = {
+    "pdf_url": "/files/cv/user-1/cv.pdf",
+    "docx_url": "/cv/cv-1/docx",
+    "cv_id": "cv-1",
+    "language": "FR",
+    "message": "Your optimized CV has been generated successfully in FR!",
+    "degradations": ["skip_enrichment", "estimate_only"],
+}
+
+
+def make_client():
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user] = lambda: USER
+    return TestClient(app)
+
+
+def with_queue(test):
+    """Run test(queue, client) against a fresh in-memory queue."""
+    original = jobs._queue
+    jobs._queue = JobQueue(InMemoryRedis())
+    try:
+        test(jobs._queue, make_client())
+    finally:
+        jobs._queue = original
+
+
+def test_finished_job_result():
+    def check(queue, client):
+        job = queue.enqueue(CV_GENERATE, {"user_id": USER.id})
+        queue.complete(queue.reserve("worker-1"), RESULT)
+
+        status = client.get(f"/cv/jobs/{job.id}")
+        assert status.status_code == 200 and status.json()["status"] == "done"
+
+        response = client.get(f"/cv/jobs/{job.id}/result")
+        assert response.status_code == 200, response.text
+        assert response.json() == RESULT
+
+    with_queue(check)
+
+
+def test_unfinished_and_foreign_jobs():
+    def check(queue, client):
+        pending = queue.enqueue(CV_GENERATE, {"user_id": USER.id})
+        assert client.get(f"/cv/jobs/{pending.id}/result").status_code == 409
+
+        foreign = queue.enqueue(CV_GENERATE, {"user_id": "user-2"})
+        assert client.get(f"/cv/jobs/{foreign.id}/result").status_code == 404
+
+    with_queue(check)
+
+
+if __name__ == "__main__":
+    test_finished_job_result()
+    test_unfinished_and_foreign_jobs()
+    print("[OK] CV router job tests passed")
@@ -0,0 +1,128 @@
+"""
+Test du budget de temps - modes dégradés quand la génération manque de temps.
+
+Validates:
+1. Deadline: remaining time, stage costs, degradations recorded once
+2. Short deadline: enrichment skipped, DOCX deferred, reported on the result
+3. Short deadline in render mode: decisions use the PFR estimate
+4. Short deadline: the zero-experience fallback extraction is skipped
+5. Generous deadline: no degradation
+"""
+import json
+import sys
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.generator as generator_module
+import app.llm_client as llm_client
+from app.deadline import Deadline, current_deadline, use_deadline
+from app.generator import CVGenerator
+from app.models import CVContent
+from test_deferred_docx import SAMPLE_CONTENT
+
+
+def low_pfr_content():
+    """Content in the enrichment zone (~68% PFR after padding)."""
+    content = deepcopy(SAMPLE_CONTENT)
+    content["work_experience"] = content["work_experience"][:3]
+    for exp in content["work_experience"]:
+        exp["bullets"] = exp["bullets"][:3]
+    return content
+
+
+def generate(content, **options):
+    """generate_from_data with the base LLM call returning content; counts other LLM calls."""
+    calls = []
+    original = (generator_module.generate_cv_content, llm_client.chat_completion)
+    generator_module.generate_cv_content = lambda **kwargs: deepcopy(content)
+    llm_client.chat_completion = lambda **kwargs: calls.append(kwargs)
+    try:
+        generator = CVGenerator(**options)
+        result = generator.generate_from_data(CVContent(**deepcopy(SAMPLE_CONTENT)), ["fr"])["fr"]
+    finally:
+        generator_module.generate_cv_content, llm_client.chat_completion = original
+    return result, calls
+
+
+def test_deadline_budget():
+    now = [0.0]
+    deadline = Deadline(30, clock=lambda: now[0])
+    assert deadline.allows("enrichment")
+
+    now[0] = 12.0
+    assert deadline.remaining() == 18.0
+    assert not deadline.allows("enrichment") and deadline.allows("docx")
+
+    deadline.degrade("skip_enrichment")
+    deadline.degrade("skip_enrichment")
+    assert deadline.degradations == ["skip_enrichment"]
+
+    with use_deadline(0) as unbounded:
+        assert unbounded is None and current_deadline() is None
+    with use_deadline(60) as outer:
+        with use_deadline(5) as inner:
+            assert inner is outer  # Nested generations keep the outer budget
+
+
+def test_short_deadline_skips_enrichment_and_defers_docx():
+    result, calls = generate(low_pfr_content(), measure_mode="estimate", docx_mode="eager", deadline_seconds=1)
+
+    assert calls == []  # No enrichment bullet requested
+    assert result.degradations == ["skip_enrichment", "defer_docx"]
+    assert result.docx_deferred and result.docx_bytes is None
+    assert result.page_count == 1
+    assert any("enrichment skipped" in w for w in result.warnings)
+    assert "degraded" in json.dumps(result.trace)
+
+
+def test_short_deadline_estimates_in_render_mode():
+    result, _ = generate(SAMPLE_CONTENT, measure_mode="render", docx_mode="deferred", deadline_seconds=1)
+
+    assert result.degradations == ["estimate_measure"]
+    assert result.page_count == 1
+
+
+def test_short_deadline_skips_fallback_extraction():
+    calls = []
+    original = llm_client.chat_completion
+
+    def fake_chat(**kwargs):
+        calls.append(kwargs)
+        content = {"contact_information": [{"name": "Jean DUPONT"}], "work_experience": []}
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(content)))],
+            usage=None,
+        )
+
+    llm_client.chat_completion = fake_chat
+    try:
+        with use_deadline(1) as deadline:
+            content = llm_client.generate_cv_content(
+                {"raw_text": "M&A Analyst at Company 0, Paris, 2023"}, language="fr"
+            )
+    finally:
+        llm_client.chat_completion = original
+
+    assert len(calls) == 1
+    assert content["work_experience"] == []
+    assert deadline.degradations == ["skip_fallback_extraction"]
+
+
+def test_generous_deadline_has_no_degradation():
+    result, _ = generate(SAMPLE_CONTENT, docx_mode="eager", deadline_seconds=600)
+
+    assert result.degradations == []
+    assert result.docx_bytes is not None
+
+
+if __name__ == "__main__":
+    test_deadline_budget()
+    test_short_deadline_skips_enrichment_and_defers_docx()
+    test_short_deadline_estimates_in_render_mode()
+    test_short_deadline_skips_fallback_extraction()
+    test_generous_deadline_has_no_degradation()
+    print("[OK] Deadline tests passed")
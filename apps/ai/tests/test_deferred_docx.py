@@ -0,0 +1,87 @@
+"""
+Test du DOCX différé - la génération ne paie plus la conversion pdf2docx.
+
+Validates:
+1. docx_mode="deferred" returns the PDF with no DOCX (docx_deferred=True)
+2. The DOCX can be built later from the result content (or its PDF bytes)
+3. docx_mode="eager" keeps building the DOCX during generation
+"""
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.docx_writer import DocxWriter
+from app.generator import CVGenerator, generate_docx_from_pdf
+
+
+BULLET = (
+    "Built a three-statement LBO model for a {n}M EUR mid-cap carve-out, "
+    "stress-testing leverage covenants and exit multiples for the investment committee"
+)
+
+# Overflowing content: adjusted by planned trimming only (no LLM call)
+SAMPLE_CONTENT = {
+    "contact_information": [{"name": "Jean DUPONT", "email": "jean@example.com"}],
+    "education": [{
+        "date": "Sep 2021 - Jun 2024",
+        "institution": "HEC Paris",
+        "location": "Paris, France",
+        "degree": "Master in Management",
+    }],
+    "work_experience": [{
+        "date": "Jan 2023 - Jun 2023",
+        "company": f"Company {i}",
+        "location": "Paris, France",
+        "position": "M&A Analyst Intern",
+        "bullets": [BULLET.format(n=10 * (i + 1) + j) for j in range(5)],
+    } for i in range(4)],
+    "language_skills": ["French (native)", "English (fluent)"],
+}
+
+
+def adjust(docx_mode):
+    generator = CVGenerator(docx_mode=docx_mode)
+    metrics = generator._measure(SAMPLE_CONTENT, trim=False)
+    return generator._adjust_language(
+        SAMPLE_CONTENT, metrics, "finance", "fr", None,
+        CVGenerator.STRUCTURED_DATA_ANALYSIS,
+    )
+
+
+def test_deferred_returns_pdf_only():
+    result = adjust("deferred")
+
+    assert result.pdf_bytes.startswith(b"%PDF")
+    assert result.docx_bytes is None
+    assert result.docx_deferred is True
+
+    # Built later, natively from the final content (or from the PDF as fallback)
+    docx_bytes = DocxWriter.generate_docx_from_data(result.content, trim=result.layout_trim)
+    assert zipfile.is_zipfile(io.BytesIO(docx_bytes))
+    assert zipfile.is_zipfile(io.BytesIO(generate_docx_from_pdf(result.pdf_bytes)))
+
+
+def test_eager_builds_docx():
+    result = adjust("eager")
+
+    assert result.docx_deferred is False
+    assert zipfile.is_zipfile(io.BytesIO(result.docx_bytes))
+
+
+def test_unknown_docx_mode_rejected():
+    try:
+        CVGenerator(docx_mode="later")
+    except ValueError:
+        return
+    raise AssertionError("Unknown docx_mode should raise ValueError")
+
+
+if __name__ == "__main__":
+    test_deferred_returns_pdf_only()
+    test_eager_builds_docx()
+    test_unknown_docx_mode_rejected()
+    print("[OK] Deferred DOCX tests passed")
@@ -0,0 +1,147 @@
+"""
+Test du DocxWriter - DOCX natif (OOXML) depuis les données normalisées.
+
+Validates:
+1. Package contains the required OOXML parts and every part is well-formed XML
+2. Structure mirrors the grid template (section titles, one row per entry, bullets)
+3. Special characters are escaped (text and hyperlink targets), N/A placeholders dropped
+4. Output is deterministic and fast (no PDF round trip)
+"""
+import io
+import sys
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from copy import deepcopy
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.docx_writer import DocxWriter
+
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+SAMPLE_CONTENT = {
+    "contact_information": [{
+        "name": "Jean DUPONT",
+        "email": "jean@example.com",
+        "phone": "+33 6 12 34 56 78",
+        "address": "Paris, France",
+    }],
+    "education": [{
+        "date": "September 2021 - June 2024",
+        "institution": "HEC Paris",
+        "location": "Jouy-en-Josas, France",
+        "degree": "Master in Management",
+        "honors": "N/A",
+        "coursework": ["Corporate Finance", "M&A"],
+    }],
+    "work_experience": [{
+        "date": "January 2023 - June 2023",
+        "company": "Rothschild & Co",
+        "location": "Paris, France",
+        "position": "M&A Analyst",
+        "duration": "6 months",
+        "bullets": [
+            "Built LBO model for a 250M EUR carve-out <IRR > 20%>",
+            "Prepared 3 pitch books for mid-cap clients",
+        ],
+    }, {
+        "date": "June 2022 - August 2022",
+        "company": "BNP Paribas",
+        "location": "London, United Kingdom",
+        "position": "Summer Analyst",
+        "bullets": ["Screened 40 targets for a consumer-goods buy-side mandate"],
+    }],
+    "language_skills": ["French (native)", "English (fluent)"],
+    "it_skills": ["Excel", "Python"],
+    "activities_interests": ["Marathon runner"],
+}
+
+
+def read_document(docx_bytes):
+    with zipfile.ZipFile(io.BytesIO(docx_bytes)) as package:
+        for name in package.namelist():
+            ET.fromstring(package.read(name))  # every part is well-formed
+        return package.namelist(), ET.fromstring(package.read("word/document.xml"))
+
+
+def paragraph_texts(element):
+    return ["".join(t.text or "" for t in p.iter(f"{W}t")) for p in element.iter(f"{W}p")]
+
+
+def test_package_parts():
+    names, _ = read_document(DocxWriter.generate_docx_from_data(SAMPLE_CONTENT))
+
+    for part in ("[Content_Types].xml", "_rels/.rels", "word/document.xml",
+                 "word/styles.xml", "word/numbering.xml", "word/_rels/document.xml.rels"):
+        assert part in names
+
+
+def test_structure_mirrors_template():
+    _, document = read_document(DocxWriter.generate_docx_from_data(SAMPLE_CONTENT))
+    texts = paragraph_texts(document)
+
+    assert texts[0] == "Jean DUPONT"
+    assert "jean@example.com" in texts[1]
+    for title in ("FORMATION", "EXPÉRIENCES PROFESSIONNELLES", "LANGUES & COMPÉTENCES"):
+        assert title in texts
+
+    tables = list(document.iter(f"{W}tbl"))
+    experience_rows = list(tables[1].iter(f"{W}tr"))
+    assert len(experience_rows) == 2
+    assert len(list(experience_rows[0].iter(f"{W}tc"))) == 3
+
+    bullets = [p for p in document.iter(f"{W}p") if p.find(f"{W}pPr/{W}numPr") is not None]
+    # 3 experience bullets + 2 skill lines + 1 interest
+    assert len(bullets) == 6
+
+
+def test_escaping_and_placeholders():
+    _, document = read_document(DocxWriter.generate_docx_from_data(SAMPLE_CONTENT))
+    texts = paragraph_texts(document)
+
+    assert "Built LBO model for a 250M EUR carve-out <IRR > 20%>" in texts
+    assert "Rothschild & Co" in texts
+    assert "N/A" not in texts
+
+
+def test_hyperlink_target_escaped():
+    content = deepcopy(SAMPLE_CONTENT)
+    content["contact_information"][0]["email"] = 'jean"dupont\'<&>@example.com'
+
+    with zipfile.ZipFile(io.BytesIO(DocxWriter.generate_docx_from_data(content))) as package:
+        relationships = ET.fromstring(package.read("word/_rels/document.xml.rels"))
+
+    targets = [rel.get("Target") for rel in relationships if rel.get("TargetMode") == "External"]
+    assert targets == ['mailto:jean"dupont\'<&>@example.com']
+
+
+def test_input_not_mutated():
+    content = {"work_experience": [dict(SAMPLE_CONTENT["work_experience"][0])]}
+
+    DocxWriter.generate_docx_from_data(content)
+
+    assert "work_experience" in content
+    assert content["work_experience"][0]["date"] == "January 2023 - June 2023"
+
+
+def test_deterministic_and_fast():
+    start = time.perf_counter()
+    first = DocxWriter.generate_docx_from_data(SAMPLE_CONTENT)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    assert first == DocxWriter.generate_docx_from_data(SAMPLE_CONTENT)
+    assert elapsed_ms < 200, f"DOCX took {elapsed_ms:.1f} ms"
+
+
+if __name__ == "__main__":
+    test_package_parts()
+    test_structure_mirrors_template()
+    test_escaping_and_placeholders()
+    test_hyperlink_target_escaped()
+    test_input_not_mutated()
+    test_deterministic_and_fast()
+    print("[OK] DocxWriter tests passed")
@@ -0,0 +1,157 @@
+"""
+Test du cache d'extraction PDF - un PDF déjà extrait ne repasse pas par l'upload ni GPT-4o.
+
+Validates:
+1. The second extraction of the same PDF skips the upload and the vision call
+2. Other PDFs and a new prompt version miss the cache
+3. The shared tier (RedisSession interface) survives a restart / serves other workers
+4. /cv/evaluate (async) then generation (sync) extract the PDF once
+5. Empty extractions are not cached
+6. Deleting an uploaded PDF drops its text from both tiers
+"""
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory (app) and repository root (apps.utils) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import app.llm_client as llm_client
+from app.cache import ExtractionCache, get_extraction_cache, set_extraction_cache
+from app.uploads import get_upload_manager, set_upload_manager
+from test_cassette import FakeOpenAI, NoNetwork, chat_response
+from test_generation_session import PDF_BYTES, RAW_TEXT
+from test_render_cache import FakeSharedStore
+
+
+def extract(openai_module, cache, pdf_bytes=PDF_BYTES, asynchronous=False, uploads=None):
+    original = (llm_client.get_client, llm_client.get_async_client, get_extraction_cache(), get_upload_manager())
+    llm_client.get_client = lambda provider="openai": openai_module
+    llm_client.get_async_client = lambda provider="openai": openai_module
+    set_extraction_cache(cache)
+    set_upload_manager(uploads)
+    try:
+        if asynchronous:
+            return asyncio.run(llm_client.aextract_text_from_pdf_bytes(pdf_bytes))
+        return llm_client.extract_text_from_pdf_bytes(pdf_bytes)
+    finally:
+        llm_client.get_client, llm_client.get_async_client = original[:2]
+        set_extraction_cache(original[2])
+        set_upload_manager(original[3])
+
+
+def test_second_extraction_skips_upload():
+    live, cache = FakeOpenAI(), ExtractionCache()
+
+    assert extract(live, cache) == RAW_TEXT
+    assert live.calls == 2  # Upload + vision call
+    assert extract(NoNetwork(), cache) == RAW_TEXT
+    assert cache.stats()["hits"] == 1
+
+
+def test_other_pdf_and_prompt_version_miss():
+    live, cache = FakeOpenAI(), ExtractionCache()
+    extract(live, cache)
+    extract(live, cache, pdf_bytes=PDF_BYTES + b"\n%%EOF")
+    assert live.calls == 4
+
+    original = llm_client._extraction_prompt_version
+    llm_client._extraction_prompt_version = lambda: "next-prompt"
+    try:
+        extract(live, cache)
+    finally:
+        llm_client._extraction_prompt_version = original
+    assert live.calls == 6
+
+
+def test_shared_tier_survives_restart():
+    store = FakeSharedStore()
+    extract(FakeOpenAI(), ExtractionCache(shared_store=store))
+
+    restarted = ExtractionCache(shared_store=store)
+    assert extract(NoNetwork(), restarted) == RAW_TEXT
+    assert restarted.stats()["shared_hits"] == 1
+    assert all(key.startswith(ExtractionCache.KEY_PREFIX) for key in store.data)
+
+
+def test_evaluate_then_generate_extracts_once():
+    class AsyncFakeOpenAI(FakeOpenAI):
+        """AsyncOpenAI stand-in: same fake, awaitable calls."""
+
+        def __init__(self):
+            super().__init__()
+            sync_create, sync_upload = self.create, self.upload
+
+            async def create(**kwargs):
+                return sync_create(**kwargs)
+
+            async def upload(**kwargs):
+                return sync_upload(**kwargs)
+
+            self.chat.completions.create = create
+            self.files.create = upload
+
+    live, cache = AsyncFakeOpenAI(), ExtractionCache()
+    assert extract(live, cache, asynchronous=True) == RAW_TEXT  # /cv/evaluate
+    assert extract(NoNetwork(), cache) == RAW_TEXT              # generation
+    assert live.calls == 2
+
+
+def test_empty_extraction_not_cached():
+    class EmptyExtraction(FakeOpenAI):
+        def create(self, **kwargs):
+            self.calls += 1
+            return chat_response(json.dumps({"raw_text": ""}))
+
+    live, cache = EmptyExtraction(), ExtractionCache()
+    extract(live, cache)
+    extract(live, cache)
+
+    assert live.calls == 4
+    assert cache.stats()["entries"] == 0
+
+
+def test_deleted_upload_forgotten():
+    # The API imports the pipeline as apps.ai.app (its own cache singleton)
+    import apps.ai.app.cache as api_cache
+    import apps.utils.file_storage as file_storage
+
+    store = FakeSharedStore()
+    cache = ExtractionCache(shared_store=store)
+    extract(FakeOpenAI(), cache)
+    extract(FakeOpenAI(), cache, pdf_bytes=PDF_BYTES + b"\n%%EOF")  # Another user's PDF
+    assert cache.stats()["entries"] == 2 and len(store.data) == 2
+
+    with tempfile.TemporaryDirectory() as folder:
+        upload = Path(folder) / "uploads" / "generated" / "user-1" / "cv.pdf"
+        upload.parent.mkdir(parents=True)
+        upload.write_bytes(PDF_BYTES)
+        (Path(folder) / "outside.pdf").write_bytes(PDF_BYTES)
+        original = (api_cache.get_extraction_cache(), file_storage.UPLOAD_BASE)
+        api_cache.set_extraction_cache(cache)
+        file_storage.UPLOAD_BASE = str(Path(folder) / "uploads")
+        try:
+            assert not file_storage.delete_uploaded_file("../outside.pdf")  # Resolved against UPLOAD_BASE only
+            assert file_storage.delete_uploaded_file("generated/user-1/cv.pdf")
+            assert not file_storage.delete_uploaded_file("generated/user-1/cv.pdf")
+        finally:
+            api_cache.set_extraction_cache(original[0])
+            file_storage.UPLOAD_BASE = original[1]
+        assert not upload.exists() and (Path(folder) / "outside.pdf").exists()
+
+    assert cache.stats()["entries"] == 1 and len(store.data) == 1
+    key = cache.make_key(PDF_BYTES, llm_client._extraction_prompt_version())
+    assert cache.get_text(key) is None
+
+
+if __name__ == "__main__":
+    test_second_extraction_skips_upload()
+    test_other_pdf_and_prompt_version_miss()
+    test_shared_tier_survives_restart()
+    test_evaluate_then_generate_extracts_once()
+    test_empty_extraction_not_cached()
+    test_deleted_upload_forgotten()
+    print("[OK] Extraction cache tests passed")
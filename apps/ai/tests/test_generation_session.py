@@ -0,0 +1,97 @@
+"""
+Test de la session de génération - la Phase 2 réutilise l'extraction de la Phase 1.
+
+Validates:
+1. Phase 1 returns a session (raw text, analysis, FR base content)
+2. Phase 2 with the session skips upload/extraction and analysis
+3. A session from a different PDF is rejected
+"""
+import sys
+from copy import deepcopy
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.generator as generator_module
+from app.generator import CVGenerator
+from test_deferred_docx import SAMPLE_CONTENT
+
+
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 2000
+RAW_TEXT = (
+    "Jean DUPONT - HEC Paris, Master in Management. M&A Analyst Intern at "
+    "Rothschild & Co: LBO models, pitch books, due diligence. " * 5
+)
+
+
+class FakeLLM:
+    """Stands in for the GPT-4o calls; counts them."""
+
+    def __init__(self):
+        self.extractions = 0
+        self.content_calls = []
+
+    def extract(self, pdf_bytes, filename="resume.pdf"):
+        self.extractions += 1
+        return RAW_TEXT
+
+    def generate(self, input_data, domain, language, **kwargs):
+        self.content_calls.append((language, input_data["raw_text"]))
+        return deepcopy(SAMPLE_CONTENT)
+
+
+def run_phases(fake):
+    original = (generator_module.extract_text_from_pdf_bytes, generator_module.generate_cv_content)
+    generator_module.extract_text_from_pdf_bytes = fake.extract
+    generator_module.generate_cv_content = fake.generate
+    try:
+        generator = CVGenerator(docx_mode="deferred")
+        phase1 = generator.generate_from_pdf(PDF_BYTES, languages=["fr"])
+        session = phase1["fr"].session
+        phase2 = generator.generate_from_pdf(PDF_BYTES, languages=["en"], session=session)
+        return phase1, phase2
+    finally:
+        generator_module.extract_text_from_pdf_bytes, generator_module.generate_cv_content = original
+
+
+def test_phase1_returns_session():
+    phase1, _ = run_phases(FakeLLM())
+    session = phase1["fr"].session
+
+    assert session.raw_text == RAW_TEXT
+    assert session.analysis["strategy"]
+    assert "fr" in session.base_content
+    assert len(session.pdf_sha256) == 64
+
+
+def test_phase2_reuses_extraction():
+    fake = FakeLLM()
+    phase1, phase2 = run_phases(fake)
+
+    # One upload + extraction for both phases, one content call per language
+    assert fake.extractions == 1
+    assert [lang for lang, _ in fake.content_calls] == ["fr", "en"]
+    assert all(raw_text == RAW_TEXT for _, raw_text in fake.content_calls)
+
+    assert phase2["en"].page_count == 1
+    assert phase2["en"].session.base_content.keys() == {"fr", "en"}
+    assert phase2["en"].trace["attributes"]["session_reused"] is True
+    assert phase1["fr"].trace["attributes"]["session_reused"] is False
+
+
+def test_session_from_other_pdf_rejected():
+    phase1, _ = run_phases(FakeLLM())
+    other_pdf = b"%PDF-1.4\n" + b"1" * 2000
+    try:
+        CVGenerator().generate_from_pdf(other_pdf, languages=["en"], session=phase1["fr"].session)
+    except ValueError:
+        return
+    raise AssertionError("Session of another PDF should raise ValueError")
+
+
+if __name__ == "__main__":
+    test_phase1_returns_session()
+    test_phase2_reuses_extraction()
+    test_session_from_other_pdf_rejected()
+    print("[OK] Generation session tests passed")
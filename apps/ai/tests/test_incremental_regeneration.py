@@ -0,0 +1,147 @@
+"""
+Test de la régénération incrémentale - seule la partie modifiée du formulaire est régénérée.
+
+Validates:
+1. Contact / skills edits plan a re-render only (no LLM call)
+2. An edited experience rewrites only its bullets (one small LLM call)
+3. Structural edits (experience added, education changed) plan a full generation
+4. Regenerated content keeps every untouched section of the last generation
+"""
+import json
+import sys
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.generator as generator_module
+import app.llm_client as llm_client
+from app.generator import CVGenerator
+from app.incremental import plan_regeneration
+from app.models import CVContent
+from test_deferred_docx import BULLET, SAMPLE_CONTENT
+
+
+def form_input():
+    """Structured input of the last generation (short form bullets)."""
+    content = CVContent(**deepcopy(SAMPLE_CONTENT))
+    content.contact_information[0].phone = "+33 6 00 00 00 00"
+    content.it_skills = ["Excel (advanced)"]
+    for i, exp in enumerate(content.work_experience):
+        exp.bullets = [f"LBO model {i}", f"Pitch book {i}"]
+    content.experience = content.work_experience
+    return content
+
+
+class FakeLLM:
+    """Counts content generations and experience rewrites."""
+
+    def __init__(self):
+        self.generated = 0
+        self.rewrites = []
+
+    def generate(self, input_data, domain, language, **kwargs):
+        self.generated += 1
+        return deepcopy(SAMPLE_CONTENT)
+
+    def chat(self, **kwargs):
+        payload = json.loads(kwargs["messages"][-1]["content"])
+        self.rewrites.append(payload["experience"]["company"])
+        bullets = [BULLET.format(n=90 + i) for i in range(len(payload["previous_bullets"]))]
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps({"bullets": bullets})))],
+            usage=None,
+        )
+
+
+def is_original(experience, index):
+    """Experience still holds the last generation's bullets (possibly trimmed by the adjustment)."""
+    original = SAMPLE_CONTENT["work_experience"][index]
+    return (
+        experience["company"] == original["company"]
+        and experience["bullets"][0][:60] == original["bullets"][0][:60]
+    )
+
+
+def regenerate(fake, new_input):
+    original = (generator_module.generate_cv_content, llm_client.chat_completion)
+    generator_module.generate_cv_content = fake.generate
+    llm_client.chat_completion = fake.chat
+    try:
+        generator = CVGenerator(docx_mode="deferred")
+        return generator.regenerate_from_data(
+            new_input, form_input().dict(), deepcopy(SAMPLE_CONTENT), "fr"
+        )["fr"]
+    finally:
+        generator_module.generate_cv_content, llm_client.chat_completion = original
+
+
+def test_plan_render_only():
+    new = form_input()
+    new.contact_information[0].phone = "+33 7 11 11 11 11"
+    new.it_skills = ["Excel (advanced)", "Python (intermediate)"]
+    plan = plan_regeneration(form_input().dict(), new.dict(), SAMPLE_CONTENT)
+
+    assert plan.mode == "render"
+    assert plan.render_fields == ["contact_information", "it_skills"]
+    assert plan.experiences == []
+
+
+def test_plan_structural_changes():
+    added = form_input()
+    added.work_experience = added.work_experience + [deepcopy(added.work_experience[0])]
+    education = form_input()
+    education.education[0].degree = "MSc Finance"
+
+    assert plan_regeneration(form_input().dict(), added.dict(), SAMPLE_CONTENT).mode == "full"
+    assert plan_regeneration(form_input().dict(), education.dict(), SAMPLE_CONTENT).mode == "full"
+    assert plan_regeneration(form_input().dict(), form_input().dict(), None).mode == "full"
+
+
+def test_render_only_edit_has_no_llm_call():
+    fake = FakeLLM()
+    new = form_input()
+    new.contact_information[0].phone = "+33 7 11 11 11 11"
+    result = regenerate(fake, new)
+
+    assert fake.generated == 0 and fake.rewrites == []
+    assert result.content["contact_information"][0]["phone"] == "+33 7 11 11 11 11"
+    assert all(is_original(exp, i) for i, exp in enumerate(result.content["work_experience"]))
+    assert result.warnings[0].startswith("Incremental regeneration")
+    assert result.trace["attributes"]["mode"] == "render"
+
+
+def test_edited_experience_rewrites_only_its_bullets():
+    fake = FakeLLM()
+    new = form_input()
+    new.work_experience[2].bullets = ["LBO model 2", "Pitch book 2", "Due diligence on a EUR 200m deal"]
+    new.work_experience[2].date = "Feb 2023 - Jul 2023"
+    result = regenerate(fake, new)
+
+    experiences = result.content["work_experience"]
+    assert fake.generated == 0
+    assert fake.rewrites == ["Company 2"]
+    assert experiences[2]["date"].startswith("Feb 2023")
+    assert experiences[2]["bullets"][0][:60] == BULLET.format(n=90)[:60]
+    assert all(is_original(experiences[i], i) for i in (0, 1, 3))
+
+
+def test_structural_edit_generates_fully():
+    fake = FakeLLM()
+    new = form_input()
+    new.education[0].degree = "MSc Finance"
+    result = regenerate(fake, new)
+
+    assert fake.generated == 1
+    assert not result.warnings or not result.warnings[0].startswith("Incremental")
+
+
+if __name__ == "__main__":
+    test_plan_render_only()
+    test_plan_structural_changes()
+    test_render_only_edit_has_no_llm_call()
+    test_edited_experience_rewrites_only_its_bullets()
+    test_structural_edit_generates_fully()
+    print("[OK] Incremental regeneration tests passed")
@@ -0,0 +1,171 @@
+"""
+Test de la file de jobs - /cv/generate exécuté par des workers.
+
+Validates:
+1. Jobs go queued -> running -> done (FIFO), results readable by id
+2. Handler errors fail the job without retry
+3. Expired leases (crashed worker) are requeued, then failed after max_attempts;
+   a job popped but not leased yet is not requeued under a live worker
+4. A worker never runs more jobs at once than its concurrency
+5. Form data maps to CVContent (moved out of the router)
+
+Runs against the in-process InMemoryRedis stand-in (same commands as Redis).
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add repository root to path (apps.jobs)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from apps.jobs import InMemoryRedis, JobQueue, JobWorker
+
+
+def make_queue(**kwargs):
+    return JobQueue(InMemoryRedis(), **kwargs)
+
+
+def test_job_lifecycle():
+    queue = make_queue()
+    first = queue.enqueue("echo", {"n": 1})
+    second = queue.enqueue("echo", {"n": 2})
+    assert queue.get(first.id).status == "queued"
+    assert queue.pending_count() == 2
+
+    worker = JobWorker(queue, {"echo": lambda payload: {"n": payload["n"] * 10}})
+    done = worker.run_once()
+
+    assert done.id == first.id  # FIFO
+    assert done.status == "done" and done.result == {"n": 10}
+    assert queue.get(first.id).attempts == 1
+    assert worker.run_once().id == second.id
+    assert worker.run_once() is None
+
+
+def test_handler_error_fails_job():
+    queue = make_queue()
+    job = queue.enqueue("generate", {})
+
+    def failing(payload):
+        raise ValueError("GENERATION BLOCKED: PFR 52%")
+
+    failed = JobWorker(queue, {"generate": failing}).run_once()
+
+    assert failed.status == "failed"
+    assert "GENERATION BLOCKED" in failed.error
+    assert queue.pending_count() == 0
+    assert JobWorker(queue, {}).run_once() is None
+    assert queue.get(job.id).status == "failed"
+
+
+def test_expired_lease_requeued_then_failed():
+    queue = make_queue(visibility_timeout=0, max_attempts=2)
+    job = queue.enqueue("generate", {})
+
+    # Worker "crashes": reserves and never completes
+    assert queue.reserve("crashed-worker").id == job.id
+    time.sleep(0.01)
+    assert queue.requeue_expired() == 1
+    assert queue.get(job.id).status == "queued"
+
+    assert queue.reserve("crashed-again").attempts == 2
+    time.sleep(0.01)
+    queue.requeue_expired()
+
+    final = queue.get(job.id)
+    assert final.status == "failed"
+    assert "Visibility timeout" in final.error
+    assert queue.pending_count() == 0
+
+
+def test_finished_job_not_run_twice():
+    queue = make_queue(visibility_timeout=0)
+    job = queue.enqueue("echo", {})
+    slow = queue.reserve("slow-worker")
+    time.sleep(0.01)
+    queue.requeue_expired()  # lease expired while the job was still running
+
+    queue.complete(slow, {"ok": True})  # slow worker finishes after all
+
+    assert queue.reserve("other-worker") is None
+    assert queue.get(job.id).result == {"ok": True}
+
+
+def test_reserved_job_not_requeued_before_lease():
+    queue = make_queue(visibility_timeout=0.2)
+    job = queue.enqueue("generate", {})
+    stale = queue.get(job.id)
+    stale.updated_at = time.time() - 3600  # Sat in a long backlog
+    queue.client.set(queue._job_key(job.id), stale.model_dump_json())
+
+    # Worker A popped the job and has not leased it yet (RPOPLPUSH, then ZADD)
+    assert queue.client.rpoplpush(queue.queue_key, queue.processing_key) == job.id
+    assert queue.requeue_expired() == 0
+    assert queue.pending_count() == 0
+
+    # Worker A died there: requeued once unleased for a full visibility timeout
+    time.sleep(0.25)
+    assert queue.requeue_expired() == 1
+    assert queue.reserve("worker-b").id == job.id
+    assert queue.client.zscore(queue.unleased_key, job.id) is None
+
+
+def test_bounded_concurrency():
+    queue = make_queue(visibility_timeout=5)
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow(payload):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return {}
+
+    jobs = [queue.enqueue("slow", {}) for _ in range(6)]
+    worker = JobWorker(queue, {"slow": slow}, concurrency=2, poll_interval=0.01)
+    worker.start()
+    deadline = time.time() + 5
+    while time.time() < deadline and not all(queue.get(j.id).status == "done" for j in jobs):
+        time.sleep(0.02)
+    worker.stop()
+
+    assert all(queue.get(j.id).status == "done" for j in jobs)
+    assert peak[0] == 2
+
+
+def test_form_mapping():
+    from apps.utils.cv_mapping import form_to_cv_content, resolve_language
+
+    form = {
+        "personal_details": {"full_name": "Jean DUPONT", "email": "jean@example.com", "language": "FR"},
+        "education": [{"institution": "HEC Paris", "degree": "MiM", "city": "Paris",
+                       "start_year": "2021", "end_year": "2024"}],
+        "employment": [{"company": "Rothschild & Co", "position": "Analyst", "location": "Paris",
+                        "start_date": "Jan 2023", "bullets": ["Built LBO models"]}],
+        "languages": [{"language": "English", "proficiency": "fluent"}],
+        "skills": [{"skill": "Excel", "level": "advanced"}],
+        "activities": [{"activity": "Marathon"}],
+    }
+    content = form_to_cv_content(form)
+
+    assert resolve_language(form["personal_details"]) == "fr"
+    assert resolve_language({"language": "de"}) == "en"
+    assert content.education[0].date == "2021 - 2024"
+    assert content.work_experience[0].date == "Jan 2023 - Present"
+    assert content.language_skills == ["English (fluent)"]
+    assert content.activities_interests == ["Marathon"]
+
+
+if __name__ == "__main__":
+    test_job_lifecycle()
+    test_handler_error_fails_job()
+    test_expired_lease_requeued_then_failed()
+    test_finished_job_not_run_twice()
+    test_reserved_job_not_requeued_before_lease()
+    test_bounded_concurrency()
+    test_form_mapping()
+    print("[OK] Job queue tests passed")
@@ -0,0 +1,98 @@
+"""
+Test de la génération concurrente par langue - pool de threads FR / EN.
+
+Validates:
+1. Both languages are produced, concurrently, in the requested order
+2. A failure in one language is raised to the caller (and recorded on its span)
+   even when the other language succeeds
+3. Worker threads see the caller's trace and deadline: language spans attach
+   to the caller's span, degradations land on the caller's deadline
+4. max_workers=1 runs the languages inline, one after the other
+"""
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.deadline import current_deadline, degrade, use_deadline
+from app.generator import CVGenerator
+from app.tracing import current_span, start_trace
+
+LANGUAGES = ["fr", "en"]
+
+
+def test_both_languages_produced_concurrently():
+    both_running = threading.Barrier(len(LANGUAGES), timeout=5)  # Breaks if run one at a time
+    threads = {}
+
+    def task(lang):
+        threads[lang] = threading.current_thread().name
+        both_running.wait()
+        return f"content-{lang}"
+
+    results = CVGenerator(max_workers=2)._run_per_language(LANGUAGES, task)
+
+    assert list(results) == LANGUAGES
+    assert results == {"fr": "content-fr", "en": "content-en"}
+    assert all(name.startswith("cvgen") for name in threads.values())
+    assert threads["fr"] != threads["en"]
+
+
+def test_failure_in_one_language_reported():
+    def task(lang):
+        if lang == "en":
+            raise ValueError("PFR below threshold for en")
+        return f"content-{lang}"
+
+    with start_trace("cv_generation") as root:
+        try:
+            CVGenerator(max_workers=2)._run_per_language(LANGUAGES, task, stage="adjust")
+            raise AssertionError("The en failure must reach the caller")
+        except ValueError as e:
+            assert "en" in str(e)
+
+    spans = {child.attributes["language"]: child for child in root.children}
+    assert "error" not in spans["fr"].attributes
+    assert spans["en"].attributes["error"] == "ValueError"
+
+
+def test_context_reaches_worker_threads():
+    seen = {}
+
+    def task(lang):
+        seen[lang] = (current_span(), current_deadline())
+        degrade(f"skip_enrichment_{lang}", "test")
+        return lang
+
+    with use_deadline(60) as deadline, start_trace("cv_generation") as root:
+        CVGenerator(max_workers=2)._run_per_language(LANGUAGES, task, stage="base")
+
+    assert [child.name for child in root.children] == ["base", "base"]
+    for child in root.children:
+        worker_span, worker_deadline = seen[child.attributes["language"]]
+        assert worker_span is child  # Language span, child of the caller's trace
+        assert worker_deadline is deadline
+    assert sorted(deadline.degradations) == ["skip_enrichment_en", "skip_enrichment_fr"]
+    assert current_deadline() is None  # Nothing leaks out of the block
+
+
+def test_single_worker_runs_inline():
+    threads = []
+
+    def task(lang):
+        threads.append(threading.current_thread())
+        return lang
+
+    results = CVGenerator(max_workers=1)._run_per_language(LANGUAGES, task)
+    assert results == {"fr": "fr", "en": "en"}
+    assert threads == [threading.current_thread()] * 2
+
+
+if __name__ == "__main__":
+    test_both_languages_produced_concurrently()
+    test_failure_in_one_language_reported()
+    test_context_reaches_worker_threads()
+    test_single_worker_runs_inline()
+    print("[OK] Language concurrency tests passed")
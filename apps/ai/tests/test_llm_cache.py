@@ -0,0 +1,132 @@
+"""
+Test du cache des réponses LLM - generate_cv_content servi sans nouvel appel GPT-4o.
+
+Validates:
+1. An identical request is answered from the cache (one LLM call, fresh dict per hit)
+2. Language, enrichment instructions and input are part of the key
+3. use_cache=False always calls the LLM
+4. The shared tier (RedisSession interface) serves other workers
+5. Content still missing its work experience is not cached
+"""
+import asyncio
+import json
+import sys
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.llm_client as llm_client
+from app.cache import LLMResponseCache, get_llm_cache, set_llm_cache
+from test_deferred_docx import SAMPLE_CONTENT
+from test_render_cache import FakeSharedStore
+
+INPUT = {"raw_text": "M&A Analyst Intern at Company 0, Paris, Jan 2023 - Jun 2023"}
+
+
+class FakeLLM:
+    """Counts content calls (sync and async)."""
+
+    def __init__(self, content=None):
+        self.content = SAMPLE_CONTENT if content is None else content
+        self.calls = 0
+
+    def response(self):
+        self.calls += 1
+        message = SimpleNamespace(content=json.dumps(self.content))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    def chat(self, **kwargs):
+        return self.response()
+
+    async def achat(self, **kwargs):
+        return self.response()
+
+
+def run(fake, cache, calls):
+    """Run calls (kwargs for generate_cv_content) with fake LLM and cache."""
+    original = (llm_client.chat_completion, llm_client.achat_completion, get_llm_cache())
+    llm_client.chat_completion, llm_client.achat_completion = fake.chat, fake.achat
+    set_llm_cache(cache)
+    try:
+        return [llm_client.generate_cv_content(**kwargs) for kwargs in calls]
+    finally:
+        llm_client.chat_completion, llm_client.achat_completion = original[:2]
+        set_llm_cache(original[2])
+
+
+def test_identical_request_served_from_cache():
+    fake, cache = FakeLLM(), LLMResponseCache()
+    first, second = run(fake, cache, [dict(input_data=INPUT, language="fr")] * 2)
+
+    assert fake.calls == 1
+    assert first == second and first is not second
+    second["work_experience"].clear()  # Callers own the returned dict
+    assert run(fake, cache, [dict(input_data=INPUT, language="fr")])[0] == first
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_key_covers_language_instructions_and_input():
+    fake, cache = FakeLLM(), LLMResponseCache()
+    run(fake, cache, [
+        dict(input_data=INPUT, language="fr"),
+        dict(input_data=INPUT, language="en"),
+        dict(input_data=INPUT, language="fr", enrichment_instructions="Add quantified outcomes."),
+        dict(input_data={"raw_text": INPUT["raw_text"] + " (2)"}, language="fr"),
+        dict(input_data=dict(reversed(list(INPUT.items()))), language="fr"),  # Same input
+    ])
+
+    assert fake.calls == 4
+
+
+def test_opt_out_and_async_path():
+    fake, cache = FakeLLM(), LLMResponseCache()
+    run(fake, cache, [dict(input_data=INPUT, language="fr")])
+    run(fake, cache, [dict(input_data=INPUT, language="fr", use_cache=False)])
+    assert fake.calls == 2
+
+    original = (llm_client.achat_completion, get_llm_cache())
+    llm_client.achat_completion = fake.achat
+    set_llm_cache(cache)
+    try:
+        content = asyncio.run(llm_client.agenerate_cv_content(input_data=INPUT, language="fr"))
+    finally:
+        llm_client.achat_completion = original[0]
+        set_llm_cache(original[1])
+    assert fake.calls == 2
+    assert content == SAMPLE_CONTENT
+
+
+def test_shared_tier_serves_other_workers():
+    store = FakeSharedStore()
+    fake = FakeLLM()
+    run(fake, LLMResponseCache(shared_store=store), [dict(input_data=INPUT, language="fr")])
+
+    other_worker = LLMResponseCache(shared_store=store)
+    content = run(fake, other_worker, [dict(input_data=INPUT, language="fr")])[0]
+
+    assert fake.calls == 1
+    assert content == SAMPLE_CONTENT
+    assert other_worker.stats()["shared_hits"] == 1 and other_worker.stats()["misses"] == 0
+
+
+def test_missing_experience_not_cached():
+    empty = deepcopy(SAMPLE_CONTENT)
+    empty["work_experience"] = []
+    fake, cache = FakeLLM(empty), LLMResponseCache()
+    run(fake, cache, [dict(input_data=INPUT, language="fr")] * 2)
+
+    # Two content calls + two fallback extractions, nothing stored
+    assert fake.calls == 4
+    assert cache.stats()["entries"] == 0
+
+
+if __name__ == "__main__":
+    test_identical_request_served_from_cache()
+    test_key_covers_language_instructions_and_input()
+    test_opt_out_and_async_path()
+    test_shared_tier_serves_other_workers()
+    test_missing_experience_not_cached()
+    print("[OK] LLM response cache tests passed")
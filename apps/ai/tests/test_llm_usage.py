@@ -0,0 +1,98 @@
+"""
+Test de la comptabilité LLM - tokens, reprises et coût par génération.
+
+Validates:
+1. Each chat completion records model, call type, tokens and retries on its span
+2. usage_from_trace() sums calls per call type and per model, with costs
+3. Cached prompt tokens are billed at the cached price; unknown models cost 0
+4. A full generation attaches the same usage to every language result
+"""
+import sys
+from pathlib import Path
+
+import httpx
+import openai
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.llm_client as llm_client
+import app.openai_client as openai_client
+from app.tracing import span, start_trace
+from app.usage import call_cost, model_prices, usage_from_trace
+from test_cassette import FakeOpenAI, run_generation
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def test_call_cost():
+    assert model_prices("gpt-4o-2024-08-06") == model_prices("gpt-4o")
+    assert model_prices("gpt-4o-mini") != model_prices("gpt-4o")
+    assert model_prices("llama-3") is None and call_cost("llama-3", 1000, 0, 1000) == 0.0
+
+    full = call_cost("gpt-4o", 1_000_000, 0, 0)
+    cached = call_cost("gpt-4o", 1_000_000, 1_000_000, 0)
+    assert full == 2.50 and cached == 1.25
+    assert call_cost("gpt-4o", 0, 0, 1_000_000) == 10.00
+
+
+def test_usage_from_trace():
+    with start_trace("cv_generation") as root:
+        with span("llm.chat", model="gpt-4o", call_type="content") as call:
+            call.set(prompt_tokens=7000, cached_tokens=6000, completion_tokens=900, retries=1)
+        for _ in range(3):
+            with span("llm.chat", model="gpt-4-turbo-preview", call_type="enrichment") as call:
+                call.set(prompt_tokens=300, completion_tokens=40)
+        with span("render"):
+            pass
+
+    usage = usage_from_trace(root)
+    assert usage.calls == 4 and usage.retries == 1
+    assert usage.prompt_tokens == 7900 and usage.cached_tokens == 6000 and usage.completion_tokens == 1020
+    assert usage.by_call_type["enrichment"].calls == 3
+    assert usage.by_model["gpt-4o"].cost_usd == round(call_cost("gpt-4o", 7000, 6000, 900), 6)
+    assert usage.cost_usd == round(
+        usage.by_call_type["content"].cost_usd + usage.by_call_type["enrichment"].cost_usd, 6
+    )
+    assert usage.latency_ms >= 0
+
+
+def test_chat_completion_records_call():
+    class FlakyOpenAI(FakeOpenAI):
+        def create(self, **kwargs):
+            if not self.calls:
+                self.calls += 1
+                response = httpx.Response(429, request=httpx.Request("POST", "https://api.openai.com"))
+                raise openai.RateLimitError("rate limited", response=response, body=None)
+            return super().create(**kwargs)
+
+    original = (llm_client.get_client, openai_client._sleep)
+    fake = FlakyOpenAI()
+    llm_client.get_client, openai_client._sleep = (lambda provider="openai": fake), (lambda delay: None)
+    try:
+        with start_trace("cv_generation") as root:
+            llm_client.chat_completion(call_type="rewrite", model="gpt-4o", messages=MESSAGES)
+    finally:
+        llm_client.get_client, openai_client._sleep = original
+
+    call = root.children[0]
+    assert call.attributes["call_type"] == "rewrite" and call.attributes["retries"] == 1
+    usage = usage_from_trace(root)
+    assert usage.by_call_type["rewrite"].prompt_tokens == 100 and usage.retries == 1
+
+
+def test_generation_usage_on_results():
+    results = run_generation(FakeOpenAI())
+    usage = results["fr"].usage
+    assert usage is results["en"].usage  # One generation, recorded once
+    assert usage.calls >= 2 and usage.cost_usd > 0
+    assert "content" in usage.by_call_type
+    assert usage.calls == sum(totals.calls for totals in usage.by_call_type.values())
+
+
+if __name__ == "__main__":
+    test_call_cost()
+    test_usage_from_trace()
+    test_chat_completion_records_call()
+    test_generation_usage_on_results()
+    print("[OK] LLM usage tests passed")
@@ -0,0 +1,116 @@
+"""
+Test de l'extraction locale - couche texte pdfplumber avant GPT-4o.
+
+Validates:
+1. Born-digital CVs are read locally with full confidence
+2. Reading order: sidebar column before main column, letter-spaced names,
+   LaTeX accents, bullets and tables
+3. Scanned or low-confidence PDFs fall back to the GPT-4o vision extraction
+4. A locally read PDF makes no OpenAI call (sync and async) and is cached
+5. LOCAL_EXTRACTION_ENABLED=False always uses GPT-4o
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.llm_client as llm_client
+from app.cache import ExtractionCache
+from app.pdf_text import _score, extract_text_layer
+from app.tracing import start_trace
+from test_cassette import FakeOpenAI, NoNetwork
+from test_extraction_cache import extract
+from test_generation_session import RAW_TEXT
+
+INPUT_DIR = Path(__file__).parent.parent / "input"
+BORN_DIGITAL = [
+    "CV_Fayed_HANAFI_en_PDF.pdf",
+    "CV_Fayed_HANAFI_fr_PDF.pdf",
+    "Guorong ZHAO - Community Manager Chine 103356475.pdf",
+    "JINFENG HU - Community Manager Chine 103474313.pdf",
+    "Leonie BOITTIN - Community Manager Chine 103121803.pdf",
+]
+SCANNED = "BAD_CV_converted.pdf"
+
+
+def read(name):
+    return (INPUT_DIR / name).read_bytes()
+
+
+def test_born_digital_cvs_read_locally():
+    for name in BORN_DIGITAL:
+        layer = extract_text_layer(read(name))
+        assert layer.confidence >= llm_client.LOCAL_EXTRACTION_MIN_CONFIDENCE, (name, layer.reasons)
+        assert len(layer.text) > 2000
+        assert "(cid:" not in layer.text
+
+
+def test_reading_order():
+    sidebar = extract_text_layer(read(BORN_DIGITAL[4])).text
+    assert sidebar.startswith("Léonie BOITTIN")  # Letter-spaced title re-joined
+    assert "Spécialiste du marketing et de la\ncommunication dans le secteur du luxe" in sidebar
+    assert sidebar.index("Google Ads") < sidebar.index("Expériences Professionnelles")
+    assert "Chef de Projet Coordination Social Media Mar - Oct 2025\nVan Cleef & Arpels" in sidebar
+
+    latex = extract_text_layer(read(BORN_DIGITAL[3])).text
+    assert "Français" in latex and "Étrangères" in latex and "´" not in latex
+    assert "\n- Collecte, nettoyage et structuration des données clients" in latex
+
+    table = extract_text_layer(read(BORN_DIGITAL[0])).text
+    assert "EDUCATION\n2019-2023 HEC Paris" in table  # Drop caps joined
+    assert "\nLanguages French (native), English (fluent, C1)" in table
+    assert table.index("PROFESSIONAL EXPERIENCE") < table.index("Languages French")
+
+
+def test_low_confidence_scores():
+    layer = extract_text_layer(read(SCANNED))
+    assert layer.confidence == 0.0 and layer.reasons
+
+    page = {"chars": 900, "cid_glyphs": 0, "image_coverage": 0.0}
+    garbled, reasons = _score("\ue001\ue002 " * 40 + RAW_TEXT, [page])
+    assert garbled < 0.5 and "unreadable glyphs" in reasons[0]
+
+    glued, reasons = _score("Capabledegérereranimerdescommunautés " * 20 + RAW_TEXT, [page])
+    assert glued < 0.5 and "glued" in reasons[0]
+
+    scan = {"chars": 20, "cid_glyphs": 0, "image_coverage": 0.9}
+    assert _score(RAW_TEXT, [page, scan])[0] <= 0.5  # One page of two is an image
+
+
+def test_local_extraction_makes_no_openai_call():
+    cache = ExtractionCache()
+    with start_trace("extract") as root:
+        text = extract(NoNetwork(), cache, pdf_bytes=read(BORN_DIGITAL[0]))
+    assert text.startswith("Fayed HANAFI")
+    assert root.attributes["extractor"] == "local"
+    assert root.children[0].attributes["confidence"] == 1.0
+
+    assert extract(NoNetwork(), ExtractionCache(), pdf_bytes=read(BORN_DIGITAL[1]), asynchronous=True)
+    assert extract(NoNetwork(), cache, pdf_bytes=read(BORN_DIGITAL[0])) == text
+    assert cache.stats()["hits"] == 1
+
+
+def test_scanned_and_disabled_fall_back_to_gpt4o():
+    live = FakeOpenAI()
+    with start_trace("extract") as root:
+        assert extract(live, ExtractionCache(), pdf_bytes=read(SCANNED)) == RAW_TEXT
+    assert live.calls == 2  # Upload + vision call
+    assert root.attributes["extractor"] == "gpt-4o"
+
+    original = llm_client.LOCAL_EXTRACTION_ENABLED
+    llm_client.LOCAL_EXTRACTION_ENABLED = False
+    try:
+        extract(live, ExtractionCache(), pdf_bytes=read(BORN_DIGITAL[0]))
+    finally:
+        llm_client.LOCAL_EXTRACTION_ENABLED = original
+    assert live.calls == 4
+
+
+if __name__ == "__main__":
+    test_born_digital_cvs_read_locally()
+    test_reading_order()
+    test_low_confidence_scores()
+    test_local_extraction_makes_no_openai_call()
+    test_scanned_and_disabled_fall_back_to_gpt4o()
+    print("[OK] Local extraction tests passed")
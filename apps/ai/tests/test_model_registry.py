@@ -0,0 +1,120 @@
+"""
+Test du registre de modèles - fournisseur et modèle par type d'appel.
+
+Validates:
+1. Defaults reproduce the models and parameters the pipeline always used
+2. LLM_MODEL_PROFILES overrides are merged field by field
+3. Invalid overrides (call type, field, provider, JSON) are rejected;
+   the PDF extraction stays on OpenAI (file upload)
+4. Calls are routed to the client of their profile's provider
+5. Enrichment bullets (single and batched) use the enrichment profile
+"""
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.enrichment as enrichment_module
+import app.llm_client as llm_client
+from app.model_registry import (
+    DEFAULT_PROFILES, ModelProfile, load_profiles, request_options, set_profiles,
+)
+from app.tracing import start_trace
+from test_cassette import FakeOpenAI
+
+
+def test_default_profiles():
+    assert request_options("content") == {"model": "gpt-4o", "temperature": 0.3}
+    assert request_options("fallback") == {"model": "gpt-4o", "temperature": 0.1}
+    assert request_options("enrichment") == {"model": "gpt-4-turbo-preview", "temperature": 0.7, "max_tokens": 100}
+    assert llm_client._json_request("extraction") == {
+        "model": "gpt-4o", "temperature": 0.2, "response_format": {"type": "json_object"},
+    }
+
+
+def test_overrides_merged():
+    profiles = load_profiles(json.dumps({
+        "enrichment": {"provider": "groq", "model": "llama-3.1-8b-instant"},
+        "translation": {"model": "gpt-4o-mini", "max_tokens": 4000},
+    }))
+    assert profiles["enrichment"] == ModelProfile("groq", "llama-3.1-8b-instant", temperature=0.7, max_tokens=100)
+    assert profiles["translation"] == ModelProfile("openai", "gpt-4o-mini", temperature=0.2, max_tokens=4000)
+    assert profiles["content"] == DEFAULT_PROFILES["content"]
+    assert load_profiles("") == DEFAULT_PROFILES
+
+
+def test_invalid_overrides_rejected():
+    for overrides in (
+        "{not json",
+        {"summarize": {"model": "gpt-4o"}},
+        {"content": {"modle": "gpt-4o"}},
+        {"content": {"provider": "mistral"}},
+        {"extraction": {"provider": "groq", "model": "llama-3.3-70b-versatile"}},
+    ):
+        try:
+            load_profiles(overrides)
+            raise AssertionError(f"Accepted invalid profiles: {overrides}")
+        except ValueError:
+            pass
+
+
+def test_calls_routed_to_profile_provider():
+    providers = []
+    fake = FakeOpenAI()
+
+    def get_client(provider="openai"):
+        providers.append(provider)
+        return fake
+
+    original = llm_client.get_client
+    llm_client.get_client = get_client
+    set_profiles(load_profiles({"rewrite": {"provider": "groq", "model": "llama-3.3-70b-versatile"}}))
+    try:
+        with start_trace("cv_generation") as root:
+            llm_client.chat_completion(call_type="rewrite", messages=[{"role": "user", "content": "a"}],
+                                       **llm_client._json_request("rewrite"))
+            llm_client.chat_completion(call_type="content", messages=[{"role": "user", "content": "b"}],
+                                       **llm_client._json_request("content"))
+    finally:
+        llm_client.get_client = original
+        set_profiles(None)
+
+    assert providers == ["groq", "openai"]
+    assert [child.attributes["provider"] for child in root.children] == ["groq", "openai"]
+    assert root.children[0].attributes["model"] == "llama-3.3-70b-versatile"
+
+
+def test_enrichment_uses_profile():
+    requests = []
+
+    def fake_chat(**kwargs):
+        requests.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))])
+
+    experiences = [{"title": "Analyst", "company": "Company", "bullets": ["Built models"]}] * 3
+    original = enrichment_module.chat_completion
+    enrichment_module.chat_completion = fake_chat
+    set_profiles(load_profiles({"enrichment": {"provider": "groq", "model": "llama-3.1-8b-instant"}}))
+    try:
+        ContentEnricher = enrichment_module.ContentEnricher
+        ContentEnricher._generate_single_bullet(experiences[0], "finance", "en")
+        ContentEnricher._generate_batch_bullets(experiences, "finance", "en")
+    finally:
+        enrichment_module.chat_completion = original
+        set_profiles(None)
+
+    assert [request["model"] for request in requests] == ["llama-3.1-8b-instant"] * 2
+    assert requests[0]["max_tokens"] == 100 and requests[1]["max_tokens"] == 240  # Batch: per item
+    assert all(request["call_type"] == "enrichment" for request in requests)
+
+
+if __name__ == "__main__":
+    test_default_profiles()
+    test_overrides_merged()
+    test_invalid_overrides_rejected()
+    test_calls_routed_to_profile_provider()
+    test_enrichment_uses_profile()
+    print("[OK] Model registry tests passed")
@@ -0,0 +1,172 @@
+"""
+Test du client OpenAI partagé - pool de connexions, timeouts et reprises.
+
+Validates:
+1. One pooled client per provider and process (sync and async), SDK retries disabled
+2. Timeouts depend on the call type
+3. 429 / 5xx / timeouts are retried with jittered backoff, 4xx are not
+4. Retry-After is honoured, retries stop when the deadline is too short
+5. Chat completions pass their call type timeout to the client
+6. close_clients() releases the pool
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import openai
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.llm_client as llm_client
+import app.openai_client as openai_client
+from app.deadline import use_deadline
+from app.tracing import start_trace
+from test_cassette import FakeOpenAI
+
+REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def status_error(status, headers=None):
+    response = httpx.Response(status, headers=headers or {}, request=REQUEST)
+    error_class = {429: openai.RateLimitError, 400: openai.BadRequestError}.get(status, openai.InternalServerError)
+    return error_class(f"HTTP {status}", response=response, body=None)
+
+
+def failing(*errors, result="ok"):
+    """send() raising errors in order, then returning result."""
+    remaining = list(errors)
+    attempts = []
+
+    def send():
+        attempts.append(len(attempts))
+        if remaining:
+            raise remaining.pop(0)
+        return result
+
+    return send, attempts
+
+
+def no_sleep(patched):
+    """Record backoff delays instead of sleeping."""
+    delays = []
+    original = (openai_client._sleep, openai_client._asleep)
+
+    async def asleep(delay):
+        delays.append(delay)
+
+    openai_client._sleep, openai_client._asleep = delays.append, asleep
+    try:
+        return patched(), delays
+    finally:
+        openai_client._sleep, openai_client._asleep = original
+
+
+def test_single_pooled_client():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Real clients are built (no request sent): keys unset in config are read from the env
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        try:
+            client = openai_client.get_client()
+            assert client is openai_client.get_client()
+            assert client.max_retries == 0  # Retried by with_backoff() only
+            assert openai_client.get_async_client() is openai_client.get_async_client()
+            groq = openai_client.get_client("groq")
+            assert groq is not client and "groq.com" in str(groq.base_url)
+        finally:
+            asyncio.run(openai_client.aclose_clients())
+        assert openai_client._clients == {} and openai_client._async_clients == {}
+        assert openai_client.get_client() is not client  # Recreated on demand
+        openai_client.close_clients()
+
+    try:
+        openai_client.get_client("mistral")
+        raise AssertionError("Unknown provider must be rejected")
+    except ValueError:
+        pass
+
+
+def test_timeouts_by_call_type():
+    assert openai_client.timeout_for("enrichment").read == 30.0
+    assert openai_client.timeout_for("extraction").read == 120.0
+    assert openai_client.timeout_for("unknown").read == openai_client.DEFAULT_TIMEOUT
+    assert openai_client.timeout_for("rewrite").connect == openai_client.OPENAI_CONNECT_TIMEOUT
+
+
+def test_transient_errors_retried():
+    send, attempts = failing(status_error(429), status_error(503), openai.APITimeoutError(request=REQUEST))
+    with start_trace("call") as root:
+        (result, delays) = no_sleep(lambda: openai_client.with_backoff(send, "content"))
+    assert result == "ok" and len(attempts) == 4 and len(delays) == 3
+    assert root.total("retries") == 3
+    for attempt, delay in enumerate(delays):
+        assert 0 <= delay <= min(openai_client.OPENAI_BACKOFF_MAX, openai_client.OPENAI_BACKOFF_BASE * 2 ** attempt)
+
+    send, attempts = failing(status_error(400))
+    try:
+        no_sleep(lambda: openai_client.with_backoff(send, "content"))
+        raise AssertionError("400 must not be retried")
+    except openai.BadRequestError:
+        assert len(attempts) == 1
+
+    send, attempts = failing(*[status_error(500)] * (openai_client.OPENAI_MAX_RETRIES + 1))
+    try:
+        no_sleep(lambda: openai_client.with_backoff(send, "content"))
+        raise AssertionError("Retries must be bounded")
+    except openai.InternalServerError:
+        assert len(attempts) == openai_client.OPENAI_MAX_RETRIES + 1
+
+
+def test_async_retry():
+    send, attempts = failing(status_error(429))
+
+    async def asend():
+        return send()
+
+    result, delays = no_sleep(lambda: asyncio.run(openai_client.awith_backoff(asend, "enrichment")))
+    assert result == "ok" and len(attempts) == 2 and len(delays) == 1
+
+
+def test_retry_after_and_deadline():
+    assert openai_client.backoff_delay(0, status_error(429, {"retry-after": "3"})) >= 3.0
+    assert openai_client.backoff_delay(0, status_error(429, {"retry-after": "3600"})) <= openai_client.OPENAI_BACKOFF_MAX
+
+    send, attempts = failing(status_error(429, {"retry-after": "3"}))
+    with use_deadline(5):  # 3 s wait + a quarter of the 120 s content timeout does not fit
+        try:
+            no_sleep(lambda: openai_client.with_backoff(send, "content"))
+            raise AssertionError("No retry expected past the deadline")
+        except openai.RateLimitError:
+            assert len(attempts) == 1
+
+
+def test_chat_completion_uses_call_type_timeout():
+    requests = []
+
+    class RecordingOpenAI(FakeOpenAI):
+        def create(self, **kwargs):
+            requests.append(kwargs)
+            return super().create(**kwargs)
+
+    original = llm_client.get_client
+    llm_client.get_client = lambda provider="openai": RecordingOpenAI()
+    try:
+        llm_client.chat_completion(call_type="enrichment", model="gpt-4o", messages=[{"role": "user", "content": "a"}])
+        llm_client.chat_completion(model="gpt-4o", messages=[{"role": "user", "content": "b"}])
+    finally:
+        llm_client.get_client = original
+
+    assert [request["timeout"].read for request in requests] == [30.0, 120.0]
+    assert "call_type" not in requests[0]
+
+
+if __name__ == "__main__":
+    test_single_pooled_client()
+    test_timeouts_by_call_type()
+    test_transient_errors_retried()
+    test_async_retry()
+    test_retry_after_and_deadline()
+    test_chat_completion_uses_call_type_timeout()
+    print("[OK] OpenAI client tests passed")
@@ -0,0 +1,193 @@
+"""
+Test du PageFillEstimator - PFR analytique sans rendu PDF.
+
+Validates:
+1. Estimate tracks the real render (xhtml2pdf + pdfplumber) within tolerance
+2. Overflow to a second page is detected, including at the page break
+3. Estimate is orders of magnitude faster than a real render
+4. Bullet blocks report the height they free when removed
+5. Generator rejects unknown measure modes
+6. Estimate mode confirms only estimates near the page break with a real render
+"""
+import sys
+import time
+from copy import deepcopy
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.density import DensityCalculator
+from app.layout import LayoutEngine
+from app.page_estimator import ESTIMATE_ERROR_MARGIN, PageFillEstimator, count_lines
+
+
+# Max |estimate - real| in PFR points (calibration: mean abs error ~0.5)
+PFR_TOLERANCE = 3.0
+
+BULLET = (
+    "Built a three-statement LBO model for a {n}M EUR mid-cap carve-out, "
+    "stress-testing leverage covenants and exit multiples for the investment committee"
+)
+
+
+# Configurations around the page break: (experiences, bullets, extra activities)
+BOUNDARY_CASES = [(4, 4, 0), (3, 5, 4), (3, 5, 5), (4, 3, 7), (4, 3, 8), (6, 2, 2), (6, 2, 3), (2, 6, 11)]
+
+
+def make_content(n_experiences=3, n_bullets=3, n_activities=0):
+    return {
+        "contact_information": [{
+            "name": "Jean DUPONT",
+            "email": "jean@example.com",
+            "phone": "+33 6 12 34 56 78",
+            "address": "Paris, France",
+        }],
+        "education": [{
+            "date": "Sep 2021 - Jun 2024",
+            "institution": "HEC Paris",
+            "location": "Jouy-en-Josas, France",
+            "degree": "Master in Management - Grande Ecole",
+            "major": "Finance",
+            "coursework": ["Corporate Finance", "Valuation", "M&A", "Private Equity"],
+        }],
+        "work_experience": [{
+            "date": "Jan 2023 - Jun 2023",
+            "company": f"Company {i}",
+            "location": "Paris, France",
+            "position": "M&A Analyst Intern",
+            "bullets": [BULLET.format(n=10 * (i + 1) + j) for j in range(n_bullets)],
+        } for i in range(n_experiences)],
+        "language_skills": ["French (native)", "English (fluent)"],
+        "it_skills": ["Excel (advanced)", "PowerPoint", "VBA", "Python"],
+        "activities_interests": ["Treasurer of the HEC Finance Club", "Marathon runner"] + [
+            f"Volunteer tutor in mathematics and economics {k}" for k in range(n_activities)
+        ],
+    }
+
+
+def real_pfr(content, trim=False):
+    pdf_bytes = LayoutEngine().generate_pdf_from_data(deepcopy(content), trim=trim)
+    return DensityCalculator.calculate_pfr(pdf_bytes)
+
+
+def test_estimate_matches_render():
+    for n_experiences, n_bullets in [(1, 2), (2, 3), (3, 4)]:
+        content = make_content(n_experiences, n_bullets)
+        estimate = DensityCalculator.estimate_pfr(content)
+        real = real_pfr(content)
+
+        assert estimate.page_count == real.page_count == 1
+        assert abs(estimate.fill_percentage - real.fill_percentage) <= PFR_TOLERANCE, (
+            f"{n_experiences}x{n_bullets}: estimate {estimate.fill_percentage}% "
+            f"vs real {real.fill_percentage}%"
+        )
+
+
+def test_overflow_detected():
+    content = make_content(n_experiences=6, n_bullets=6)
+
+    estimate = DensityCalculator.estimate_pfr(content)
+
+    assert estimate.page_count > 1
+    assert estimate.fill_percentage == 100.0
+    assert real_pfr(content).page_count > 1
+
+
+def test_page_break_boundary():
+    for case in BOUNDARY_CASES:
+        for trim in (False, True):
+            content = make_content(*case)
+            estimate = DensityCalculator.estimate_pfr(content, trim=trim)
+            real = real_pfr(content, trim=trim)
+
+            assert estimate.page_count == real.page_count, (
+                f"{case} trim={trim}: estimate {estimate.fill_percentage}% ({estimate.page_count}p) "
+                f"vs real {real.fill_percentage}% ({real.page_count}p)"
+            )
+            if real.page_count == 1:  # The generator's confirm margin covers the error
+                assert abs(estimate.fill_percentage - real.fill_percentage) < ESTIMATE_ERROR_MARGIN
+
+
+def test_estimate_is_fast():
+    content = make_content(3, 4)
+    PageFillEstimator.estimate(content)  # warm font metrics cache
+
+    start = time.perf_counter()
+    for _ in range(20):
+        PageFillEstimator.estimate(content)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / 20
+
+    assert elapsed_ms < 50, f"estimate took {elapsed_ms:.1f} ms"
+
+
+def test_input_content_not_mutated():
+    content = make_content(2, 2)
+    snapshot = deepcopy(content)
+
+    PageFillEstimator.estimate(content, trim=True)
+
+    assert content == snapshot
+
+
+def test_bullet_blocks():
+    layout = PageFillEstimator.estimate(make_content(2, 3))
+    bullets = [b for b in layout.blocks if b.kind == "bullet"]
+
+    assert len(bullets) == 6
+    assert bullets[0].path == ("experience", 0, "bullets", 0)
+    assert all(b.lines >= 1 and b.height > 0 for b in bullets)
+
+
+def test_count_lines():
+    assert count_lines("", "Times-Roman", 9.5, 300) == 0
+    assert count_lines("short text", "Times-Roman", 9.5, 300) == 1
+    assert count_lines(BULLET.format(n=10) * 3, "Times-Roman", 9.5, 300) > 3
+
+
+def test_unknown_measure_mode_rejected():
+    from app.generator import CVGenerator
+
+    try:
+        CVGenerator(measure_mode="guess")
+    except ValueError:
+        return
+    raise AssertionError("Unknown measure_mode should raise ValueError")
+
+
+def test_estimate_mode_confirms_near_page_break():
+    from app.generator import CVGenerator
+
+    generator = CVGenerator(measure_mode="estimate")
+    renders = []
+    original = generator._render_and_measure
+
+    def render_and_measure(content, trim):
+        renders.append(trim)
+        return original(content, trim=trim)
+
+    generator._render_and_measure = render_and_measure
+
+    far = generator._measure(make_content(2, 3), trim=False)
+    window = generator._measure(make_content(3, 5, 2), trim=False)  # Enrich / accept window
+    overflow = generator._measure(make_content(6, 6), trim=False)
+    assert renders == []
+    assert far.page_count == window.page_count == 1 and 86 < window.fill_percentage < 90
+    assert overflow.page_count > 1
+
+    for case in [(3, 5, 4), (4, 4, 0)]:  # Either side of the page break, within the margin
+        assert generator._measure(make_content(*case), trim=False) == real_pfr(make_content(*case))
+    assert renders == [False, False]
+
+
+if __name__ == "__main__":
+    test_estimate_matches_render()
+    test_overflow_detected()
+    test_page_break_boundary()
+    test_estimate_is_fast()
+    test_input_content_not_mutated()
+    test_bullet_blocks()
+    test_count_lines()
+    test_unknown_measure_mode_rejected()
+    test_estimate_mode_confirms_near_page_break()
+    print("[OK] PageFillEstimator tests passed")
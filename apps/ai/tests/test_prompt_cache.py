@@ -0,0 +1,129 @@
+"""
+Test de la mise en page des messages - préfixe statique pour le cache de prompt du fournisseur.
+
+Validates:
+1. Prompts are preloaded: building messages never reads the disk
+2. The base system prompt is the first message, byte-identical across
+   languages, enrichment instructions and request types
+3. Variable parts (language, instructions) only appear after it
+4. Cached prompt tokens reported by the API are recorded on the trace
+"""
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.llm_client as llm_client
+from app.cache import LLMResponseCache, get_llm_cache, set_llm_cache
+from app.tracing import start_trace
+from openai.types.chat import ChatCompletion
+from test_deferred_docx import SAMPLE_CONTENT
+
+INPUT = {"raw_text": "M&A Analyst Intern at Company 0, Paris, Jan 2023 - Jun 2023"}
+
+
+def content_messages(language="fr", instructions=None, metrics=None):
+    return llm_client._build_content_messages(
+        INPUT, language, enrichment_mode=bool(metrics), current_metrics=metrics,
+        enrichment_instructions=instructions,
+    )
+
+
+def test_prompts_preloaded():
+    original = Path.read_text
+
+    def no_disk(self, *args, **kwargs):
+        raise AssertionError(f"Prompt read from disk: {self}")
+
+    Path.read_text = no_disk
+    try:
+        content_messages(metrics={"fill_percentage": 80, "char_count": 2000})
+        llm_client._build_rewrite_messages(SAMPLE_CONTENT["work_experience"][0], ["a"], "en")
+        llm_client._build_extraction_messages("file-1")
+    finally:
+        Path.read_text = original
+
+    assert llm_client.PROMPTS["base_system.txt"] == (llm_client.PROMPTS_DIR / "base_system.txt").read_text(encoding="utf-8")
+
+
+def test_static_prefix_identical_across_requests():
+    requests = [
+        content_messages("fr"),
+        content_messages("en"),
+        content_messages("fr", instructions="Add quantified outcomes."),
+        content_messages("en", metrics={"fill_percentage": 80, "char_count": 2000}),
+        llm_client._build_rewrite_messages(SAMPLE_CONTENT["work_experience"][0], ["a", "b"], "fr"),
+    ]
+    prefixes = {json.dumps(messages[0], ensure_ascii=False) for messages in requests}
+    assert len(prefixes) == 1
+    assert requests[0][0]["content"] == llm_client.BASE_SYSTEM_PROMPT
+
+    variable = [messages[1]["content"] for messages in requests]
+    assert variable[0] == "Output must be in French." and variable[1] == "Output must be in English."
+    assert variable[2].endswith("Add quantified outcomes.")
+    assert "80" in variable[3]
+    assert all(messages[-1]["role"] == "user" for messages in requests)
+
+
+def test_llm_cache_key_covers_variable_messages():
+    captured = []
+    original = (llm_client.chat_completion, get_llm_cache())
+
+    def fake_chat(**kwargs):
+        captured.append(kwargs)
+        return ChatCompletion.model_validate({
+            "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": "gpt-4o",
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": json.dumps(SAMPLE_CONTENT)}}],
+        })
+
+    llm_client.chat_completion = fake_chat
+    set_llm_cache(LLMResponseCache())
+    try:
+        for fill in (70, 80, 80):
+            llm_client.generate_cv_content(
+                INPUT, language="fr", enrichment_mode=True,
+                current_metrics={"fill_percentage": fill, "char_count": 2000},
+            )
+    finally:
+        llm_client.chat_completion = original[0]
+        set_llm_cache(original[1])
+    assert len(captured) == 2  # Legacy enrichment metrics are part of the key
+
+
+def test_cached_tokens_recorded():
+    class FakeOpenAI:
+        def __init__(self):
+            self.chat = self
+            self.completions = self
+
+        def create(self, **kwargs):
+            return ChatCompletion.model_validate({
+                "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": "gpt-4o",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "{}"}}],
+                "usage": {"prompt_tokens": 7000, "completion_tokens": 900, "total_tokens": 7900,
+                          "prompt_tokens_details": {"cached_tokens": 6912}},
+            })
+
+    original = llm_client.get_client
+    llm_client.get_client = lambda provider="openai": FakeOpenAI()
+    try:
+        with start_trace("cv_generation") as root:
+            llm_client.chat_completion(model="gpt-4o", messages=content_messages())
+            llm_client.chat_completion(model="gpt-4o", messages=content_messages("en"))
+    finally:
+        llm_client.get_client = original
+
+    assert root.total("cached_tokens") == 2 * 6912
+    assert root.total("prompt_tokens") == 14000
+
+
+if __name__ == "__main__":
+    test_prompts_preloaded()
+    test_static_prefix_identical_across_requests()
+    test_llm_cache_key_covers_variable_messages()
+    test_cached_tokens_recorded()
+    print("[OK] Prompt cache layout tests passed")
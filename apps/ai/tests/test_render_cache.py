@@ -0,0 +1,126 @@
+"""
+Test du RenderCache - memoization render + PFR par hash de contenu.
+
+Validates:
+1. Identical content is rendered once (cache hit on second call)
+2. trim flag is part of the key
+3. LRU eviction respects max_entries
+4. Shared store (RedisSession interface) serves entries across instances
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.cache import RenderCache
+from app.models import PageFillMetrics
+
+
+SAMPLE_CONTENT = {
+    "contact_information": [{"name": "Jean DUPONT", "email": "jean@example.com"}],
+    "work_experience": [{
+        "date": "January 2023 - June 2023",
+        "company": "Rothschild & Co",
+        "location": "Paris, France",
+        "position": "M&A Analyst",
+        "bullets": ["Built LBO model for a 250M EUR carve-out"],
+    }],
+}
+
+
+class FakeSharedStore:
+    """Minimal in-memory store exposing the RedisSession interface."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set_with_expiry(self, key, value, expiry_seconds=600):
+        self.data[key] = value
+        return True
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+def make_renderer(calls):
+    def render(content, trim):
+        calls.append(trim)
+        metrics = PageFillMetrics(page_count=1, fill_percentage=91.5, char_count=2800)
+        return b"%PDF-fake", metrics
+    return render
+
+
+def test_identical_content_rendered_once():
+    calls = []
+    cache = RenderCache(max_entries=4)
+    render = make_renderer(calls)
+
+    cache.get_or_render(SAMPLE_CONTENT, False, render)
+    pdf_bytes, metrics = cache.get_or_render(dict(SAMPLE_CONTENT), False, render)
+
+    assert calls == [False]
+    assert pdf_bytes == b"%PDF-fake"
+    assert metrics.fill_percentage == 91.5
+    assert cache.stats()["hits"] == 1
+
+
+def test_trim_flag_is_part_of_key():
+    calls = []
+    cache = RenderCache(max_entries=4)
+    render = make_renderer(calls)
+
+    cache.get_or_render(SAMPLE_CONTENT, False, render)
+    cache.get_or_render(SAMPLE_CONTENT, True, render)
+
+    assert calls == [False, True]
+
+
+def test_input_content_not_mutated():
+    cache = RenderCache(max_entries=4)
+    content = {"work_experience": [dict(SAMPLE_CONTENT["work_experience"][0])]}
+
+    cache.get_or_render(content, False, make_renderer([]))
+
+    assert "work_experience" in content
+    assert content["work_experience"][0]["date"] == "January 2023 - June 2023"
+
+
+def test_lru_eviction():
+    calls = []
+    cache = RenderCache(max_entries=2)
+    render = make_renderer(calls)
+
+    for name in ["A", "B", "C"]:
+        cache.get_or_render({"contact_information": [{"name": name}]}, False, render)
+    # "A" was evicted, "C" is still cached
+    cache.get_or_render({"contact_information": [{"name": "A"}]}, False, render)
+    cache.get_or_render({"contact_information": [{"name": "C"}]}, False, render)
+
+    assert len(calls) == 4
+
+
+def test_shared_store_between_workers():
+    store = FakeSharedStore()
+    worker_a = RenderCache(shared_store=store)
+    worker_b = RenderCache(shared_store=store)
+    calls = []
+
+    worker_a.get_or_render(SAMPLE_CONTENT, False, make_renderer(calls))
+    pdf_bytes, metrics = worker_b.get_or_render(SAMPLE_CONTENT, False, make_renderer(calls))
+
+    assert len(calls) == 1
+    assert pdf_bytes == b"%PDF-fake"
+    assert metrics.page_count == 1
+
+
+if __name__ == "__main__":
+    test_identical_content_rendered_once()
+    test_trim_flag_is_part_of_key()
+    test_input_content_not_mutated()
+    test_lru_eviction()
+    test_shared_store_between_workers()
+    print("[OK] RenderCache tests passed")
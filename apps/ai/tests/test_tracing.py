@@ -0,0 +1,139 @@
+"""
+Test du tracing - arbre de spans par génération (durée, octets, tokens).
+
+Validates:
+1. Nested spans form a tree with durations; the root is emitted to sinks
+2. Token usage is accumulated and summed over the tree
+3. Spans propagate to worker threads (run_in_context) and asyncio.to_thread
+4. Generator stages (trim plan, measure, render, DOCX) are recorded per language
+5. A failing sink never breaks generation
+"""
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.generator import CVGenerator
+from app.tracing import (
+    MemorySink,
+    TraceSink,
+    add_sink,
+    remove_sink,
+    run_in_context,
+    span,
+    start_trace,
+)
+from test_deferred_docx import SAMPLE_CONTENT
+
+
+def find(trace, name):
+    """All spans named `name` in a to_dict() tree."""
+    found = [trace] if trace["name"] == name else []
+    for child in trace["children"]:
+        found.extend(find(child, name))
+    return found
+
+
+def test_span_tree_emitted_to_sink():
+    sink = MemorySink()
+    add_sink(sink)
+    try:
+        with start_trace("cv_generation", source="data") as root:
+            with span("base", language="fr"):
+                with span("llm.chat", model="gpt-4o") as chat:
+                    chat.record_usage(SimpleNamespace(prompt_tokens=120, completion_tokens=30, total_tokens=150))
+            with span("base", language="en"):
+                with span("llm.chat", model="gpt-4o") as chat:
+                    chat.record_usage(SimpleNamespace(prompt_tokens=100, completion_tokens=20, total_tokens=120))
+                    chat.record_usage(None)
+    finally:
+        remove_sink(sink)
+
+    assert sink.traces == [root]
+    assert [child.attributes["language"] for child in root.children] == ["fr", "en"]
+    assert root.duration_ms is not None and root.duration_ms >= 0
+    assert root.total("total_tokens") == 270
+
+    trace = root.to_dict()
+    assert len(find(trace, "llm.chat")) == 2
+    assert "cv_generation" in root.format()
+
+
+def test_span_outside_trace_is_detached():
+    with span("render") as orphan:
+        pass
+    assert orphan.duration_ms is not None
+    assert orphan.children == []
+
+
+def test_propagation_to_threads():
+    def work(lang):
+        with span("adjust", language=lang):
+            return lang
+
+    async def run_async():
+        with start_trace("async_root") as root:
+            await asyncio.gather(*[asyncio.to_thread(work, lang) for lang in ("fr", "en")])
+        return root
+
+    with start_trace("threads_root") as root:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(run_in_context(work), ["fr", "en"]))
+
+    assert sorted(c.attributes["language"] for c in root.children) == ["en", "fr"]
+    assert len(asyncio.run(run_async()).children) == 2
+
+
+def test_generator_stages_recorded():
+    generator = CVGenerator(docx_mode="eager")
+    with start_trace("cv_generation", source="data") as root:
+        results = generator._run_per_language(
+            ["fr", "en"],
+            lambda lang: generator._adjust_language(
+                SAMPLE_CONTENT, generator._measure(SAMPLE_CONTENT, trim=False),
+                "finance", lang, None, CVGenerator.STRUCTURED_DATA_ANALYSIS,
+            ),
+            stage="adjust",
+        )
+    generator._attach_trace(results, root)
+
+    trace = results["fr"].trace
+    assert trace is results["en"].trace
+    adjust_spans = find(trace, "adjust")
+    assert sorted(s["attributes"]["language"] for s in adjust_spans) == ["en", "fr"]
+
+    for adjust_span in adjust_spans:
+        assert find(adjust_span, "trim.plan")
+        assert find(adjust_span, "measure")
+        render = find(adjust_span, "render")
+        assert render and render[-1]["attributes"]["bytes"] > 0
+        assert find(adjust_span, "docx")[0]["attributes"]["bytes"] > 0
+
+
+class FailingSink(TraceSink):
+    def emit(self, trace):
+        raise RuntimeError("sink down")
+
+
+def test_failing_sink_ignored():
+    sink = FailingSink()
+    add_sink(sink)
+    try:
+        with start_trace("cv_generation") as root:
+            pass
+    finally:
+        remove_sink(sink)
+    assert root.duration_ms is not None
+
+
+if __name__ == "__main__":
+    test_span_tree_emitted_to_sink()
+    test_span_outside_trace_is_detached()
+    test_propagation_to_threads()
+    test_generator_stages_recorded()
+    test_failing_sink_ignored()
+    print("[OK] Tracing tests passed")
@@ -0,0 +1,143 @@
+"""
+Test du mode traduction - la seconde langue est traduite, pas régénérée.
+
+Validates:
+1. Translation keeps the CV structure and the bullet length tolerance
+2. second_language_mode="translate" generates FR once and translates EN
+3. A failed translation falls back to full generation
+4. Phase 2 with a session translates from the Phase 1 final content
+"""
+import json
+import sys
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.generator as generator_module
+import app.llm_client as llm_client
+from app.generator import CVGenerator
+from app.llm_client import TRANSLATION_LENGTH_TOLERANCE, _merge_translation
+from app.models import CVContent
+from test_deferred_docx import SAMPLE_CONTENT
+from test_generation_session import PDF_BYTES, RAW_TEXT
+
+
+def translated_payload(content, stretch=1.0):
+    """What the model would return: same structure, bullets re-worded."""
+    payload = {key: deepcopy(value) for key, value in content.items() if key != "contact_information"}
+    for exp in payload.get("work_experience", []):
+        exp["bullets"] = [
+            ("Réalisation " + bullet)[:int(len(bullet) * stretch)] if stretch <= 1 else
+            "Réalisation " + bullet + " avec" * int(len(bullet) * (stretch - 1) / 5)
+            for bullet in exp["bullets"]
+        ]
+    return payload
+
+
+class FakeLLM:
+    """Stands in for generate_cv_content and the translation chat call."""
+
+    def __init__(self, stretch=1.0, fail_translation=False):
+        self.stretch = stretch
+        self.fail_translation = fail_translation
+        self.generated = []
+        self.translations = 0
+
+    def generate(self, input_data, domain, language, **kwargs):
+        self.generated.append(language)
+        return deepcopy(SAMPLE_CONTENT)
+
+    def extract(self, pdf_bytes, filename="resume.pdf"):
+        return RAW_TEXT
+
+    def chat(self, **kwargs):
+        self.translations += 1
+        if self.fail_translation:
+            raise RuntimeError("timeout")
+        source = json.loads(kwargs["messages"][1]["content"])
+        message = SimpleNamespace(content=json.dumps(translated_payload(source, self.stretch)))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def patched(fake, run):
+    original = (
+        generator_module.generate_cv_content,
+        generator_module.extract_text_from_pdf_bytes,
+        llm_client.chat_completion,
+    )
+    generator_module.generate_cv_content = fake.generate
+    generator_module.extract_text_from_pdf_bytes = fake.extract
+    llm_client.chat_completion = fake.chat
+    try:
+        return run()
+    finally:
+        (
+            generator_module.generate_cv_content,
+            generator_module.extract_text_from_pdf_bytes,
+            llm_client.chat_completion,
+        ) = original
+
+
+def test_merge_enforces_structure_and_length():
+    translated = translated_payload(SAMPLE_CONTENT, stretch=1.5)
+    merged = _merge_translation(SAMPLE_CONTENT, translated)
+
+    assert merged["contact_information"] == SAMPLE_CONTENT["contact_information"]
+    for src_exp, exp in zip(SAMPLE_CONTENT["work_experience"], merged["work_experience"]):
+        for src, bullet in zip(src_exp["bullets"], exp["bullets"]):
+            assert bullet.startswith("Réalisation")
+            assert len(bullet) <= len(src) * (1 + TRANSLATION_LENGTH_TOLERANCE)
+
+    translated["work_experience"][0]["bullets"].pop()
+    try:
+        _merge_translation(SAMPLE_CONTENT, translated)
+    except ValueError:
+        return
+    raise AssertionError("Dropped bullet should raise ValueError")
+
+
+def test_second_language_translated():
+    fake = FakeLLM()
+    generator = CVGenerator(docx_mode="deferred", second_language_mode="translate")
+    results = patched(fake, lambda: generator.generate_from_data(CVContent(), languages=["fr", "en"]))
+
+    assert fake.generated == ["fr"]
+    assert fake.translations == 1
+    assert results["en"].page_count == 1
+    assert results["en"].warnings[0] == "Translated from FR final content"
+    assert results["en"].content["work_experience"][0]["bullets"][0].startswith("Réalisation")
+
+
+def test_failed_translation_falls_back_to_generation():
+    fake = FakeLLM(fail_translation=True)
+    generator = CVGenerator(docx_mode="deferred", second_language_mode="translate")
+    results = patched(fake, lambda: generator.generate_from_data(CVContent(), languages=["fr", "en"]))
+
+    assert fake.generated == ["fr", "en"]
+    assert results["en"].page_count == 1
+
+
+def test_phase2_translates_from_session():
+    fake = FakeLLM()
+    generator = CVGenerator(docx_mode="deferred", second_language_mode="translate")
+
+    def run():
+        phase1 = generator.generate_from_pdf(PDF_BYTES, languages=["fr"])
+        return generator.generate_from_pdf(None, languages=["en"], session=phase1["fr"].session)
+
+    phase2 = patched(fake, run)
+
+    assert fake.generated == ["fr"]
+    assert fake.translations == 1
+    assert phase2["en"].session.final_content.keys() == {"fr", "en"}
+
+
+if __name__ == "__main__":
+    test_merge_enforces_structure_and_length()
+    test_second_language_translated()
+    test_failed_translation_falls_back_to_generation()
+    test_phase2_translates_from_session()
+    print("[OK] Translate mode tests passed")
@@ -0,0 +1,156 @@
+"""
+Test du TrimPlanner - coupes minimales pour revenir dans la fenêtre PFR.
+
+Validates:
+1. An overflowing CV is planned into the 86-95% window on ONE page (real render)
+2. Content already in the window gets an empty plan
+3. Minimum bullets / experiences are always kept
+4. Input content is not mutated and both experience keys are supported
+5. Cuts hit the planned entries when N/A entries shift normalized indexes
+"""
+import sys
+from copy import deepcopy
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.density import DensityCalculator
+from app.layout import LayoutEngine
+from app.page_estimator import PageFillEstimator
+from app.trim_planner import TrimCut, TrimPlan, TrimPlanner
+
+
+BULLET = (
+    "Built a three-statement LBO model for a {n}M EUR mid-cap carve-out, "
+    "stress-testing leverage covenants and exit multiples for the investment committee"
+)
+
+
+def make_content(n_experiences=4, n_bullets=5):
+    return {
+        "contact_information": [{"name": "Jean DUPONT", "email": "jean@example.com"}],
+        "education": [{
+            "date": "Sep 2021 - Jun 2024",
+            "institution": "HEC Paris",
+            "location": "Paris, France",
+            "degree": "Master in Management",
+            "coursework": ["Corporate Finance", "Valuation", "M&A", "Private Equity"],
+        }],
+        "work_experience": [{
+            "date": "Jan 2023 - Jun 2023",
+            "company": f"Company {i}",
+            "location": "Paris, France",
+            "position": "M&A Analyst Intern",
+            "bullets": [BULLET.format(n=10 * (i + 1) + j) for j in range(n_bullets)],
+        } for i in range(n_experiences)],
+        "language_skills": ["French (native)", "English (fluent)"],
+        "activities_interests": ["Treasurer of the HEC Finance Club", "Marathon runner", "Chess"],
+    }
+
+
+def real_pfr(content):
+    pdf_bytes = LayoutEngine().generate_pdf_from_data(deepcopy(content), trim=False)
+    return DensityCalculator.calculate_pfr(pdf_bytes)
+
+
+def test_overflow_planned_into_window():
+    planner = TrimPlanner()
+    content = make_content(4, 5)
+    assert real_pfr(content).page_count > 1
+
+    plan = planner.plan(content)
+    assert plan is not None and plan.cuts
+
+    metrics = real_pfr(planner.apply(content, plan))
+    assert metrics.page_count == 1
+    assert planner.TARGET_MIN <= metrics.fill_percentage <= planner.TARGET_MAX
+
+
+def test_content_in_window_not_cut():
+    planner = TrimPlanner()
+    content = make_content(4, 5)
+    trimmed = planner.apply(content, planner.plan(content))
+
+    plan = planner.plan(trimmed)
+
+    assert plan is not None
+    assert plan.cuts == []
+
+
+def test_minimums_kept():
+    planner = TrimPlanner()
+    content = make_content(5, 6)
+
+    trimmed = planner.apply(content, planner.plan(content))
+
+    assert len(trimmed["work_experience"]) >= planner.MIN_EXPERIENCES
+    assert all(len(exp["bullets"]) >= planner.MIN_BULLETS for exp in trimmed["work_experience"])
+    assert trimmed["activities_interests"][0] == "Treasurer of the HEC Finance Club"
+
+
+def test_input_not_mutated_and_experience_key():
+    planner = TrimPlanner()
+    content = make_content(4, 5)
+    content["experience"] = content.pop("work_experience")
+    snapshot = deepcopy(content)
+
+    trimmed = planner.apply(content, planner.plan(content))
+
+    assert content == snapshot
+    assert "work_experience" not in trimmed
+    total_before = sum(len(exp["bullets"]) for exp in content["experience"])
+    total_after = sum(len(exp["bullets"]) for exp in trimmed["experience"])
+    assert total_after <= total_before
+
+
+def with_na_entries(content):
+    """Insert N/A placeholders that normalization filters out."""
+    content["work_experience"][0]["bullets"].insert(1, "N/A")
+    content["work_experience"].insert(1, {"company": "N/A", "bullets": []})
+    content["activities_interests"].insert(1, "n/a")
+    return content
+
+
+def test_cuts_mapped_past_na_entries():
+    content = with_na_entries(make_content(4, 5))
+    bullets = content["work_experience"][0]["bullets"]
+
+    # Normalized paths: bullet 2 = raw bullet 3, interest 1 = raw interest 2
+    plan = TrimPlan(cuts=[
+        TrimCut("drop", "bullet", ("experience", 0, "bullets", 2), 0.0, 0.0),
+        TrimCut("shorten", "bullet", ("experience", 0, "bullets", 3), 0.0, 0.0, new_text="Shortened..."),
+        TrimCut("drop", "interest", ("interests", 1), 0.0, 0.0),
+    ])
+    trimmed = TrimPlanner.apply(content, plan)
+
+    assert trimmed["work_experience"][0]["bullets"] == bullets[:3] + ["Shortened...", bullets[5]]
+    assert trimmed["activities_interests"] == ["Treasurer of the HEC Finance Club", "n/a", "Chess"]
+
+    # Applying a planned trim yields exactly the bullets the plan measured
+    content = with_na_entries(make_content(4, 6))
+    planner = TrimPlanner()
+    plan = planner.plan(content)
+    assert any(cut.kind == "bullet" and cut.action == "drop" for cut in plan.cuts)
+
+    cuts = {cut.path: cut for cut in plan.cuts}
+    expected = [
+        cuts[block.path].new_text if block.path in cuts else block.text
+        for block in PageFillEstimator.estimate(content).blocks
+        if block.kind == "bullet"
+        and ("experience", block.path[1]) not in cuts
+        and getattr(cuts.get(block.path), "action", "shorten") == "shorten"
+    ]
+    kept = [
+        bullet for exp in LayoutEngine.normalize_cv_data(planner.apply(content, plan))["experience"]
+        for bullet in exp.get("bullets", [])
+    ]
+    assert kept == expected
+
+if __name__ == "__main__":
+    test_overflow_planned_into_window()
+    test_content_in_window_not_cut()
+    test_minimums_kept()
+    test_input_not_mutated_and_experience_key()
+    test_cuts_mapped_past_na_entries()
+    print("[OK] TrimPlanner tests passed")
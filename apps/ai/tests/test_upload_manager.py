@@ -0,0 +1,124 @@
+"""
+Test du gestionnaire d'uploads OpenAI - réutilisation et nettoyage des fichiers.
+
+Validates:
+1. An identical PDF reuses a live upload until its TTL
+2. An extraction whose text is cached deletes its upload in the background
+3. A failed / empty extraction keeps the upload for the retry
+4. Concurrent uploads of the same PDF keep one file, delete the other
+5. Cleanup works in batches and retries failed deletions
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.cache import ExtractionCache
+from app.uploads import MAX_DELETE_ATTEMPTS, UploadManager
+from test_cassette import FakeOpenAI, chat_response
+from test_extraction_cache import extract
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_identical_pdf_reuses_live_upload():
+    clock, deleted = FakeClock(), []
+    manager = UploadManager(ttl_seconds=60, clock=clock)
+    digest = manager.digest(b"%PDF-1.4 cv")
+
+    assert manager.acquire(digest) is None
+    assert manager.register(digest, "file-1", delete=deleted.append) == "file-1"
+    manager.release("file-1")
+    assert manager.acquire(digest) == "file-1"
+    manager.release("file-1")
+
+    clock.now = 61.0
+    assert manager.acquire(digest) is None  # Expired: upload again
+    assert manager.sweep() == 1 and deleted == ["file-1"]
+    assert manager.stats()["reuses"] == 1 and manager.stats()["live"] == 0
+
+
+def test_cached_extraction_deletes_upload_in_background():
+    live = FakeOpenAI()
+    manager = UploadManager(cleanup_interval=0.05)
+    extract(live, ExtractionCache(), uploads=manager)
+
+    for _ in range(100):
+        if live.deleted:
+            break
+        time.sleep(0.02)
+    assert live.deleted == ["file-1"]
+    assert live.calls == 2  # Deletion off the request path, not a request call
+    manager.close()
+
+
+def test_failed_extraction_keeps_upload_for_retry():
+    class EmptyExtraction(FakeOpenAI):
+        def create(self, **kwargs):
+            self.calls += 1
+            return chat_response(json.dumps({"raw_text": ""}))
+
+    live = EmptyExtraction()
+    manager = UploadManager(cleanup_interval=60)
+    extract(live, ExtractionCache(), uploads=manager)
+    extract(live, ExtractionCache(), uploads=manager)
+
+    assert live.calls == 3  # One upload, two vision calls
+    assert live.deleted == [] and manager.stats()["live"] == 1
+    assert manager.flush() == 1 and live.deleted == ["file-1"]  # Shutdown
+    manager.close()
+
+
+def test_concurrent_uploads_keep_one_file():
+    deleted = []
+    manager = UploadManager()
+    digest = manager.digest(b"%PDF-1.4 cv")
+
+    first = manager.register(digest, "file-a", delete=deleted.append)
+    second = manager.register(digest, "file-b", delete=deleted.append)
+    assert first == second == "file-a"
+
+    assert manager.sweep() == 1 and deleted == ["file-b"]
+    manager.release("file-a", keep=False)
+    assert manager.stats()["live"] == 1  # Still used by the second extraction
+    manager.release("file-a", keep=False)
+    assert manager.sweep() == 1 and deleted == ["file-b", "file-a"]
+
+
+def test_cleanup_batches_and_retries():
+    deleted, failures = [], {"file-0": 1, "file-1": MAX_DELETE_ATTEMPTS}
+
+    def delete(file_id):
+        if failures.get(file_id, 0) > 0:
+            failures[file_id] -= 1
+            raise ConnectionError("timeout")
+        deleted.append(file_id)
+
+    manager = UploadManager(batch_size=2)
+    for index in range(5):
+        manager.register(f"pdf-{index}", f"file-{index}", delete=delete)
+        manager.release(f"file-{index}", keep=False)
+
+    assert manager.sweep() == 0           # file-0 and file-1 fail, requeued
+    assert manager.sweep() == 2           # file-2, file-3
+    assert manager.flush() == 2           # file-4, file-0 retried; file-1 given up
+    assert sorted(deleted) == ["file-0", "file-2", "file-3", "file-4"]
+    assert manager.stats()["pending"] == 0
+
+
+if __name__ == "__main__":
+    test_identical_pdf_reuses_live_upload()
+    test_cached_extraction_deletes_upload_in_background()
+    test_failed_extraction_keeps_upload_for_retry()
+    test_concurrent_uploads_keep_one_file()
+    test_cleanup_batches_and_retries()
+    print("[OK] Upload manager tests passed")
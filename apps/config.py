@@ -1,6 +1,5 @@
 import os
 from dotenv import load_dotenv
-from openai import OpenAI
 
 load_dotenv()
 
@@ -36,11 +35,104 @@ DOMAIN=os.getenv("DOMAIN")
 GROQ_API_KEY=os.getenv("GROQ_API_KEY")
 HF_TOKEN=os.getenv("HF_TOKEN")
 
-EXCEL_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "exercises.csv")
+# CV render cache (render + PFR memoization, optionally shared through Redis)
+RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE", 64))
+RENDER_CACHE_SHARED = os.getenv("RENDER_CACHE_SHARED", "False").lower() in ("true", "1", "yes")
+RENDER_CACHE_TTL = int(os.getenv("RENDER_CACHE_TTL", 3600))
+
+# LLM response cache (generate_cv_content): in-process LRU, optionally
+# shared through Redis with a TTL; LLM_CACHE_ENABLED=False always calls GPT-4o
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "True").lower() in ("true", "1", "yes")
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", 128))
+LLM_CACHE_SHARED = os.getenv("LLM_CACHE_SHARED", "False").lower() in ("true", "1", "yes")
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 86400))
+
+# PDF text extraction cache (keyed by PDF SHA-256 + prompt version): the same
+# PDF evaluated then generated, or re-uploaded, skips upload + vision call.
+# Entries are full CV texts (personal data): in-process by default, sharing
+# through Redis is opt-in with a short TTL; deleting an upload drops its entry
+EXTRACTION_CACHE_ENABLED = os.getenv("EXTRACTION_CACHE_ENABLED", "True").lower() in ("true", "1", "yes")
+EXTRACTION_CACHE_SIZE = int(os.getenv("EXTRACTION_CACHE_SIZE", 256))
+EXTRACTION_CACHE_SHARED = os.getenv("EXTRACTION_CACHE_SHARED", "False").lower() in ("true", "1", "yes")
+EXTRACTION_CACHE_TTL = int(os.getenv("EXTRACTION_CACHE_TTL", 3600))
+
+# Local PDF text-layer extraction (pdfplumber, see apps/ai/app/pdf_text.py):
+# born-digital PDFs are read locally; scanned or low-confidence PDFs (score
+# below LOCAL_EXTRACTION_MIN_CONFIDENCE, 0.0 - 1.0) go to the GPT-4o vision call
+LOCAL_EXTRACTION_ENABLED = os.getenv("LOCAL_EXTRACTION_ENABLED", "True").lower() in ("true", "1", "yes")
+LOCAL_EXTRACTION_MIN_CONFIDENCE = float(os.getenv("LOCAL_EXTRACTION_MIN_CONFIDENCE", 0.8))
+
+# OpenAI file uploads (GPT-4o vision extraction): a live upload of the same
+# PDF is reused for UPLOAD_TTL seconds; uploads are deleted in the background
+# (every UPLOAD_CLEANUP_INTERVAL seconds, UPLOAD_CLEANUP_BATCH per sweep) once
+# their text is cached or their TTL expired. UPLOAD_REUSE_ENABLED=False keeps
+# the previous behaviour (one upload per extraction, never deleted)
+UPLOAD_REUSE_ENABLED = os.getenv("UPLOAD_REUSE_ENABLED", "True").lower() in ("true", "1", "yes")
+UPLOAD_TTL = int(os.getenv("UPLOAD_TTL", 900))
+UPLOAD_CLEANUP_INTERVAL = float(os.getenv("UPLOAD_CLEANUP_INTERVAL", 30))
+UPLOAD_CLEANUP_BATCH = int(os.getenv("UPLOAD_CLEANUP_BATCH", 20))
+
+# Shared OpenAI clients (see apps/ai/app/openai_client.py): connection pool
+# with keep-alive, connect timeout (read timeouts are per call type), retries
+# of 429 / 5xx / connection errors with jittered exponential backoff
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", 64))
+OPENAI_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", 32))
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", 60))
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", 5))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", 3))
+OPENAI_BACKOFF_BASE = float(os.getenv("OPENAI_BACKOFF_BASE", 0.5))
+OPENAI_BACKOFF_MAX = float(os.getenv("OPENAI_BACKOFF_MAX", 20))
+
+# Model per LLM call type (see apps/ai/app/model_registry.py): JSON merged into
+# the defaults, e.g. '{"enrichment": {"provider": "groq", "model": "llama-3.1-8b-instant"}}'
+# Call types: extraction, content, fallback, translation, rewrite, enrichment;
+# providers: openai, groq (GROQ_API_KEY)
+LLM_MODEL_PROFILES = os.getenv("LLM_MODEL_PROFILES", "")
+
+# PFR measurement for pipeline decisions: "estimate" (analytical, real render
+# only for the final artifact and within ~2 PFR points of the page break),
+# "render" (xhtml2pdf + pdfplumber at every step) or "cross_check" (both, logs the delta)
+PFR_MEASURE_MODE = os.getenv("PFR_MEASURE_MODE", "estimate").lower()
 
+# DOCX artifact: "eager" (built during generation) or "deferred" (built on
+# first download / in background; the /cv/generate route always defers)
+DOCX_MODE = os.getenv("DOCX_MODE", "eager").lower()
 
-groq_client = OpenAI(
-    api_key=os.getenv("GROQ_API_KEY"),
-    base_url="https://api.groq.com/openai/v1",
+# Second language: "generate" (full generation per language) or "translate"
+# (compact translation of the first language's final content)
+SECOND_LANGUAGE_MODE = os.getenv("SECOND_LANGUAGE_MODE", "generate").lower()
+
+# Print the per-stage span tree of every generation (see apps/ai/app/tracing.py)
+TRACE_LOG = os.getenv("TRACE_LOG", "False").lower() in ("true", "1", "yes")
+
+# Record / replay of OpenAI calls (offline benchmarks, deterministic tests):
+# "off", "record", "replay" or "auto"; replay latency = recorded latency x scale
+LLM_CASSETTE_MODE = os.getenv("LLM_CASSETTE_MODE", "off").lower()
+LLM_CASSETTE_DIR = os.getenv(
+    "LLM_CASSETTE_DIR", os.path.join(os.path.dirname(__file__), "ai", "cassettes")
 )
+LLM_CASSETTE_LATENCY_SCALE = float(os.getenv("LLM_CASSETTE_LATENCY_SCALE", 0))
+
+# Background jobs (/cv/generate): "redis" (shared queue, `python -m apps.jobs.worker`)
+# or "memory" (in-process queue and worker, tests / local development)
+JOB_QUEUE_BACKEND = os.getenv("JOB_QUEUE_BACKEND", "redis").lower()
+JOB_WORKER_CONCURRENCY = int(os.getenv("JOB_WORKER_CONCURRENCY", 2))
+JOB_VISIBILITY_TIMEOUT = int(os.getenv("JOB_VISIBILITY_TIMEOUT", 300))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+JOB_RESULT_TTL = int(os.getenv("JOB_RESULT_TTL", 86400))
+
+# Batch generation (cohorts): chat completions in flight for the whole batch
+# (shared API quota), items generated at once, max items per request.
+# Items run on threads (GIL-bound renders do not scale with cores): the
+# default worker count keeps the LLM budget busy, two languages per item
+BATCH_LLM_CONCURRENCY = int(os.getenv("BATCH_LLM_CONCURRENCY", 16))
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", max(1, BATCH_LLM_CONCURRENCY // 2)))
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", 100))
+
+# Time budget of one generation in seconds (0 = unbounded, the default): when
+# it runs short, stages degrade (skip enrichment, direct trim, defer DOCX...).
+# Opt in with a budget above the deployment's measured p90 generation latency
+GENERATION_DEADLINE_SECONDS = float(os.getenv("GENERATION_DEADLINE_SECONDS", 0))
+
+EXCEL_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "exercises.csv")
 
@@ -0,0 +1,69 @@
+"""
+Background jobs: Redis-backed queue + worker processes.
+
+The API enqueues long-running work (CV generation) and returns a job id;
+workers (`python -m apps.jobs.worker`) execute it. With
+JOB_QUEUE_BACKEND=memory the queue lives in the API process and an
+in-process worker runs the jobs (tests, local development).
+"""
+import threading
+from typing import Optional
+
+from .memory import InMemoryRedis
+from .queue import Job, JobQueue
+from .worker import JobWorker
+
+_queue: Optional[JobQueue] = None
+_in_process_worker: Optional[JobWorker] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """
+    Process-wide job queue configured from apps.config.
+
+    JOB_QUEUE_BACKEND=redis (default) uses the RedisSession pool;
+    JOB_QUEUE_BACKEND=memory uses InMemoryRedis and starts an in-process worker.
+    """
+    global _queue, _in_process_worker
+    with _queue_lock:
+        if _queue is None:
+            from apps.config import (
+                JOB_MAX_ATTEMPTS,
+                JOB_QUEUE_BACKEND,
+                JOB_RESULT_TTL,
+                JOB_VISIBILITY_TIMEOUT,
+                JOB_WORKER_CONCURRENCY,
+            )
+
+            if JOB_QUEUE_BACKEND == "memory":
+                client = InMemoryRedis()
+            elif JOB_QUEUE_BACKEND == "redis":
+                from apps.database import RedisSession
+                client = RedisSession().client
+            else:
+                raise ValueError(
+                    f"Unknown JOB_QUEUE_BACKEND '{JOB_QUEUE_BACKEND}'. Expected 'redis' or 'memory'"
+                )
+
+            _queue = JobQueue(
+                client,
+                visibility_timeout=JOB_VISIBILITY_TIMEOUT,
+                max_attempts=JOB_MAX_ATTEMPTS,
+                result_ttl=JOB_RESULT_TTL,
+            )
+
+            if JOB_QUEUE_BACKEND == "memory":
+                from .handlers import HANDLERS
+                _in_process_worker = JobWorker(_queue, HANDLERS, concurrency=JOB_WORKER_CONCURRENCY)
+                _in_process_worker.start()
+        return _queue
+
+
+__all__ = [
+    "Job",
+    "JobQueue",
+    "JobWorker",
+    "InMemoryRedis",
+    "get_job_queue",
+]
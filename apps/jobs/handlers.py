@@ -0,0 +1,91 @@
+"""
+Job handlers executed by the workers (job kind -> callable(payload) -> result).
+"""
+import threading
+from typing import Any, Dict, Optional
+
+from ..ai.app.generator import CVContent, CVGenerator
+from ..utils.cv_artifacts import (
+    build_cv_docx_in_background,
+    find_previous_generation,
+    store_generated_cv,
+)
+from ..utils.file_storage import get_file_url
+from ..utils.usage_ledger import record_llm_usage
+
+
+CV_GENERATE = "cv_generate"
+
+# One warm generator per worker process, shared by its job threads
+_generator: Optional[CVGenerator] = None
+_generator_lock = threading.Lock()
+
+
+def _get_generator() -> CVGenerator:
+    global _generator
+    with _generator_lock:
+        if _generator is None:
+            _generator = CVGenerator(docx_mode="deferred")  # DOCX built from the stored content
+        return _generator
+
+
+def run_cv_generation(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate a CV from mapped form data, store the PDF and the CV row
+    (and the LLM usage in the ledger), then build the DOCX (native writer,
+    off the request path).
+
+    If the same person already has a generation in this language, only the
+    edited parts are regenerated (CVGenerator.regenerate_from_data).
+
+    Payload:
+        user_id: Owner of the CV
+        form_id: Submitted form (stored on the CV for the next diff)
+        language: "fr" or "en"
+        cv_content: CVContent.dict() (see utils.cv_mapping.form_to_cv_content)
+
+    Returns:
+        Same payload the synchronous /cv/generate used to return
+        (pdf_url, docx_url, cv_id, language, message), plus the
+        degradations applied to meet the generation deadline
+
+    Raises:
+        ValueError: If generation fails (e.g. PFR too low to fill one page)
+    """
+    user_id = payload["user_id"]
+    language = payload["language"]
+    cv_content = CVContent(**payload["cv_content"])
+
+    form_id = payload.get("form_id")
+    full_name = cv_content.contact_information[0].name if cv_content.contact_information else ""
+
+    previous = find_previous_generation(user_id, language, full_name, exclude_form_id=form_id)
+    if previous is not None:
+        previous_input, previous_content = previous
+        generation_result = _get_generator().regenerate_from_data(
+            cv_content, previous_input, previous_content, language
+        )
+    else:
+        generation_result = _get_generator().generate_from_data(cv_content, languages=[language])
+    cv_result = generation_result[language]
+
+    db_cv = store_generated_cv(user_id, cv_result, form_id=form_id, language=language)
+    record_llm_usage(user_id, cv_result.usage, source="cv_generate")
+    cv_id = str(db_cv.id)
+
+    # Failures are logged; the download endpoint rebuilds on demand
+    build_cv_docx_in_background(cv_id)
+
+    return {
+        "pdf_url": get_file_url(db_cv.file_path),
+        "docx_url": f"/cv/{cv_id}/docx",
+        "cv_id": cv_id,
+        "language": language.upper(),
+        "message": f"Your optimized CV has been generated successfully in {language.upper()}!",
+        "degradations": cv_result.degradations,
+    }
+
+
+HANDLERS = {
+    CV_GENERATE: run_cv_generation,
+}
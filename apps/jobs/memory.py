@@ -0,0 +1,114 @@
+"""
+In-process stand-in for the Redis client used by the job queue.
+
+Implements the subset of redis.Redis commands JobQueue relies on, with the
+same semantics (decoded strings, atomic RPOPLPUSH / ZREM), so the queue and
+worker logic run unchanged without a Redis server: tests, local
+development, single-process deployments (JOB_QUEUE_BACKEND=memory).
+"""
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class InMemoryRedis:
+    """Thread-safe in-memory subset of redis.Redis (strings, lists, sorted sets)."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._strings: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._lists: Dict[str, List[str]] = {}
+        self._zsets: Dict[str, Dict[str, float]] = {}
+
+    # Strings
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._strings.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._strings[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            expires_at = time.time() + ex if ex else None
+            self._strings[key] = (str(value), expires_at)
+            return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            deleted = 0
+            for key in keys:
+                for store in (self._strings, self._lists, self._zsets):
+                    if store.pop(key, None) is not None:
+                        deleted += 1
+            return deleted
+
+    # Lists (head = index 0, like LPUSH / RPOP)
+
+    def lpush(self, key: str, *values: str) -> int:
+        with self._lock:
+            items = self._lists.setdefault(key, [])
+            for value in values:
+                items.insert(0, str(value))
+            return len(items)
+
+    def rpoplpush(self, source: str, destination: str) -> Optional[str]:
+        with self._lock:
+            items = self._lists.get(source)
+            if not items:
+                return None
+            value = items.pop()
+            self._lists.setdefault(destination, []).insert(0, value)
+            return value
+
+    def lrem(self, key: str, count: int, value: str) -> int:
+        with self._lock:
+            removed = 0
+            kept = []
+            for item in self._lists.get(key, []):
+                if item == value and (count == 0 or removed < abs(count)):
+                    removed += 1
+                else:
+                    kept.append(item)
+            self._lists[key] = kept
+            return removed
+
+    def lrange(self, key: str, start: int, end: int) -> List[str]:
+        with self._lock:
+            items = self._lists.get(key, [])
+            return list(items[start:] if end == -1 else items[start:end + 1])
+
+    def llen(self, key: str) -> int:
+        with self._lock:
+            return len(self._lists.get(key, []))
+
+    # Sorted sets
+
+    def zadd(self, key: str, mapping: Dict[str, float], nx: bool = False) -> int:
+        with self._lock:
+            zset = self._zsets.setdefault(key, {})
+            if nx:  # Only add new members, never update existing scores
+                mapping = {member: score for member, score in mapping.items() if str(member) not in zset}
+            added = sum(1 for member in mapping if str(member) not in zset)
+            zset.update({str(member): float(score) for member, score in mapping.items()})
+            return added
+
+    def zrem(self, key: str, *members: str) -> int:
+        with self._lock:
+            zset = self._zsets.get(key, {})
+            return sum(1 for member in members if zset.pop(member, None) is not None)
+
+    def zscore(self, key: str, member: str) -> Optional[float]:
+        with self._lock:
+            return self._zsets.get(key, {}).get(member)
+
+    def zrangebyscore(self, key: str, min_score, max_score) -> List[str]:
+        with self._lock:
+            low, high = float(min_score), float(max_score)
+            members = sorted(self._zsets.get(key, {}).items(), key=lambda item: item[1])
+            return [member for member, score in members if low <= score <= high]
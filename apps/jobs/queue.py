@@ -0,0 +1,242 @@
+"""
+Redis-backed job queue with visibility timeouts.
+
+Long-running work (CV generation) is enqueued by the API and executed by
+worker processes (see worker.py). State lives in Redis, so any number of
+API and worker processes share the queue:
+
+    {prefix}:queue        list of pending job ids (LPUSH, RPOPLPUSH by workers)
+    {prefix}:processing   list of reserved job ids
+    {prefix}:leases       sorted set job id -> lease deadline (visibility timeout)
+    {prefix}:unleased     sorted set job id -> time a sweep first saw it reserved
+                          without a lease (between RPOPLPUSH and ZADD)
+    {prefix}:job:{id}     job record (JSON; expires result_ttl after it finishes)
+
+A reserved job is leased for visibility_timeout seconds; workers extend the
+lease while they run it. If a worker dies, the lease expires and
+requeue_expired() puts the job back in the queue (up to max_attempts).
+Delivery is at-least-once: a job that outlived its lease may run twice,
+the first result written wins.
+"""
+import json
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Job(BaseModel):
+    """One unit of background work and its outcome."""
+    id: str
+    kind: str                                   # Handler name (e.g. "cv_generate")
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    status: str = "queued"                      # queued, running, done, failed
+    attempts: int = 0                           # Reservations so far (crash retries included)
+    max_attempts: int = 3
+    worker: Optional[str] = None                # Worker holding / last holding the job
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in JobQueue.FINISHED
+
+
+class JobQueue:
+    """
+    Job queue over a Redis client (redis.Redis with decode_responses=True,
+    e.g. RedisSession().client, or the in-process InMemoryRedis stand-in).
+    """
+
+    STATUSES = ("queued", "running", "done", "failed")
+    FINISHED = ("done", "failed")
+
+    def __init__(
+        self,
+        client,
+        prefix: str = "jobs",
+        visibility_timeout: int = 300,
+        max_attempts: int = 3,
+        result_ttl: int = 86400,
+    ):
+        """
+        Args:
+            client: Redis client (decoded responses) or InMemoryRedis
+            prefix: Key namespace (one queue per prefix)
+            visibility_timeout: Seconds a reserved job stays invisible to
+                                other workers without a lease extension
+            max_attempts: Reservations allowed before a crashed job fails
+            result_ttl: Seconds finished job records are kept
+        """
+        self.client = client
+        self.prefix = prefix
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.result_ttl = result_ttl
+        self.queue_key = f"{prefix}:queue"
+        self.processing_key = f"{prefix}:processing"
+        self.leases_key = f"{prefix}:leases"
+        self.unleased_key = f"{prefix}:unleased"
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    def _save(self, job: Job) -> None:
+        job.updated_at = time.time()
+        ttl = self.result_ttl if job.finished else None
+        self.client.set(self._job_key(job.id), job.model_dump_json(), ex=ttl)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Job record, or None if unknown (or expired)."""
+        raw = self.client.get(self._job_key(job_id))
+        return Job.model_validate_json(raw) if raw else None
+
+    def enqueue(
+        self, kind: str, payload: Dict[str, Any], max_attempts: Optional[int] = None
+    ) -> Job:
+        """
+        Add a job at the tail of the queue.
+
+        Args:
+            kind: Handler name the worker dispatches on
+            payload: JSON-serializable job arguments
+            max_attempts: Override of the queue default
+
+        Returns:
+            The queued Job (its id is what clients poll)
+
+        Raises:
+            ValueError: If the payload is not JSON-serializable
+        """
+        try:
+            json.dumps(payload)
+        except TypeError as e:
+            raise ValueError(f"Job payload must be JSON-serializable: {e}")
+
+        now = time.time()
+        job = Job(
+            id=str(uuid.uuid4()),
+            kind=kind,
+            payload=payload,
+            max_attempts=max_attempts or self.max_attempts,
+            created_at=now,
+        )
+        self._save(job)
+        self.client.lpush(self.queue_key, job.id)
+        return job
+
+    def reserve(self, worker: str) -> Optional[Job]:
+        """
+        Take the oldest queued job and lease it to a worker.
+
+        Returns:
+            The running Job, or None if the queue is empty
+        """
+        while True:
+            job_id = self.client.rpoplpush(self.queue_key, self.processing_key)
+            if job_id is None:
+                return None
+
+            job = self.get(job_id)
+            if job is None or job.finished:
+                # Expired record, or finished by a worker whose lease had run out
+                self.client.lrem(self.processing_key, 0, job_id)
+                continue
+
+            self.client.zadd(self.leases_key, {job_id: time.time() + self.visibility_timeout})
+            self.client.zrem(self.unleased_key, job_id)
+            job.status = "running"
+            job.attempts += 1
+            job.worker = worker
+            self._save(job)
+            return job
+
+    def extend(self, job_id: str) -> None:
+        """Extend the lease of a running job (worker heartbeat)."""
+        if self.client.zscore(self.leases_key, job_id) is not None:
+            self.client.zadd(self.leases_key, {job_id: time.time() + self.visibility_timeout})
+
+    def _release(self, job_id: str) -> None:
+        self.client.zrem(self.leases_key, job_id)
+        self.client.zrem(self.unleased_key, job_id)
+        self.client.lrem(self.processing_key, 0, job_id)
+
+    def complete(self, job: Job, result: Dict[str, Any]) -> Job:
+        """Record the result of a job and release it."""
+        current = self.get(job.id) or job
+        if current.status != "done":
+            current.status = "done"
+            current.result = result
+            current.error = None
+            self._save(current)
+        self._release(job.id)
+        return current
+
+    def fail(self, job: Job, error: str) -> Job:
+        """
+        Record a job failure raised by its handler (no retry: generation
+        errors are deterministic, e.g. blocked PFR).
+        """
+        current = self.get(job.id) or job
+        if current.status != "done":
+            current.status = "failed"
+            current.error = error
+            self._save(current)
+        self._release(job.id)
+        return current
+
+    def requeue_expired(self) -> int:
+        """
+        Return jobs whose lease expired (worker crashed or stuck) to the queue,
+        or fail them once max_attempts is reached. Safe to call from every
+        worker: ZREM decides which caller handles each job.
+
+        Returns:
+            Number of expired jobs handled
+        """
+        now = time.time()
+        handled = 0
+
+        expired = self.client.zrangebyscore(self.leases_key, "-inf", now)
+        # Reserved but not leased: a live worker may be between RPOPLPUSH and
+        # ZADD, so the job is only requeued once it stayed unleased for a full
+        # visibility timeout after a sweep first saw it (worker died in between)
+        for job_id in self.client.lrange(self.processing_key, 0, -1):
+            if job_id in expired or self.client.zscore(self.leases_key, job_id) is not None:
+                continue
+            self.client.zadd(self.unleased_key, {job_id: now}, nx=True)
+            seen_at = self.client.zscore(self.unleased_key, job_id)
+            if self.get(job_id) is None or (seen_at or now) + self.visibility_timeout <= now:
+                self.client.zadd(self.leases_key, {job_id: now})
+                expired.append(job_id)
+
+        for job_id in expired:
+            if not self.client.zrem(self.leases_key, job_id):
+                continue  # Handled by another worker, or completed meanwhile
+            self.client.zrem(self.unleased_key, job_id)
+            self.client.lrem(self.processing_key, 0, job_id)
+            handled += 1
+
+            job = self.get(job_id)
+            if job is None or job.finished:
+                continue
+            if job.attempts >= job.max_attempts:
+                job.status = "failed"
+                job.error = f"Visibility timeout exceeded {job.attempts} time(s) (worker crashed or stuck)"
+                self._save(job)
+                print(f"[JOBS] Job {job_id} failed after {job.attempts} attempt(s)")
+            else:
+                job.status = "queued"
+                job.worker = None
+                self._save(job)
+                self.client.lpush(self.queue_key, job_id)
+                print(f"[JOBS] Job {job_id} requeued (lease expired, attempt {job.attempts})")
+
+        return handled
+
+    def pending_count(self) -> int:
+        """Number of jobs waiting in the queue."""
+        return self.client.llen(self.queue_key)
@@ -0,0 +1,156 @@
+"""
+Job worker: bounded pool of threads pulling jobs from a JobQueue.
+
+Run one or more worker processes next to the API (same environment):
+
+    python -m apps.jobs.worker
+
+Each process runs JOB_WORKER_CONCURRENCY jobs at a time. A heartbeat
+thread extends the leases of running jobs and requeues jobs whose lease
+expired (crashed or stuck workers).
+"""
+import os
+import socket
+import threading
+import time
+import traceback
+from typing import Callable, Dict, Optional, Set
+
+from .queue import Job, JobQueue
+
+JobHandler = Callable[[Dict], Dict]
+
+
+class JobWorker:
+    """Runs queued jobs with bounded concurrency."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Dict[str, JobHandler],
+        concurrency: int = 2,
+        poll_interval: float = 1.0,
+        name: Optional[str] = None,
+    ):
+        """
+        Args:
+            queue: Job queue to pull from
+            handlers: Job kind -> callable(payload) returning a JSON-serializable result
+            concurrency: Jobs run at the same time by this worker
+            poll_interval: Seconds between polls of an empty queue
+            name: Worker id recorded on jobs (default: host:pid)
+        """
+        if concurrency < 1:
+            raise ValueError("Worker concurrency must be >= 1")
+        self.queue = queue
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self._running: Set[str] = set()
+        self._running_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def run_once(self) -> Optional[Job]:
+        """
+        Reserve and run one job in the calling thread.
+
+        Returns:
+            The finished Job, or None if the queue was empty
+        """
+        job = self.queue.reserve(self.name)
+        if job is None:
+            return None
+        return self._process(job)
+
+    def _process(self, job: Job) -> Job:
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            return self.queue.fail(job, f"No handler for job kind '{job.kind}'")
+
+        with self._running_lock:
+            self._running.add(job.id)
+        start = time.time()
+        try:
+            result = handler(job.payload)
+        except Exception as e:
+            print(f"[JOBS] Job {job.id} ({job.kind}) failed: {str(e)}")
+            traceback.print_exc()
+            return self.queue.fail(job, str(e))
+        finally:
+            with self._running_lock:
+                self._running.discard(job.id)
+
+        print(f"[JOBS] Job {job.id} ({job.kind}) done in {time.time() - start:.1f}s")
+        return self.queue.complete(job, result)
+
+    def _work_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                job = self.run_once()
+            except Exception as e:
+                # Queue unreachable (e.g. Redis restart): back off, keep the worker alive
+                print(f"[JOBS] Worker {self.name} poll failed: {str(e)}")
+                job = None
+            if job is None:
+                self._stop.wait(self.poll_interval)
+
+    def _heartbeat_loop(self) -> None:
+        interval = max(self.queue.visibility_timeout / 3, 0.05)
+        while not self._stop.wait(interval):
+            try:
+                with self._running_lock:
+                    running = list(self._running)
+                for job_id in running:
+                    self.queue.extend(job_id)
+                self.queue.requeue_expired()
+            except Exception as e:
+                print(f"[JOBS] Heartbeat failed: {str(e)}")
+
+    def start(self) -> None:
+        """Start the worker threads and the heartbeat thread (daemon threads)."""
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._work_loop, name=f"jobs-worker-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        self._threads.append(
+            threading.Thread(target=self._heartbeat_loop, name="jobs-heartbeat", daemon=True)
+        )
+        for thread in self._threads:
+            thread.start()
+        print(f"[JOBS] Worker {self.name} started ({self.concurrency} slot(s))")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for running jobs to finish."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run_forever(self) -> None:
+        """
+        Start and block until Ctrl+C. A killed process needs no cleanup:
+        its leases expire and other workers requeue its jobs.
+        """
+        self.start()
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"[JOBS] Worker {self.name} stopping")
+            self.stop()
+
+
+def main() -> None:
+    """Entry point of `python -m apps.jobs.worker`."""
+    from apps.config import JOB_WORKER_CONCURRENCY
+    from . import get_job_queue
+    from .handlers import HANDLERS
+
+    JobWorker(get_job_queue(), HANDLERS, concurrency=JOB_WORKER_CONCURRENCY).run_forever()
+
+
+if __name__ == "__main__":
+    main()
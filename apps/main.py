@@ -1,16 +1,26 @@
 from fastapi import FastAPI, status, HTTPException
 from .database import Base, engine
 from .routers import register_users, login_user, admin_user, cv_router
+from .ai.app.openai_client import aclose_clients
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'apps')))
 
 
+# Creates missing tables only: columns added to existing tables come from
+# migrations (alembic upgrade head, see migrations/README.md)
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI()
 
+
+@app.on_event("shutdown")
+async def close_openai_clients():
+    """Release the shared OpenAI connection pools."""
+    await aclose_clients()
+
+
 @app.get('/health', status_code=status.HTTP_200_OK)
 def health():
     return HTTPException(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, JSON, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
@@ -15,6 +15,11 @@ class CV(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     title = Column(String, nullable=True)
     file_path = Column(String, nullable=False)
+    docx_path = Column(String, nullable=True)   # built lazily on first DOCX request
+    content = Column(JSON, nullable=True)       # final generated content (native DOCX source)
+    layout_trim = Column(Boolean, default=False)
+    form_id = Column(UUID(as_uuid=True), ForeignKey("cv_forms.id"), nullable=True)  # source form (incremental regeneration)
+    language = Column(String, nullable=True)    # "fr" / "en" of content
     score = Column(Integer, nullable=True)
     tips = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
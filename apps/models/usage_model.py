@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, JSON, DateTime, ForeignKey, Integer, Float
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+from ..database import Base
+import uuid
+
+
+
+
+class LLMUsageRecord(Base):
+    """LLM usage of one generation / evaluation (see utils/usage_ledger.py)."""
+    __tablename__ = "llm_usage"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    plan = Column(String, nullable=True, index=True)   # user's plan at generation time
+    source = Column(String, nullable=False)            # "cv_generate", "batch", "evaluate"
+    calls = Column(Integer, default=0)
+    prompt_tokens = Column(Integer, default=0)
+    cached_tokens = Column(Integer, default=0)
+    completion_tokens = Column(Integer, default=0)
+    retries = Column(Integer, default=0)
+    latency_ms = Column(Float, default=0.0)
+    cost_usd = Column(Float, default=0.0)
+    by_call_type = Column(JSON, nullable=True)         # {call_type: [calls, prompt, cached, completion, retries, latency_ms, cost_usd]}
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -2,11 +2,12 @@ from fastapi import HTTPException, status, APIRouter, Depends
 from sqlalchemy.orm import Session
 from typing import Annotated, List
 from fastapi.security import OAuth2PasswordRequestForm
-from datetime import timedelta
+from datetime import datetime, timedelta
 from ..database import get_db
 from ..authentication import users_oauth
 from ..models.users_model import User
 from ..schemas import users_schema
+from ..utils.usage_ledger import summarize_llm_usage
 
 
 
@@ -23,4 +24,21 @@ def get_all_users(
     db: Annotated[Session, Depends(get_db)]
 ):
     users = db.query(User).all()
-    return users
\ No newline at end of file
+    return users
+
+
+@router.get("/llm-usage", response_model=List[users_schema.LLMUsageSummaryItem])
+def get_llm_usage(
+    admin: Annotated[User, Depends(users_oauth.get_current_admin_user)],
+    db: Annotated[Session, Depends(get_db)],
+    group_by: str = "plan",
+    days: int = 30
+):
+    """LLM tokens and estimated cost per plan (group_by=plan) or per user (group_by=user)."""
+    if group_by not in ("plan", "user"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="group_by must be 'plan' or 'user'"
+        )
+    since = datetime.utcnow() - timedelta(days=days) if days > 0 else None
+    return summarize_llm_usage(db, group_by=group_by, since=since)
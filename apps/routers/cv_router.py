@@ -1,18 +1,36 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
-from typing import Dict, Any
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, status
+from fastapi.responses import FileResponse, StreamingResponse
+from typing import Dict, Any, Iterator, List
 from sqlalchemy.orm import Session
 
-from apps.ai.app.models import ContactInformation, EducationEntry, WorkExperienceEntry
+from ..ai.app.batch import generate_cv_batch
 from ..ai.app.cv_grader import grade_cv, analyze_cv_metadata, format_client_output, GradingResult
-from ..ai.app.generator import generate_cv_from_data, CVGenerationResult, CVContent
-from ..ai.app.llm_client import extract_text_from_pdf_bytes
+from ..ai.app.generator import generate_cv_from_data
+from ..ai.app.llm_client import aextract_text_from_pdf_bytes
+from ..ai.app.models import BatchItem
+from ..ai.app.tracing import start_trace
+from ..ai.app.usage import usage_from_trace
 from ..authentication.users_oauth import get_current_user
+from ..config import BATCH_MAX_ITEMS
 from ..database import get_db
 from ..models.users_model import User
 from ..models.cv_model import CV, CVForm, CoverLetter
-from ..schemas.cv_schema import CVEvaluationResponse, CVGenerateRequest, CoverLetterRequest, CVFormData
+from ..schemas.cv_schema import (
+    CVBatchGenerateRequest,
+    CVEvaluationResponse,
+    CVGenerateRequest,
+    CoverLetterRequest,
+    CVFormData,
+)
 from ..utils.file_storage import save_uploaded_file, save_bytes_file, get_file_url
-
+from ..utils.cv_artifacts import ensure_cv_docx, store_generated_cv
+from ..utils.cv_mapping import SUPPORTED_LANGUAGES, form_to_cv_content, resolve_language
+from ..utils.usage_ledger import record_llm_usage
+from ..jobs import Job, get_job_queue
+from ..jobs.handlers import CV_GENERATE
+
+import asyncio
+import json
 import os
 
 
@@ -50,7 +68,9 @@ async def evaluate_cv(
         with open(file_path, "rb") as f:
             pdf_bytes = f.read()
 
-        raw_text = extract_text_from_pdf_bytes(pdf_bytes)
+        with start_trace("cv_evaluation") as root:
+            raw_text = await aextract_text_from_pdf_bytes(pdf_bytes)
+        record_llm_usage(str(current_user.id), usage_from_trace(root), source="evaluate")
         metadata = analyze_cv_metadata(raw_text, page_count=1)
         cv_data: Dict[str, Any] = {"raw_text": raw_text}
 
@@ -80,13 +100,60 @@ async def evaluate_cv(
     
 
 
-@router.post("/generate", response_model=Dict[str, str])
+@router.post("/generate", response_model=Dict[str, str], status_code=status.HTTP_202_ACCEPTED)
 async def generate_optimized_cv(
     request: CVGenerateRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    
+    """
+    Queue a CV generation. Returns 202 with a job id right away; the LLM +
+    render pipeline runs in a worker. Poll GET /cv/jobs/{job_id}, then read
+    GET /cv/jobs/{job_id}/result (pdf_url, docx_url, cv_id).
+    """
+    _require_generation_plan(current_user)
+
+    # -------------------------------------------------------------------------
+    # 1️⃣ Save submitted form data
+    # -------------------------------------------------------------------------
+    db_form = _save_form(db, current_user, request.form_data)
+
+    try:
+        # -------------------------------------------------------------------------
+        # 2️⃣ Map the form to CVContent (validated here, before queuing)
+        # -------------------------------------------------------------------------
+        form = request.form_data.dict()
+        user_language = resolve_language(form["personal_details"])
+        cv_content = form_to_cv_content(form)
+
+        # -------------------------------------------------------------------------
+        # 3️⃣ Queue the generation (a worker runs the pipeline)
+        # -------------------------------------------------------------------------
+        job = get_job_queue().enqueue(CV_GENERATE, {
+            "user_id": str(current_user.id),
+            "form_id": str(db_form.id),
+            "language": user_language,
+            "cv_content": cv_content.dict(),
+        })
+
+    except Exception as e:
+        print(f"CV Generation Error: {str(e)}")  # লগিং
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"CV generation failed: {str(e)}"
+        )
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/cv/jobs/{job.id}",
+        "result_url": f"/cv/jobs/{job.id}/result",
+        "language": user_language.upper(),
+        "message": f"Your CV generation in {user_language.upper()} has been queued."
+    }
+
+
+def _require_generation_plan(current_user: User) -> None:
     allowed_plans = ["starter", "premium", "ultimate"]
     if current_user.plan not in allowed_plans:
         raise HTTPException(
@@ -94,158 +161,213 @@ async def generate_optimized_cv(
             detail=f"CV generation requires one of these plans: {', '.join(allowed_plans)}. Please upgrade."
         )
 
-    # -------------------------------------------------------------------------
-    # 1️⃣ Save submitted form data
-    # -------------------------------------------------------------------------
+
+def _save_form(db: Session, current_user: User, form_data: CVFormData) -> CVForm:
     db_form = CVForm(
         user_id=current_user.id,
-        personal_details=request.form_data.personal_details,
-        education=request.form_data.education,
-        employment=request.form_data.employment,
-        languages=request.form_data.languages,
-        skills=request.form_data.skills,
-        activities=request.form_data.activities
+        personal_details=form_data.personal_details,
+        education=form_data.education,
+        employment=form_data.employment,
+        languages=form_data.languages,
+        skills=form_data.skills,
+        activities=form_data.activities
     )
     db.add(db_form)
     db.commit()
     db.refresh(db_form)
+    return db_form
 
-    try:
-        # -------------------------------------------------------------------------
-        # 2️⃣ Determine language
-        # -------------------------------------------------------------------------
-        user_language = request.form_data.personal_details.get("language", "en").lower()
-        if user_language not in ["en", "fr"]:
-            user_language = "en"  
 
-        # -------------------------------------------------------------------------
-        # ৩. তোমার JSON → CVContent মডেলে ম্যাপিং (এটাই মূল পরিবর্তন)
-        # -------------------------------------------------------------------------
-        form = request.form_data.dict()  
-
-        # Contact Information
-        contact = ContactInformation(
-            name=form["personal_details"].get("full_name", ""),
-            email=form["personal_details"].get("email", ""),
-            phone=form["personal_details"].get("phone", ""),
-            address=form["personal_details"].get("address", "")
+def _check_batch_size(count: int) -> None:
+    if not 1 <= count <= BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch must contain between 1 and {BATCH_MAX_ITEMS} CVs (got {count})."
         )
 
-        # Education Entries
-        education_entries = []
-        for edu in form.get("education", []):
-            education_entries.append(
-                EducationEntry(
-                    institution=edu.get("institution", ""),
-                    degree=edu.get("degree", ""),
-                    location=edu.get("location", edu.get("city", "")),
-                    date=f"{edu.get('start_year', '')} - {edu.get('end_year', '')}",
-                    coursework=edu.get("coursework", []),
-                    major=edu.get("major", None),
-                    honors=edu.get("honors", None)
-                )
-            )
-
-        # Work Experience Entries
-        work_experiences = []
-        for emp in form.get("employment", []):
-            work_experiences.append(
-                WorkExperienceEntry(
-                    date=f"{emp.get('start_date', '')} - {emp.get('end_date', 'Present')}",
-                    company=emp.get("company", ""),
-                    location=emp.get("location", ""),
-                    position=emp.get("position", ""),
-                    duration=emp.get("duration", ""),
-                    bullets=emp.get("bullets", [])
-                )
-            )
-
-        # Languages
-        languages_list = [f"{l['language']} ({l['proficiency']})" for l in form.get("languages", [])]
-
-        # Skills
-        skills_list = [f"{s['skill']} ({s['level']})" for s in form.get("skills", [])]
-
-        # Activities / Interests
-        activities_list = [a.get("description", a.get("activity", "")) for a in form.get("activities", [])]
-
-        # CVContent অবজেক্ট তৈরি
-        cv_content = CVContent(
-            contact_information=[contact],
-            education=education_entries,
-            work_experience=work_experiences,
-            experience=work_experiences,  # alias
-            language_skills=languages_list,
-            languages=languages_list,     # alias
-            it_skills=skills_list,
-            activities_interests=activities_list,
-            domain="finance",             # পরে ডাইনামিক করতে পারো
-            summary=None,
-            certifications=[]             # যদি থাকে তাহলে যোগ করো
-        )
 
-        # -------------------------------------------------------------------------
-        # ৪. AI দিয়ে CV জেনারেট করা
-        # -------------------------------------------------------------------------
-        generation_result: Dict[str, CVGenerationResult] = generate_cv_from_data(
-            cv_content,
-            languages=[user_language]
-        )
+def _stream_batch(items: List[BatchItem], user_id: str) -> Iterator[str]:
+    """
+    NDJSON lines, one per item as soon as it finishes (completion order).
+    Each generated language is stored as a CV; DOCX is built on first download.
+    The LLM usage of each item is recorded once in the ledger.
+    """
+    for item in generate_cv_batch(items, docx_mode="deferred"):
+        line: Dict[str, Any] = {
+            "item_id": item.item_id,
+            "index": item.index,
+            "status": item.status,
+            "error": item.error,
+            "duration_seconds": item.duration_seconds,
+            "cvs": [],
+        }
+        try:
+            if item.results:
+                record_llm_usage(user_id, next(iter(item.results.values())).usage, source="batch")
+            for language, cv_result in item.results.items():
+                db_cv = store_generated_cv(user_id, cv_result)
+                line["cvs"].append({
+                    "language": language.upper(),
+                    "cv_id": str(db_cv.id),
+                    "pdf_url": get_file_url(db_cv.file_path),
+                    "docx_url": f"/cv/{db_cv.id}/docx",
+                    "degradations": cv_result.degradations,
+                })
+        except Exception as e:
+            print(f"Batch item {item.index} storage error: {str(e)}")
+            line.update(status="failed", error=f"Storage failed: {str(e)}")
+        yield json.dumps(line) + "\n"
+
+
+@router.post("/generate/batch")
+async def generate_cv_batch_from_forms(
+    request: CVBatchGenerateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Cohort generation from form payloads (one CV per form, in the form's language).
+    Streams NDJSON: one line per CV as soon as it is generated (item_id = form id).
+    """
+    _require_generation_plan(current_user)
+    _check_batch_size(len(request.forms))
+
+    items = []
+    for form_data in request.forms:
+        db_form = _save_form(db, current_user, form_data)
+        form = form_data.dict()
+        items.append(BatchItem(
+            item_id=str(db_form.id),
+            cv_content=form_to_cv_content(form),
+            languages=[resolve_language(form["personal_details"])],
+        ))
+
+    return StreamingResponse(
+        _stream_batch(items, str(current_user.id)),
+        media_type="application/x-ndjson"
+    )
 
-        # নির্বাচিত ভাষার রেজাল্ট নাও
-        cv_result = generation_result[user_language]
 
-        # -------------------------------------------------------------------------
-        # ৫. ফাইল সেভ (PDF + DOCX)
-        # -------------------------------------------------------------------------
-        pdf_path = save_bytes_file(
-            cv_result.pdf_bytes,
-            "generated",
-            str(current_user.id),
-            ".pdf"
+@router.post("/generate/batch/pdf")
+async def generate_cv_batch_from_pdfs(
+    files: List[UploadFile] = File(...),
+    domain: str = Form("finance"),
+    languages: str = Form("fr,en"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Cohort generation from existing CV PDFs (languages: comma-separated, e.g. "fr,en").
+    Streams NDJSON: one line per PDF as soon as it is generated (item_id = filename).
+    """
+    _require_generation_plan(current_user)
+    _check_batch_size(len(files))
+
+    requested = [lang.strip().lower() for lang in languages.split(",") if lang.strip()]
+    if not requested or any(lang not in SUPPORTED_LANGUAGES for lang in requested):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"languages must be a comma-separated subset of {', '.join(SUPPORTED_LANGUAGES)}"
         )
-        docx_path = save_bytes_file(
-            cv_result.docx_bytes,
-            "generated",
-            str(current_user.id),
-            ".docx"
+
+    items = [
+        BatchItem(
+            item_id=file.filename or f"cv_{index}.pdf",
+            pdf_bytes=await file.read(),
+            domain=domain,
+            languages=requested,
         )
+        for index, file in enumerate(files)
+    ]
 
-        # -------------------------------------------------------------------------
-        # ৬. ডাটাবেসে CV রেকর্ড সেভ
-        # -------------------------------------------------------------------------
-        db_cv = CV(
-            user_id=current_user.id,
-            file_path=pdf_path,  # প্রাইমারি PDF
-            score=100,           # AI জেনারেটেড = পারফেক্ট
-            tips=[]              # টিপস লাগবে না
+    return StreamingResponse(
+        _stream_batch(items, str(current_user.id)),
+        media_type="application/x-ndjson"
+    )
+
+
+def _get_user_job(job_id: str, current_user: User) -> Job:
+    """Job owned by the current user (404 otherwise)."""
+    job = get_job_queue().get(job_id)
+    if job is None or job.payload.get("user_id") != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found or does not belong to you"
         )
-        db.add(db_cv)
-        db.commit()
-        db.refresh(db_cv)
+    return job
 
-        # -------------------------------------------------------------------------
-        # ৭. ক্লায়েন্টকে রেসপন্স দাও
-        # -------------------------------------------------------------------------
-        return {
-            "pdf_url": get_file_url(pdf_path),
-            "docx_url": get_file_url(docx_path),
-            "cv_id": str(db_cv.id),
-            "language": user_language.upper(),
-            "message": f"Your optimized CV has been generated successfully in {user_language.upper()}!"
-        }
 
-    except Exception as e:
-        db.rollback()
-        print(f"CV Generation Error: {str(e)}")  # লগিং
+@router.get("/jobs/{job_id}", response_model=Dict[str, Any])
+async def get_generation_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Status of a queued CV generation (queued, running, done, failed)."""
+    job = _get_user_job(job_id, current_user)
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "attempts": job.attempts,
+        "error": job.error,
+        "result_url": f"/cv/jobs/{job.id}/result",
+    }
+
+
+@router.get("/jobs/{job_id}/result", response_model=Dict[str, Any])
+async def get_generation_job_result(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Result of a finished CV generation (pdf_url, docx_url, cv_id, degradations)."""
+    job = _get_user_job(job_id, current_user)
+
+    if job.status == "failed":
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"CV generation failed: {str(e)}"
+            detail=f"CV generation failed: {job.error}"
         )
+    if job.status != "done":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"CV generation is not finished yet (status: {job.status})"
+        )
+    return job.result
+
 
+@router.get("/{cv_id}/docx")
+async def download_cv_docx(
+    cv_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    DOCX of a generated CV. Built natively from the stored content on first
+    request (if the background build has not finished yet), then served from
+    storage; legacy CVs without stored content are converted from their PDF.
+    """
+    cv = db.query(CV).filter(
+        CV.id == cv_id,
+        CV.user_id == current_user.id
+    ).first()
 
+    if not cv:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="CV not found or does not belong to you"
+        )
 
+    try:
+        docx_file = await asyncio.to_thread(ensure_cv_docx, str(cv.id))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"DOCX generation failed: {str(e)}"
+        )
 
+    return FileResponse(
+        docx_file,
+        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        filename=f"{cv.title or 'cv'}.docx"
+    )
 
 
 @router.post("/cover-letter", response_model=Dict[str, str])
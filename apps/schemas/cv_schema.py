@@ -26,6 +26,11 @@ class CVGenerateRequest(BaseModel):
     format: str = "pdf"
 
 
+class CVBatchGenerateRequest(BaseModel):
+    """Cohort generation (career services): one form per student"""
+    forms: List[CVFormData]
+
+
 class CoverLetterRequest(BaseModel):
     reference_cv_id: str
     job_description: Optional[str] = None
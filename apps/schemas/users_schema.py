@@ -73,3 +73,15 @@ class TutorStats(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class LLMUsageSummaryItem(BaseModel):
+    key: Optional[str]          # plan name or user id
+    generations: int
+    calls: int
+    prompt_tokens: int
+    cached_tokens: int
+    completion_tokens: int
+    retries: int
+    latency_ms: float
+    cost_usd: float
@@ -0,0 +1,181 @@
+import os
+import threading
+import uuid
+from typing import Dict, Optional, Tuple
+
+from ..ai.app.docx_writer import DocxWriter
+from ..ai.app.generator import generate_docx_from_pdf
+from ..ai.app.models import CVGenerationResult
+from ..database import seasionlocal
+from ..models.cv_model import CV, CVForm
+from .cv_mapping import form_to_cv_content
+from .file_storage import UPLOAD_BASE, save_bytes_file
+
+# Generations scanned for the previous CV of the same person (incremental regeneration)
+PREVIOUS_GENERATION_LOOKBACK = 20
+
+
+# One build per CV at a time (background task and download may race).
+# Striped locks: bounded memory, a collision only serializes two builds.
+_DOCX_LOCKS = [threading.Lock() for _ in range(64)]
+
+
+def _docx_lock(cv_id: str) -> threading.Lock:
+    return _DOCX_LOCKS[hash(cv_id) % len(_DOCX_LOCKS)]
+
+
+def _stored_path(rel_path: Optional[str]) -> Optional[str]:
+    """Resolve a stored relative path to a file on disk (None if missing)."""
+    if not rel_path:
+        return None
+    for candidate in (os.path.join(UPLOAD_BASE, rel_path), rel_path):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def store_generated_cv(
+    user_id: str,
+    cv_result: CVGenerationResult,
+    form_id: Optional[str] = None,
+    language: Optional[str] = None,
+) -> CV:
+    """
+    Save a generated PDF and record its CV row (content kept for the DOCX).
+
+    Args:
+        user_id: Owner of the CV
+        cv_result: Generation result
+        form_id: Source form, enables incremental regeneration on the next edit
+        language: Language of the generated content
+
+    Returns:
+        The stored CV (detached; id and file_path are loaded)
+    """
+    pdf_path = save_bytes_file(cv_result.pdf_bytes, "generated", user_id, ".pdf")
+
+    db = seasionlocal()
+    try:
+        db_cv = CV(
+            user_id=uuid.UUID(str(user_id)),
+            file_path=pdf_path,
+            content=cv_result.content,  # DOCX is rendered natively from it
+            layout_trim=cv_result.layout_trim,
+            form_id=uuid.UUID(str(form_id)) if form_id else None,
+            language=language,
+            score=100,
+            tips=[]
+        )
+        db.add(db_cv)
+        db.commit()
+        db.refresh(db_cv)
+        return db_cv
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _form_dict(db_form: CVForm) -> Dict:
+    return {
+        "personal_details": db_form.personal_details or {},
+        "education": db_form.education or [],
+        "employment": db_form.employment or [],
+        "languages": db_form.languages or [],
+        "skills": db_form.skills or [],
+        "activities": db_form.activities or [],
+    }
+
+
+def find_previous_generation(
+    user_id: str, language: str, full_name: str, exclude_form_id: Optional[str] = None
+) -> Optional[Tuple[Dict, Dict]]:
+    """
+    Last generation of the same person in the same language, for diffing.
+
+    Matched on the form's full name: one account (e.g. a career service)
+    may generate CVs for several people.
+
+    Returns:
+        Tuple (previous CVContent.dict(), previous final content), or None
+    """
+    db = seasionlocal()
+    try:
+        candidates = (
+            db.query(CV, CVForm)
+            .join(CVForm, CV.form_id == CVForm.id)
+            .filter(
+                CV.user_id == uuid.UUID(str(user_id)),
+                CV.language == language,
+                CV.content.isnot(None),
+            )
+            .order_by(CV.created_at.desc())
+            .limit(PREVIOUS_GENERATION_LOOKBACK)
+            .all()
+        )
+        for cv, db_form in candidates:
+            if not cv.content or (exclude_form_id and str(db_form.id) == str(exclude_form_id)):
+                continue
+            form = _form_dict(db_form)
+            if (form["personal_details"].get("full_name") or "").strip().lower() != full_name.strip().lower():
+                continue
+            return form_to_cv_content(form).dict(), cv.content
+        return None
+    finally:
+        db.close()
+
+
+def ensure_cv_docx(cv_id: str) -> str:
+    """
+    Return the stored DOCX of a CV, building it on first call.
+
+    Built natively from the stored content (DocxWriter); CVs without stored
+    content fall back to converting the stored PDF.
+
+    Safe to call from a background task and a download request at the same
+    time: the conversion runs once, the result is cached in storage and its
+    path recorded on the CV row.
+
+    Returns:
+        Full path of the DOCX file on disk
+
+    Raises:
+        ValueError: If the CV id is invalid, the CV or its PDF does not exist,
+                    or conversion fails
+    """
+    with _docx_lock(cv_id):
+        db = seasionlocal()
+        try:
+            cv = db.query(CV).filter(CV.id == uuid.UUID(str(cv_id))).first()
+            if cv is None:
+                raise ValueError(f"CV {cv_id} not found")
+
+            docx_file = _stored_path(cv.docx_path)
+            if docx_file:
+                return docx_file
+
+            if cv.content:
+                # Native writer from the generated content (milliseconds)
+                docx_bytes = DocxWriter.generate_docx_from_data(cv.content, trim=bool(cv.layout_trim))
+            else:
+                # CVs stored before content was recorded: convert the PDF
+                pdf_file = _stored_path(cv.file_path)
+                if pdf_file is None:
+                    raise ValueError(f"PDF of CV {cv_id} not found in storage")
+                with open(pdf_file, "rb") as f:
+                    docx_bytes = generate_docx_from_pdf(f.read())
+
+            cv.docx_path = save_bytes_file(docx_bytes, "generated", str(cv.user_id), ".docx")
+            db.commit()
+            return os.path.join(UPLOAD_BASE, cv.docx_path)
+        finally:
+            db.close()
+
+
+def build_cv_docx_in_background(cv_id: str) -> None:
+    """BackgroundTasks entry point: pre-build the DOCX, log failures (on-demand retries)."""
+    try:
+        ensure_cv_docx(cv_id)
+    except Exception as e:
+        print(f"DOCX background build failed for CV {cv_id}: {str(e)}")
@@ -0,0 +1,77 @@
+from typing import Any, Dict
+
+from ..ai.app.models import CVContent, ContactInformation, EducationEntry, WorkExperienceEntry
+
+
+SUPPORTED_LANGUAGES = ("en", "fr")
+
+
+def resolve_language(personal_details: Dict[str, Any]) -> str:
+    """Output language chosen in the form (defaults to English)."""
+    language = (personal_details.get("language") or "en").lower()
+    return language if language in SUPPORTED_LANGUAGES else "en"
+
+
+def form_to_cv_content(form: Dict[str, Any]) -> CVContent:
+    """
+    Map the multi-step form (CVFormData.dict()) to the generator's CVContent.
+    """
+    # Contact Information
+    contact = ContactInformation(
+        name=form["personal_details"].get("full_name", ""),
+        email=form["personal_details"].get("email", ""),
+        phone=form["personal_details"].get("phone", ""),
+        address=form["personal_details"].get("address", "")
+    )
+
+    # Education Entries
+    education_entries = []
+    for edu in form.get("education", []):
+        education_entries.append(
+            EducationEntry(
+                institution=edu.get("institution", ""),
+                degree=edu.get("degree", ""),
+                location=edu.get("location", edu.get("city", "")),
+                date=f"{edu.get('start_year', '')} - {edu.get('end_year', '')}",
+                coursework=edu.get("coursework", []),
+                major=edu.get("major", None),
+                honors=edu.get("honors", None)
+            )
+        )
+
+    # Work Experience Entries
+    work_experiences = []
+    for emp in form.get("employment", []):
+        work_experiences.append(
+            WorkExperienceEntry(
+                date=f"{emp.get('start_date', '')} - {emp.get('end_date', 'Present')}",
+                company=emp.get("company", ""),
+                location=emp.get("location", ""),
+                position=emp.get("position", ""),
+                duration=emp.get("duration", ""),
+                bullets=emp.get("bullets", [])
+            )
+        )
+
+    # Languages
+    languages_list = [f"{l['language']} ({l['proficiency']})" for l in form.get("languages", [])]
+
+    # Skills
+    skills_list = [f"{s['skill']} ({s['level']})" for s in form.get("skills", [])]
+
+    # Activities / Interests
+    activities_list = [a.get("description", a.get("activity", "")) for a in form.get("activities", [])]
+
+    return CVContent(
+        contact_information=[contact],
+        education=education_entries,
+        work_experience=work_experiences,
+        experience=work_experiences,  # alias
+        language_skills=languages_list,
+        languages=languages_list,     # alias
+        it_skills=skills_list,
+        activities_interests=activities_list,
+        domain="finance",
+        summary=None,
+        certifications=[]
+    )
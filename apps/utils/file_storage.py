@@ -50,6 +50,28 @@ def save_bytes_file(content: bytes | BinaryIO, folder: str, user_id: str, ext: s
 
 
 
+def delete_uploaded_file(path: str) -> bool:
+    """
+    Delete a stored file (path relative to UPLOAD_BASE, as returned by
+    save_bytes_file()). PDFs also leave the extraction cache, which holds
+    their full text. Returns True if a file was deleted; paths resolving
+    outside UPLOAD_BASE are never touched.
+    """
+    base = os.path.realpath(UPLOAD_BASE)
+    full_path = os.path.realpath(os.path.join(base, path))
+    if os.path.commonpath([base, full_path]) != base or not os.path.isfile(full_path):
+        return False
+
+    if full_path.lower().endswith(".pdf"):
+        from ..ai.app.llm_client import forget_extraction
+
+        with open(full_path, "rb") as f:
+            forget_extraction(f.read())
+
+    os.remove(full_path)
+    return True
+
+
 def get_file_url(rel_path: str) -> str:
     # Local dev: http://localhost:8000/uploads/...
     # Production: https://yourdomain.com/uploads/... (Nginx/Static serve)
@@ -0,0 +1,101 @@
+"""
+LLM usage ledger: one compact row per generation / evaluation (table
+llm_usage), summed per user or per plan for cost reviews and capacity
+budgeting.
+
+Recording never fails the request: a ledger error is logged and dropped.
+"""
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..ai.app.models import LLMUsage
+from ..database import seasionlocal
+from ..models.usage_model import LLMUsageRecord
+from ..models.users_model import User
+
+# Order of the per call type values stored in LLMUsageRecord.by_call_type
+USAGE_FIELDS = ("calls", "prompt_tokens", "cached_tokens", "completion_tokens", "retries", "latency_ms", "cost_usd")
+
+
+def compact_usage(usage: LLMUsage) -> Dict[str, List[float]]:
+    """Per call type usage as value lists (see USAGE_FIELDS)."""
+    return {
+        call_type: [getattr(totals, key) for key in USAGE_FIELDS]
+        for call_type, totals in usage.by_call_type.items()
+    }
+
+
+def record_llm_usage(user_id: str, usage: Optional[LLMUsage], source: str) -> Optional[LLMUsageRecord]:
+    """
+    Store the LLM usage of one generation (no row when it made no LLM call).
+
+    Args:
+        user_id: Owner of the generation
+        usage: CVGenerationResult.usage (shared by its language results: record it once)
+        source: "cv_generate", "batch" or "evaluate"
+
+    Returns:
+        The stored record, or None (nothing to record, or the ledger failed)
+    """
+    if usage is None or usage.calls == 0:
+        return None
+
+    db = seasionlocal()
+    try:
+        user_uuid = uuid.UUID(str(user_id))
+        plan = db.query(User.plan).filter(User.id == user_uuid).scalar()
+        record = LLMUsageRecord(
+            user_id=user_uuid,
+            plan=plan,
+            source=source,
+            **{key: getattr(usage, key) for key in USAGE_FIELDS},
+            by_call_type=compact_usage(usage),
+        )
+        db.add(record)
+        db.commit()
+        return record
+    except Exception as e:
+        db.rollback()
+        print(f"[USAGE] Failed to record LLM usage of {user_id}: {e}")
+        return None
+    finally:
+        db.close()
+
+
+def summarize_llm_usage(db: Session, group_by: str = "plan", since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Sum the ledger per plan or per user, most expensive first.
+
+    Args:
+        db: Database session
+        group_by: "plan" or "user"
+        since: Only records created at or after this time
+
+    Returns:
+        One dict per group: key, generations and the USAGE_FIELDS sums
+
+    Raises:
+        ValueError: If group_by is not "plan" or "user"
+    """
+    if group_by not in ("plan", "user"):
+        raise ValueError(f"Unknown usage grouping: {group_by} (expected plan or user)")
+    key = LLMUsageRecord.plan if group_by == "plan" else LLMUsageRecord.user_id
+
+    query = db.query(
+        key,
+        func.count(LLMUsageRecord.id),
+        *[func.coalesce(func.sum(getattr(LLMUsageRecord, field)), 0) for field in USAGE_FIELDS],
+    )
+    if since is not None:
+        query = query.filter(LLMUsageRecord.created_at >= since)
+    rows = query.group_by(key).order_by(func.sum(LLMUsageRecord.cost_usd).desc()).all()
+
+    return [
+        {"key": str(row[0]) if row[0] is not None else None, "generations": row[1],
+         **{field: value for field, value in zip(USAGE_FIELDS, row[2:])}}
+        for row in rows
+    ]
@@ -0,0 +1,24 @@
+"""Baseline: schema created by Base.metadata.create_all before migrations
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-17
+
+Existing databases are stamped at this revision (alembic stamp 0001_baseline)
+before their first upgrade; see migrations/README.md.
+"""
+from typing import Sequence, Union
+
+
+revision: str = "0001_baseline"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,34 @@
+"""CV: path of the lazily built DOCX
+
+Revision ID: 0002_cv_docx_path
+Revises: 0001_baseline
+Create Date: 2026-10-17
+
+Skips the column if it already exists (tables created by create_all at
+startup already have it).
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "0002_cv_docx_path"
+down_revision: Union[str, None] = "0001_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    if context.is_offline_mode():  # --sql: no database to inspect
+        return False
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    if not _has_column("cv", "docx_path"):
+        op.add_column("cv", sa.Column("docx_path", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("cv", "docx_path")
@@ -0,0 +1,34 @@
+"""CV: final generated content and layout trim flag (native DOCX source)
+
+Revision ID: 0003_cv_content
+Revises: 0002_cv_docx_path
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "0003_cv_content"
+down_revision: Union[str, None] = "0002_cv_docx_path"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    if context.is_offline_mode():  # --sql: no database to inspect
+        return False
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    if not _has_column("cv", "content"):
+        op.add_column("cv", sa.Column("content", sa.JSON(), nullable=True))
+    if not _has_column("cv", "layout_trim"):
+        op.add_column("cv", sa.Column("layout_trim", sa.Boolean(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("cv", "layout_trim")
+    op.drop_column("cv", "content")
@@ -0,0 +1,39 @@
+"""CV: source form and language (incremental regeneration)
+
+Revision ID: 0004_cv_form_source
+Revises: 0003_cv_content
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+revision: str = "0004_cv_form_source"
+down_revision: Union[str, None] = "0003_cv_content"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    if context.is_offline_mode():  # --sql: no database to inspect
+        return False
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    if not _has_column("cv", "form_id"):
+        with op.batch_alter_table("cv") as batch:  # batch: SQLite cannot ALTER constraints
+            batch.add_column(sa.Column("form_id", UUID(as_uuid=True), nullable=True))
+            batch.create_foreign_key("cv_form_id_fkey", "cv_forms", ["form_id"], ["id"])
+    if not _has_column("cv", "language"):
+        op.add_column("cv", sa.Column("language", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("cv", "language")
+    with op.batch_alter_table("cv") as batch:
+        batch.drop_constraint("cv_form_id_fkey", type_="foreignkey")
+        batch.drop_column("form_id")
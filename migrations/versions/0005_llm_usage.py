@@ -0,0 +1,51 @@
+"""llm_usage: LLM usage ledger (tokens, retries, latency, cost per generation)
+
+Revision ID: 0005_llm_usage
+Revises: 0004_cv_form_source
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+revision: str = "0005_llm_usage"
+down_revision: Union[str, None] = "0004_cv_form_source"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(table: str) -> bool:
+    if context.is_offline_mode():  # --sql: no database to inspect
+        return False
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    if _has_table("llm_usage"):  # Created by create_all at startup
+        return
+    op.create_table(
+        "llm_usage",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("plan", sa.String(), nullable=True),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("calls", sa.Integer(), nullable=True),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=True),
+        sa.Column("cached_tokens", sa.Integer(), nullable=True),
+        sa.Column("completion_tokens", sa.Integer(), nullable=True),
+        sa.Column("retries", sa.Integer(), nullable=True),
+        sa.Column("latency_ms", sa.Float(), nullable=True),
+        sa.Column("cost_usd", sa.Float(), nullable=True),
+        sa.Column("by_call_type", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_llm_usage_user_id", "llm_usage", ["user_id"])
+    op.create_index("ix_llm_usage_plan", "llm_usage", ["plan"])
+    op.create_index("ix_llm_usage_created_at", "llm_usage", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("llm_usage")